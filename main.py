@@ -7,24 +7,28 @@ A modular video creation application that combines images and audio files.
 
 import sys
 import os
-from PyQt6.QtWidgets import QApplication, QDialog, QVBoxLayout, QLabel, QLineEdit, QHBoxLayout, QPushButton
-from PyQt6.QtGui import QIcon
-from PyQt6.QtCore import Qt
-from src.config import check_ffmpeg_installation, ICON_PATH
-from src.main_ui import SuperCutUI
-from src.utils import cleanup_temp_files
+# Imported first so it can time everything below (see --profile-startup)
+from src.startup_profiler import startup_profiler
+startup_profiler.start_import_tracking()
 
-# Clear the log file at startup prgram
-with open('supercut.log', 'w'):
-    pass
+with startup_profiler.phase("imports"):
+    from PyQt6.QtWidgets import QApplication, QDialog, QVBoxLayout, QLabel, QLineEdit, QHBoxLayout, QPushButton
+    from PyQt6.QtGui import QIcon
+    from PyQt6.QtCore import Qt
+    from src.config import check_ffmpeg_installation, ICON_PATH
+    from src.main_ui import SuperCutUI
+    from src.utils import cleanup_temp_files, cleanup_stale_workspaces
 
 # Clean up any leftover temp files before starting the program
-cleanup_temp_files()
+with startup_profiler.phase("temp_cleanup"):
+    cleanup_temp_files()
+    cleanup_stale_workspaces()
 
 # Create the QApplication instance ONCE at the very start
-app = QApplication(sys.argv)
-app.setApplicationName("SuperCut")
-app.setApplicationVersion("1.0")
+with startup_profiler.phase("qapplication"):
+    app = QApplication(sys.argv)
+    app.setApplicationName("SuperCut")
+    app.setApplicationVersion("1.0")
 
 class PasswordDialog(QDialog):
     def __init__(self, parent=None):
@@ -80,19 +84,20 @@ if current_pc_name is None:
     current_pc_name = ''
 
 if not os.path.exists(ACTIVATION_FILENAME):
-    while True:
-        dlg = PasswordDialog()
-        if dlg.exec() == QDialog.DialogCode.Accepted:
-            password = dlg.get_password()
-            if password == current_pc_name:
-                with open(ACTIVATION_FILENAME, 'w') as f:
-                    f.write('activated')
-                break
+    with startup_profiler.phase("activation", interactive=True):
+        while True:
+            dlg = PasswordDialog()
+            if dlg.exec() == QDialog.DialogCode.Accepted:
+                password = dlg.get_password()
+                if password == current_pc_name:
+                    with open(ACTIVATION_FILENAME, 'w') as f:
+                        f.write('activated')
+                    break
+                else:
+                    dlg.set_error("Incorrect password. Please contact Sna.")
+                    continue
             else:
-                dlg.set_error("Incorrect password. Please contact Sna.")
-                continue
-        else:
-            sys.exit(0)
+                sys.exit(0)
     # No need to call app.exit() here; continue to main window
 
 # Only run main if the flag file exists (i.e., activation succeeded)
@@ -102,11 +107,20 @@ if os.path.exists(ACTIVATION_FILENAME):
         print("Starting SuperCut Video Maker...")        
         # QApplication already created above
         # Check FFmpeg installation
-        ffmpeg_ok, error_msg = check_ffmpeg_installation()
+        with startup_profiler.phase("ffmpeg_check"):
+            ffmpeg_ok, error_msg = check_ffmpeg_installation()
         if not ffmpeg_ok:
             print(f"Warning: FFmpeg not found. {error_msg or 'The application will attempt to extract it on first use.'}")
-        window = SuperCutUI()
-        window.show()
+        else:
+            # Probe available encoders once per ffmpeg binary (cached on disk)
+            with startup_profiler.phase("encoder_probe"):
+                from src.encoder_utils import probe_encoder_capabilities
+                encoders = probe_encoder_capabilities()
+            print(f"🔧 Available video encoders: {', '.join(encoders) if encoders else 'unknown'}")
+        with startup_profiler.phase("window_init"):
+            window = SuperCutUI()
+        with startup_profiler.phase("window_show"):
+            window.show()
         print("Application started successfully! \u2727 ")
         
         # Print current FFmpeg settings that will be used for video creation
@@ -130,6 +144,8 @@ if os.path.exists(ACTIVATION_FILENAME):
         from PyQt6.QtCore import QTimer
         timer = QTimer()
         timer.singleShot(100, print_ffmpeg_settings)
+        # Report startup time once the event loop has drawn the window
+        QTimer.singleShot(0, startup_profiler.finish)
         
         sys.exit(app.exec())
 
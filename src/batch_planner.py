@@ -0,0 +1,123 @@
+# This file uses PyQt6
+"""
+Up-front batch planning for VideoWorker runs.
+
+The whole run is planned in one pass before any rendering starts: every
+batch gets its MP3s, background image and output name. Pools are
+array-backed with swap-remove, so each draw is O(1) and a full plan is O(n)
+instead of the O(n^2) of per-batch sampling and list removal. Plans are
+seeded, so the same seed and inputs always produce the same plan.
+"""
+import random
+from typing import Collection, List, Optional, Iterable
+
+
+class MediaPool:
+    """Array-backed pool with O(1) random draw and O(1) removal by value"""
+
+    def __init__(self, items: Iterable[str], rng: random.Random):
+        # Sorted so a seed reproduces the same plan regardless of directory listing order
+        self._items = sorted(set(items))
+        self._index = {item: i for i, item in enumerate(self._items)}
+        self._rng = rng
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item: str) -> bool:
+        return item in self._index
+
+    def _take(self, i: int) -> str:
+        item = self._items[i]
+        last = self._items.pop()
+        if i < len(self._items):
+            self._items[i] = last
+            self._index[last] = i
+        del self._index[item]
+        return item
+
+    def draw(self) -> str:
+        """Remove and return a random item"""
+        return self._take(self._rng.randrange(len(self._items)))
+
+    def draw_many(self, count: int) -> List[str]:
+        return [self.draw() for _ in range(count)]
+
+    def remove(self, item: str) -> bool:
+        """Remove a specific item; returns False if it was not in the pool"""
+        i = self._index.get(item)
+        if i is None:
+            return False
+        self._take(i)
+        return True
+
+    def remaining(self) -> List[str]:
+        return list(self._items)
+
+
+def plan_batches(mp3_files: List[str], image_files: List[str], min_mp3_count: int,
+                 start_number: int, export_name: str, name_list: Optional[List[str]] = None,
+                 max_batches: Optional[int] = None, seed: Optional[int] = None,
+                 first_batch_index: int = 0, skip_indices: Collection[int] = (),
+                 reserved: Iterable[str] = ()) -> dict:
+    """
+    Build the complete batch plan for a run.
+
+    Args:
+        mp3_files / image_files: Available inputs
+        min_mp3_count: MP3s per batch
+        start_number: Number used for the first planned batch's output name
+        export_name: Base output name when no name list is used
+        name_list: Optional output names, indexed by batch index
+        max_batches: Upper bound on batches (default: as many as inputs allow)
+        seed: Random seed; a fresh one is chosen and recorded if None
+        first_batch_index: Index of the first planned batch (non-zero on resume)
+        skip_indices: Batch indices already taken (finished or re-queued on resume);
+            their numbers and output names are not reused
+        reserved: Inputs already used or held by other batches; never drawn
+
+    Returns:
+        {"seed": int, "batches": [{"batch", "number", "output_filename", "mp3s", "image"}, ...],
+         "leftover_mp3s": [...], "leftover_images": [...]}
+    """
+    if seed is None:
+        seed = random.SystemRandom().randrange(2 ** 32)
+    rng = random.Random(seed)
+    mp3_pool = MediaPool(mp3_files, rng)
+    image_pool = MediaPool(image_files, rng)
+    # Sorted so removal order (and with it the plan) does not depend on set ordering
+    for item in sorted(set(reserved)):
+        if item in mp3_pool:
+            mp3_pool.remove(item)
+        else:
+            image_pool.remove(item)
+
+    possible = min(len(image_pool), len(mp3_pool) // min_mp3_count) if min_mp3_count > 0 else 0
+    count = possible if max_batches is None else max(0, min(possible, max_batches))
+
+    batches = []
+    batch_index = first_batch_index
+    while len(batches) < count:
+        if batch_index in skip_indices:
+            batch_index += 1
+            continue
+        number = start_number + (batch_index - first_batch_index)
+        if name_list and batch_index < len(name_list):
+            from src.utils import sanitize_filename
+            output_filename = f"{sanitize_filename(name_list[batch_index])}.mp4"
+        else:
+            output_filename = f"{export_name}_{number}.mp4"
+        batches.append({
+            "batch": batch_index,
+            "number": number,
+            "output_filename": output_filename,
+            "mp3s": mp3_pool.draw_many(min_mp3_count),
+            "image": image_pool.draw(),
+        })
+        batch_index += 1
+    return {
+        "seed": seed,
+        "batches": batches,
+        "leftover_mp3s": mp3_pool.remaining(),
+        "leftover_images": image_pool.remaining(),
+    }
@@ -0,0 +1,214 @@
+# This file uses PyQt6
+"""
+Pre-run capacity planning: disk, temp space and wall time for a whole job.
+
+Before the first batch renders, the planner estimates for every planned
+batch its audio length, output bytes (video + audio bitrate, plus
+renditions) and temp bytes (merged audio, shared rendition audio, soundwave
+WAV and movie, song title and cover PNGs). Temp workspaces are removed
+after each batch, so the temp need is the largest single batch; output
+needs add up.
+
+Estimates improve with use: every finished encode records its real output
+size, temp peak and encode speed per render signature (codec, resolution,
+fps, preset, soundwave) in config/capacity_history.json, and those
+measurements replace the bitrate-based guesses.
+
+A job that does not fit is either refused or split: only the leading
+batches that fit are rendered and the remaining inputs stay in the media
+folder for a later run.
+"""
+import os
+import re
+import shutil
+import tempfile
+import threading
+from typing import Dict, List, Optional
+from src.config import PROJECT_ROOT
+from src.logger import logger
+from src.settings_store import atomic_write_json, read_json
+
+CAPACITY_HISTORY_FILE = os.path.join(PROJECT_ROOT, "config", "capacity_history.json")
+CAPACITY_SAFETY_MARGIN = 1.15  # Estimates are inflated by this factor before comparing to free space
+CAPACITY_RESERVE_BYTES = 1024 * 1024 * 1024  # Always leave 1GB free on each disk
+CAPACITY_HISTORY_WEIGHT = 0.3  # Weight of a new measurement in the running average
+DEFAULT_ENCODE_SPEED = 1.0  # Audio seconds encoded per wall second when there is no history
+PER_SONG_TEMP_BYTES = 4 * 1024 * 1024  # Song title and cover PNGs
+SOUNDWAVE_TEMP_BYTES_PER_SECOND = 44100 * 2 * 2 + 2 * 1024 * 1024  # WAV + QuickTime RLE movie
+MERGED_AUDIO_BITRATE = 384000  # merge_mp3s_with_ffmpeg encodes AAC at 384k
+
+
+def parse_bitrate(bitrate: str) -> int:
+    """Bits per second of an ffmpeg bitrate string such as "12M" or "384k" (0 if unparseable)"""
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)([kKmM]?)", str(bitrate).strip())
+    if not match:
+        return 0
+    return int(float(match.group(1)) * {"": 1, "k": 1000, "m": 1000000}[match.group(2).lower()])
+
+
+def format_bytes(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size) < 1024:
+            return f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}TB"
+
+
+def format_duration(seconds: float) -> str:
+    hours, rest = divmod(int(seconds), 3600)
+    return f"{hours}h{rest // 60:02d}m"
+
+
+def media_duration(path: str) -> float:
+    """Length of an audio file in seconds: mutagen when available, ffprobe otherwise"""
+    try:
+        from mutagen import File as MutagenFile
+        audio = MutagenFile(path)
+        if audio is not None and audio.info and audio.info.length:
+            return float(audio.info.length)
+    except ImportError:
+        pass
+    except Exception as e:
+        logger.debug(f"mutagen could not read {path}: {e}")
+    from src.ffmpeg_utils import get_audio_duration
+    return get_audio_duration(path)
+
+
+def free_bytes(path: str) -> Optional[int]:
+    try:
+        return shutil.disk_usage(os.path.abspath(path)).free
+    except OSError as e:
+        logger.warning(f"Could not check free space of {path}: {e}")
+        return None
+
+
+class CapacityHistory:
+    """Measured output size, temp peak and encode speed per render signature"""
+
+    def __init__(self, path: str = CAPACITY_HISTORY_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._data: Optional[Dict[str, dict]] = None
+
+    def _load(self) -> Dict[str, dict]:
+        if self._data is None:
+            data = read_json(self.path) if os.path.exists(self.path) else None
+            self._data = data if isinstance(data, dict) else {}
+        return self._data
+
+    def get(self, signature: str) -> Optional[dict]:
+        with self._lock:
+            return self._load().get(signature)
+
+    def record(self, signature: str, audio_seconds: float, encode_seconds: float,
+               output_bytes: int, temp_bytes: int):
+        """Fold one finished encode into the running averages"""
+        if audio_seconds <= 0 or encode_seconds <= 0:
+            return
+        sample = {
+            "speed": audio_seconds / encode_seconds,
+            "output_bytes_per_second": output_bytes / audio_seconds,
+            "temp_bytes_per_second": temp_bytes / audio_seconds,
+        }
+        with self._lock:
+            data = self._load()
+            entry = data.get(signature)
+            if entry is None:
+                entry = dict(sample, samples=0)
+            else:
+                for key, value in sample.items():
+                    entry[key] = entry.get(key, value) * (1 - CAPACITY_HISTORY_WEIGHT) + value * CAPACITY_HISTORY_WEIGHT
+            entry["samples"] = entry.get("samples", 0) + 1
+            data[signature] = entry
+            atomic_write_json(self.path, data)
+
+
+capacity_history = CapacityHistory()
+
+
+def render_signature(codec: str, resolution: str, fps, preset: str, renditions: List[str],
+                     use_soundwave: bool, frame_rate_mode: str) -> str:
+    return "|".join(str(part) for part in (codec, resolution, fps, preset, ",".join(renditions),
+                                            "soundwave" if use_soundwave else "", frame_rate_mode))
+
+
+def estimate_job(batches: List[dict], signature: str, video_bitrate: str, audio_bitrate: str,
+                 rendition_bitrates: List[str], use_soundwave: bool, output_folder: str,
+                 temp_dir: Optional[str] = None, check_temp: bool = True) -> dict:
+    """
+    Estimate a planned job.
+
+    Returns a dict with the per-batch "audio_seconds", the job totals
+    "output_bytes", "peak_temp_bytes" and "wall_seconds", free space on the
+    output and temp disks, and "fits": how many leading batches fit.
+    """
+    history = capacity_history.get(signature)
+    bits_per_second = parse_bitrate(video_bitrate) + parse_bitrate(audio_bitrate)
+    bits_per_second += sum(parse_bitrate(bitrate) + parse_bitrate(audio_bitrate) for bitrate in rendition_bitrates)
+    if history:
+        output_rate = history["output_bytes_per_second"]
+        temp_rate = history["temp_bytes_per_second"]
+        speed = history["speed"]
+    else:
+        output_rate = bits_per_second / 8
+        temp_rate = MERGED_AUDIO_BITRATE / 8
+        if rendition_bitrates:
+            temp_rate += parse_bitrate(audio_bitrate) / 8
+        if use_soundwave:
+            temp_rate += SOUNDWAVE_TEMP_BYTES_PER_SECOND
+        speed = DEFAULT_ENCODE_SPEED
+
+    audio_seconds, output_bytes, temp_bytes = [], [], []
+    for batch in batches:
+        seconds = sum(media_duration(mp3) for mp3 in batch["mp3s"])
+        audio_seconds.append(seconds)
+        output_bytes.append(int(seconds * output_rate * CAPACITY_SAFETY_MARGIN))
+        song_assets = 0 if history else PER_SONG_TEMP_BYTES * len(batch["mp3s"])
+        temp_bytes.append(int((seconds * temp_rate + song_assets) * CAPACITY_SAFETY_MARGIN))
+
+    temp_dir = temp_dir or tempfile.gettempdir()
+    output_free = free_bytes(output_folder)
+    temp_free = free_bytes(temp_dir) if check_temp else None
+    # Output and temp may share a disk: the temp peak then comes out of the same free space
+    same_disk = output_free is not None and temp_free is not None and _same_device(output_folder, temp_dir)
+    fits, used = 0, 0
+    for out, temp in zip(output_bytes, temp_bytes):
+        if temp_free is not None and temp + CAPACITY_RESERVE_BYTES > temp_free - (used if same_disk else 0):
+            break
+        if output_free is not None and used + out + (temp if same_disk else 0) + CAPACITY_RESERVE_BYTES > output_free:
+            break
+        used += out
+        fits += 1
+
+    return {
+        "batches": len(batches),
+        "audio_seconds": audio_seconds,
+        "output_bytes": sum(output_bytes),
+        "peak_temp_bytes": max(temp_bytes, default=0),
+        "wall_seconds": sum(audio_seconds) / speed if speed > 0 else 0,
+        "from_history": bool(history),
+        "output_free": output_free,
+        "temp_free": temp_free,
+        "temp_dir": temp_dir,
+        "fits": fits,
+    }
+
+
+def _same_device(path_a: str, path_b: str) -> bool:
+    try:
+        return os.stat(path_a).st_dev == os.stat(path_b).st_dev
+    except OSError:
+        return False
+
+
+def describe_estimate(estimate: dict) -> str:
+    source = "measured" if estimate["from_history"] else "bitrate estimate"
+    lines = [
+        f"📐 Capacity plan for {estimate['batches']} batches ({source}):",
+        f"   Output : {format_bytes(estimate['output_bytes'])}"
+        + (f" of {format_bytes(estimate['output_free'])} free" if estimate['output_free'] is not None else ""),
+        f"   Temp   : {format_bytes(estimate['peak_temp_bytes'])} peak"
+        + (f" of {format_bytes(estimate['temp_free'])} free in {estimate['temp_dir']}" if estimate['temp_free'] is not None else ""),
+        f"   Time   : ~{format_duration(estimate['wall_seconds'])} for {format_duration(sum(estimate['audio_seconds']))} of audio",
+    ]
+    return "\n".join(lines)
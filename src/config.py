@@ -3,6 +3,7 @@ import os
 import sys
 import json
 from datetime import datetime
+from src.settings_store import UserSettingsStore
 
 # Project root is one level up from this file
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -168,7 +169,8 @@ STYLE_SHEET = os.path.join(PROJECT_ROOT, "src", "sources", "style.qss") if os.pa
 
 # Video Configuration
 DEFAULT_CODECS = [
-    ("H.264 NVENC", "h264_nvenc")
+    ("H.264 NVENC", "h264_nvenc"),
+    ("H.264 x264", "libx264")
 ]
 
 DEFAULT_RESOLUTIONS = [
@@ -222,6 +224,47 @@ DEFAULT_FFMPEG_PRESETS = [
 ]
 DEFAULT_FFMPEG_PRESET = "slow"
 
+# Output frame rate modes: constant, variable (frames only when the composite changes), or
+# variable frames written as a CFR stream for platforms that require it (same encode, no second pass)
+DEFAULT_FRAME_RATE_MODES = [
+    ("Constant (CFR)", "cfr"),
+    ("Variable (VFR)", "vfr"),
+    ("VFR + CFR Output", "vfr_cfr")
+]
+DEFAULT_FRAME_RATE_MODE = "cfr"
+# Longest a single frame may be held in VFR output before a repeat is emitted
+VFR_MAX_HOLD_SECONDS = 5
+
+# Dry Run modes: full quality, proxy (scaled down, fastest preset), or proxy cut to the layer transitions
+DEFAULT_DRY_RUN_MODES = [
+    ("Full", "full"),
+    ("Proxy", "proxy"),
+    ("Proxy: Transitions", "proxy_transitions")
+]
+DEFAULT_DRY_RUN_MODE = "full"
+DRY_RUN_PROXY_SCALE = 0.5  # Proxy output size relative to the configured resolution
+DRY_RUN_TRANSITION_MARGIN = 2  # Seconds kept before and after each transition
+DRY_RUN_WINDOW_MERGE_GAP = 4  # Transition windows closer than this are rendered as one
+DRY_RUN_MAX_WINDOW_SECONDS = 90  # Total length of the transition windows; later ones are skipped
+
+# Capacity policy when a planned job does not fit on the output or temp disk:
+# render only the batches that fit, refuse the job, or skip the check
+DEFAULT_CAPACITY_POLICIES = [
+    ("Split", "split"),
+    ("Refuse", "refuse"),
+    ("Off", "off")
+]
+DEFAULT_CAPACITY_POLICY = "split"
+
+# Loudness normalization target (integrated LUFS) applied per track when merging audio
+DEFAULT_LOUDNESS_TARGETS = [
+    ("Off", "off"),
+    ("-14 LUFS", "-14"),
+    ("-16 LUFS", "-16"),
+    ("-23 LUFS", "-23")
+]
+DEFAULT_LOUDNESS_TARGET = "off"
+
 # FFmpeg Audio Bitrate Options
 DEFAULT_AUDIO_BITRATE_OPTIONS = [
     ("96 kbps", "96k"),
@@ -271,45 +314,17 @@ def get_config_file_path():
     os.makedirs(config_dir, exist_ok=True)
     return os.path.join(config_dir, "user_settings.json")
 
+# User settings are held in memory; changes are written atomically after a short debounce
+user_settings = UserSettingsStore(get_config_file_path())
+
 def save_layer_order(layer_order):
     """Save layer order to configuration file"""
-    config_file = get_config_file_path()
-    try:
-        # Load existing config or create new one
-        if os.path.exists(config_file):
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-        else:
-            config = {}
-        
-        # Save layer order
-        config['layer_order'] = layer_order
-        
-        # Write back to file
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
-        
-
-        return True
-    except Exception as e:
-
-        return False
+    user_settings.set('layer_order', list(layer_order))
+    return True
 
 def load_layer_order():
     """Load layer order from configuration file"""
-    config_file = get_config_file_path()
-    try:
-        if os.path.exists(config_file):
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                layer_order = config.get('layer_order')
-                if layer_order:
-            
-                    return layer_order
-    except Exception as e:
-        pass
-
-    return None
+    return user_settings.get('layer_order') or None
 
 # FFmpeg bufsize Options
 DEFAULT_BUFSIZE_OPTIONS = [
@@ -345,6 +360,8 @@ def save_template(template_data, template_name):
     try:
         with open(template_file, 'w', encoding='utf-8') as f:
             json.dump(template_data, f, indent=2, ensure_ascii=False)
+        from src.template_store import template_store
+        template_store.invalidate(template_name)
         return True
     except Exception as e:
         print(f"Error saving template: {e}")
@@ -365,22 +382,9 @@ def load_template(template_name):
     return None
 
 def get_available_templates():
-    """Get list of all available templates"""
-    templates_dir = get_templates_dir()
-    templates = []
-    
-    try:
-        if os.path.exists(templates_dir):
-            for file in os.listdir(templates_dir):
-                if file.endswith('.json'):
-                    template_name = file[:-5]  # Remove .json
-                    template_data = load_template(template_name)
-                    if template_data:
-                        templates.append(template_data)
-    except Exception as e:
-        print(f"Error loading templates: {e}")
-    
-    return templates
+    """Get list of all available templates (parsed once, re-read only when a file changes)"""
+    from src.template_store import template_store
+    return template_store.all()
 
 def delete_template(template_name):
     """Delete a template file"""
@@ -390,6 +394,8 @@ def delete_template(template_name):
     try:
         if os.path.exists(template_file):
             os.remove(template_file)
+            from src.template_store import template_store
+            template_store.invalidate(template_name)
             return True
     except Exception as e:
         print(f"Error deleting template {template_name}: {e}")
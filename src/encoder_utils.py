@@ -0,0 +1,312 @@
+# This file uses PyQt6
+"""
+Encoder capability detection and per-encoder argument profiles.
+
+The capability probe asks the ffmpeg binary which video encoders it was built
+with, which pixel formats and private options each one accepts, and whether
+hardware encoders can actually open a session on this machine. Results are
+cached in memory and in config/encoder_capabilities.json, keyed by the ffmpeg
+binary path and its size/mtime, so the probe only runs once per binary.
+"""
+import os
+import json
+import re
+import subprocess
+from typing import Optional, List, Dict
+from src.config import FFMPEG_BINARY, PROJECT_ROOT, VIDEO_SETTINGS
+from src.logger import logger
+from src.settings_store import atomic_write_json
+
+ENCODER_CACHE_FILE = os.path.join(PROJECT_ROOT, "config", "encoder_capabilities.json")
+
+# Encoders we know how to drive, in order of preference when downgrading
+HARDWARE_ENCODERS = ["h264_nvenc", "h264_qsv", "h264_amf", "h264_videotoolbox"]
+SOFTWARE_ENCODERS = ["libx264", "libopenh264", "mpeg4"]
+
+# Preset names each encoder family understands; UI presets are mapped onto these
+_X264_PRESETS = ["ultrafast", "superfast", "veryfast", "faster", "fast", "medium", "slow", "slower", "veryslow"]
+_NVENC_PRESETS = ["fast", "medium", "slow", "p1", "p2", "p3", "p4", "p5", "p6", "p7"]
+_QSV_PRESETS = ["veryfast", "faster", "fast", "medium", "slow", "slower", "veryslow"]
+_AMF_QUALITY = {"fast": "speed", "medium": "balanced", "slow": "quality"}
+# Fastest preset per encoder, used for proxy renders
+_FASTEST_PRESETS = {"libx264": "ultrafast", "h264_nvenc": "p1", "h264_qsv": "veryfast", "h264_amf": "fast"}
+
+# Per-encoder argument profiles.
+#   preset_flag:   option used to pass the speed/quality preset (None = no preset)
+#   presets:       accepted preset values (None = pass through unchanged)
+#   rc_animated:   rate-control args when the background is animated (GIF)
+#   rc_static:     rate-control args when the background is a still image
+#   profile/level: whether -profile:v / -level:v are valid for this encoder
+ENCODER_PROFILES = {
+    "h264_nvenc": {
+        "preset_flag": "-preset",
+        "presets": _NVENC_PRESETS,
+        "rc_animated": ["-rc", "vbr", "-cq", "19"],
+        "rc_static": ["-rc", "cbr"],
+        "profile": True,
+        "level": True,
+    },
+    "libx264": {
+        "preset_flag": "-preset",
+        "presets": _X264_PRESETS,
+        # Capped CRF: -maxrate/-bufsize still bound the bitrate
+        "rc_animated": ["-crf", "19"],
+        "rc_static": [],
+        "profile": True,
+        "level": True,
+    },
+    "h264_qsv": {
+        "preset_flag": "-preset",
+        "presets": _QSV_PRESETS,
+        "rc_animated": [],
+        "rc_static": [],
+        "profile": True,
+        "level": False,
+    },
+    "h264_amf": {
+        "preset_flag": "-quality",
+        "presets": None,
+        "rc_animated": ["-rc", "vbr_peak"],
+        "rc_static": ["-rc", "cbr"],
+        "profile": True,
+        "level": False,
+    },
+    "h264_videotoolbox": {
+        "preset_flag": None,
+        "presets": None,
+        "rc_animated": [],
+        "rc_static": [],
+        "profile": True,
+        "level": False,
+    },
+    "libopenh264": {
+        "preset_flag": None,
+        "presets": None,
+        "rc_animated": [],
+        "rc_static": [],
+        "profile": False,
+        "level": False,
+    },
+    "mpeg4": {
+        "preset_flag": None,
+        "presets": None,
+        "rc_animated": ["-q:v", "3"],
+        "rc_static": [],
+        "profile": False,
+        "level": False,
+    },
+}
+
+# Options that belong to every encoder (AVCodecContext) rather than a private class
+_GENERIC_OPTIONS = {"b", "maxrate", "bufsize", "g", "bf", "profile", "level", "pix_fmt", "q", "qscale"}
+
+_capabilities_cache: Dict[str, dict] = {}
+_reported_fallbacks = set()
+
+
+def _binary_fingerprint(ffmpeg_binary: str) -> Optional[str]:
+    """Identify an ffmpeg build by path, size and modification time"""
+    try:
+        st = os.stat(ffmpeg_binary)
+    except OSError:
+        return None
+    return f"{os.path.abspath(ffmpeg_binary)}|{st.st_size}|{int(st.st_mtime)}"
+
+
+def _run_ffmpeg(ffmpeg_binary: str, args: List[str], timeout: float = 15) -> Optional[subprocess.CompletedProcess]:
+    try:
+        return subprocess.run(
+            [ffmpeg_binary, "-hide_banner"] + args,
+            capture_output=True, text=True, timeout=timeout,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.warning(f"Encoder probe failed for {args}: {e}")
+        return None
+
+
+def _list_video_encoders(ffmpeg_binary: str) -> List[str]:
+    """Names of all video encoders compiled into the binary"""
+    result = _run_ffmpeg(ffmpeg_binary, ["-encoders"])
+    if result is None or result.returncode != 0:
+        return []
+    encoders = []
+    for line in result.stdout.splitlines():
+        # Lines look like " V....D libx264  libx264 H.264 / AVC ..."
+        match = re.match(r"^\s*V[A-Z.]{5}\s+(\S+)", line)
+        if match and match.group(1) != "=":
+            encoders.append(match.group(1))
+    return encoders
+
+
+def _describe_encoder(ffmpeg_binary: str, encoder: str) -> dict:
+    """Supported pixel formats and private option names for one encoder"""
+    info = {"pix_fmts": [], "options": []}
+    result = _run_ffmpeg(ffmpeg_binary, ["-h", f"encoder={encoder}"])
+    if result is None or result.returncode != 0:
+        return info
+    options = set()
+    for line in result.stdout.splitlines():
+        if "Supported pixel formats:" in line:
+            info["pix_fmts"] = line.split(":", 1)[1].split()
+            continue
+        match = re.match(r"^\s{2,}-([\w:-]+)\s", line)
+        if match:
+            options.add(match.group(1))
+    info["options"] = sorted(options)
+    return info
+
+
+def _encoder_opens(ffmpeg_binary: str, encoder: str) -> bool:
+    """Encode a few tiny frames to confirm a hardware encoder is usable here"""
+    result = _run_ffmpeg(ffmpeg_binary, [
+        "-loglevel", "error",
+        "-f", "lavfi", "-i", "color=c=black:s=256x256:r=30:d=0.2",
+        "-c:v", encoder, "-pix_fmt", "yuv420p", "-f", "null", "-",
+    ], timeout=20)
+    return result is not None and result.returncode == 0
+
+
+def _load_disk_cache() -> dict:
+    try:
+        with open(ENCODER_CACHE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        return {}
+
+
+def _save_disk_cache(data: dict) -> None:
+    if not atomic_write_json(ENCODER_CACHE_FILE, data):
+        logger.warning("Could not write encoder capability cache")
+
+
+def probe_encoder_capabilities(ffmpeg_binary: str = FFMPEG_BINARY, refresh: bool = False) -> dict:
+    """
+    Detect usable video encoders for an ffmpeg binary.
+
+    Returns:
+        dict mapping encoder name -> {"pix_fmts": [...], "options": [...]},
+        containing only encoders that are both compiled in and working.
+        Empty dict if ffmpeg cannot be run.
+    """
+    fingerprint = _binary_fingerprint(ffmpeg_binary)
+    if fingerprint is None:
+        return {}
+    if not refresh and fingerprint in _capabilities_cache:
+        return _capabilities_cache[fingerprint]
+
+    disk_cache = _load_disk_cache()
+    if not refresh and fingerprint in disk_cache:
+        _capabilities_cache[fingerprint] = disk_cache[fingerprint]
+        return disk_cache[fingerprint]
+
+    compiled = set(_list_video_encoders(ffmpeg_binary))
+    capabilities = {}
+    for encoder in HARDWARE_ENCODERS + SOFTWARE_ENCODERS:
+        if encoder not in compiled:
+            continue
+        if encoder in HARDWARE_ENCODERS and not _encoder_opens(ffmpeg_binary, encoder):
+            logger.info(f"Encoder {encoder} is compiled in but not usable on this machine")
+            continue
+        capabilities[encoder] = _describe_encoder(ffmpeg_binary, encoder)
+
+    _capabilities_cache[fingerprint] = capabilities
+    # Only keep entries for binaries that still exist
+    disk_cache = {k: v for k, v in disk_cache.items() if os.path.exists(k.split("|", 1)[0])}
+    disk_cache[fingerprint] = capabilities
+    _save_disk_cache(disk_cache)
+    logger.info(f"Usable video encoders: {', '.join(capabilities) or 'none'}")
+    return capabilities
+
+
+def resolve_encoder(codec: str, ffmpeg_binary: str = FFMPEG_BINARY) -> str:
+    """Return codec if usable, otherwise the best working software encoder"""
+    capabilities = probe_encoder_capabilities(ffmpeg_binary)
+    if not capabilities or codec in capabilities:
+        # Nothing known about this binary: leave the choice to ffmpeg
+        return codec
+    for fallback in SOFTWARE_ENCODERS + HARDWARE_ENCODERS:
+        if fallback in capabilities:
+            if codec not in _reported_fallbacks:
+                _reported_fallbacks.add(codec)
+                print(f"⚠️ Encoder {codec} is not available, falling back to {fallback}")
+                logger.warning(f"Encoder {codec} unavailable, using {fallback}")
+            return fallback
+    return codec
+
+
+def _map_preset(encoder: str, preset: str) -> Optional[str]:
+    profile = ENCODER_PROFILES.get(encoder)
+    if profile is None:
+        return preset
+    if encoder == "h264_amf":
+        return _AMF_QUALITY.get(preset, "balanced")
+    presets = profile["presets"]
+    if presets is None:
+        return None
+    if preset in presets:
+        return preset
+    return "medium" if "medium" in presets else presets[0]
+
+
+def get_fastest_preset(codec: str, ffmpeg_binary: str = FFMPEG_BINARY) -> str:
+    """Speed-first preset for the encoder that will actually be used"""
+    return _FASTEST_PRESETS.get(resolve_encoder(codec, ffmpeg_binary), "fast")
+
+
+def _supported(flag: str, options: set) -> bool:
+    """Whether a private option flag is accepted by the encoder"""
+    if not options:
+        return True
+    name = flag.lstrip("-").split(":", 1)[0]
+    return name in _GENERIC_OPTIONS or name in options
+
+
+def get_video_encoder_args(codec: str, preset: str, animated_background: Optional[bool],
+                           ffmpeg_binary: str = FFMPEG_BINARY) -> List[str]:
+    """
+    Build the video encoder arguments for a codec.
+
+    Args:
+        codec: Requested encoder name (e.g. "h264_nvenc", "libx264")
+        preset: UI preset ("fast", "medium", "slow")
+        animated_background: True for a GIF background, False for a still PNG,
+            None to leave rate control at the encoder default
+
+    Returns:
+        List of ffmpeg arguments starting with "-c:v", containing only flags
+        valid for the encoder that will actually be used.
+    """
+    encoder = resolve_encoder(codec, ffmpeg_binary)
+    capabilities = probe_encoder_capabilities(ffmpeg_binary)
+    info = capabilities.get(encoder, {})
+    options = set(info.get("options", []))
+    profile = ENCODER_PROFILES.get(encoder)
+
+    args = ["-c:v", encoder]
+    if profile is None:
+        # Unknown encoder: keep the historical generic flags only
+        return args + ["-preset", preset]
+
+    mapped_preset = _map_preset(encoder, preset)
+    if profile["preset_flag"] and mapped_preset and _supported(profile["preset_flag"], options):
+        args.extend([profile["preset_flag"], mapped_preset])
+
+    if animated_background is None:
+        rc_args = []
+    else:
+        rc_args = profile["rc_animated"] if animated_background else profile["rc_static"]
+    for i in range(0, len(rc_args), 2):
+        if _supported(rc_args[i], options):
+            args.extend(rc_args[i:i + 2])
+
+    if profile["profile"]:
+        args.extend(["-profile:v", VIDEO_SETTINGS["profile"]])
+    if profile["level"]:
+        args.extend(["-level:v", VIDEO_SETTINGS["level"]])
+
+    pix_fmts = info.get("pix_fmts", [])
+    if pix_fmts and VIDEO_SETTINGS["pixel_format"] not in pix_fmts:
+        fallback_fmt = "nv12" if "nv12" in pix_fmts else pix_fmts[0]
+        args.extend(["-pix_fmt", fallback_fmt])
+    return args
@@ -6,13 +6,22 @@ import tempfile
 import time
 import re
 import sys
-from typing import Optional, List, Tuple
-from src.config import FFMPEG_BINARY, FFPROBE_BINARY, VIDEO_SETTINGS
+from typing import Optional, List, Tuple, Union
+from src.config import (FFMPEG_BINARY, FFPROBE_BINARY, VIDEO_SETTINGS, VFR_MAX_HOLD_SECONDS, DRY_RUN_TRANSITION_MARGIN,
+                        DRY_RUN_WINDOW_MERGE_GAP, DRY_RUN_MAX_WINDOW_SECONDS)
 from src.logger import logger
 from src.utils import has_enough_disk_space, create_temp_file
+from src.encoder_utils import get_video_encoder_args, get_fastest_preset
+from src.overlay_cache import get_cached_overlay
+from src.layer_timeline import LayerTimeline
+from src.resource_governor import resource_governor
+from src.metrics import metrics
+
+TRANSITIONS_WINDOW = "transitions"  # time_window value: short windows around the layer transitions
 
 def get_audio_duration(file_path: str) -> float:
     """Get audio duration using ffprobe"""
+    start = time.perf_counter()
     try:
         cmd = [
             FFPROBE_BINARY,
@@ -22,50 +31,76 @@ def get_audio_duration(file_path: str) -> float:
             file_path
         ]
         
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result = resource_governor.run(cmd, capture_output=True, text=True, check=True)
         data = json.loads(result.stdout)
         return float(data['format']['duration'])
     except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError, ValueError) as e:
         logger.error(f"Error getting duration for {file_path}: {e}")
         return 0.0
+    finally:
+        # Probes are too frequent to log one by one
+        metrics.observe_stage("probe", time.perf_counter() - start)
+
+MERGED_AUDIO_SAMPLE_RATE = 44100  # Every track is decoded to this rate so the concat filter can join them
+MERGED_AUDIO_CHANNELS = 2
+_TRACK_SAMPLES_PATTERN = re.compile(r'\[[^\]]*sctrack(\d+)[^\]]*\] n_samples: (\d+)')
+
+def merge_mp3s_with_ffmpeg(input_files: list, output_file: str,
+                           gains: Optional[List[float]] = None) -> Optional[List[float]]:
+    """
+    Decode and join MP3 files in one ffmpeg process, encoding AAC/M4A.
+
+    Each file is a separate input, so the decoder applies its encoder delay
+    and padding (gapless playback) instead of the concat demuxer splicing raw
+    frames. A volumedetect per track counts the decoded samples on the way,
+    which gives sample-accurate track lengths without probing.
+
+    Args:
+        input_files: Tracks in play order
+        output_file: Merged M4A path
+        gains: Optional gain in dB per track (loudness normalization, see src.loudness)
 
-def merge_mp3s_with_ffmpeg(input_files: list, output_file: str) -> bool:
-    """Merge multiple MP3 files using ffmpeg and convert to AAC/M4A format"""
+    Returns:
+        Length in seconds of each input track, or None if the merge failed
+    """
+    if not input_files:
+        return None
+    cmd = [FFMPEG_BINARY, "-hide_banner", "-nostats"]
+    for file_path in input_files:
+        cmd.extend(["-i", file_path])
+    chains = []
+    for i in range(len(input_files)):
+        gain = gains[i] if gains and i < len(gains) else 0.0
+        volume = f"volume={gain:.2f}dB," if abs(gain) >= 0.01 else ""
+        chains.append(
+            f"[{i}:a]aresample={MERGED_AUDIO_SAMPLE_RATE},"
+            f"aformat=sample_fmts=fltp:channel_layouts=stereo,{volume}volumedetect@sctrack{i}[t{i}]"
+        )
+    inputs = "".join(f"[t{i}]" for i in range(len(input_files)))
+    filter_graph = ";".join(chains) + f";{inputs}concat=n={len(input_files)}:v=0:a=1[aout]"
+    cmd.extend([
+        "-filter_complex", filter_graph,
+        "-map", "[aout]",
+        "-c:a", "aac",        # Convert to AAC codec
+        "-b:a", "384k",       # High quality bitrate matching video settings
+        output_file,
+        "-y"  # Overwrite output file
+    ])
     try:
-        # Create a file list for ffmpeg
-        file_list_path = create_temp_file(suffix='.txt')
-        with open(file_list_path, 'w') as f:
-            for file_path in input_files:
-                f.write(f"file '{file_path}'\n")
-        
-        # Use ffmpeg to concatenate and convert to AAC
-        cmd = [
-            FFMPEG_BINARY,
-            "-f", "concat",
-            "-safe", "0",
-            "-i", file_list_path,
-            "-c:a", "aac",        # Convert to AAC codec
-            "-b:a", "384k",       # High quality bitrate matching video settings
-            output_file,
-            "-y"  # Overwrite output file
-        ]
-        
-        subprocess.run(cmd, check=True, capture_output=True)
-        
-        # Clean up file list
-        if file_list_path and os.path.exists(file_list_path):
-            try:
-                os.unlink(file_list_path)
-            except FileNotFoundError:
-                logger.warning(f"Temp file list {file_list_path} not found for removal.")
-            except PermissionError:
-                logger.warning(f"No permission to remove temp file list {file_list_path}.")
-            except OSError as e:
-                logger.warning(f"OS error removing temp file list {file_list_path}: {e}")
-        return True
-    except (subprocess.CalledProcessError, OSError, ValueError) as e:
+        result = resource_governor.run(cmd, check=True, capture_output=True, text=True)
+    except subprocess.CalledProcessError as e:
+        logger.error(f"Error merging MP3s: {e} {(e.stderr or '').strip()[-500:]}")
+        return None
+    except (OSError, ValueError) as e:
         logger.error(f"Error merging MP3s: {e}")
-        return False
+        return None
+
+    samples = {int(index): int(count) for index, count in _TRACK_SAMPLES_PATTERN.findall(result.stderr or "")}
+    if len(samples) != len(input_files):
+        # Should not happen with a working ffmpeg; fall back to probing the sources
+        logger.warning(f"Sample counts missing for {len(input_files) - len(samples)} merged tracks, probing instead")
+        return [get_audio_duration(file_path) for file_path in input_files]
+    return [samples[i] / MERGED_AUDIO_CHANNELS / MERGED_AUDIO_SAMPLE_RATE for i in range(len(input_files))]
 
 def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
     image_path: str, 
@@ -229,9 +264,26 @@ def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
     # --- Add layer order parameter ---
     layer_order: Optional[List[str]] = None,
     # --- Add filter complex alt mode parameter ---
-    filter_complex_alt_mode: bool = False
+    filter_complex_alt_mode: bool = False,
+    # --- Frame rate mode: "cfr", "vfr", or "vfr_cfr" (VFR frames written as a CFR stream) ---
+    frame_rate_mode: str = "cfr",
+    # --- Add preview parameter: render only the frame at this time (seconds) to output_path as an image ---
+    preview_time: Optional[float] = None,
+    # --- Add proxy parameters (fast Dry Run): output scale factor and (start, duration) window in seconds ---
+    # --- (or TRANSITIONS_WINDOW for short windows around the layer transitions on the timeline) ---
+    proxy_scale: Optional[float] = None,
+    time_window: Optional[Union[Tuple[float, float], str]] = None,
+    # --- Add renditions parameter: extra outputs from the same composite pass ---
+    # --- (dicts with output_path, resolution "WxH" and optional video_bitrate / maxrate / bufsize) ---
+    renditions: Optional[List[dict]] = None,
+    # --- Add audio duration parameter: length of audio_path when the caller already knows it (probed if None) ---
+    audio_duration: Optional[float] = None
 ) -> Tuple[bool, Optional[str]]:
+    # Arguments of this call, so transition windows can be rendered as separate segments
+    render_args = dict(locals())
     temp_png_path = None
+    shared_audio_path = None
+    encode_slot = None
     try:
         # If input is JPG, convert to PNG using ffmpeg
         if image_path.lower().endswith('.jpg') or image_path.lower().endswith('.jpeg'):
@@ -242,7 +294,7 @@ def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
                 '-i', image_path,
                 temp_png_path
             ]
-            result = subprocess.run(convert_cmd, capture_output=True, text=True)
+            result = resource_governor.run(convert_cmd, capture_output=True, text=True)
             if result.returncode != 0:
                 msg = f"Error converting JPG to PNG: {result.stderr}"
                 logger.error(msg)
@@ -273,6 +325,24 @@ def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
         else:
             cmd.insert(1, "-loop")
             cmd.insert(2, "1")
+        # Animated overlays come from the pre-transcoded cache at their final size (see src.overlay_cache).
+        # Overlays 4-7 only accept GIF/PNG inputs, so they keep their source files.
+        if use_intro:
+            intro_path = get_cached_overlay(intro_path, intro_size_percent)
+        if use_overlay:
+            overlay1_path = get_cached_overlay(overlay1_path, overlay1_size_percent)
+        if use_overlay2:
+            overlay2_path = get_cached_overlay(overlay2_path, overlay2_size_percent)
+        if use_overlay3:
+            overlay3_path = get_cached_overlay(overlay3_path, overlay3_size_percent)
+        if use_overlay8:
+            overlay8_path = get_cached_overlay(overlay8_path, overlay8_size_percent)
+        if use_overlay9:
+            overlay9_path = get_cached_overlay(overlay9_path, overlay9_size_percent)
+        if use_overlay10:
+            overlay10_path = get_cached_overlay(overlay10_path, overlay10_size_percent)
+        if use_frame_mp3cover:
+            frame_mp3cover_path = get_cached_overlay(frame_mp3cover_path, frame_mp3cover_size_percent)
         ext1 = os.path.splitext(overlay1_path)[1].lower() if overlay1_path else ''
         ext2 = os.path.splitext(overlay2_path)[1].lower() if overlay2_path else ''
         ext3 = os.path.splitext(overlay3_path)[1].lower() if overlay3_path else ''
@@ -457,6 +527,11 @@ def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
             soundwave_idx = input_idx
             input_idx += 1
         # --- End Song Title Overlay Filter Graph ---
+        # Every layer's visible and transition windows; enable expressions and the
+        # proxy transitions window are taken from it
+        if audio_duration is None:
+            audio_duration = get_audio_duration(audio_path)
+        timeline = LayerTimeline(audio_duration)
         # Build filter graph with correct indices
         overlays_present = use_intro or use_overlay or use_overlay2 or use_overlay3 or use_overlay4 or use_overlay5 or use_overlay6 or use_overlay7 or use_overlay8 or use_overlay9 or use_overlay10 or use_frame_box or use_frame_mp3cover or bool(extra_overlays) or use_soundwave_overlay
         if overlays_present:
@@ -828,6 +903,9 @@ def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
                                     stream = data['streams'][0]
                                     actual_width = int(stream.get('width', 200))
                                     actual_height = int(stream.get('height', 200))
+                                    # Preprocessed (cached) files are already at their final size
+                                    if os.path.basename(overlay_path).startswith("supercut_"):
+                                        return actual_width, actual_height
                                     # Apply size_percent for video/GIF files
                                     scaled_width = int(actual_width * (size_percent / 100))
                                     scaled_height = int(actual_height * (size_percent / 100))
@@ -932,16 +1010,20 @@ def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
                         hold_duration = 5
                     fadein_end = effect_time + fadein_duration
                     fadeout_start = fadein_end + hold_duration
+                    timeline.add_transition(label, effect_time, fadein_duration)
+                    timeline.add_transition(label, fadeout_start, fadeout_duration)
                     if scale_expr != "iw:ih":
                         chain += f"fade=t=in:st={effect_time}:d={fadein_duration}{fade_alpha},fade=t=out:st={fadeout_start}:d={fadeout_duration}{fade_alpha},"
                     else:
                         chain += f"fade=t=in:st={effect_time}:d={fadein_duration}{fade_alpha},fade=t=out:st={fadeout_start}:d={fadeout_duration}{fade_alpha}"
                 elif effect == "fadein":
+                    timeline.add_transition(label, effect_time, 1)
                     if scale_expr != "iw:ih":
                         chain += f"fade=t=in:st={effect_time}:d=1{fade_alpha},"
                     else:
                         chain += f"fade=t=in:st={effect_time}:d=1{fade_alpha}"
                 elif effect == "fadeout":
+                    timeline.add_transition(label, effect_time, 1)
                     if scale_expr != "iw:ih":
                         chain += f"fade=t=out:st={effect_time}:d=1{fade_alpha},"
                     else:
@@ -975,6 +1057,7 @@ def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
                 chain += ","
                 fade_alpha = ":alpha=1" if ext == ".png" else ""
                 if effect == "fadein":
+                    timeline.add_transition(label, start_at, 1)
                     # Add comma only if scale operation will follow
                     if scale_expr != "iw:ih":
                         chain += f"fade=t=in:st={start_at}:d=1{fade_alpha},"
@@ -986,6 +1069,7 @@ def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
                         fadeout_start = start_at + duration - 1.5
                     else:
                         fadeout_start = start_at + 6 - 1.5  # Default 6 seconds
+                    timeline.add_transition(label, fadeout_start, 1.5)
                     # Add comma only if scale operation will follow
                     if scale_expr != "iw:ih":
                         chain += f"fade=t=out:st={fadeout_start}:d=1.5{fade_alpha},"
@@ -997,6 +1081,8 @@ def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
                         fadeout_start = start_at + duration - 1.5
                     else:
                         fadeout_start = start_at + 6 - 1.5  # Default 6 seconds
+                    timeline.add_transition(label, start_at, 1.5)
+                    timeline.add_transition(label, fadeout_start, 1.5)
                     # Add comma only if scale operation will follow
                     if scale_expr != "iw:ih":
                         chain += f"fade=t=in:st={start_at}:d=1.5{fade_alpha},fade=t=out:st={fadeout_start}:d=1.5{fade_alpha},"
@@ -1160,10 +1246,14 @@ def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
                             hold_duration = max(0, duration - fadein_duration - fadeout_duration)
                             fadein_end = start + fadein_duration
                             fadeout_start = fadein_end + hold_duration
+                            timeline.add_transition(label, start, fadein_duration)
+                            timeline.add_transition(label, fadeout_start, fadeout_duration)
                             chain += f",fade=t=in:st={start}:d={fadein_duration}{fade_alpha},fade=t=out:st={fadeout_start}:d={fadeout_duration}{fade_alpha}"
                         elif effect == "fadein":
+                            timeline.add_transition(label, start, 1)
                             chain += f",fade=t=in:st={start}:d=1{fade_alpha}"
                         elif effect == "fadeout":
+                            timeline.add_transition(label, start, 1)
                             chain += f",fade=t=out:st={start}:d=1{fade_alpha}"
                         elif effect == "zoompan":
                             chain += f",zoompan=z='min(1.5,zoom+0.005)':d=1:x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)'"
@@ -1194,10 +1284,14 @@ def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
                             hold_duration = max(0, duration - fadein_duration - fadeout_duration)
                             fadein_end = start + fadein_duration
                             fadeout_start = fadein_end + hold_duration
+                            timeline.add_transition(label, start, fadein_duration)
+                            timeline.add_transition(label, fadeout_start, fadeout_duration)
                             chain += f",fade=t=in:st={start}:d={fadein_duration}{fade_alpha},fade=t=out:st={fadeout_start}:d={fadeout_duration}{fade_alpha}"
                         elif effect == "fadein":
+                            timeline.add_transition(label, start, 1)
                             chain += f",fade=t=in:st={start}:d=1{fade_alpha}"
                         elif effect == "fadeout":
+                            timeline.add_transition(label, start, 1)
                             chain += f",fade=t=out:st={start}:d=1{fade_alpha}"
                         elif effect == "zoompan":
                             chain += f",zoompan=z='min(1.5,zoom+0.005)':d=1:x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)'"
@@ -1363,6 +1457,23 @@ def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
                              'overlay6', 'overlay7', 'overlay8', 'overlay9', 'overlay10',
                              'intro', 'frame_box', 'frame_mp3cover', 'mp3_cover_overlay', 'song_titles', 'soundwave']
             
+            # Visible windows of every layer in use
+            for layer_id, config in layer_configs.items():
+                if not config.get('filter'):
+                    continue
+                if config.get('intervals'):
+                    timeline.add_intervals(layer_id, config['intervals'])
+                elif config['duration_control'] is None:
+                    timeline.add(layer_id)
+                elif config['duration_control']:
+                    timeline.add(layer_id, config['start_time'] or 0)
+                else:
+                    timeline.add(layer_id, config['start_time'], config['start_time'] + config['duration'])
+            for label, start, duration, _, _ in song_title_labels + mp3_cover_labels:
+                timeline.add(label, start, start + duration)
+            if use_soundwave_overlay and soundwave_idx is not None:
+                timeline.add('soundwave', soundwave_start_time)
+
             # Build filter graph with proper 2-grouping: input processing first, then overlay applications
             # But ensure the order within each group matches the overlay application order
             input_processing_filters = []
@@ -1409,37 +1520,7 @@ def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
                     input_processing_filters.append(config['filter'])
                     
                     # Prepare overlay application
-                    if layer_id == 'overlay8' and config.get('intervals'):
-                        # Build combined enable expression for all intervals
-                        intervals = config['intervals']
-                        enable_expr = "+".join([
-                            f"between(t,{start},{start+duration})" for start, duration in intervals if duration > 0
-                        ])
-                        overlay_application_filters.append((f"{config['overlay']}:enable='{enable_expr}'[tmp_{layer_id}]", f"tmp_{layer_id}"))
-                    elif layer_id == 'overlay9' and config.get('intervals'):
-                        # Build combined enable expression for all intervals
-                        intervals = config['intervals']
-                        enable_expr = "+".join([
-                            f"between(t,{start},{start+duration})" for start, duration in intervals if duration > 0
-                        ])
-                        overlay_application_filters.append((f"{config['overlay']}:enable='{enable_expr}'[tmp_{layer_id}]", f"tmp_{layer_id}"))
-                    elif layer_id == 'overlay10' and config.get('intervals'):
-                        # Build combined enable expression for all intervals
-                        intervals = config['intervals']
-                        enable_expr = "+".join([
-                            f"between(t,{start},{start+duration})" for start, duration in intervals if duration > 0
-                        ])
-                        overlay_application_filters.append((f"{config['overlay']}:enable='{enable_expr}'[tmp_{layer_id}]", f"tmp_{layer_id}"))
-                    elif config['duration_control'] is None:
-                        # No duration control (like overlay3)
-                        overlay_application_filters.append((f"{config['overlay']}[tmp_{layer_id}]", None))
-                    elif config['duration_control']:
-                        # Full duration
-                        overlay_application_filters.append((f"{config['overlay']}:enable='gte(t,{config['start_time']})'[tmp_{layer_id}]", f"tmp_{layer_id}"))
-                    else:
-                        # Time-based enable expressions
-                        end_time = config['start_time'] + config['duration']
-                        overlay_application_filters.append((f"{config['overlay']}:enable='between(t,{config['start_time']},{end_time})'[tmp_{layer_id}]", f"tmp_{layer_id}"))
+                    overlay_application_filters.append((f"{config['overlay']}{timeline.enable_option(layer_id)}[tmp_{layer_id}]", f"tmp_{layer_id}"))
             
             # Build the filter graph based on the selected approach
             if filter_complex_alt_mode:
@@ -1463,11 +1544,9 @@ def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
                         # Apply song title overlays immediately
                         if song_title_labels:
                             for i, (label, start, duration, x_expr, y_expr) in enumerate(song_title_labels):
-                                end_time = start + duration
-                                enable_expr = f"between(t,{start},{end_time})"
                                 is_last_song = (i == len(song_title_labels)-1) and not mp3_cover_chains and not (use_soundwave_overlay and soundwave_idx is not None)
                                 out_label = f"songtmp{i+1}" if i < len(song_title_labels)-1 else "songtmp_final"
-                                filter_graph += f";{last_label}[{label}]overlay={x_expr}:{y_expr}:enable='{enable_expr}'[{out_label}]"
+                                filter_graph += f";{last_label}[{label}]overlay={x_expr}:{y_expr}{timeline.enable_option(label)}[{out_label}]"
                                 last_label = f"[{out_label}]"
                         continue
                     
@@ -1478,14 +1557,12 @@ def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
                         # Apply MP3 cover overlays immediately
                         if mp3_cover_labels:
                             for i, (label, start, duration, x_expr, y_expr) in enumerate(mp3_cover_labels):
-                                end_time = start + duration
-                                enable_expr = f"between(t,{start},{end_time})"
                                 current_layer_index = final_order.index('mp3_cover_overlay')
                                 layers_after_mp3 = final_order[current_layer_index + 1:]
                                 has_layers_after = any(layer in layers_after_mp3 for layer in ['song_titles', 'soundwave'])
                                 is_last_mp3 = (i == len(mp3_cover_labels)-1) and not has_layers_after
                                 out_label = f"mp3covertmp{i+1}" if i < len(mp3_cover_labels)-1 else "mp3covertmp_final"
-                                filter_graph += f";{last_label}[{label}]overlay={x_expr}:{y_expr}:enable='{enable_expr}'[{out_label}]"
+                                filter_graph += f";{last_label}[{label}]overlay={x_expr}:{y_expr}{timeline.enable_option(label)}[{out_label}]"
                                 last_label = f"[{out_label}]"
                         continue
                     
@@ -1497,7 +1574,7 @@ def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
                         current_layer_index = final_order.index('soundwave')
                         is_last_layer = (current_layer_index == len(final_order) - 1)
                         out_label = "soundwave_final"
-                        filter_graph += f";{last_label}[soundwave]overlay={ox_soundwave}:{oy_soundwave}:enable='gte(t,{soundwave_start_time})'[{out_label}]"
+                        filter_graph += f";{last_label}[soundwave]overlay={ox_soundwave}:{oy_soundwave}{timeline.enable_option('soundwave')}[{out_label}]"
                         last_label = f"[{out_label}]"
                         continue
                     
@@ -1507,50 +1584,12 @@ def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
                         filter_graph += f";{config['filter']}"
                         
                         # Apply overlay immediately
-                        if layer_id == 'overlay8' and config.get('intervals'):
-                            # Build combined enable expression for all intervals
-                            intervals = config['intervals']
-                            enable_expr = "+".join([
-                                f"between(t,{start},{start+duration})" for start, duration in intervals if duration > 0
-                            ])
-                            input_label = config['overlay'].split(']')[0] + ']' if ']' in config['overlay'] else config['overlay']
-                            output_label = f"tmp_{layer_id}"
-                            overlay_params = config['overlay'].split('overlay=')[1]
-                            filter_graph += f";{last_label}{input_label}overlay={overlay_params}:enable='{enable_expr}'[{output_label}]"
-                            last_label = f"[{output_label}]"
-                        elif layer_id == 'overlay9' and config.get('intervals'):
-                            # Build combined enable expression for all intervals
-                            intervals = config['intervals']
-                            enable_expr = "+".join([
-                                f"between(t,{start},{start+duration})" for start, duration in intervals if duration > 0
-                            ])
-                            input_label = config['overlay'].split(']')[0] + ']' if ']' in config['overlay'] else config['overlay']
-                            output_label = f"tmp_{layer_id}"
-                            overlay_params = config['overlay'].split('overlay=')[1]
-                            filter_graph += f";{last_label}{input_label}overlay={overlay_params}:enable='{enable_expr}'[{output_label}]"
-                            last_label = f"[{output_label}]"
-                        elif config['duration_control'] is None:
-                            # No duration control (like overlay3)
-                            # Extract the input label from the overlay filter (e.g., "[ol1]" from "[ol1]overlay={ox1}:{oy1}")
-                            input_label = config['overlay'].split(']')[0] + ']' if ']' in config['overlay'] else config['overlay']
-                            output_label = f"tmp_{layer_id}"
-                            filter_graph += f";{last_label}{input_label}overlay={config['overlay'].split('overlay=')[1]}[{output_label}]"
-                            last_label = f"[{output_label}]"
-                        elif config['duration_control']:
-                            # Full duration
-                            input_label = config['overlay'].split(']')[0] + ']' if ']' in config['overlay'] else config['overlay']
-                            output_label = f"tmp_{layer_id}"
-                            overlay_params = config['overlay'].split('overlay=')[1]
-                            filter_graph += f";{last_label}{input_label}overlay={overlay_params}:enable='gte(t,{config['start_time']})'[{output_label}]"
-                            last_label = f"[{output_label}]"
-                        else:
-                            # Time-based enable expressions
-                            end_time = config['start_time'] + config['duration']
-                            input_label = config['overlay'].split(']')[0] + ']' if ']' in config['overlay'] else config['overlay']
-                            output_label = f"tmp_{layer_id}"
-                            overlay_params = config['overlay'].split('overlay=')[1]
-                            filter_graph += f";{last_label}{input_label}overlay={overlay_params}:enable='between(t,{config['start_time']},{end_time})'[{output_label}]"
-                            last_label = f"[{output_label}]"
+                        # Extract the input label from the overlay filter (e.g., "[ol1]" from "[ol1]overlay={ox1}:{oy1}")
+                        input_label = config['overlay'].split(']')[0] + ']' if ']' in config['overlay'] else config['overlay']
+                        output_label = f"tmp_{layer_id}"
+                        overlay_params = config['overlay'].split('overlay=')[1]
+                        filter_graph += f";{last_label}{input_label}overlay={overlay_params}{timeline.enable_option(layer_id)}[{output_label}]"
+                        last_label = f"[{output_label}]"
                 
                 # Handle final output for alternative mode - always add format filter
                 if last_label != "[vout_final]":
@@ -1579,30 +1618,22 @@ def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
                     # Handle song titles (special case)
                     if layer_id == 'song_titles' and song_title_labels:
                         for i, (label, start, duration, x_expr, y_expr) in enumerate(song_title_labels):
-                            # 🚀 PRE-CALCULATION OPTIMIZATION: Time-based enable expressions
-                            # Pre-calculate end time instead of real-time addition
-                            end_time = start + duration
-                            enable_expr = f"between(t,{start},{end_time})"
                             is_last_song = (i == len(song_title_labels)-1) and not mp3_cover_chains and not (use_soundwave_overlay and soundwave_idx is not None)
                             out_label = f"songtmp{i+1}" if i < len(song_title_labels)-1 else "songtmp_final"
-                            filter_graph += f";{last_label}[{label}]overlay={x_expr}:{y_expr}:enable='{enable_expr}'[{out_label}]"
+                            filter_graph += f";{last_label}[{label}]overlay={x_expr}:{y_expr}{timeline.enable_option(label)}[{out_label}]"
                             last_label = f"[{out_label}]"
                         continue
                     
                     # Handle MP3 cover overlays (special case)
                     if layer_id == 'mp3_cover_overlay' and mp3_cover_labels:
                         for i, (label, start, duration, x_expr, y_expr) in enumerate(mp3_cover_labels):
-                            # 🚀 PRE-CALCULATION OPTIMIZATION: Time-based enable expressions
-                            # Pre-calculate end time instead of real-time addition
-                            end_time = start + duration
-                            enable_expr = f"between(t,{start},{end_time})"
                             # Check if this is the last MP3 cover AND if there are layers after mp3_cover_overlay in the order
                             current_layer_index = final_order.index('mp3_cover_overlay')
                             layers_after_mp3 = final_order[current_layer_index + 1:]
                             has_layers_after = any(layer in layers_after_mp3 for layer in ['song_titles', 'soundwave'])
                             is_last_mp3 = (i == len(mp3_cover_labels)-1) and not has_layers_after
                             out_label = f"mp3covertmp{i+1}" if i < len(mp3_cover_labels)-1 else "mp3covertmp_final"
-                            filter_graph += f";{last_label}[{label}]overlay={x_expr}:{y_expr}:enable='{enable_expr}'[{out_label}]"
+                            filter_graph += f";{last_label}[{label}]overlay={x_expr}:{y_expr}{timeline.enable_option(label)}[{out_label}]"
                             last_label = f"[{out_label}]"
                         continue
                     
@@ -1612,7 +1643,7 @@ def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
                         current_layer_index = final_order.index('soundwave')
                         is_last_layer = (current_layer_index == len(final_order) - 1)
                         out_label = "soundwave_final"
-                        filter_graph += f";{last_label}[soundwave]overlay={ox_soundwave}:{oy_soundwave}:enable='gte(t,{soundwave_start_time})'[{out_label}]"
+                        filter_graph += f";{last_label}[soundwave]overlay={ox_soundwave}:{oy_soundwave}{timeline.enable_option('soundwave')}[{out_label}]"
                         last_label = f"[{out_label}]"
                         continue
                     
@@ -1673,47 +1704,123 @@ def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
             # For simple background-only videos, the output is always [vout_final]
             final_output_label = "[vout_final]"
         
-        cmd.extend(["-filter_complex", filter_graph, "-map", final_output_label, "-map", "1:a"])
+        if preview_time is not None:
+            return render_preview_frame(cmd, filter_graph, final_output_label, output_path, preview_time)
 
-        cmd.extend(["-c:v", codec, "-preset", preset])       
+        # Proxy render: same graph, only cut to a window and scaled down at the very end
+        if time_window == TRANSITIONS_WINDOW:
+            windows = transition_windows(timeline.boundaries(), audio_duration)
+            if len(windows) > 1:
+                return render_window_segments(render_args, windows)
+            time_window = windows[0]
+            print(f"🔧 Dry Run window: {time_window[0]:.1f}s - {time_window[0] + time_window[1]:.1f}s")
+        window_start = 0.0
+        if time_window is not None and time_window[0] > 0:
+            window_start = time_window[0]
+            cmd = seek_inputs_for_preview(cmd, window_start)
+            filter_graph += f";{final_output_label}setpts=PTS-STARTPTS[vout_window]"
+            final_output_label = "[vout_window]"
+        if proxy_scale and proxy_scale < 1:
+            filter_graph += (f";{final_output_label}scale=trunc(iw*{proxy_scale}/2)*2:"
+                             f"trunc(ih*{proxy_scale}/2)*2[vout_proxy]")
+            final_output_label = "[vout_proxy]"
+            preset = get_fastest_preset(codec)
+            print(f"🔧 Proxy render: {int(proxy_scale * 100)}% resolution, preset {preset}")
 
-        # Rate control based on input image type
-        if image_path_for_ffmpeg.lower().endswith('.gif'):
-            cmd.extend(["-rc", "vbr", "-cq", "19"])
-        elif image_path_for_ffmpeg.lower().endswith('.png'):
-            cmd.extend(["-rc", "cbr"])        
+        use_vfr = frame_rate_mode in ("vfr", "vfr_cfr")
+        # CFR timestamps for platforms that reject VFR: the muxer repeats each held frame up to fps in
+        # the same encode; the repeats are exact copies, so the encoder codes them as cheap skip frames
+        cfr_output = frame_rate_mode == "vfr_cfr"
+        if frame_rate_mode not in ("cfr", "vfr", "vfr_cfr"):
+            logger.warning(f"Unknown frame rate mode {frame_rate_mode!r}, rendering CFR")
+        if use_vfr:
+            # Drop only frames identical to the previous one (hi=lo=0, frac=0); kept frames hold
+            # their timestamps, so static spans become a few long frames instead of fps identical
+            # ones. mpdecimate's default thresholds would also drop near-duplicates and make slow
+            # fades, subtle soundwave motion and low-contrast GIFs stutter; the price of exact
+            # matching is that noisy sources (e.g. a compressed background video) save little.
+            max_hold_frames = max(1, int(VFR_MAX_HOLD_SECONDS * fps))
+            filter_graph += f";{final_output_label}mpdecimate=hi=0:lo=0:frac=0:max={max_hold_frames}[vout_vfr]"
+            final_output_label = "[vout_vfr]"
+            print(f"🔧 Frame rate mode: VFR (duplicate frames dropped, max hold {VFR_MAX_HOLD_SECONDS}s)"
+                  + (f", written as {fps} fps CFR" if cfr_output else ""))
 
-        # Video settings
-        video_bitrate_str = str(video_bitrate)
-        maxrate_str = str(maxrate)
-        buffer_size_str = str(bufsize)
-        audio_bitrate_str = str(audio_bitrate)
-        cmd.extend([   
-            "-b:v", video_bitrate_str,
-            "-maxrate", maxrate_str,
-            "-bufsize", buffer_size_str     
-        ])
+        # Extra renditions: split the finished composite once, then scale/crop and encode per output
+        renditions = [r for r in (renditions or []) if r.get('output_path')]
+        if renditions and time_window is not None:
+            print("⚠️ Extra renditions are skipped for windowed renders")
+            renditions = []
+        audio_map = "1:a"
+        if renditions:
+            # Encode the audio once; every output stream-copies it
+            shared_audio_path = encode_shared_audio(audio_path, audio_bitrate)
+            if shared_audio_path is None:
+                logger.warning("Shared audio encode failed, rendering the main output only")
+                renditions = []
+            else:
+                cmd.extend(["-i", shared_audio_path])
+                audio_map = f"{input_idx}:a"
+                split_labels = [f"vsplit{i}" for i in range(len(renditions) + 1)]
+                filter_graph += f";{final_output_label}split={len(split_labels)}" + "".join(f"[{label}]" for label in split_labels)
+                for i, rendition in enumerate(renditions, start=1):
+                    filter_graph += f";[vsplit{i}]{rendition_filter(rendition['resolution'], width, height)}[vout_r{i}]"
+                final_output_label = "[vsplit0]"
+                print(f"🔧 Renditions: {resolution} + " + ", ".join(r['resolution'] for r in renditions) + " from one composite pass")
 
-        # Audio settings
-        cmd.extend([   
-            "-c:a", VIDEO_SETTINGS["audio_codec"],
-            "-b:a", audio_bitrate_str,
-            "-ar", VIDEO_SETTINGS["audio_sample_rate"],
-            "-ac", VIDEO_SETTINGS["audio_channels"]
-        ])
-       
-        cmd.extend([
-            "-r", str(fps),
-            "-g", VIDEO_SETTINGS["gop_size"],
-            "-bf", VIDEO_SETTINGS["bframes"],
-            "-profile:v", VIDEO_SETTINGS["profile"],
-            "-level:v", VIDEO_SETTINGS["level"],
-            "-movflags", "+faststart", 
-            "-shortest",
-            "-y"
-        ])              
-        
-        cmd.append(output_path)
+        cmd.extend(["-filter_complex", filter_graph])
+
+        # Encoder, preset, rate control and profile flags valid for the codec actually available
+        bg_lower = image_path_for_ffmpeg.lower()
+        animated_background = True if bg_lower.endswith('.gif') else (False if bg_lower.endswith('.png') else None)
+        video_encoder_args = get_video_encoder_args(codec, preset, animated_background)
+
+        def add_output(video_label, path, out_video_bitrate, out_maxrate, out_bufsize):
+            cmd.extend(["-map", video_label, "-map", audio_map])
+            if window_start > 0:
+                cmd.extend(["-af", "asetpts=PTS-STARTPTS"])
+            cmd.extend(video_encoder_args)
+
+            # Video settings
+            cmd.extend([
+                "-b:v", str(out_video_bitrate),
+                "-maxrate", str(out_maxrate),
+                "-bufsize", str(out_bufsize)
+            ])
+
+            # Audio settings
+            if shared_audio_path:
+                cmd.extend(["-c:a", "copy"])
+            else:
+                cmd.extend([
+                    "-c:a", VIDEO_SETTINGS["audio_codec"],
+                    "-b:a", str(audio_bitrate),
+                    "-ar", VIDEO_SETTINGS["audio_sample_rate"],
+                    "-ac", VIDEO_SETTINGS["audio_channels"]
+                ])
+
+            if cfr_output:
+                cmd.extend(["-fps_mode", "cfr", "-r", str(fps)])
+            elif use_vfr:
+                cmd.extend(["-fps_mode", "vfr"])
+            else:
+                cmd.extend(["-r", str(fps)])
+            cmd.extend([
+                "-g", VIDEO_SETTINGS["gop_size"],
+                "-bf", VIDEO_SETTINGS["bframes"],
+                "-movflags", "+faststart",
+                "-shortest",
+                "-y"
+            ])
+            if time_window is not None:
+                cmd.extend(["-t", f"{time_window[1]:.3f}"])
+            cmd.append(path)
+
+        add_output(final_output_label, output_path, video_bitrate, maxrate, bufsize)
+        for i, rendition in enumerate(renditions, start=1):
+            add_output(f"[vout_r{i}]", rendition['output_path'],
+                       rendition.get('video_bitrate', video_bitrate),
+                       rendition.get('maxrate', maxrate),
+                       rendition.get('bufsize', bufsize))
 
         # Display raw FFmpeg command for debugging performance bottlenecks
         print(f"✏️  RAW FFMPEG COMMAND (for performance analysis):")
@@ -1721,11 +1828,15 @@ def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
         print(raw_cmd)
         print()
 
-        audio_duration = get_audio_duration(audio_path)
+        if time_window is not None:
+            audio_duration = max(0.0, min(time_window[1], audio_duration - window_start))
         total_frames = int(audio_duration * fps)
         
-        process = subprocess.Popen(cmd, stderr=subprocess.PIPE, universal_newlines=True, bufsize=1)
+        # Wait until the governor admits another encode on this machine
+        encode_slot = resource_governor.admit_encode()
+        process = resource_governor.popen(cmd, stderr=subprocess.PIPE, universal_newlines=True, bufsize=1)
 
+        metrics_output = os.path.basename(output_path)
         start_time = time.time()
         last_seconds = 0.0
         last_update = time.time()
@@ -1759,6 +1870,10 @@ def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
                                 break
                             except ValueError:
                                 continue
+                    for gauge in ("speed", "fps"):
+                        match = re.search(gauge + r'=\s*(\d+\.?\d*)', line)
+                        if match:
+                            metrics.set_gauge(f"ffmpeg_{gauge}", float(match.group(1)), output=metrics_output)
                     match = re.search(r'time=(\d+):(\d+):(\d+\.\d+)', line)
                     if match:
                         h, m, s = map(float, match.groups())
@@ -1782,6 +1897,8 @@ def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
             if process.stderr is not None:
                 process.stderr.close()
             process.wait()
+            metrics.remove_gauge("ffmpeg_speed", output=metrics_output)
+            metrics.remove_gauge("ffmpeg_fps", output=metrics_output)
             sys.stdout.flush()
         sys.stdout.write(
             f"\r  100.0% | Frame: {total_frames}/{total_frames} | ETA: 00:00:00 | it/s: {current_its} 🚀\n"
@@ -1797,6 +1914,8 @@ def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
         logger.error(msg)
         return False, msg
     finally:
+        if encode_slot is not None:
+            encode_slot.release()
         if temp_png_path and os.path.exists(temp_png_path):
             try:
                 os.unlink(temp_png_path)
@@ -1806,19 +1925,270 @@ def create_video_with_ffmpeg( # pyright: ignore[reportGeneralTypeIssues]
                 logger.warning(f"No permission to remove temp PNG {temp_png_path}.")
             except OSError as e:
                 logger.warning(f"OS error removing temp PNG {temp_png_path}: {e}")
+        if shared_audio_path and os.path.exists(shared_audio_path):
+            try:
+                os.unlink(shared_audio_path)
+            except OSError as e:
+                logger.warning(f"Could not remove shared audio {shared_audio_path}: {e}")
 
 
 
 
 
-def merge_random_mp3s(selected_mp3s: list) -> Tuple[Optional[str], float]:
-    """Merge MP3 files using ffmpeg - returns output path and duration"""
+def rendition_filter(target_resolution: str, width: int, height: int) -> str:
+    """
+    Filter turning the composite (width x height) into one rendition.
+
+    A rendition with a different aspect ratio (e.g. a vertical 1080x1920 from a
+    1920x1080 mix) is center-cropped to that aspect first, then scaled.
+    """
+    target_width, target_height = map(int, target_resolution.lower().split('x'))
+    if target_width * height != target_height * width:
+        if target_width * height < target_height * width:
+            crop_width, crop_height = int(height * target_width / target_height) // 2 * 2, height
+        else:
+            crop_width, crop_height = width, int(width * target_height / target_width) // 2 * 2
+        return f"crop={crop_width}:{crop_height},scale={target_width}:{target_height}"
+    return f"scale={target_width}:{target_height}"
+
+
+def parse_renditions(text: str) -> List[str]:
+    """Rendition resolutions from a comma separated setting ("1280x720, 1080x1920"); invalid entries are dropped"""
+    resolutions = []
+    for item in (text or "").replace(';', ',').split(','):
+        item = item.strip().lower()
+        if re.fullmatch(r"\d{2,5}x\d{2,5}", item) and item not in resolutions:
+            resolutions.append(item)
+    return resolutions
+
+
+def scale_bitrate(bitrate: str, factor: float) -> str:
+    """Scale an ffmpeg bitrate string such as "12M" or "8000k"; unparseable values are returned unchanged"""
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)([kKmM]?)", str(bitrate).strip())
+    if not match:
+        return bitrate
+    multiplier = {"": 1, "k": 1000, "m": 1000000}[match.group(2).lower()]
+    return f"{max(1, int(float(match.group(1)) * multiplier * factor / 1000))}k"
+
+
+def encode_shared_audio(audio_path: str, audio_bitrate: str) -> Optional[str]:
+    """Encode the audio track once with the output audio settings; returns the temp file or None"""
+    shared_path = create_temp_file(suffix='.m4a')
+    cmd = [
+        FFMPEG_BINARY, "-hide_banner", "-loglevel", "error",
+        "-i", audio_path,
+        "-vn",
+        "-c:a", VIDEO_SETTINGS["audio_codec"],
+        "-b:a", str(audio_bitrate),
+        "-ar", VIDEO_SETTINGS["audio_sample_rate"],
+        "-ac", VIDEO_SETTINGS["audio_channels"],
+        "-y", shared_path
+    ]
+    try:
+        result = resource_governor.run(cmd, capture_output=True, text=True)
+        if result.returncode == 0:
+            return shared_path
+        logger.error(f"Shared audio encode failed: {result.stderr.strip()[-500:]}")
+    except OSError as e:
+        logger.error(f"Shared audio encode failed: {e}")
+    if os.path.exists(shared_path):
+        os.unlink(shared_path)
+    return None
+
+
+# Seconds allowed for rendering one preview frame
+PREVIEW_FRAME_TIMEOUT = 60
+# (path, mtime_ns) -> duration of looped inputs, so scrubbing probes each file once
+_preview_duration_cache = {}
+
+
+def _looped_input_duration(path: str) -> float:
+    try:
+        key = (path, os.stat(path).st_mtime_ns)
+    except OSError:
+        return 0.0
+    if key not in _preview_duration_cache:
+        _preview_duration_cache[key] = get_audio_duration(path)
+    return _preview_duration_cache[key]
+
+
+def seek_inputs_for_preview(input_cmd: List[str], preview_time: float) -> List[str]:
+    """
+    Rewrite the input part of a render command so every input starts at preview_time.
+
+    Each input is seeked to the position it would be at after preview_time
+    seconds (accounting for -itsoffset and looping) and shifted with
+    -itsoffset so, together with -copyts, its first frame carries timestamp
+    preview_time. Enable/fade expressions in the filter graph then see the
+    same t as in the full render. Still images are only shifted.
+    """
+    result = [input_cmd[0], "-copyts"]
+    pending = []
+    offset = 0.0
+    i = 1
+    while i < len(input_cmd):
+        arg = input_cmd[i]
+        if arg == "-itsoffset":
+            offset = float(input_cmd[i + 1])
+            i += 2
+            continue
+        if arg != "-i":
+            pending.append(arg)
+            i += 1
+            continue
+        path = input_cmd[i + 1]
+        if "-loop" in pending:
+            seek, shift = 0.0, preview_time
+        else:
+            elapsed = max(0.0, preview_time - offset)
+            seek = elapsed
+            if "-stream_loop" in pending:
+                duration = _looped_input_duration(path)
+                if duration > 0:
+                    seek = elapsed % duration
+            shift = offset + (elapsed - seek)
+        if seek > 0:
+            pending.extend(["-ss", f"{seek:.3f}"])
+        if shift:
+            pending.extend(["-itsoffset", f"{shift:.3f}"])
+        result.extend(pending)
+        result.extend(["-i", path])
+        pending = []
+        offset = 0.0
+        i += 2
+    return result
+
+
+def transition_windows(transition_times: List[float], total_duration: float, effect_time: float = 0,
+                       margin: float = DRY_RUN_TRANSITION_MARGIN, merge_gap: float = DRY_RUN_WINDOW_MERGE_GAP,
+                       max_seconds: float = DRY_RUN_MAX_WINDOW_SECONDS) -> List[Tuple[float, float]]:
+    """
+    (start, duration) windows around the layer start/end times.
+
+    Each transition gets margin seconds before and margin (plus the effect
+    time) after it, clamped to the track. Windows less than merge_gap apart
+    are joined, and windows past max_seconds of total length are skipped, so
+    intro and song-boundary transitions at both ends of a long track stay a
+    short render.
+    """
+    times = sorted(t for t in transition_times if 0 <= t <= total_duration)
+    if not times:
+        return [(0.0, min(total_duration, margin + effect_time))]
+    windows = []
+    for t in times:
+        start = max(0.0, t - margin)
+        end = min(total_duration, t + effect_time + margin)
+        if windows and start - windows[-1][1] <= merge_gap:
+            windows[-1][1] = max(windows[-1][1], end)
+        else:
+            windows.append([start, end])
+    result, total = [], 0.0
+    for start, end in windows:
+        duration = max(end - start, 1.0)
+        if result and total + duration > max_seconds:
+            print(f"⚠️ Dry Run: {len(windows) - len(result)} later transition windows skipped "
+                  f"(over {max_seconds:.0f}s)")
+            break
+        result.append((start, duration))
+        total += duration
+    return result
+
+
+def render_window_segments(render_args: dict, windows: List[Tuple[float, float]]) -> Tuple[bool, Optional[str]]:
+    """Render each window as its own segment with the same settings and join them without re-encoding"""
+    output_path = render_args["output_path"]
+    base, ext = os.path.splitext(output_path)
+    segments = []
+    list_path = None
+    try:
+        for i, window in enumerate(windows):
+            print(f"🔧 Dry Run window {i + 1}/{len(windows)}: {window[0]:.1f}s - {window[0] + window[1]:.1f}s")
+            segment_path = f"{base}.part{i}{ext}"
+            segments.append(segment_path)
+            success, err = create_video_with_ffmpeg(**dict(render_args, output_path=segment_path,
+                                                           time_window=window, renditions=None))
+            if not success:
+                return False, err
+        list_path = create_temp_file(suffix='.txt')
+        with open(list_path, 'w', encoding='utf-8') as f:
+            for segment_path in segments:
+                escaped = os.path.abspath(segment_path).replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+        cmd = [FFMPEG_BINARY, "-hide_banner", "-loglevel", "error", "-f", "concat", "-safe", "0",
+               "-i", list_path, "-c", "copy", "-movflags", "+faststart", "-y", output_path]
+        result = resource_governor.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            msg = f"Joining Dry Run windows failed: {result.stderr.strip()[-500:]}"
+            logger.error(msg)
+            return False, msg
+        return True, None
+    except OSError as e:
+        msg = f"Error joining Dry Run windows: {e}"
+        logger.error(msg)
+        return False, msg
+    finally:
+        for path in segments + ([list_path] if list_path else []):
+            if os.path.exists(path):
+                try:
+                    os.unlink(path)
+                except OSError as e:
+                    logger.warning(f"Could not remove Dry Run segment {path}: {e}")
+
+
+def render_preview_frame(input_cmd: List[str], filter_graph: str, final_output_label: str,
+                         output_path: str, preview_time: float) -> Tuple[bool, Optional[str]]:
+    """
+    Render one frame of a video's filter graph to an image instead of encoding.
+
+    Args:
+        input_cmd: ffmpeg binary plus the -i inputs built for the full render
+        filter_graph / final_output_label: The same graph the full render uses
+        output_path: Image file to write (e.g. .png)
+        preview_time: Timeline position in seconds
+
+    Returns:
+        (success, error message)
+    """
+    cmd = seek_inputs_for_preview(input_cmd, preview_time)
+    cmd.extend([
+        "-filter_complex", filter_graph,
+        "-map", final_output_label,
+        "-frames:v", "1",
+        "-update", "1",
+        "-y", output_path
+    ])
+    start = time.time()
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=PREVIEW_FRAME_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        msg = f"Preview frame at {preview_time:.2f}s timed out after {PREVIEW_FRAME_TIMEOUT}s"
+        logger.error(msg)
+        return False, msg
+    except OSError as e:
+        msg = f"Error rendering preview frame: {e}"
+        logger.error(msg)
+        return False, msg
+    if result.returncode != 0 or not os.path.exists(output_path):
+        msg = f"Preview frame failed: {result.stderr.strip()[-500:]}"
+        logger.error(msg)
+        return False, msg
+    print(f"🖼️ Preview frame at {preview_time:.2f}s rendered in {time.time() - start:.2f}s")
+    return True, None
+
+
+def merge_random_mp3s(selected_mp3s: list,
+                      gains: Optional[List[float]] = None) -> Tuple[Optional[str], float, List[Tuple[float, float]]]:
+    """Merge MP3 files using ffmpeg - returns output path, duration and (start, length) of each track"""
     from src.utils import create_temp_file
     
     output_path = create_temp_file(suffix=".m4a")  # Changed from .mp3 to .m4a
     
-    if merge_mp3s_with_ffmpeg(selected_mp3s, output_path):
-        duration = get_audio_duration(output_path)
-        return output_path, duration
-    else:
-        return None, 0.0 
\ No newline at end of file
+    track_durations = merge_mp3s_with_ffmpeg(selected_mp3s, output_path, gains)
+    if not track_durations:
+        return None, 0.0, []
+    song_durations = []
+    offset = 0.0
+    for duration in track_durations:
+        song_durations.append((offset, duration))
+        offset += duration
+    return output_path, offset, song_durations
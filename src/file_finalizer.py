@@ -0,0 +1,140 @@
+# This file uses PyQt6
+"""
+Background finalization of finished batches.
+
+After a batch is encoded its log has to be written and its MP3s and image
+moved into the media folder's bin/. On network shares a move is a copy and
+can take a long time, so the worker hands these jobs to a FileFinalizer
+thread and starts the next encode right away. Transient failures (locked
+files, share hiccups) are retried; anything that still fails is reported
+back as failed moves.
+"""
+import os
+import time
+import queue
+import shutil
+import threading
+from typing import List, Optional, Callable
+from src.logger import logger, timed_stage
+
+
+class FinalizeTask:
+    """Log + move work for one finished batch"""
+
+    def __init__(self, media_sources: str, output_filename: str, output_path: str,
+                 selected_image: str, selected_mp3s: List[str],
+                 on_done: Optional[Callable[[List[str]], None]] = None):
+        self.media_sources = media_sources
+        self.output_filename = output_filename
+        self.output_path = output_path
+        self.selected_image = selected_image
+        self.selected_mp3s = list(selected_mp3s)
+        self.on_done = on_done
+
+
+def _move_with_retry(src: str, dst: str, retries: int, retry_delay: float) -> bool:
+    """Move src to dst, retrying transient errors. Returns True on success."""
+    for attempt in range(retries + 1):
+        if not os.path.exists(src) and os.path.exists(dst):
+            # Already moved by a run that was interrupted mid-finalize
+            return True
+        try:
+            shutil.move(src, dst)
+            return True
+        except FileNotFoundError:
+            logger.error(f"File {src} not found for moving.")
+            return False
+        except PermissionError:
+            if attempt == retries:
+                logger.error(f"No permission to move file {src}.")
+                return False
+        except OSError as move_err:
+            if attempt == retries:
+                logger.error(f"OS error moving {src} to {dst}: {move_err}")
+                return False
+        time.sleep(retry_delay * (2 ** attempt))
+    return False
+
+
+def finalize_batch_files(task: FinalizeTask, retries: int = 3, retry_delay: float = 0.5) -> List[str]:
+    """Write the batch log and move its files to bin. Returns list of failed moves."""
+    output_base_name = os.path.splitext(task.output_filename)[0]
+    bin_folder = os.path.join(task.media_sources, "bin")
+    os.makedirs(bin_folder, exist_ok=True)
+
+    # Write the log straight into bin (replace handles a log left by an interrupted run)
+    log_path = os.path.join(bin_folder, f"{output_base_name}.log")
+    try:
+        with open(log_path, "w", encoding="utf-8") as logf:
+            logf.write(f"Output video: {task.output_path}\n")
+            logf.write(f"Image used: {task.selected_image}\n")
+            logf.write("MP3s used:\n")
+            for mp3 in task.selected_mp3s:
+                logf.write(f"  {mp3}\n")
+    except OSError as e:
+        logger.error(f"Could not write log {log_path}: {e}")
+
+    failed_moves = []
+    output_base = os.path.splitext(os.path.basename(task.output_path))[0]
+    for idx, mp3 in enumerate(task.selected_mp3s, 1):
+        new_name = f"{output_base}+{idx}.mp3"
+        if not _move_with_retry(mp3, os.path.join(bin_folder, new_name), retries, retry_delay):
+            failed_moves.append(mp3)
+    img_ext = os.path.splitext(task.selected_image)[1]
+    img_new_name = f"{output_base}{img_ext}"
+    if not _move_with_retry(task.selected_image, os.path.join(bin_folder, img_new_name), retries, retry_delay):
+        failed_moves.append(task.selected_image)
+    if failed_moves:
+        logger.warning(f"Some files could not be moved to bin: {failed_moves}")
+    return failed_moves
+
+
+class FileFinalizer:
+    """Single background thread that finalizes batches in submission order"""
+
+    def __init__(self, retries: int = 3, retry_delay: float = 0.5):
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self._queue: "queue.Queue[Optional[FinalizeTask]]" = queue.Queue()
+        self._failed_moves: List[str] = []
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="SuperCutFinalizer", daemon=True)
+        self._thread.start()
+
+    def submit(self, task: FinalizeTask):
+        """Queue a finished batch; returns immediately"""
+        self._queue.put(task)
+
+    def _run(self):
+        while True:
+            task = self._queue.get()
+            try:
+                if task is None:
+                    return
+                with timed_stage("finalize", output=task.output_filename):
+                    failed = finalize_batch_files(task, self.retries, self.retry_delay)
+                with self._lock:
+                    self._failed_moves.extend(failed)
+                if task.on_done:
+                    task.on_done(failed)
+            except Exception as e:
+                logger.error(f"Finalization failed for {task.output_filename if task else '?'}: {e}")
+                if task is not None:
+                    with self._lock:
+                        self._failed_moves.extend(task.selected_mp3s + [task.selected_image])
+            finally:
+                self._queue.task_done()
+
+    def drain(self) -> List[str]:
+        """Wait for all queued batches to finish and return (and clear) their failed moves"""
+        self._queue.join()
+        with self._lock:
+            failed, self._failed_moves = self._failed_moves, []
+        return failed
+
+    def close(self) -> List[str]:
+        """Finish outstanding work and stop the thread"""
+        failed = self.drain()
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+        return failed
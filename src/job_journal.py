@@ -0,0 +1,195 @@
+# This file uses PyQt6
+"""
+Crash-safe job journal for batch video runs.
+
+Each export job appends one JSON record per state change to a journal file
+in the media folder. Every record is flushed and fsync'd before the worker
+moves on, so after a crash the journal tells exactly which batches were
+planned, which finished encoding (with output checksum) and which were fully
+finalized (files moved to bin). Replaying the journal lets the next run skip
+finished batches and discard half-written outputs.
+
+Batch states: "planned" -> "encoded" -> "finalized".
+"""
+import os
+import json
+import time
+import hashlib
+import threading
+from typing import Optional, List, Tuple
+from src.logger import logger
+
+JOURNAL_FILENAME = ".supercut_job.journal"
+
+
+def file_checksum(path: str, chunk_size: int = 4 * 1024 * 1024) -> Optional[str]:
+    """SHA-256 of a file, or None if it cannot be read"""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+    except OSError as e:
+        logger.warning(f"Could not checksum {path}: {e}")
+        return None
+    return digest.hexdigest()
+
+
+class JobJournal:
+    """Append-only, fsync'd record of one export job's batches"""
+
+    def __init__(self, media_sources: str):
+        self.path = os.path.join(media_sources, JOURNAL_FILENAME)
+        # Batches are finalized on a background thread, so appends can race
+        self._lock = threading.Lock()
+
+    def _append(self, record: dict) -> None:
+        record["ts"] = time.time()
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._write_line(line)
+
+    def _write_line(self, line: str) -> None:
+        try:
+            # Terminate a torn line left by a crash so this record stays parseable
+            if os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+                with open(self.path, "rb") as f:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        line = "\n" + line
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            logger.error(f"Could not write job journal {self.path}: {e}")
+
+    def load(self) -> Optional[dict]:
+        """
+        Replay the journal.
+
+        Returns:
+            None if there is no journal, otherwise
+            {"job": {...}, "batches": {index: {...}}, "done": bool}
+        """
+        if not os.path.exists(self.path):
+            return None
+        state = {"job": {}, "batches": {}, "done": False}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn final line from a crash mid-write; everything before it is valid
+                        continue
+                    event = record.get("event")
+                    if event == "job_start":
+                        state = {"job": record.get("job", {}), "batches": {}, "done": False}
+                    elif event == "batch_planned":
+                        state["batches"][record["batch"]] = {
+                            "state": "planned",
+                            "number": record.get("number"),
+                            "output_path": record.get("output_path"),
+                            "mp3s": record.get("mp3s", []),
+                            "image": record.get("image"),
+                            "farm_job": record.get("farm_job"),
+                        }
+                    elif event in ("batch_encoded", "batch_finalized"):
+                        batch = state["batches"].get(record["batch"])
+                        if batch is None:
+                            continue
+                        batch["state"] = "encoded" if event == "batch_encoded" else "finalized"
+                        if "checksum" in record:
+                            batch["checksum"] = record["checksum"]
+                            batch["size"] = record.get("size")
+                    elif event == "job_done":
+                        state["done"] = True
+        except OSError as e:
+            logger.error(f"Could not read job journal {self.path}: {e}")
+            return None
+        return state
+
+    def load_interrupted_job(self) -> Optional[dict]:
+        """Replayed state of an unfinished job, or None if there is nothing to resume"""
+        state = self.load()
+        if not state or state["done"] or not state["job"]:
+            return None
+        return state
+
+    def start_job(self, job: dict) -> None:
+        """Begin a fresh job, discarding any previous journal"""
+        try:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+        except OSError as e:
+            logger.warning(f"Could not remove old job journal {self.path}: {e}")
+        self._append({"event": "job_start", "job": job})
+
+    def plan_batch(self, batch: int, number: int, output_path: str, mp3s: List[str], image: str,
+                   farm_job: Optional[str] = None) -> None:
+        record = {
+            "event": "batch_planned", "batch": batch, "number": number,
+            "output_path": output_path, "mp3s": list(mp3s), "image": image,
+        }
+        if farm_job:
+            # Render farm job id, so a resume can collect or withdraw it
+            record["farm_job"] = farm_job
+        self._append(record)
+
+    def mark_encoded(self, batch: int, output_path: str) -> None:
+        size = os.path.getsize(output_path) if os.path.exists(output_path) else None
+        self._append({
+            "event": "batch_encoded", "batch": batch,
+            "checksum": file_checksum(output_path), "size": size,
+        })
+
+    def mark_finalized(self, batch: int) -> None:
+        self._append({"event": "batch_finalized", "batch": batch})
+
+    def finish_job(self) -> None:
+        self._append({"event": "job_done"})
+
+    @staticmethod
+    def split_batches(batches: dict) -> Tuple[List[int], List[int], List[int]]:
+        """
+        Sort a replayed job's batches for resuming.
+
+        Batches finish out of order (background finalizing, render farm), so
+        every entry is looked at, not just the leading ones.
+
+        Returns:
+            (finalized, reusable, redo) batch indices: fully done, encoded with
+            an intact output (only log and moves missing), and everything else
+        """
+        finalized, reusable, redo = [], [], []
+        for idx in sorted(batches):
+            batch = batches[idx]
+            if batch["state"] == "finalized":
+                finalized.append(idx)
+            elif batch["state"] == "encoded" and JobJournal.output_is_intact(batch):
+                reusable.append(idx)
+            else:
+                redo.append(idx)
+        return finalized, reusable, redo
+
+    @staticmethod
+    def output_is_intact(batch: dict) -> bool:
+        """Whether an encoded batch's output still matches its recorded checksum"""
+        output_path = batch.get("output_path")
+        if not output_path or not os.path.exists(output_path) or not batch.get("checksum"):
+            return False
+        if batch.get("size") is not None and os.path.getsize(output_path) != batch["size"]:
+            return False
+        return file_checksum(output_path) == batch["checksum"]
+
+    @staticmethod
+    def discard_partial_output(batch: dict) -> None:
+        """Remove a half-written output left behind by an interrupted encode"""
+        output_path = batch.get("output_path")
+        if output_path and os.path.exists(output_path):
+            try:
+                os.remove(output_path)
+                print(f"🗑️ Discarded partial output: {os.path.basename(output_path)}")
+            except OSError as e:
+                logger.warning(f"Could not remove partial output {output_path}: {e}")
@@ -0,0 +1,168 @@
+# This file uses PyQt6
+"""
+Layer timeline: when each layer is visible and when it transitions.
+
+One LayerTimeline is built per render. The filter graph builder takes its
+enable expressions from it, the proxy Dry Run takes its transition window
+from it, and previews can ask which layers are visible at a time. Intervals
+are kept sorted and merged per layer, so the emitted expressions are
+minimal: a layer visible for the whole video gets no enable option at all,
+one that stays until the end gets gte(t,..), and overlapping popups
+collapse into one between(t,..).
+"""
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Tuple
+
+Interval = Tuple[float, Optional[float]]  # (start, end); end None = until the end of the video
+
+
+def _fmt(value: float) -> str:
+    return f"{value:g}"
+
+
+class LayerTimeline:
+    """Interval index of every layer's visible and transition windows"""
+
+    def __init__(self, total_duration: Optional[float] = None):
+        self.total_duration = total_duration if total_duration and total_duration > 0 else None
+        self._raw: Dict[str, List[Interval]] = {}
+        self._merged: Dict[str, List[Interval]] = {}
+        self._starts: Dict[str, List[float]] = {}
+        self._transitions: List[Tuple[str, float, float]] = []
+
+    # --- Building ---
+    def add(self, layer_id: str, start: float = 0, end: Optional[float] = None):
+        """Layer is visible from start to end (None = until the end of the video)"""
+        start = max(0.0, float(start))
+        if end is not None:
+            end = float(end)
+            if end <= start:
+                self._raw.setdefault(layer_id, [])
+                return
+            if self.total_duration is not None and end >= self.total_duration:
+                end = None
+        if self.total_duration is not None and start >= self.total_duration:
+            self._raw.setdefault(layer_id, [])
+            return
+        self._raw.setdefault(layer_id, []).append((start, end))
+        self._merged.pop(layer_id, None)
+
+    def add_intervals(self, layer_id: str, intervals: Iterable[Tuple[float, float]]):
+        """Several (start, duration) windows; non-positive durations are ignored"""
+        self._raw.setdefault(layer_id, [])
+        for start, duration in intervals:
+            if duration > 0:
+                self.add(layer_id, start, start + duration)
+        self._merged.pop(layer_id, None)
+
+    def add_transition(self, layer_id: str, start: float, duration: float):
+        """A fade or other effect window on a layer"""
+        self._transitions.append((layer_id, float(start), float(duration)))
+
+    # --- Queries ---
+    def layers(self) -> List[str]:
+        return list(self._raw)
+
+    def intervals(self, layer_id: str) -> List[Interval]:
+        """Sorted, merged visible windows of a layer"""
+        merged = self._merged.get(layer_id)
+        if merged is None:
+            merged = []
+            for start, end in sorted(self._raw.get(layer_id, []), key=lambda iv: iv[0]):
+                if merged:
+                    last_start, last_end = merged[-1]
+                    if last_end is None:
+                        continue
+                    if start <= last_end:
+                        merged[-1] = (last_start, None if end is None else max(last_end, end))
+                        continue
+                merged.append((start, end))
+            self._merged[layer_id] = merged
+            self._starts[layer_id] = [start for start, _ in merged]
+        return merged
+
+    def is_visible(self, layer_id: str, t: float) -> bool:
+        intervals = self.intervals(layer_id)
+        i = bisect_right(self._starts[layer_id], t) - 1
+        if i < 0:
+            return False
+        end = intervals[i][1]
+        return end is None or t <= end
+
+    def visible_layers(self, t: float) -> List[str]:
+        return [layer_id for layer_id in self._raw if self.is_visible(layer_id, t)]
+
+    def boundaries(self) -> List[float]:
+        """Every time at which some layer appears, disappears or starts/ends a transition"""
+        times = set()
+        for layer_id in self._raw:
+            for start, end in self.intervals(layer_id):
+                if start > 0:
+                    times.add(start)
+                if end is not None:
+                    times.add(end)
+        for _, start, duration in self._transitions:
+            times.add(start)
+            times.add(start + duration)
+        if self.total_duration is not None:
+            times = {t for t in times if 0 <= t <= self.total_duration}
+        return sorted(times)
+
+    def enable_expr(self, layer_id: str) -> Optional[str]:
+        """
+        Minimal ffmpeg enable expression for a layer.
+
+        Returns None when the layer is visible for the whole video (no enable
+        option needed) and "0" when it is never visible.
+        """
+        intervals = self.intervals(layer_id)
+        if not intervals:
+            return "0"
+        if len(intervals) == 1 and intervals[0] == (0.0, None):
+            return None
+        parts = []
+        for start, end in intervals:
+            if end is None:
+                parts.append(f"gte(t,{_fmt(start)})")
+            elif start <= 0:
+                parts.append(f"lte(t,{_fmt(end)})")
+            else:
+                parts.append(f"between(t,{_fmt(start)},{_fmt(end)})")
+        return "+".join(parts)
+
+    def enable_option(self, layer_id: str) -> str:
+        """':enable=...' suffix for an overlay filter, or '' when always visible"""
+        expr = self.enable_expr(layer_id)
+        return "" if expr is None else f":enable='{expr}'"
+
+
+def popup_intervals(first_start: int, duration: float, popup_num: int, total_duration: float) -> List[Tuple[int, float]]:
+    """
+    Popup windows: the first at first_start, then popup_num more spaced so
+    the last one ends at the end of the video. Windows that would run past
+    the end are dropped.
+    """
+    spacing = (total_duration - first_start) / popup_num
+    intervals = [(first_start, duration)]
+    for i in range(popup_num):
+        if i == 0:
+            interval_start = first_start + spacing - duration
+        else:
+            previous_end = intervals[-1][0] + duration
+            interval_start = previous_end + spacing - duration
+        interval_start = int(interval_start)
+        if interval_start + duration > total_duration:
+            break
+        intervals.append((interval_start, duration))
+    return intervals
+
+
+def song_boundary_intervals(song_durations: List[Tuple[float, float]], duration: float,
+                            first_start: float, at_end: bool) -> List[Tuple[float, float]]:
+    """
+    Windows tied to song boundaries: the last `duration` seconds of every
+    song (at_end) or first_start plus the start of every following song.
+    """
+    if at_end:
+        return [(song_start + song_duration - duration, duration) for song_start, song_duration in song_durations]
+    return [(first_start, duration)] + [(song_start, duration) for song_start, _ in song_durations[1:]]
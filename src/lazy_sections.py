@@ -0,0 +1,219 @@
+# This file uses PyQt6
+"""
+On-demand construction of the main window's layer sections.
+
+Each heavy layer section (intro, overlays, soundwave, frame box, ...) starts
+out as an empty placeholder in the scroll layout. The real group box is
+built the first time the section is scrolled into view, navigated to, or
+one of its widgets is accessed. Until then the manager acts as the model for
+the section: visibility from settings and template values are recorded here
+and applied when the section is built.
+"""
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+from PyQt6.QtWidgets import QWidget
+
+# Settings key that shows/hides each lazy section
+LAZY_SECTION_SETTINGS = {
+    'intro': 'show_intro_settings',
+    'overlay1_2': 'show_overlay1_2_settings',
+    'overlay4_5': 'show_overlay4_5_settings',
+    'overlay6_7': 'show_overlay6_7_settings',
+    'overlay3_titles_wave': 'show_overlay3_titles_soundwave_settings',
+    'frame_box': 'show_frame_box_settings',
+    'mp3_cover': 'show_mp3_cover_overlay_settings',
+    'overlay8': 'show_overlay8_settings',
+    'overlay9': 'show_overlay9_settings',
+    'overlay10': 'show_overlay10_settings',
+    'frame_mp3cover': 'show_frame_mp3cover_settings',
+}
+
+# SuperCutUI attributes created by each section's builder (exact names or
+# prefixes ending in "_")
+SECTION_ATTRIBUTE_PREFIXES = {
+    'intro': ('intro_',),
+    'overlay1_2': ('overlay1_', 'overlay2_', 'overlay_checkbox', 'overlay_groupbox_1_2',
+                   'overlay_start_at', 'effect_combo', 'selected_overlay1_2_'),
+    'overlay4_5': ('overlay4_', 'overlay5_', 'overlay_groupbox_4_5', 'selected_overlay4_5_'),
+    'overlay6_7': ('overlay6_', 'overlay7_', 'overlay_groupbox_6_7', 'selected_overlay6_7_'),
+    'overlay3_titles_wave': ('overlay3_', 'song_title_', 'soundwave_', 'overlay_groupbox_3_titles_wave',
+                             'selected_overlay3_soundwave_'),
+    'frame_box': ('frame_box_', 'selected_frame_box_'),
+    'mp3_cover': ('mp3_cover_', 'selected_mp3_cover_'),
+    'overlay8': ('overlay8_', 'overlay_groupbox_8', 'selected_overlay8_'),
+    'overlay9': ('overlay9_', 'overlay_groupbox_9', 'selected_overlay9_'),
+    'overlay10': ('overlay10_', 'overlay_groupbox_10', 'selected_overlay10_'),
+    'frame_mp3cover': ('frame_mp3cover_', 'selected_frame_mp3cover_'),
+}
+
+# Template entries that belong to each section
+SECTION_TEMPLATE_KEYS = {
+    'intro': (['intro'], []),
+    'overlay1_2': (['overlay1', 'overlay2'], ['overlay1_2_effect_settings']),
+    'overlay4_5': (['overlay4', 'overlay5'], ['overlay4_5_effect_settings']),
+    'overlay6_7': (['overlay6', 'overlay7'], ['overlay6_7_effect_settings']),
+    'overlay3_titles_wave': (['overlay3', 'song_titles', 'soundwave'], ['overlay3_soundwave_effect_settings']),
+    'frame_box': (['frame_box'], []),
+    'mp3_cover': (['mp3_cover_overlay'], []),
+    'overlay8': (['overlay8'], []),
+    'overlay9': (['overlay9'], []),
+    'overlay10': (['overlay10'], []),
+    'frame_mp3cover': (['frame_mp3cover'], []),
+}
+
+# Approximate built height of each section, so the scroll range stays close
+PLACEHOLDER_HEIGHTS = {
+    'intro': 110,
+    'overlay1_2': 190,
+    'overlay4_5': 190,
+    'overlay6_7': 190,
+    'overlay3_titles_wave': 300,
+    'frame_box': 340,
+    'mp3_cover': 150,
+    'overlay8': 190,
+    'overlay9': 190,
+    'overlay10': 150,
+    'frame_mp3cover': 150,
+}
+
+
+class SectionPlaceholder(QWidget):
+    """Empty stand-in that reserves a section's place in the scroll layout"""
+
+    def __init__(self, section_id: str, height: int, parent=None):
+        super().__init__(parent)
+        self.section_id = section_id
+        self.setFixedHeight(height)
+
+
+class _SectionSlot:
+    """Layout stand-in handed to a builder; inserts widgets where the placeholder sits"""
+
+    def __init__(self, layout, placeholder: SectionPlaceholder):
+        self._layout = layout
+        self._placeholder = placeholder
+
+    def addWidget(self, widget, *args, **kwargs):
+        index = self._layout.indexOf(widget)
+        if index != -1:
+            # Builders may add their group box more than once; keep the first position
+            return
+        self._layout.insertWidget(self._layout.indexOf(self._placeholder), widget, *args, **kwargs)
+
+
+class LazySectionManager:
+    """Tracks placeholders, builds sections on demand and holds their pending state"""
+
+    def __init__(self, on_built: Optional[Callable[[str, dict], None]] = None):
+        self._builders: Dict[str, Callable] = {}
+        self._placeholders: Dict[str, SectionPlaceholder] = {}
+        self._layouts = {}
+        self._built = set()
+        self._building = set()
+        self._visible: Dict[str, bool] = {}
+        self._pending_templates: Dict[str, dict] = {}
+        self._deferred = 0
+        self._on_built = on_built
+
+    def add(self, section_id: str, layout, builder: Callable) -> SectionPlaceholder:
+        """Reserve a section in layout; builder(layout) creates it later"""
+        placeholder = SectionPlaceholder(section_id, PLACEHOLDER_HEIGHTS.get(section_id, 150))
+        placeholder.setVisible(False)
+        layout.addWidget(placeholder)
+        self._builders[section_id] = builder
+        self._placeholders[section_id] = placeholder
+        self._layouts[section_id] = layout
+        self._visible[section_id] = False
+        return placeholder
+
+    def is_built(self, section_id: str) -> bool:
+        return section_id in self._built
+
+    def unbuilt_sections(self):
+        return [sid for sid in self._builders if sid not in self._built]
+
+    def placeholder(self, section_id: str) -> Optional[SectionPlaceholder]:
+        return self._placeholders.get(section_id)
+
+    def section_for_attribute(self, name: str) -> Optional[str]:
+        """Unbuilt section whose builder creates attribute name, if any"""
+        for section_id, prefixes in SECTION_ATTRIBUTE_PREFIXES.items():
+            if section_id in self._builders and section_id not in self._built:
+                for prefix in prefixes:
+                    if name == prefix or (prefix.endswith('_') and name.startswith(prefix)):
+                        return section_id
+        return None
+
+    @contextmanager
+    def deferred(self):
+        """While active, unbuilt sections stay unbuilt; hasattr() on their widgets is False"""
+        self._deferred += 1
+        try:
+            yield
+        finally:
+            self._deferred -= 1
+
+    def build(self, section_id: str, force: bool = False) -> bool:
+        """Build a section now. Returns True if it was built by this call."""
+        if section_id not in self._builders or section_id in self._built or section_id in self._building:
+            return False
+        if self._deferred and not force:
+            return False
+        placeholder = self._placeholders[section_id]
+        layout = self._layouts[section_id]
+        self._building.add(section_id)
+        try:
+            self._builders[section_id](_SectionSlot(layout, placeholder))
+        finally:
+            self._building.discard(section_id)
+        self._built.add(section_id)
+        layout.removeWidget(placeholder)
+        placeholder.deleteLater()
+        del self._placeholders[section_id]
+        pending = self._pending_templates.pop(section_id, None)
+        if self._on_built:
+            self._on_built(section_id, pending)
+        return True
+
+    def build_all(self):
+        for section_id in self.unbuilt_sections():
+            self.build(section_id, force=True)
+
+    # --- Model for unbuilt sections ---
+    def is_visible(self, section_id: str) -> bool:
+        return self._visible.get(section_id, False)
+
+    def set_visible(self, section_id: str, visible: bool):
+        """Record a section's visibility; unbuilt sections only show their placeholder"""
+        self._visible[section_id] = visible
+        placeholder = self._placeholders.get(section_id)
+        if placeholder is not None:
+            placeholder.setVisible(visible)
+            if not visible:
+                # Hiding a section unchecks its layers, as it does for built sections
+                self._disable_pending_layers(section_id)
+
+    def remember_template(self, template_data: dict):
+        """Keep the parts of a template that belong to unbuilt sections until they are built"""
+        layer_settings = template_data.get('layer_settings', {})
+        for section_id in self.unbuilt_sections():
+            layer_keys, extra_keys = SECTION_TEMPLATE_KEYS.get(section_id, ([], []))
+            subset = {}
+            layers = {k: dict(layer_settings[k]) for k in layer_keys if k in layer_settings}
+            if layers:
+                subset['layer_settings'] = layers
+            for key in extra_keys:
+                if key in template_data:
+                    subset[key] = template_data[key]
+            if subset:
+                self._pending_templates[section_id] = subset
+
+    def pending_template(self, section_id: str) -> Optional[dict]:
+        return self._pending_templates.get(section_id)
+
+    def _disable_pending_layers(self, section_id: str):
+        pending = self._pending_templates.get(section_id)
+        if pending:
+            for layer in pending.get('layer_settings', {}).values():
+                layer['enabled'] = False
@@ -1,19 +1,177 @@
 # This file uses PyQt6
-import logging
+"""
+Non-blocking logging pipeline.
+
+Log calls only put the record on a queue; a single QueueListener thread
+formats it and writes it to the console, the rotating text log and (when
+enabled) a JSON-lines sink. Render threads never wait on disk or console I/O.
+
+Stage timings go through log_stage()/timed_stage() and carry batch, stage and
+duration fields so a JSON log can be analysed offline for throughput. Timed
+stages are also folded into src.metrics for the live metrics endpoint.
+"""
+import os
 import sys
+import json
+import time
+import queue
+import atexit
+import logging
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Optional
+from src.metrics import metrics
+
+LOG_FILE = 'supercut.log'
+LOG_JSON_FILE = 'supercut.jsonl'
+LOG_MAX_BYTES = 5 * 1024 * 1024  # Rotate when the file grows past this size (and daily)
+LOG_BACKUP_COUNT = 7
+# Set SUPERCUT_JSON_LOG=1 to write the JSON-lines sink from startup
+JSON_LOG_ENV = 'SUPERCUT_JSON_LOG'
+
+# Extra record fields copied into the JSON sink
+STRUCTURED_FIELDS = ('batch', 'stage', 'duration', 'fields')
+
+
+class SizedTimedRotatingFileHandler(RotatingFileHandler):
+    """Rotates when the file exceeds max_bytes and at the first write after midnight"""
+
+    def __init__(self, filename, max_bytes=LOG_MAX_BYTES, backup_count=LOG_BACKUP_COUNT, encoding='utf-8'):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding=encoding, delay=True)
+        # A log last written on an earlier day is rotated on the first record of this run
+        try:
+            last_write = os.path.getmtime(self.baseFilename)
+        except OSError:
+            last_write = time.time()
+        self.rollover_at = self._next_midnight(last_write)
+
+    @staticmethod
+    def _next_midnight(timestamp):
+        day = datetime.fromtimestamp(timestamp).date() + timedelta(days=1)
+        return datetime.combine(day, datetime.min.time()).timestamp()
+
+    def shouldRollover(self, record):
+        if record.created >= self.rollover_at and os.path.exists(self.baseFilename):
+            return True
+        return super().shouldRollover(record)
+
+    def doRollover(self):
+        super().doRollover()
+        self.rollover_at = self._next_midnight(time.time())
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per record, including batch/stage/duration when present"""
+
+    def format(self, record):
+        entry = {
+            'ts': round(record.created, 3),
+            'level': record.levelname,
+            'module': record.module,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        for field in STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class SwitchableHandler(logging.Handler):
+    """Wraps a handler so it can be turned on and off while the listener runs"""
+
+    def __init__(self, factory, enabled=False):
+        super().__init__()
+        self._factory = factory
+        self._handler = None
+        self.enabled = enabled
+
+    def emit(self, record):
+        if not self.enabled:
+            return
+        if self._handler is None:
+            self._handler = self._factory()
+        self._handler.handle(record)
+
+    def close(self):
+        if self._handler is not None:
+            self._handler.close()
+        super().close()
+
+
+class _ConsoleFilter(logging.Filter):
+    """Keep stage timing records out of the console; they are for the log files"""
+
+    def filter(self, record):
+        return getattr(record, 'stage', None) is None
+
+
+def _json_handler_factory():
+    handler = SizedTimedRotatingFileHandler(LOG_JSON_FILE)
+    handler.setFormatter(JsonLinesFormatter())
+    return handler
+
 
 # Create a custom handler that writes to stdout
 console_handler = logging.StreamHandler(sys.stdout)
 console_handler.setLevel(logging.INFO)
 console_formatter = logging.Formatter('[%(asctime)s] %(levelname)s in %(module)s: %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
 console_handler.setFormatter(console_formatter)
+console_handler.addFilter(_ConsoleFilter())
 
-# Create a file handler for persistent logs
-file_handler = logging.FileHandler('supercut.log', encoding='utf-8')
+# Create a rotating file handler for persistent logs
+file_handler = SizedTimedRotatingFileHandler(LOG_FILE)
 file_handler.setLevel(logging.INFO)
-file_handler.setFormatter(console_formatter)
+file_handler.setFormatter(logging.Formatter(
+    '[%(asctime)s] %(levelname)s in %(module)s [%(threadName)s]: %(message)s', datefmt='%Y-%m-%d %H:%M:%S'))
+
+# Optional JSON-lines sink for offline analysis
+json_handler = SwitchableHandler(_json_handler_factory, enabled=os.environ.get(JSON_LOG_ENV) == '1')
+json_handler.setLevel(logging.INFO)
+
+# Log calls only enqueue; the listener thread does all formatting and I/O
+log_queue = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, console_handler, file_handler, json_handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+# Configure the root logger; the queue handler passes the bare message on to the listener
+queue_handler = QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+
+logger = logging.getLogger('SuperCut')
+
+
+def set_structured_log_enabled(enabled: bool) -> None:
+    """Turn the JSON-lines sink on or off"""
+    json_handler.enabled = bool(enabled) or os.environ.get(JSON_LOG_ENV) == '1'
+
+
+def log_stage(stage: str, batch: Optional[int] = None, duration: Optional[float] = None, **fields) -> None:
+    """Record one pipeline stage with its batch and timing"""
+    if duration is not None:
+        metrics.observe_stage(stage, duration)
+    details = ''.join(f" {k}={v}" for k, v in fields.items())
+    timing = f" in {duration:.2f}s" if duration is not None else ''
+    batch_text = f" batch={batch}" if batch is not None else ''
+    logger.info(f"stage={stage}{batch_text}{timing}{details}", extra={
+        'stage': stage,
+        'batch': batch,
+        'duration': round(duration, 3) if duration is not None else None,
+        'fields': fields or None,
+    })
 
-# Configure the root logger
-logging.basicConfig(level=logging.INFO, handlers=[console_handler, file_handler])
 
-logger = logging.getLogger('SuperCut') 
\ No newline at end of file
+@contextmanager
+def timed_stage(stage: str, batch: Optional[int] = None, **fields):
+    """Time the enclosed block and record it with log_stage()"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        log_stage(stage, batch=batch, duration=time.perf_counter() - start, **fields)
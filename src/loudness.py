@@ -0,0 +1,189 @@
+# This file uses PyQt6
+"""
+Per-track loudness index for normalizing mixes.
+
+Each MP3 is measured once with ffmpeg's ebur128 filter (integrated
+loudness and true peak), and the result is kept in config/loudness_index.json
+keyed by path, size and mtime. When a batch is merged, every track gets a
+precomputed gain in the same ffmpeg pass that joins the tracks (see
+merge_mp3s_with_ffmpeg), so normalizing adds no per-batch analysis: only
+tracks never seen before are measured, and only once. A scan writes the
+index in batches, merged under a lock file with whatever other processes
+stored meanwhile.
+
+Gains bring each track to the target loudness, limited so its true peak
+stays below LOUDNESS_PEAK_CEILING.
+"""
+import os
+import re
+import subprocess
+import threading
+import time
+from typing import Dict, List, Optional
+from src.config import FFMPEG_BINARY, PROJECT_ROOT
+from src.logger import logger, log_stage
+from src.resource_governor import resource_governor
+from src.settings_store import atomic_write_json, read_json, file_lock
+
+LOUDNESS_INDEX_FILE = os.path.join(PROJECT_ROOT, "config", "loudness_index.json")
+LOUDNESS_PEAK_CEILING = -1.0  # dBTP a track may reach after its gain
+LOUDNESS_SILENCE_LUFS = -70.0  # ebur128 gating floor; quieter tracks are left alone
+LOUDNESS_MAX_GAIN = 20.0  # dB, so a near-silent intro track is not blown up
+LOUDNESS_MEASURE_TIMEOUT = 600
+LOUDNESS_SAVE_EVERY = 50  # Tracks measured per index write during a scan
+
+_INTEGRATED_PATTERN = re.compile(r'I:\s+(-?\d+(?:\.\d+)?|-inf) LUFS')
+_TRUE_PEAK_PATTERN = re.compile(r'Peak:\s+(-?\d+(?:\.\d+)?|-inf) dBFS')
+
+
+def _last_value(pattern: re.Pattern, text: str) -> Optional[float]:
+    # The summary printed at the end comes after any per-frame output
+    matches = pattern.findall(text)
+    if not matches:
+        return None
+    return float("-inf") if matches[-1] == "-inf" else float(matches[-1])
+
+
+def measure_loudness(path: str) -> Optional[dict]:
+    """Integrated loudness (LUFS) and true peak (dBTP) of an audio file, or None on failure"""
+    cmd = [
+        FFMPEG_BINARY, "-hide_banner", "-nostats",
+        "-i", path,
+        "-vn",
+        "-af", "ebur128=peak=true:framelog=verbose",
+        "-f", "null", "-",
+    ]
+    try:
+        result = resource_governor.run(cmd, capture_output=True, text=True, check=True,
+                                       timeout=LOUDNESS_MEASURE_TIMEOUT)
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as e:
+        logger.warning(f"Could not measure loudness of {path}: {e}")
+        return None
+    integrated = _last_value(_INTEGRATED_PATTERN, result.stderr or "")
+    true_peak = _last_value(_TRUE_PEAK_PATTERN, result.stderr or "")
+    if integrated is None or true_peak is None:
+        logger.warning(f"No loudness summary for {path}")
+        return None
+    return {"lufs": integrated, "true_peak": true_peak}
+
+
+def loudness_gain(measurement: Optional[dict], target_lufs: float) -> float:
+    """Gain in dB that brings a measured track to target_lufs without passing the peak ceiling"""
+    if not measurement or measurement["lufs"] <= LOUDNESS_SILENCE_LUFS:
+        return 0.0
+    gain = min(target_lufs - measurement["lufs"], LOUDNESS_MAX_GAIN)
+    if measurement["true_peak"] > float("-inf"):
+        gain = min(gain, LOUDNESS_PEAK_CEILING - measurement["true_peak"])
+    return gain
+
+
+class LoudnessIndex:
+    """Loudness measurements per track, keyed by path, size and mtime"""
+
+    def __init__(self, path: str = LOUDNESS_INDEX_FILE):
+        self.path = path
+        self.lock_path = path + ".lock"
+        self._lock = threading.Lock()
+        self._data: Optional[Dict[str, dict]] = None
+
+    def _load(self) -> Dict[str, dict]:
+        if self._data is None:
+            data = read_json(self.path) if os.path.exists(self.path) else None
+            self._data = data if isinstance(data, dict) else {}
+        return self._data
+
+    @staticmethod
+    def _key(path: str) -> str:
+        st = os.stat(path)
+        return f"{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}"
+
+    def _save(self, measurements: Dict[str, dict]):
+        """Merge new measurements into the index on disk and write it once"""
+        if not measurements:
+            return
+        with self._lock:
+            try:
+                with file_lock(self.lock_path):
+                    # Re-read so entries stored by other processes since our load are kept
+                    data = read_json(self.path) if os.path.exists(self.path) else None
+                    data = data if isinstance(data, dict) else {}
+                    for key, measurement in measurements.items():
+                        # Drop entries for older versions of the same file
+                        prefix = key.rsplit("|", 2)[0] + "|"
+                        for stale in [k for k in data if k.startswith(prefix) and k != key]:
+                            del data[stale]
+                        data[key] = measurement
+                    atomic_write_json(self.path, data)
+            except OSError as e:
+                logger.warning(f"Could not update loudness index: {e}")
+                data = dict(self._load())
+                data.update(measurements)
+            self._data = data
+
+    def _measure(self, path: str) -> Optional[tuple]:
+        """(key, measurement) of a track from the index or ffmpeg, without writing the index"""
+        try:
+            key = self._key(path)
+        except OSError as e:
+            logger.warning(f"Could not stat {path} for loudness: {e}")
+            return None
+        with self._lock:
+            cached = self._load().get(key)
+        if cached is not None:
+            return key, cached
+        measurement = measure_loudness(path)
+        return (key, measurement) if measurement is not None else None
+
+    def get(self, path: str) -> Optional[dict]:
+        """Measurement of a track, measuring (and storing) it on first use"""
+        result = self._measure(path)
+        if result is None:
+            return None
+        key, measurement = result
+        with self._lock:
+            stored = key in self._load()
+        if not stored:
+            self._save({key: measurement})
+        return measurement
+
+    def missing(self, paths: List[str]) -> List[str]:
+        """Tracks without a measurement yet"""
+        with self._lock:
+            data = self._load()
+            result = []
+            for path in paths:
+                try:
+                    if self._key(path) not in data:
+                        result.append(path)
+                except OSError:
+                    continue
+            return result
+
+    def scan(self, paths: List[str]) -> int:
+        """Measure every track not in the index yet; returns how many were measured"""
+        pending = self.missing(paths)
+        if not pending:
+            return 0
+        print(f"🔊 Measuring loudness of {len(pending)} new tracks (once per track)...")
+        start = time.perf_counter()
+        measured = 0
+        batch: Dict[str, dict] = {}
+        for path in pending:
+            result = self._measure(path)
+            if result is None:
+                continue
+            batch[result[0]] = result[1]
+            measured += 1
+            if len(batch) >= LOUDNESS_SAVE_EVERY:
+                self._save(batch)
+                batch = {}
+        self._save(batch)
+        log_stage("loudness_scan", duration=time.perf_counter() - start, tracks=measured)
+        return measured
+
+    def gains(self, paths: List[str], target_lufs: float) -> List[float]:
+        """Precomputed gain in dB for each track"""
+        return [loudness_gain(self.get(path), target_lufs) for path in paths]
+
+
+loudness_index = LoudnessIndex()
@@ -1,5 +1,6 @@
 # This file uses PyQt6
 import os
+from contextlib import contextmanager
 from PyQt6 import QtWidgets
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
@@ -8,7 +9,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QSettings, QThread, QPoint, QSize, QTimer, QObject, QEvent
 from PyQt6.QtGui import QIntValidator, QIcon, QPixmap, QMovie, QImage, QShortcut, QKeySequence, QColor
-from src.logger import logger
+from src.logger import logger, set_structured_log_enabled
 
 # Force console output to be visible (safe for .pyw)
 import sys
@@ -31,6 +32,10 @@ from src.config import (
     DEFAULT_MIN_MP3_COUNT,
     PROJECT_ROOT,
     DEFAULT_FFMPEG_PRESETS, DEFAULT_FFMPEG_PRESET,
+    DEFAULT_FRAME_RATE_MODES, DEFAULT_FRAME_RATE_MODE,
+    DEFAULT_DRY_RUN_MODES, DEFAULT_DRY_RUN_MODE, DRY_RUN_PROXY_SCALE,
+    DEFAULT_CAPACITY_POLICIES, DEFAULT_CAPACITY_POLICY,
+    DEFAULT_LOUDNESS_TARGETS, DEFAULT_LOUDNESS_TARGET,
     DEFAULT_AUDIO_BITRATE_OPTIONS, DEFAULT_AUDIO_BITRATE,
     DEFAULT_VIDEO_BITRATE_OPTIONS, DEFAULT_VIDEO_BITRATE,
     DEFAULT_MAXRATE_OPTIONS, DEFAULT_MAXRATE,
@@ -40,13 +45,20 @@ from src.utils import (
     sanitize_filename, get_desktop_folder, open_folder_in_explorer,
     validate_inputs, validate_media_files, clean_file_path
 )
-from src.ui_components import FolderDropLineEdit, PleaseWaitDialog, StoppedDialog, SuccessDialog, DryRunSuccessDialog, ScrollableErrorDialog, ImageDropLineEdit, NoWheelComboBox, KhmerSupportLineEdit, KhmerSupportPlainTextEdit
+from src.ui_components import FolderDropLineEdit, PleaseWaitDialog, StoppedDialog, SuccessDialog, DryRunSuccessDialog, FramePreviewDialog, ScrollableErrorDialog, ImageDropLineEdit, NoWheelComboBox, KhmerSupportLineEdit, KhmerSupportPlainTextEdit
 from src.video_worker import VideoWorker
+from src.ffmpeg_utils import parse_renditions
+from src.resource_governor import parse_resource_limits, format_resource_limits
+from src.metrics import start_metrics_server, start_metrics_from_env
 from src.terminal_widget import TerminalWidget
 from src.layer_manager import LayerManagerDialog
 from src.config import save_layer_order, load_layer_order
 from src.template_manager_dialog import TemplateManagerDialog
+from src.render_queue import render_queue
+from src.render_queue_dialog import RenderQueueDialog
 from src.template_utils import apply_template_to_settings
+from src.lazy_sections import LazySectionManager, LAZY_SECTION_SETTINGS
+from src.startup_profiler import startup_profiler
 
 import time
 import threading
@@ -655,6 +667,107 @@ class SettingsDialog(QDialog):
             self.settings.value('filter_complex_alt_mode', False, type=bool) if self.settings is not None else False
         )
 
+        # --- Add to SettingsDialog: RAM Disk Temp Files Checkbox ---
+        self.ram_temp_checkbox = QtWidgets.QCheckBox("RAM Disk")
+        self.ram_temp_checkbox.setChecked(
+            self.settings.value('use_ram_temp', False, type=bool) if self.settings is not None else False
+        )
+
+        # --- Add to SettingsDialog: Structured Log Checkbox ---
+        self.structured_log_checkbox = QtWidgets.QCheckBox("JSON Lines")
+        self.structured_log_checkbox.setChecked(
+            self.settings.value('structured_log', False, type=bool) if self.settings is not None else False
+        )
+
+        # --- Add to SettingsDialog: Frame Rate Mode Combo ---
+        self.frame_rate_mode_combo = NoWheelComboBox(self)
+        self.frame_rate_mode_combo.setFixedWidth(120)
+        for label, value in DEFAULT_FRAME_RATE_MODES:
+            self.frame_rate_mode_combo.addItem(label, value)
+        if self.settings is not None:
+            default_frame_rate_mode = self.settings.value('frame_rate_mode', DEFAULT_FRAME_RATE_MODE, type=str)
+        else:
+            default_frame_rate_mode = DEFAULT_FRAME_RATE_MODE
+        idx = next((i for i, (label, value) in enumerate(DEFAULT_FRAME_RATE_MODES) if value == default_frame_rate_mode), 0)
+        self.frame_rate_mode_combo.setCurrentIndex(idx)
+
+        # --- Add to SettingsDialog: Dry Run Mode Combo ---
+        self.dry_run_mode_combo = NoWheelComboBox(self)
+        self.dry_run_mode_combo.setFixedWidth(120)
+        for label, value in DEFAULT_DRY_RUN_MODES:
+            self.dry_run_mode_combo.addItem(label, value)
+        if self.settings is not None:
+            default_dry_run_mode = self.settings.value('dry_run_mode', DEFAULT_DRY_RUN_MODE, type=str)
+        else:
+            default_dry_run_mode = DEFAULT_DRY_RUN_MODE
+        idx = next((i for i, (label, value) in enumerate(DEFAULT_DRY_RUN_MODES) if value == default_dry_run_mode), 0)
+        self.dry_run_mode_combo.setCurrentIndex(idx)
+
+        # --- Add to SettingsDialog: Capacity Policy Combo ---
+        self.capacity_policy_combo = NoWheelComboBox(self)
+        self.capacity_policy_combo.setFixedWidth(120)
+        self.capacity_policy_combo.setToolTip("What to do when the planned job does not fit on the output or temp disk")
+        for label, value in DEFAULT_CAPACITY_POLICIES:
+            self.capacity_policy_combo.addItem(label, value)
+        if self.settings is not None:
+            default_capacity_policy = self.settings.value('capacity_policy', DEFAULT_CAPACITY_POLICY, type=str)
+        else:
+            default_capacity_policy = DEFAULT_CAPACITY_POLICY
+        idx = next((i for i, (label, value) in enumerate(DEFAULT_CAPACITY_POLICIES) if value == default_capacity_policy), 0)
+        self.capacity_policy_combo.setCurrentIndex(idx)
+
+        # --- Add to SettingsDialog: Loudness Target Combo ---
+        self.loudness_target_combo = NoWheelComboBox(self)
+        self.loudness_target_combo.setFixedWidth(120)
+        self.loudness_target_combo.setToolTip("Normalize every track to this loudness when merging (measured once per track)")
+        for label, value in DEFAULT_LOUDNESS_TARGETS:
+            self.loudness_target_combo.addItem(label, value)
+        if self.settings is not None:
+            default_loudness_target = self.settings.value('loudness_target', DEFAULT_LOUDNESS_TARGET, type=str)
+        else:
+            default_loudness_target = DEFAULT_LOUDNESS_TARGET
+        idx = next((i for i, (label, value) in enumerate(DEFAULT_LOUDNESS_TARGETS) if value == default_loudness_target), 0)
+        self.loudness_target_combo.setCurrentIndex(idx)
+
+        # --- Add to SettingsDialog: Extra Renditions ---
+        self.renditions_edit = QLineEdit()
+        self.renditions_edit.setFixedWidth(120)
+        self.renditions_edit.setPlaceholderText("1280x720, 1080x1920")
+        self.renditions_edit.setToolTip("Extra outputs rendered from the same pass, comma separated")
+        self.renditions_edit.setText(
+            self.settings.value('extra_renditions', '', type=str) if self.settings is not None else ''
+        )
+
+        # --- Add to SettingsDialog: Render Farm Folder ---
+        self.render_farm_dir_edit = QLineEdit()
+        self.render_farm_dir_edit.setFixedWidth(120)
+        self.render_farm_dir_edit.setPlaceholderText("Render locally")
+        self.render_farm_dir_edit.setToolTip("Shared folder polled by render farm workers (python -m src.render_farm worker)")
+        self.render_farm_dir_edit.setText(
+            self.settings.value('render_farm_dir', '', type=str) if self.settings is not None else ''
+        )
+
+        # --- Add to SettingsDialog: Resource Limits ---
+        self.resource_limits_edit = QLineEdit()
+        self.resource_limits_edit.setFixedWidth(120)
+        self.resource_limits_edit.setPlaceholderText("nice=10, cpu=90, ram=85")
+        self.resource_limits_edit.setToolTip(
+            "Limits for ffmpeg processes: nice, io_priority, encodes (max concurrent), "
+            "cpu / ram / io ceilings in percent (0 = off)"
+        )
+        self.resource_limits_edit.setText(
+            self.settings.value('resource_limits', '', type=str) if self.settings is not None else ''
+        )
+
+        # --- Add to SettingsDialog: Metrics Port ---
+        self.metrics_port_edit = QLineEdit()
+        self.metrics_port_edit.setFixedWidth(120)
+        self.metrics_port_edit.setPlaceholderText("Off (e.g. 9464)")
+        self.metrics_port_edit.setToolTip("Serve stage timings on http://127.0.0.1:<port>/metrics (Prometheus) and /metrics.json")
+        self.metrics_port_edit.setValidator(QIntValidator(0, 65535, self))
+        metrics_port = self.settings.value('metrics_port', 0, type=int) if self.settings is not None else 0
+        self.metrics_port_edit.setText(str(metrics_port) if metrics_port else '')
+
         # Add advanced settings to right_form
         left_form.addRow("Intro:", self.intro_checkbox_label_edit)
         left_form.addRow("Overlay 1:", self.overlay1_label_edit)
@@ -705,8 +818,18 @@ class SettingsDialog(QDialog):
         right_form.addRow("List Name:", self.default_list_name_enabled_checkbox)
         right_form.addRow("MP3 # Default:", self.default_mp3_count_enabled_checkbox)
         right_form.addRow("Filter Complex:", self.filter_complex_alt_checkbox)
+        right_form.addRow("Temp Files:", self.ram_temp_checkbox)
+        right_form.addRow("Stage Log:", self.structured_log_checkbox)
         right_form.addRow("FPS:", self.fps_combo)
+        right_form.addRow("Frame Rate:", self.frame_rate_mode_combo)
+        right_form.addRow("Dry Run:", self.dry_run_mode_combo)
+        right_form.addRow("Low Disk:", self.capacity_policy_combo)
+        right_form.addRow("Loudness:", self.loudness_target_combo)
         right_form.addRow("Resolution:", self.resolution_combo)
+        right_form.addRow("Renditions:", self.renditions_edit)
+        right_form.addRow("Render Farm:", self.render_farm_dir_edit)
+        right_form.addRow("Resources:", self.resource_limits_edit)
+        right_form.addRow("Metrics Port:", self.metrics_port_edit)
         right_form.addRow("FFmpeg Preset:", self.preset_combo)
         right_form.addRow("Audio Bitrate:", self.audio_bitrate_combo)
         right_form.addRow("Video Bitrate:", self.video_bitrate_combo)
@@ -772,6 +895,17 @@ class SettingsDialog(QDialog):
             self.settings.setValue('show_mp3_cover_overlay_settings', self.show_mp3_cover_overlay_settings_checkbox.isChecked())
             self.settings.setValue('show_frame_box_settings', self.show_frame_box_settings_checkbox.isChecked())
             self.settings.setValue('filter_complex_alt_mode', self.filter_complex_alt_checkbox.isChecked())
+            self.settings.setValue('frame_rate_mode', self.frame_rate_mode_combo.currentData())
+            self.settings.setValue('dry_run_mode', self.dry_run_mode_combo.currentData())
+            self.settings.setValue('capacity_policy', self.capacity_policy_combo.currentData())
+            self.settings.setValue('loudness_target', self.loudness_target_combo.currentData())
+            self.settings.setValue('use_ram_temp', self.ram_temp_checkbox.isChecked())
+            self.settings.setValue('structured_log', self.structured_log_checkbox.isChecked())
+            self.settings.setValue('extra_renditions', ", ".join(parse_renditions(self.renditions_edit.text())))
+            self.settings.setValue('render_farm_dir', self.render_farm_dir_edit.text().strip())
+            self.settings.setValue('resource_limits', format_resource_limits(parse_resource_limits(self.resource_limits_edit.text())))
+            metrics_port_text = self.metrics_port_edit.text().strip()
+            self.settings.setValue('metrics_port', int(metrics_port_text) if metrics_port_text.isdigit() else 0)
             # Validate and save layer label customizations
             intro_label = self.intro_checkbox_label_edit.text().strip()
             if not intro_label:
@@ -1123,6 +1257,9 @@ class SuperCutUI(QWidget):
         self._worker = None
         self._thread = None
         self._dry_run_thread = None
+        self._frame_preview_dialog = None
+        self._frame_preview_thread = None
+        self._frame_preview_worker = None
         self._stopped_by_user = False
         self._auto_close_on_stop = False
         self._stopping_msgbox = None
@@ -1139,12 +1276,19 @@ class SuperCutUI(QWidget):
         self.layer_order = load_layer_order()  # Load saved layer order or None for default
         self.layer_manager_dialog = None  # Track layer manager dialog for toggle functionality
         self.template_manager_dialog = None  # Track template manager dialog for toggle functionality
-        
-        self.init_ui()
+        self.render_queue_dialog = None  # Track render queue dialog for toggle functionality
+        self.queue_runner = None  # Runs the render queue; created by the render queue dialog
+        self._enqueue_priority = None  # Set while create_video queues a job instead of rendering it
+        # Layer sections are built when first needed (see src.lazy_sections)
+        self._lazy_sections = LazySectionManager(on_built=self._on_lazy_section_built)
+        
+        with startup_profiler.phase("ui.init_ui"):
+            self.init_ui()
         self.restore_window_position()
         self.setup_shortcuts()
         self.update_output_name()
-        self.apply_settings()
+        with startup_profiler.phase("ui.apply_settings"):
+            self.apply_settings()
 
     def init_ui(self):
         """Initialize the user interface"""
@@ -1316,6 +1460,8 @@ class SuperCutUI(QWidget):
         
         # Store scroll area reference for resize handling
         self.scroll_area = scroll_area
+        # Build layer sections as they scroll into view
+        scroll_area.verticalScrollBar().valueChanged.connect(lambda _: self._build_sections_in_view())
 
     def create_navigation_menu(self, main_layout):
         """Create the sticky navigation menu"""
@@ -1385,6 +1531,9 @@ class SuperCutUI(QWidget):
     def scroll_to_section(self, section_id):
         """Scroll to the specified section"""
         if hasattr(self, 'section_widgets') and section_id in self.section_widgets:
+            # Build a visible section that is still a placeholder so its real position is known
+            if self._lazy_sections.is_visible(section_id) and self._lazy_sections.build(section_id):
+                self.scroll_area.widget().layout().activate()
             target_widget = self.section_widgets[section_id]
             # Find the scroll area
             scroll_area = None
@@ -1414,6 +1563,38 @@ class SuperCutUI(QWidget):
             self.section_widgets = {}
         self.section_widgets[section_id] = widget
 
+    def __getattr__(self, name):
+        # Only called for missing attributes: build the section that creates name, if any
+        lazy_sections = self.__dict__.get('_lazy_sections')
+        if lazy_sections is not None:
+            section_id = lazy_sections.section_for_attribute(name)
+            if section_id is not None and lazy_sections.build(section_id):
+                return getattr(self, name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def _build_sections_in_view(self):
+        """Build visible placeholders within the viewport and one screen below it"""
+        if not hasattr(self, 'scroll_area'):
+            return
+        viewport_height = self.scroll_area.viewport().height()
+        top = self.scroll_area.verticalScrollBar().value()
+        bottom = top + 2 * viewport_height
+        for section_id in self._lazy_sections.unbuilt_sections():
+            placeholder = self._lazy_sections.placeholder(section_id)
+            if placeholder is None or not self._lazy_sections.is_visible(section_id):
+                continue
+            if placeholder.y() <= bottom and placeholder.y() + placeholder.height() >= top:
+                self._lazy_sections.build(section_id)
+
+    def _on_lazy_section_built(self, section_id, pending_template):
+        """Bring a freshly built section in line with the settings and template model"""
+        section_widget = self.section_widgets.get(section_id)
+        if section_widget is not None:
+            section_widget.setVisible(self._lazy_sections.is_visible(section_id))
+        if pending_template:
+            with self._lazy_sections.deferred():
+                self._apply_template_layer_settings(pending_template)
+
 
     def create_folder_inputs(self, layout):
         """Create folder selection inputs"""
@@ -1788,6 +1969,295 @@ class SuperCutUI(QWidget):
 
         
 
+        # Shared effect choices for the overlay sections
+        effect_options = [
+            ("Fade in & out", "fadeinout"),
+            ("Fade in", "fadein"),
+            ("Fade out", "fadeout"),
+            ("Zoompan", "zoompan"),
+            ("None", "none")
+        ]
+
+        # Layer sections are built on demand; until then a placeholder holds their place
+        self._section_dims = {
+            'checkbox_solo_width': checkbox_solo_width,
+            'combo_long_width': combo_long_width,
+            'combo_medium_width': combo_medium_width,
+            'combo_mini_width': combo_mini_width,
+            'combo_short_width': combo_short_width,
+            'edit_long_width': edit_long_width,
+            'edit_medium_width': edit_medium_width,
+            'edit_short_width': edit_short_width,
+            'file_btn_width': file_btn_width,
+            'label_checkbox_width': label_checkbox_width,
+            'label_medium_width': label_medium_width,
+            'label_micro_width': label_micro_width,
+            'label_mini_width': label_mini_width,
+            'label_short_width': label_short_width,
+            'unified_height': unified_height,
+            'effect_options': effect_options,
+        }
+        for section_id, builder in (
+            ('intro', self._build_intro_section),
+            ('overlay1_2', self._build_overlay1_2_section),
+            ('overlay4_5', self._build_overlay4_5_section),
+            ('overlay6_7', self._build_overlay6_7_section),
+            ('overlay3_titles_wave', self._build_overlay3_titles_wave_section),
+            ('frame_box', self._build_frame_box_section),
+            ('mp3_cover', self._build_mp3_cover_section),
+            ('overlay8', self._build_overlay8_section),
+            ('overlay9', self._build_overlay9_section),
+            ('overlay10', self._build_overlay10_section),
+            ('frame_mp3cover', self._build_frame_mp3cover_section),
+        ):
+            self._lazy_sections.add(section_id, layout, builder)
+            self.register_section_widget(section_id, self._lazy_sections.placeholder(section_id))
+
+        # --- FINAL SETTINGS GROUP BOX ---
+        final_settings_groupbox = QtWidgets.QGroupBox("Final Settings")
+        final_settings_groupbox.setStyleSheet("""
+        QGroupBox {
+            font-weight: bold;
+            border: 2px solid #cccccc;
+            border-radius: 5px;
+            margin-top: 10px;
+            padding-top: 10px;
+        }
+        QGroupBox::title {
+            subcontrol-origin: margin;
+            left: 10px;
+            padding: 0 5px 0 5px;
+            color: #333333;
+            }
+        """)
+        final_settings_groupbox_layout = QVBoxLayout(final_settings_groupbox)
+        final_settings_groupbox_layout.setSpacing(8)
+        final_settings_groupbox_layout.setContentsMargins(10, 5, 10, 10)
+        layout.addWidget(final_settings_groupbox)
+        # Register for navigation
+        self.register_section_widget('final', final_settings_groupbox)
+        
+        # --- BACKGROUND LAYER SCALE CONTROL ---
+        # Load custom background checkbox label from settings
+        if hasattr(self, 'settings') and self.settings is not None:
+            background_label = self.settings.value('background_checkbox_label', " Background :", type=str)
+        else:
+            background_label = " Background :"
+        self.bg_layer_checkbox = QtWidgets.QCheckBox(background_label)
+        self.bg_layer_checkbox.setFixedWidth(label_checkbox_width)
+        self.bg_layer_checkbox.setFixedHeight(unified_height)
+        self.bg_layer_checkbox.setChecked(False)
+        def update_bg_layer_checkbox_style(state):
+            self.bg_layer_checkbox.setStyleSheet("")  # Always default color
+        self.bg_layer_checkbox.stateChanged.connect(update_bg_layer_checkbox_style)
+        update_bg_layer_checkbox_style(self.bg_layer_checkbox.checkState())
+
+        # Background scale dropdown (100% to 200%)
+        bg_scale_label = QLabel("Scale:")
+        bg_scale_label.setFixedWidth(label_short_width)
+        bg_scale_label.setFixedHeight(unified_height)
+        self.bg_scale_combo = NoWheelComboBox()
+        self.bg_scale_combo.setFixedWidth(combo_bg_width)
+        self.bg_scale_combo.setFixedHeight(unified_height)
+        for percent in range(100, 201, 5):  # 100% to 200% in 5% increments
+            self.bg_scale_combo.addItem(f"{percent}%", percent)
+        # Set default to 103% (index 0 for 100%, index 1 for 105%, so we'll use 100% as default)
+        self.bg_scale_combo.setCurrentIndex(0)  # Default 100%
+        self.bg_scale_percent = 100  # Default to 100%, will be overridden to 103% when checkbox is unchecked
+        def on_bg_scale_changed(idx):
+            self.bg_scale_percent = self.bg_scale_combo.itemData(idx)
+        self.bg_scale_combo.currentIndexChanged.connect(on_bg_scale_changed)
+        on_bg_scale_changed(self.bg_scale_combo.currentIndex())
+
+        # Background crop position dropdown
+        bg_crop_position_label = QLabel("Crop:")
+        bg_crop_position_label.setFixedWidth(label_short_width)
+        bg_crop_position_label.setFixedHeight(unified_height)
+        self.bg_crop_position_combo = NoWheelComboBox()
+        self.bg_crop_position_combo.setFixedWidth(combo_bg_width)
+        self.bg_crop_position_combo.setFixedHeight(unified_height)
+        crop_positions = [
+            "Center",
+            "Left",
+            "Right",
+            "Top",
+            "Bottom",
+            "Top Left",
+            "Top Right",
+            "Bottom Left",
+            "Bottom Right"
+        ]
+        for position in crop_positions:
+            self.bg_crop_position_combo.addItem(position)
+        self.bg_crop_position_combo.setCurrentIndex(0)  # Default Center
+        self.bg_crop_position = "center"
+        def on_bg_crop_position_changed(idx):
+            self.bg_crop_position = self.bg_crop_position_combo.itemText(idx).lower().replace(" ", "_")
+        self.bg_crop_position_combo.currentIndexChanged.connect(on_bg_crop_position_changed)
+        on_bg_crop_position_changed(self.bg_crop_position_combo.currentIndex())
+
+        # Background effect dropdown
+        bg_effect_label = QLabel("Effect:")
+        bg_effect_label.setFixedWidth(label_short_width)
+        bg_effect_label.setFixedHeight(unified_height)
+        self.bg_effect_combo = NoWheelComboBox()
+        self.bg_effect_combo.setFixedWidth(combo_bg_width)
+        self.bg_effect_combo.setFixedHeight(unified_height)
+
+        bg_effects = [
+            ("None", "none"),
+            ("Gaussian Blur", "gaussian_blur"),
+            ("Sharpen", "sharpen"),
+            ("Vignette", "vignette")
+        ]
+        for label, value in bg_effects:
+            self.bg_effect_combo.addItem(label, value)
+        self.bg_effect_combo.setCurrentIndex(0)  # Default None
+        self.bg_effect = "none"
+        def on_bg_effect_changed(idx):
+            self.bg_effect = self.bg_effect_combo.itemData(idx)
+        self.bg_effect_combo.currentIndexChanged.connect(on_bg_effect_changed)
+        on_bg_effect_changed(self.bg_effect_combo.currentIndex())
+
+        # Background effect intensity dropdown (1-100)
+        bg_intensity_label = QLabel("Level:")
+        bg_intensity_label.setFixedWidth(label_short_width)
+        bg_intensity_label.setFixedHeight(unified_height)
+        self.bg_intensity_combo = NoWheelComboBox()
+        self.bg_intensity_combo.setFixedWidth(combo_short_width)
+        self.bg_intensity_combo.setFixedHeight(unified_height)
+        for intensity in range(1, 101):
+            self.bg_intensity_combo.addItem(str(intensity), intensity)
+        self.bg_intensity_combo.setCurrentIndex(49)  # Default 50
+        self.bg_intensity = 50
+        def on_bg_intensity_changed(idx):
+            self.bg_intensity = self.bg_intensity_combo.itemData(idx)
+        self.bg_intensity_combo.currentIndexChanged.connect(on_bg_intensity_changed)
+        on_bg_intensity_changed(self.bg_intensity_combo.currentIndex())
+
+        def set_bg_layer_enabled(state):
+            enabled = state == Qt.CheckState.Checked
+            self.bg_scale_combo.setEnabled(enabled)
+            self.bg_crop_position_combo.setEnabled(enabled)
+            self.bg_effect_combo.setEnabled(enabled)
+            self.bg_intensity_combo.setEnabled(enabled)
+            if enabled:
+                self.bg_scale_combo.setStyleSheet("")
+                bg_scale_label.setStyleSheet("")
+                self.bg_crop_position_combo.setStyleSheet("")
+                bg_crop_position_label.setStyleSheet("")
+                self.bg_effect_combo.setStyleSheet("")
+                bg_effect_label.setStyleSheet("")
+                self.bg_intensity_combo.setStyleSheet("")
+                bg_intensity_label.setStyleSheet("")
+            else:
+                grey_btn_style = "background-color: #f2f2f2; color: #888; border: 1px solid #cfcfcf;"
+                self.bg_scale_combo.setStyleSheet(grey_btn_style)
+                bg_scale_label.setStyleSheet("color: grey;")
+                self.bg_crop_position_combo.setStyleSheet(grey_btn_style)
+                bg_crop_position_label.setStyleSheet("color: grey;")
+                self.bg_effect_combo.setStyleSheet(grey_btn_style)
+                bg_effect_label.setStyleSheet("color: grey;")
+                self.bg_intensity_combo.setStyleSheet(grey_btn_style)
+                bg_intensity_label.setStyleSheet("color: grey;")
+        
+        self.bg_layer_checkbox.stateChanged.connect(lambda _: set_bg_layer_enabled(self.bg_layer_checkbox.checkState()))
+
+        bg_layer_layout = QHBoxLayout()
+        bg_layer_layout.setSpacing(0)
+        bg_layer_layout.addWidget(self.bg_layer_checkbox)
+        bg_layer_layout.addSpacing(-18)
+        bg_layer_layout.addWidget(bg_scale_label)
+        bg_layer_layout.addSpacing(-3)
+        bg_layer_layout.addWidget(self.bg_scale_combo)
+        bg_layer_layout.addSpacing(8)
+        bg_layer_layout.addWidget(bg_crop_position_label)
+        bg_layer_layout.addSpacing(-6)
+        bg_layer_layout.addWidget(self.bg_crop_position_combo)
+        bg_layer_layout.addSpacing(8)
+        bg_layer_layout.addWidget(bg_effect_label)
+        bg_layer_layout.addSpacing(-1)
+        bg_layer_layout.addWidget(self.bg_effect_combo)
+        bg_layer_layout.addSpacing(12)
+        bg_layer_layout.addWidget(bg_intensity_label)
+        bg_layer_layout.addSpacing(-4)
+        bg_layer_layout.addWidget(self.bg_intensity_combo)
+        bg_layer_layout.addStretch()
+        final_settings_groupbox_layout.addLayout(bg_layer_layout)
+
+        # Initialize background layer enabled state
+        set_bg_layer_enabled(self.bg_layer_checkbox.checkState())
+        # --- END BACKGROUND LAYER SCALE CONTROL ---
+
+        # Placeholder checkbox (placeholder - does nothing for now)
+        self.lyric_checkbox = QtWidgets.QCheckBox("Lyric:")
+        self.lyric_checkbox.setFixedWidth(100)
+        self.lyric_checkbox.setChecked(False)
+        def update_lyric_checkbox_style(state):
+            self.lyric_checkbox.setStyleSheet("")  # Always default color
+        self.lyric_checkbox.stateChanged.connect(update_lyric_checkbox_style)
+        update_lyric_checkbox_style(self.lyric_checkbox.checkState())
+
+        # Placeholder dropdown (placeholder - does nothing for now)
+        self.lyric_dropdown_label = QtWidgets.QLabel("Lyric:")
+        self.lyric_dropdown_label.setFixedWidth(80)
+        self.lyric_dropdown = NoWheelComboBox()
+        self.lyric_dropdown.setFixedWidth(125)
+        self.lyric_dropdown.addItem("Select option...")
+        self.lyric_dropdown.addItem("Option 1")
+        self.lyric_dropdown.addItem("Option 2")
+        self.lyric_dropdown.addItem("Option 3")
+        self.lyric_dropdown.setCurrentIndex(0)  # Default to "Select option..."
+
+        # Enable/disable placeholder dropdown based on checkbox
+        def set_lyric_dropdown_enabled(state):
+            enabled = state == Qt.CheckState.Checked
+            self.lyric_dropdown.setEnabled(enabled)
+            self.lyric_dropdown_label.setStyleSheet("" if enabled else "color: grey;")
+            if not enabled:
+                grey_btn_style = "background-color: #f2f2f2; color: #888; border: 1px solid #cfcfcf;"
+                self.lyric_dropdown.setStyleSheet(grey_btn_style)
+            else:
+                self.lyric_dropdown.setStyleSheet("")
+        self.lyric_checkbox.stateChanged.connect(lambda _: set_lyric_dropdown_enabled(self.lyric_checkbox.checkState()))
+        set_lyric_dropdown_enabled(self.lyric_checkbox.checkState())
+
+        lyric_layout = QHBoxLayout()
+        lyric_layout.setSpacing(0)
+        lyric_layout.addWidget(self.lyric_checkbox)
+        lyric_layout.addSpacing(0)
+        lyric_layout.addWidget(self.lyric_dropdown_label)
+        lyric_layout.addWidget(self.lyric_dropdown)
+        lyric_layout.addStretch()
+        final_settings_groupbox_layout.addLayout(lyric_layout)        
+
+        # last_item label
+        self.last_item_label = QtWidgets.QLabel("Let's fucking go!")
+        self.last_item_label.setFixedWidth(120)
+        self.last_item_label.setStyleSheet("font-size: 14px; font-weight: thin; color: #888;")
+        self.last_item_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        # Add last_item label to layout
+        last_item_label_layout = QHBoxLayout()
+        last_item_label_layout.addStretch()
+        last_item_label_layout.addSpacing(23)
+        last_item_label_layout.addWidget(self.last_item_label)
+        last_item_label_layout.addStretch()
+        layout.addLayout(last_item_label_layout)
+
+    def _build_intro_section(self, layout):
+        """Build the intro section (created on demand, see src.lazy_sections)"""
+        checkbox_solo_width = self._section_dims['checkbox_solo_width']
+        combo_mini_width = self._section_dims['combo_mini_width']
+        edit_long_width = self._section_dims['edit_long_width']
+        edit_short_width = self._section_dims['edit_short_width']
+        file_btn_width = self._section_dims['file_btn_width']
+        label_checkbox_width = self._section_dims['label_checkbox_width']
+        label_micro_width = self._section_dims['label_micro_width']
+        label_mini_width = self._section_dims['label_mini_width']
+        label_short_width = self._section_dims['label_short_width']
+        unified_height = self._section_dims['unified_height']
+
         # --- INTRO OVERLAY CONTROLS ---
         # Load custom intro checkbox label from settings
         if hasattr(self, 'settings') and self.settings is not None:
@@ -2170,6 +2640,20 @@ class SuperCutUI(QWidget):
         # Register for navigation
         self.register_section_widget('intro', intro_group_box)
 
+    def _build_overlay1_2_section(self, layout):
+        """Build the overlay 1 & 2 section (created on demand, see src.lazy_sections)"""
+        checkbox_solo_width = self._section_dims['checkbox_solo_width']
+        combo_long_width = self._section_dims['combo_long_width']
+        combo_mini_width = self._section_dims['combo_mini_width']
+        edit_long_width = self._section_dims['edit_long_width']
+        edit_short_width = self._section_dims['edit_short_width']
+        file_btn_width = self._section_dims['file_btn_width']
+        label_checkbox_width = self._section_dims['label_checkbox_width']
+        label_micro_width = self._section_dims['label_micro_width']
+        label_mini_width = self._section_dims['label_mini_width']
+        label_short_width = self._section_dims['label_short_width']
+        unified_height = self._section_dims['unified_height']
+
         # Move PNG overlay checkbox below video settings
         # Load custom overlay1 checkbox label from settings
         if hasattr(self, 'settings') and self.settings is not None:
@@ -2698,7 +3182,22 @@ class SuperCutUI(QWidget):
         set_overlay1_2_duration_enabled(self.overlay1_2_duration_full_checkbox.checkState())
         # Initialize start at/from fields based on checkbox state
         set_overlay1_2_start_at_enabled(self.overlay1_2_start_at_checkbox.checkState())
-        
+
+    def _build_overlay4_5_section(self, layout):
+        """Build the overlay 4 & 5 section (created on demand, see src.lazy_sections)"""
+        checkbox_solo_width = self._section_dims['checkbox_solo_width']
+        combo_long_width = self._section_dims['combo_long_width']
+        combo_mini_width = self._section_dims['combo_mini_width']
+        edit_long_width = self._section_dims['edit_long_width']
+        edit_short_width = self._section_dims['edit_short_width']
+        effect_options = self._section_dims['effect_options']
+        file_btn_width = self._section_dims['file_btn_width']
+        label_checkbox_width = self._section_dims['label_checkbox_width']
+        label_micro_width = self._section_dims['label_micro_width']
+        label_mini_width = self._section_dims['label_mini_width']
+        label_short_width = self._section_dims['label_short_width']
+        unified_height = self._section_dims['unified_height']
+
         # --- Overlay 4, 5, and 4_5 Effect Group Box ---
         overlay_groupbox_4_5 = QtWidgets.QGroupBox("Overlay 4 && 5")
         self.overlay_groupbox_4_5 = overlay_groupbox_4_5  # Store reference for visibility control
@@ -3172,6 +3671,21 @@ class SuperCutUI(QWidget):
         # Initialize start at/from fields based on checkbox state
         set_overlay4_5_start_at_enabled(self.overlay4_5_start_at_checkbox.checkState())
 
+    def _build_overlay6_7_section(self, layout):
+        """Build the overlay 6 & 7 section (created on demand, see src.lazy_sections)"""
+        checkbox_solo_width = self._section_dims['checkbox_solo_width']
+        combo_long_width = self._section_dims['combo_long_width']
+        combo_mini_width = self._section_dims['combo_mini_width']
+        edit_long_width = self._section_dims['edit_long_width']
+        edit_short_width = self._section_dims['edit_short_width']
+        effect_options = self._section_dims['effect_options']
+        file_btn_width = self._section_dims['file_btn_width']
+        label_checkbox_width = self._section_dims['label_checkbox_width']
+        label_micro_width = self._section_dims['label_micro_width']
+        label_mini_width = self._section_dims['label_mini_width']
+        label_short_width = self._section_dims['label_short_width']
+        unified_height = self._section_dims['unified_height']
+
         # --- Overlay 6, 7, and 6_7 Effect Group Box ---
         overlay_groupbox_6_7 = QtWidgets.QGroupBox("Overlay 6 && 7")
         self.overlay_groupbox_6_7 = overlay_groupbox_6_7  # Store reference for visibility control
@@ -3668,6 +4182,21 @@ class SuperCutUI(QWidget):
         # Initialize start at/from fields based on checkbox state
         set_overlay6_7_start_at_enabled(self.overlay6_7_start_at_checkbox.checkState())
 
+    def _build_overlay3_titles_wave_section(self, layout):
+        """Build the overlay 3, song titles & soundwave section (created on demand, see src.lazy_sections)"""
+        combo_long_width = self._section_dims['combo_long_width']
+        combo_medium_width = self._section_dims['combo_medium_width']
+        combo_mini_width = self._section_dims['combo_mini_width']
+        combo_short_width = self._section_dims['combo_short_width']
+        edit_long_width = self._section_dims['edit_long_width']
+        file_btn_width = self._section_dims['file_btn_width']
+        label_checkbox_width = self._section_dims['label_checkbox_width']
+        label_medium_width = self._section_dims['label_medium_width']
+        label_micro_width = self._section_dims['label_micro_width']
+        label_mini_width = self._section_dims['label_mini_width']
+        label_short_width = self._section_dims['label_short_width']
+        unified_height = self._section_dims['unified_height']
+
         # --- Overlay 3, Song Titles, and Soundwave Group Box ---
         overlay_groupbox_3_titles_wave = QtWidgets.QGroupBox("Song Titles && Soundwave")
         self.overlay_groupbox_3_titles_wave = overlay_groupbox_3_titles_wave  # Store reference for visibility control
@@ -4538,6 +5067,27 @@ class SuperCutUI(QWidget):
         overlay_groupbox_3_titles_wave_layout.addLayout(song_title_controls_layout)
         
                 ###
+
+        # Initialize overlay 3 & soundwave effect control state
+        set_overlay3_soundwave_effect_enabled()
+
+    def _build_frame_box_section(self, layout):
+        """Build the frame box section (created on demand, see src.lazy_sections)"""
+        checkbox_solo_width = self._section_dims['checkbox_solo_width']
+        combo_medium_width = self._section_dims['combo_medium_width']
+        combo_mini_width = self._section_dims['combo_mini_width']
+        combo_short_width = self._section_dims['combo_short_width']
+        edit_medium_width = self._section_dims['edit_medium_width']
+        edit_short_width = self._section_dims['edit_short_width']
+        effect_options = self._section_dims['effect_options']
+        file_btn_width = self._section_dims['file_btn_width']
+        label_checkbox_width = self._section_dims['label_checkbox_width']
+        label_medium_width = self._section_dims['label_medium_width']
+        label_micro_width = self._section_dims['label_micro_width']
+        label_mini_width = self._section_dims['label_mini_width']
+        label_short_width = self._section_dims['label_short_width']
+        unified_height = self._section_dims['unified_height']
+
         # --- FRAME BOX GROUP BOX ---
         frame_box_groupbox = QtWidgets.QGroupBox("Frame Box Settings")
         self.frame_box_groupbox = frame_box_groupbox  # Store reference for visibility control
@@ -5580,6 +6130,23 @@ class SuperCutUI(QWidget):
         update_frame_box_effect_label_style()
         update_custom_image_controls_state()
 
+    def _build_mp3_cover_section(self, layout):
+        """Build the MP3 cover overlay section (created on demand, see src.lazy_sections)"""
+        checkbox_solo_width = self._section_dims['checkbox_solo_width']
+        combo_medium_width = self._section_dims['combo_medium_width']
+        combo_mini_width = self._section_dims['combo_mini_width']
+        combo_short_width = self._section_dims['combo_short_width']
+        edit_medium_width = self._section_dims['edit_medium_width']
+        edit_short_width = self._section_dims['edit_short_width']
+        effect_options = self._section_dims['effect_options']
+        file_btn_width = self._section_dims['file_btn_width']
+        label_checkbox_width = self._section_dims['label_checkbox_width']
+        label_medium_width = self._section_dims['label_medium_width']
+        label_micro_width = self._section_dims['label_micro_width']
+        label_mini_width = self._section_dims['label_mini_width']
+        label_short_width = self._section_dims['label_short_width']
+        unified_height = self._section_dims['unified_height']
+
         # --- MP3 COVER OVERLAY GROUP BOX ---
         mp3_cover_groupbox = QtWidgets.QGroupBox("MP3 Cover Overlay Settings")
         self.mp3_cover_groupbox = mp3_cover_groupbox  # Store reference for visibility control
@@ -5971,6 +6538,22 @@ class SuperCutUI(QWidget):
         set_mp3_cover_overlay_enabled(self.mp3_cover_overlay_checkbox.checkState())
         # --- END DYNAMIC MP3 COVER OVERLAY ---
 
+    def _build_overlay8_section(self, layout):
+        """Build the overlay 8 section (created on demand, see src.lazy_sections)"""
+        checkbox_solo_width = self._section_dims['checkbox_solo_width']
+        combo_long_width = self._section_dims['combo_long_width']
+        combo_mini_width = self._section_dims['combo_mini_width']
+        edit_long_width = self._section_dims['edit_long_width']
+        edit_short_width = self._section_dims['edit_short_width']
+        effect_options = self._section_dims['effect_options']
+        file_btn_width = self._section_dims['file_btn_width']
+        label_checkbox_width = self._section_dims['label_checkbox_width']
+        label_medium_width = self._section_dims['label_medium_width']
+        label_micro_width = self._section_dims['label_micro_width']
+        label_mini_width = self._section_dims['label_mini_width']
+        label_short_width = self._section_dims['label_short_width']
+        unified_height = self._section_dims['unified_height']
+
         # --- OVERLAY 8 GROUP BOX ---
         overlay_groupbox_8 = QtWidgets.QGroupBox("Overlay 8 Settings")
         self.overlay_groupbox_8 = overlay_groupbox_8  # Store reference for visibility control
@@ -6476,6 +7059,22 @@ class SuperCutUI(QWidget):
         self.overlay8_start_at_checkbox.stateChanged.connect(lambda _: set_overlay8_start_enabled(self.overlay8_start_at_checkbox.checkState()))
         update_overlay8_effect_label_style()
 
+    def _build_overlay9_section(self, layout):
+        """Build the overlay 9 section (created on demand, see src.lazy_sections)"""
+        checkbox_solo_width = self._section_dims['checkbox_solo_width']
+        combo_long_width = self._section_dims['combo_long_width']
+        combo_mini_width = self._section_dims['combo_mini_width']
+        edit_long_width = self._section_dims['edit_long_width']
+        edit_short_width = self._section_dims['edit_short_width']
+        effect_options = self._section_dims['effect_options']
+        file_btn_width = self._section_dims['file_btn_width']
+        label_checkbox_width = self._section_dims['label_checkbox_width']
+        label_medium_width = self._section_dims['label_medium_width']
+        label_micro_width = self._section_dims['label_micro_width']
+        label_mini_width = self._section_dims['label_mini_width']
+        label_short_width = self._section_dims['label_short_width']
+        unified_height = self._section_dims['unified_height']
+
         # --- OVERLAY 9 GROUP BOX ---
         overlay_groupbox_9 = QtWidgets.QGroupBox("Overlay 9 Settings")
         self.overlay_groupbox_9 = overlay_groupbox_9  # Store reference for visibility control
@@ -6978,6 +7577,21 @@ class SuperCutUI(QWidget):
         self.overlay9_start_at_checkbox.stateChanged.connect(lambda _: set_overlay9_start_enabled(self.overlay9_start_at_checkbox.checkState()))
         update_overlay9_effect_label_style()
 
+    def _build_overlay10_section(self, layout):
+        """Build the overlay 10 section (created on demand, see src.lazy_sections)"""
+        checkbox_solo_width = self._section_dims['checkbox_solo_width']
+        combo_long_width = self._section_dims['combo_long_width']
+        combo_mini_width = self._section_dims['combo_mini_width']
+        combo_short_width = self._section_dims['combo_short_width']
+        edit_long_width = self._section_dims['edit_long_width']
+        effect_options = self._section_dims['effect_options']
+        file_btn_width = self._section_dims['file_btn_width']
+        label_checkbox_width = self._section_dims['label_checkbox_width']
+        label_micro_width = self._section_dims['label_micro_width']
+        label_mini_width = self._section_dims['label_mini_width']
+        label_short_width = self._section_dims['label_short_width']
+        unified_height = self._section_dims['unified_height']
+
         # --- OVERLAY 10 GROUP BOX ---
         overlay_groupbox_10 = QtWidgets.QGroupBox("Overlay 10 Settings")
         self.overlay_groupbox_10 = overlay_groupbox_10  # Store reference for visibility control
@@ -7369,6 +7983,23 @@ class SuperCutUI(QWidget):
         self.overlay10_start_end_combo.currentIndexChanged.connect(lambda _: update_overlay10_effect_label_style())
         update_overlay10_effect_label_style()
 
+    def _build_frame_mp3cover_section(self, layout):
+        """Build the frame MP3 cover section (created on demand, see src.lazy_sections)"""
+        checkbox_solo_width = self._section_dims['checkbox_solo_width']
+        combo_medium_width = self._section_dims['combo_medium_width']
+        combo_mini_width = self._section_dims['combo_mini_width']
+        combo_short_width = self._section_dims['combo_short_width']
+        edit_medium_width = self._section_dims['edit_medium_width']
+        edit_short_width = self._section_dims['edit_short_width']
+        effect_options = self._section_dims['effect_options']
+        file_btn_width = self._section_dims['file_btn_width']
+        label_checkbox_width = self._section_dims['label_checkbox_width']
+        label_medium_width = self._section_dims['label_medium_width']
+        label_micro_width = self._section_dims['label_micro_width']
+        label_mini_width = self._section_dims['label_mini_width']
+        label_short_width = self._section_dims['label_short_width']
+        unified_height = self._section_dims['unified_height']
+
         # --- FRAME MP3 COVER GROUP BOX ---
         frame_mp3cover_groupbox = QtWidgets.QGroupBox("Frame MP3 Cover Settings")
         self.frame_mp3cover_groupbox = frame_mp3cover_groupbox  # Store reference for visibility control
@@ -7707,262 +8338,27 @@ class SuperCutUI(QWidget):
                 self.frame_mp3cover_start_edit.setEnabled(False)
                 frame_mp3cover_duration_label.setStyleSheet("color: grey;")
                 self.frame_mp3cover_duration_edit.setStyleSheet("background-color: #f2f2f2; color: #888; border: 1px solid #cfcfcf;")
-                self.frame_mp3cover_duration_edit.setEnabled(False)
-                frame_mp3cover_duration_full_label.setStyleSheet("color: grey;")
-                self.frame_mp3cover_duration_full_checkbox.setStyleSheet("color: grey;")
-                self.frame_mp3cover_duration_full_checkbox.setEnabled(False)
-            else:
-                frame_mp3cover_label.setStyleSheet("")
-                self.frame_mp3cover_effect_combo.setStyleSheet("")
-                self.frame_mp3cover_effect_combo.setEnabled(True)
-                frame_mp3cover_start_label.setStyleSheet("")
-                self.frame_mp3cover_start_edit.setStyleSheet("")
-                self.frame_mp3cover_start_edit.setEnabled(True)
-                # Re-enable the full duration checkbox and let it control the duration field styling
-                self.frame_mp3cover_duration_full_checkbox.setStyleSheet("")
-                self.frame_mp3cover_duration_full_checkbox.setEnabled(True)
-                set_frame_mp3cover_duration_enabled(self.frame_mp3cover_duration_full_checkbox.checkState())
-        self.frame_mp3cover_checkbox.stateChanged.connect(lambda _: update_frame_mp3cover_effect_label_style())
-        self.frame_mp3cover_checkbox.stateChanged.connect(lambda _: update_frame_mp3cover_custom_image_controls_state())
-        self.frame_mp3cover_duration_full_checkbox.stateChanged.connect(lambda _: set_frame_mp3cover_duration_enabled(self.frame_mp3cover_duration_full_checkbox.checkState()))
-        update_frame_mp3cover_effect_label_style()
-        update_frame_mp3cover_custom_image_controls_state()
-
-        # --- FINAL SETTINGS GROUP BOX ---
-        final_settings_groupbox = QtWidgets.QGroupBox("Final Settings")
-        final_settings_groupbox.setStyleSheet("""
-        QGroupBox {
-            font-weight: bold;
-            border: 2px solid #cccccc;
-            border-radius: 5px;
-            margin-top: 10px;
-            padding-top: 10px;
-        }
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px 0 5px;
-            color: #333333;
-            }
-        """)
-        final_settings_groupbox_layout = QVBoxLayout(final_settings_groupbox)
-        final_settings_groupbox_layout.setSpacing(8)
-        final_settings_groupbox_layout.setContentsMargins(10, 5, 10, 10)
-        layout.addWidget(final_settings_groupbox)
-        # Register for navigation
-        self.register_section_widget('final', final_settings_groupbox)
-        
-        # --- BACKGROUND LAYER SCALE CONTROL ---
-        # Load custom background checkbox label from settings
-        if hasattr(self, 'settings') and self.settings is not None:
-            background_label = self.settings.value('background_checkbox_label', " Background :", type=str)
-        else:
-            background_label = " Background :"
-        self.bg_layer_checkbox = QtWidgets.QCheckBox(background_label)
-        self.bg_layer_checkbox.setFixedWidth(label_checkbox_width)
-        self.bg_layer_checkbox.setFixedHeight(unified_height)
-        self.bg_layer_checkbox.setChecked(False)
-        def update_bg_layer_checkbox_style(state):
-            self.bg_layer_checkbox.setStyleSheet("")  # Always default color
-        self.bg_layer_checkbox.stateChanged.connect(update_bg_layer_checkbox_style)
-        update_bg_layer_checkbox_style(self.bg_layer_checkbox.checkState())
-
-        # Background scale dropdown (100% to 200%)
-        bg_scale_label = QLabel("Scale:")
-        bg_scale_label.setFixedWidth(label_short_width)
-        bg_scale_label.setFixedHeight(unified_height)
-        self.bg_scale_combo = NoWheelComboBox()
-        self.bg_scale_combo.setFixedWidth(combo_bg_width)
-        self.bg_scale_combo.setFixedHeight(unified_height)
-        for percent in range(100, 201, 5):  # 100% to 200% in 5% increments
-            self.bg_scale_combo.addItem(f"{percent}%", percent)
-        # Set default to 103% (index 0 for 100%, index 1 for 105%, so we'll use 100% as default)
-        self.bg_scale_combo.setCurrentIndex(0)  # Default 100%
-        self.bg_scale_percent = 100  # Default to 100%, will be overridden to 103% when checkbox is unchecked
-        def on_bg_scale_changed(idx):
-            self.bg_scale_percent = self.bg_scale_combo.itemData(idx)
-        self.bg_scale_combo.currentIndexChanged.connect(on_bg_scale_changed)
-        on_bg_scale_changed(self.bg_scale_combo.currentIndex())
-
-        # Background crop position dropdown
-        bg_crop_position_label = QLabel("Crop:")
-        bg_crop_position_label.setFixedWidth(label_short_width)
-        bg_crop_position_label.setFixedHeight(unified_height)
-        self.bg_crop_position_combo = NoWheelComboBox()
-        self.bg_crop_position_combo.setFixedWidth(combo_bg_width)
-        self.bg_crop_position_combo.setFixedHeight(unified_height)
-        crop_positions = [
-            "Center",
-            "Left",
-            "Right",
-            "Top",
-            "Bottom",
-            "Top Left",
-            "Top Right",
-            "Bottom Left",
-            "Bottom Right"
-        ]
-        for position in crop_positions:
-            self.bg_crop_position_combo.addItem(position)
-        self.bg_crop_position_combo.setCurrentIndex(0)  # Default Center
-        self.bg_crop_position = "center"
-        def on_bg_crop_position_changed(idx):
-            self.bg_crop_position = self.bg_crop_position_combo.itemText(idx).lower().replace(" ", "_")
-        self.bg_crop_position_combo.currentIndexChanged.connect(on_bg_crop_position_changed)
-        on_bg_crop_position_changed(self.bg_crop_position_combo.currentIndex())
-
-        # Background effect dropdown
-        bg_effect_label = QLabel("Effect:")
-        bg_effect_label.setFixedWidth(label_short_width)
-        bg_effect_label.setFixedHeight(unified_height)
-        self.bg_effect_combo = NoWheelComboBox()
-        self.bg_effect_combo.setFixedWidth(combo_bg_width)
-        self.bg_effect_combo.setFixedHeight(unified_height)
-
-        bg_effects = [
-            ("None", "none"),
-            ("Gaussian Blur", "gaussian_blur"),
-            ("Sharpen", "sharpen"),
-            ("Vignette", "vignette")
-        ]
-        for label, value in bg_effects:
-            self.bg_effect_combo.addItem(label, value)
-        self.bg_effect_combo.setCurrentIndex(0)  # Default None
-        self.bg_effect = "none"
-        def on_bg_effect_changed(idx):
-            self.bg_effect = self.bg_effect_combo.itemData(idx)
-        self.bg_effect_combo.currentIndexChanged.connect(on_bg_effect_changed)
-        on_bg_effect_changed(self.bg_effect_combo.currentIndex())
-
-        # Background effect intensity dropdown (1-100)
-        bg_intensity_label = QLabel("Level:")
-        bg_intensity_label.setFixedWidth(label_short_width)
-        bg_intensity_label.setFixedHeight(unified_height)
-        self.bg_intensity_combo = NoWheelComboBox()
-        self.bg_intensity_combo.setFixedWidth(combo_short_width)
-        self.bg_intensity_combo.setFixedHeight(unified_height)
-        for intensity in range(1, 101):
-            self.bg_intensity_combo.addItem(str(intensity), intensity)
-        self.bg_intensity_combo.setCurrentIndex(49)  # Default 50
-        self.bg_intensity = 50
-        def on_bg_intensity_changed(idx):
-            self.bg_intensity = self.bg_intensity_combo.itemData(idx)
-        self.bg_intensity_combo.currentIndexChanged.connect(on_bg_intensity_changed)
-        on_bg_intensity_changed(self.bg_intensity_combo.currentIndex())
-
-        def set_bg_layer_enabled(state):
-            enabled = state == Qt.CheckState.Checked
-            self.bg_scale_combo.setEnabled(enabled)
-            self.bg_crop_position_combo.setEnabled(enabled)
-            self.bg_effect_combo.setEnabled(enabled)
-            self.bg_intensity_combo.setEnabled(enabled)
-            if enabled:
-                self.bg_scale_combo.setStyleSheet("")
-                bg_scale_label.setStyleSheet("")
-                self.bg_crop_position_combo.setStyleSheet("")
-                bg_crop_position_label.setStyleSheet("")
-                self.bg_effect_combo.setStyleSheet("")
-                bg_effect_label.setStyleSheet("")
-                self.bg_intensity_combo.setStyleSheet("")
-                bg_intensity_label.setStyleSheet("")
-            else:
-                grey_btn_style = "background-color: #f2f2f2; color: #888; border: 1px solid #cfcfcf;"
-                self.bg_scale_combo.setStyleSheet(grey_btn_style)
-                bg_scale_label.setStyleSheet("color: grey;")
-                self.bg_crop_position_combo.setStyleSheet(grey_btn_style)
-                bg_crop_position_label.setStyleSheet("color: grey;")
-                self.bg_effect_combo.setStyleSheet(grey_btn_style)
-                bg_effect_label.setStyleSheet("color: grey;")
-                self.bg_intensity_combo.setStyleSheet(grey_btn_style)
-                bg_intensity_label.setStyleSheet("color: grey;")
-        
-        self.bg_layer_checkbox.stateChanged.connect(lambda _: set_bg_layer_enabled(self.bg_layer_checkbox.checkState()))
-
-        bg_layer_layout = QHBoxLayout()
-        bg_layer_layout.setSpacing(0)
-        bg_layer_layout.addWidget(self.bg_layer_checkbox)
-        bg_layer_layout.addSpacing(-18)
-        bg_layer_layout.addWidget(bg_scale_label)
-        bg_layer_layout.addSpacing(-3)
-        bg_layer_layout.addWidget(self.bg_scale_combo)
-        bg_layer_layout.addSpacing(8)
-        bg_layer_layout.addWidget(bg_crop_position_label)
-        bg_layer_layout.addSpacing(-6)
-        bg_layer_layout.addWidget(self.bg_crop_position_combo)
-        bg_layer_layout.addSpacing(8)
-        bg_layer_layout.addWidget(bg_effect_label)
-        bg_layer_layout.addSpacing(-1)
-        bg_layer_layout.addWidget(self.bg_effect_combo)
-        bg_layer_layout.addSpacing(12)
-        bg_layer_layout.addWidget(bg_intensity_label)
-        bg_layer_layout.addSpacing(-4)
-        bg_layer_layout.addWidget(self.bg_intensity_combo)
-        bg_layer_layout.addStretch()
-        final_settings_groupbox_layout.addLayout(bg_layer_layout)
-
-        # Initialize background layer enabled state
-        set_bg_layer_enabled(self.bg_layer_checkbox.checkState())
-        # --- END BACKGROUND LAYER SCALE CONTROL ---
-
-        # Placeholder checkbox (placeholder - does nothing for now)
-        self.lyric_checkbox = QtWidgets.QCheckBox("Lyric:")
-        self.lyric_checkbox.setFixedWidth(100)
-        self.lyric_checkbox.setChecked(False)
-        def update_lyric_checkbox_style(state):
-            self.lyric_checkbox.setStyleSheet("")  # Always default color
-        self.lyric_checkbox.stateChanged.connect(update_lyric_checkbox_style)
-        update_lyric_checkbox_style(self.lyric_checkbox.checkState())
-
-        # Placeholder dropdown (placeholder - does nothing for now)
-        self.lyric_dropdown_label = QtWidgets.QLabel("Lyric:")
-        self.lyric_dropdown_label.setFixedWidth(80)
-        self.lyric_dropdown = NoWheelComboBox()
-        self.lyric_dropdown.setFixedWidth(125)
-        self.lyric_dropdown.addItem("Select option...")
-        self.lyric_dropdown.addItem("Option 1")
-        self.lyric_dropdown.addItem("Option 2")
-        self.lyric_dropdown.addItem("Option 3")
-        self.lyric_dropdown.setCurrentIndex(0)  # Default to "Select option..."
-
-        # Enable/disable placeholder dropdown based on checkbox
-        def set_lyric_dropdown_enabled(state):
-            enabled = state == Qt.CheckState.Checked
-            self.lyric_dropdown.setEnabled(enabled)
-            self.lyric_dropdown_label.setStyleSheet("" if enabled else "color: grey;")
-            if not enabled:
-                grey_btn_style = "background-color: #f2f2f2; color: #888; border: 1px solid #cfcfcf;"
-                self.lyric_dropdown.setStyleSheet(grey_btn_style)
-            else:
-                self.lyric_dropdown.setStyleSheet("")
-        self.lyric_checkbox.stateChanged.connect(lambda _: set_lyric_dropdown_enabled(self.lyric_checkbox.checkState()))
-        set_lyric_dropdown_enabled(self.lyric_checkbox.checkState())
-
-        lyric_layout = QHBoxLayout()
-        lyric_layout.setSpacing(0)
-        lyric_layout.addWidget(self.lyric_checkbox)
-        lyric_layout.addSpacing(0)
-        lyric_layout.addWidget(self.lyric_dropdown_label)
-        lyric_layout.addWidget(self.lyric_dropdown)
-        lyric_layout.addStretch()
-        final_settings_groupbox_layout.addLayout(lyric_layout)        
-
-        # last_item label
-        self.last_item_label = QtWidgets.QLabel("Let's fucking go!")
-        self.last_item_label.setFixedWidth(120)
-        self.last_item_label.setStyleSheet("font-size: 14px; font-weight: thin; color: #888;")
-        self.last_item_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                self.frame_mp3cover_duration_edit.setEnabled(False)
+                frame_mp3cover_duration_full_label.setStyleSheet("color: grey;")
+                self.frame_mp3cover_duration_full_checkbox.setStyleSheet("color: grey;")
+                self.frame_mp3cover_duration_full_checkbox.setEnabled(False)
+            else:
+                frame_mp3cover_label.setStyleSheet("")
+                self.frame_mp3cover_effect_combo.setStyleSheet("")
+                self.frame_mp3cover_effect_combo.setEnabled(True)
+                frame_mp3cover_start_label.setStyleSheet("")
+                self.frame_mp3cover_start_edit.setStyleSheet("")
+                self.frame_mp3cover_start_edit.setEnabled(True)
+                # Re-enable the full duration checkbox and let it control the duration field styling
+                self.frame_mp3cover_duration_full_checkbox.setStyleSheet("")
+                self.frame_mp3cover_duration_full_checkbox.setEnabled(True)
+                set_frame_mp3cover_duration_enabled(self.frame_mp3cover_duration_full_checkbox.checkState())
+        self.frame_mp3cover_checkbox.stateChanged.connect(lambda _: update_frame_mp3cover_effect_label_style())
+        self.frame_mp3cover_checkbox.stateChanged.connect(lambda _: update_frame_mp3cover_custom_image_controls_state())
+        self.frame_mp3cover_duration_full_checkbox.stateChanged.connect(lambda _: set_frame_mp3cover_duration_enabled(self.frame_mp3cover_duration_full_checkbox.checkState()))
+        update_frame_mp3cover_effect_label_style()
+        update_frame_mp3cover_custom_image_controls_state()
 
-        # Add last_item label to layout
-        last_item_label_layout = QHBoxLayout()
-        last_item_label_layout.addStretch()
-        last_item_label_layout.addSpacing(23)
-        last_item_label_layout.addWidget(self.last_item_label)
-        last_item_label_layout.addStretch()
-        layout.addLayout(last_item_label_layout)
-        
-        # Initialize overlay 3 & soundwave effect control state
-        set_overlay3_soundwave_effect_enabled()
-        
     def reset_main_form(self):
         """Reset all main form fields to default values"""
         try:
@@ -8177,6 +8573,13 @@ class SuperCutUI(QWidget):
         self.placeholder_btn.setMouseTracking(True)
         self.placeholder_btn.enterEvent = lambda event: self.placeholder_btn.setIconSize(QSize(33, 33))
         self.placeholder_btn.leaveEvent = lambda event: self.placeholder_btn.setIconSize(QSize(30, 30))
+
+        # Add render queue button next to the template manager button
+        self.queue_btn = QPushButton("Queue")
+        self.queue_btn.setFixedHeight(38)
+        self.queue_btn.setToolTip("Render Queue: queue folders with the current settings and run them unattended")
+        self.queue_btn.setStyleSheet("QPushButton { background: transparent; border: none; padding: 0px 4px; font-weight: 500; color: #4a90e2; } QPushButton:hover { color: #357abd; }")
+        self.queue_btn.clicked.connect(self.open_render_queue)
         
 
         # Add reset button after placeholder button
@@ -8244,6 +8647,8 @@ class SuperCutUI(QWidget):
         button_layout.addSpacing(5)
         button_layout.addWidget(self.template_manager_btn)
         button_layout.addSpacing(5)
+        button_layout.addWidget(self.queue_btn)
+        button_layout.addSpacing(5)
         button_layout.addWidget(self.placeholder_btn)
         button_layout.addSpacing(12)
         layout.addLayout(button_layout)
@@ -8309,8 +8714,7 @@ class SuperCutUI(QWidget):
 
     def restore_window_position(self):
         """Restore window position from settings"""
-        settings = QSettings('SuperCut', 'SuperCutUI')
-        pos = settings.value('window_position')
+        pos = self.settings.value('window_position')
         if isinstance(pos, QPoint):
             self.move(pos)
         elif isinstance(pos, (tuple, list)) and len(pos) == 2:
@@ -8657,6 +9061,28 @@ class SuperCutUI(QWidget):
             if len(self.name_list) < total_batches:
                 QMessageBox.critical(self, "❌ Not Enough Names", f"You provided {len(self.name_list)} names, but {total_batches} are required for all video batches.", QMessageBox.StandardButton.Ok)
                 return
+        # Queue the job instead of rendering it now (see enqueue_current_job)
+        self._resume_run = False
+        if self._enqueue_priority is not None:
+            self._setup_worker_and_thread(media_sources, export_name, number, folder, codec, resolution, fps, original_mp3_files, original_image_files, min_mp3_count)
+            return
+        # Offer to resume a run that was interrupted in this media folder
+        from src.job_journal import JobJournal
+        interrupted = JobJournal(media_sources).load_interrupted_job()
+        if interrupted and interrupted['job'].get('folder') == folder:
+            job_total = interrupted['job'].get('total_batches', total_batches)
+            done = sum(1 for b in interrupted['batches'].values() if b['state'] == 'finalized')
+            reply = QMessageBox.question(
+                self, "Resume Interrupted Run",
+                f"A previous run in this folder stopped after {done}/{job_total} batches.\n\n"
+                "Resume it? Finished videos are kept and partial output is discarded.\n"
+                "Choose No to start a new run.",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+            if reply == QMessageBox.StandardButton.Yes:
+                self._resume_run = True
+                total_batches = job_total
+                self._intended_total_batches = total_batches
         # Step 2: Prepare UI for processing
         self._set_ui_processing_state(True, total_batches=total_batches)
         # Step 3: Set up worker and thread
@@ -9297,6 +9723,33 @@ class SuperCutUI(QWidget):
         # Handle Preview button (which contains Dry Run) - disable during normal processing
         if hasattr(self, 'preview_btn'):
             self.preview_btn.setEnabled(not processing)
+    def _start_frame_preview(self, worker, preview_time):
+        """Render one dry run frame in a background thread and show it in the frame preview"""
+        thread = QThread()
+        worker.moveToThread(thread)
+        # Keep references so the worker outlives this call
+        self._frame_preview_thread = thread
+        self._frame_preview_worker = worker
+        started = time.time()
+
+        def on_finished(success, msg):
+            dialog = self._frame_preview_dialog
+            if dialog is not None:
+                if success:
+                    dialog.set_frame(msg, preview_time, time.time() - started)
+                else:
+                    dialog.set_error(msg)
+            if self._frame_preview_thread is thread:
+                self._frame_preview_thread = None
+                self._frame_preview_worker = None
+            worker.deleteLater()
+            thread.deleteLater()
+
+        worker.finished.connect(on_finished)
+        worker.finished.connect(thread.quit)
+        thread.started.connect(worker.run)
+        thread.start()
+
     def _set_dry_run_state(self, is_dry_run):
         """Set dry run state and update UI accordingly."""
         self.is_dry_run_mode = is_dry_run
@@ -9352,7 +9805,6 @@ class SuperCutUI(QWidget):
 
     def _setup_worker_and_thread(self, media_sources, export_name, number, folder, codec, resolution, fps, original_mp3_files, original_image_files, min_mp3_count):
         """Set up the VideoWorker and QThread, connect signals, and start processing."""
-        self._thread = QThread()
         use_name_list = hasattr(self, 'name_list_checkbox') and self.name_list_checkbox.isChecked()
         name_list = self.name_list if use_name_list else None
         # Get ffmpeg preset from UI selection
@@ -9513,7 +9965,7 @@ class SuperCutUI(QWidget):
         # Fallback if not set
         if not frame_box_path:
             frame_box_path = "src/sources/frame_box.png"
-        self._worker = VideoWorker(
+        worker = VideoWorker(
             media_sources=media_sources, export_name=export_name, number=number, folder=folder, codec=codec, resolution=resolution, fps=fps,
             use_overlay=self.overlay_checkbox.isChecked(), min_mp3_count=min_mp3_count, overlay1_path=self.overlay1_path, overlay1_size_percent=self.overlay1_size_percent, overlay1_x_percent=self.overlay1_x_percent, overlay1_y_percent=self.overlay1_y_percent,
             use_overlay2=self.overlay2_checkbox.isChecked(), overlay2_path=self.overlay2_path, overlay2_size_percent=self.overlay2_size_percent, overlay2_x_percent=self.overlay2_x_percent, overlay2_y_percent=self.overlay2_y_percent,
@@ -9671,8 +10123,32 @@ class SuperCutUI(QWidget):
             layer_order=getattr(self, 'layer_order', None),
             # --- Add filter complex alt mode parameter ---
             filter_complex_alt_mode=self.settings.value('filter_complex_alt_mode', False, type=bool) if self.settings else False,
-
+            # --- Add frame rate mode parameter ---
+            frame_rate_mode=self.settings.value('frame_rate_mode', DEFAULT_FRAME_RATE_MODE, type=str) if self.settings else DEFAULT_FRAME_RATE_MODE,
+            # --- Resume an interrupted run from the job journal ---
+            resume=getattr(self, '_resume_run', False),
+            # --- Place small per-batch temp files on a RAM disk ---
+            use_ram_temp=self.settings.value('use_ram_temp', False, type=bool) if self.settings else False,
+            # --- Extra renditions from the same composite pass ---
+            renditions=parse_renditions(self.settings.value('extra_renditions', '', type=str)) if self.settings else [],
+            # --- Hand batches to render farm workers instead of rendering here ---
+            farm_dir=(self.settings.value('render_farm_dir', '', type=str) or None) if self.settings else None,
+            # --- Priority and ceilings for ffmpeg child processes ---
+            resource_limits=parse_resource_limits(self.settings.value('resource_limits', '', type=str)) if self.settings else None,
+            # --- Refuse or split a job that does not fit on disk ---
+            capacity_policy=self.settings.value('capacity_policy', DEFAULT_CAPACITY_POLICY, type=str) if self.settings else DEFAULT_CAPACITY_POLICY,
+            # --- Per-track loudness normalization while merging audio ---
+            loudness_target=self.settings.value('loudness_target', DEFAULT_LOUDNESS_TARGET, type=str) if self.settings else DEFAULT_LOUDNESS_TARGET,
         )
+        if self._enqueue_priority is not None:
+            # Queued jobs keep the worker's settings and run later from the render queue
+            template = self.template_combo.currentText() if hasattr(self, 'template_combo') and self.template_combo.currentData() else None
+            job_id = render_queue.add(worker.job_settings, self._enqueue_priority, template=template)
+            worker.deleteLater()
+            print(f"✅ Queued {os.path.basename(os.path.normpath(media_sources))} as job {job_id}")
+            return
+        self._worker = worker
+        self._thread = QThread()
         self._worker.moveToThread(self._thread)
         self._thread.started.connect(self._worker.run)
         self._worker.progress.connect(self.on_worker_progress)
@@ -9695,6 +10171,7 @@ class SuperCutUI(QWidget):
         self.progress_bar.setValue(batch_count)
         self.progress_bar.setFormat(f"Batch: {batch_count}/{total_batches}")
         self._completed_batches = batch_count  # Track completed batches
+        self._intended_total_batches = total_batches  # The capacity planner may have split the job
         QtWidgets.QApplication.processEvents()
 
     def on_worker_error(self, message):
@@ -9933,8 +10410,7 @@ class SuperCutUI(QWidget):
             event.ignore()
             return
         # Save window position and close as normal
-        settings = QSettings('SuperCut', 'SuperCutUI')
-        settings.setValue('window_position', self.pos())
+        self.settings.setValue('window_position', self.pos())
         super().closeEvent(event)
     def handle_quit_response(self, button, event):
         if self.quit_dialog is not None and button == self.quit_dialog.button(QMessageBox.StandardButton.Yes):
@@ -10097,6 +10573,20 @@ class SuperCutUI(QWidget):
         msg.exec()
 
     def apply_settings(self):
+        # Unbuilt sections only record their visibility; the ones in view are built afterwards
+        with self._lazy_sections.deferred():
+            self._apply_settings()
+        QTimer.singleShot(0, self._build_sections_in_view)
+
+    def _apply_settings(self):
+        # JSON-lines stage log for offline throughput analysis
+        set_structured_log_enabled(self.settings.value('structured_log', False, type=bool))
+        # Local metrics endpoint (0 = off, unless SUPERCUT_METRICS_PORT is set)
+        metrics_port = self.settings.value('metrics_port', 0, type=int)
+        if metrics_port:
+            start_metrics_server(metrics_port)
+        elif not start_metrics_from_env():
+            start_metrics_server(0)
         # Apply window size settings only if window is already shown (i.e., settings were changed)
         if self.isVisible():
             saved_width = self.settings.value('default_window_width', WINDOW_SIZE[0], type=int)
@@ -10149,6 +10639,10 @@ class SuperCutUI(QWidget):
             idx = next((i for i, (label, value) in enumerate(DEFAULT_RESOLUTIONS) if value == default_resolution), 0)
             self.resolution_combo.setCurrentIndex(idx)
 
+        # Record section visibility for layer sections that are not built yet
+        for section_id, setting_key in LAZY_SECTION_SETTINGS.items():
+            self._lazy_sections.set_visible(section_id, self.settings.value(setting_key, False, type=bool))
+
         # Show/hide placeholder controls based on settings
         show_placeholder = self.settings.value('show_placeholder_controls', False, type=bool)
         if hasattr(self, 'lyric_checkbox') and hasattr(self, 'lyric_dropdown'):
@@ -10357,7 +10851,7 @@ class SuperCutUI(QWidget):
     # --- TEMPLATE METHODS ---
     def load_templates_to_combo(self):
         """Load available templates into the combo box"""
-        from src.template_utils import get_available_templates
+        from src.config import get_available_templates
         
         # Clear existing items except "No Template"
         while self.template_combo.count() > 1:
@@ -10383,6 +10877,24 @@ class SuperCutUI(QWidget):
             self.template_manager_dialog.raise_()
             self.template_manager_dialog.activateWindow()
     
+    def open_render_queue(self):
+        """Open the render queue dialog"""
+        if self.render_queue_dialog is None or not self.render_queue_dialog.isVisible():
+            self.render_queue_dialog = RenderQueueDialog(self)
+            self.render_queue_dialog.show()
+        else:
+            # Bring existing dialog to front
+            self.render_queue_dialog.raise_()
+            self.render_queue_dialog.activateWindow()
+
+    def enqueue_current_job(self, priority=0):
+        """Validate the current inputs like Create Video does, but add the job to the render queue"""
+        self._enqueue_priority = priority
+        try:
+            self.create_video()
+        finally:
+            self._enqueue_priority = None
+
     def get_current_settings(self):
         """Get current application settings for template creation"""
         settings = {
@@ -10681,1218 +11193,1167 @@ class SuperCutUI(QWidget):
         except Exception as e:
             QMessageBox.warning(self, "Template Error", f"Error applying template '{template_name}': {str(e)}")
     
-    def apply_template(self, template_data, show_success_dialog=True):
-        """Apply a template to current settings"""
-        try:
-            # Apply video settings
-            video_settings = template_data.get('video_settings', {})
-            
-            # Apply codec
-            if 'codec' in video_settings:
-                codec = video_settings['codec']
-                for i in range(self.codec_combo.count()):
-                    if self.codec_combo.itemData(i) == codec:
-                        self.codec_combo.setCurrentIndex(i)
+    def _apply_template_layer_settings(self, template_data):
+        """Apply a template's layer settings to the sections that are built"""
+        # Apply layer settings
+        layer_settings = template_data.get('layer_settings', {})
+        if 'overlay1' in layer_settings:
+            overlay1_settings = layer_settings['overlay1']
+            if hasattr(self, 'overlay_checkbox'):
+                self.overlay_checkbox.setChecked(overlay1_settings.get('enabled', False))
+            if hasattr(self, 'overlay1_edit'):
+                self.overlay1_edit.setText(overlay1_settings.get('path', ''))
+            if hasattr(self, 'overlay1_size_percent'):
+                self.overlay1_size_percent = overlay1_settings.get('size_percent', 50)
+            if hasattr(self, 'overlay1_x_percent'):
+                self.overlay1_x_percent = overlay1_settings.get('x_percent', 0)
+            if hasattr(self, 'overlay1_y_percent'):
+                self.overlay1_y_percent = overlay1_settings.get('y_percent', 75)
+            
+            # Update UI controls to reflect the restored values
+            if hasattr(self, 'overlay1_size_combo'):
+                size = overlay1_settings.get('size_percent', 50)
+                for i in range(self.overlay1_size_combo.count()):
+                    if self.overlay1_size_combo.itemData(i) == size:
+                        self.overlay1_size_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay1_x_combo'):
+                x = overlay1_settings.get('x_percent', 0)
+                for i in range(self.overlay1_x_combo.count()):
+                    if self.overlay1_x_combo.itemData(i) == x:
+                        self.overlay1_x_combo.setCurrentIndex(i)
                         break
+            if hasattr(self, 'overlay1_y_combo'):
+                y = overlay1_settings.get('y_percent', 75)
+                for i in range(self.overlay1_y_combo.count()):
+                    if self.overlay1_y_combo.itemData(i) == y:
+                        self.overlay1_y_combo.setCurrentIndex(i)
+                        break
+        if 'overlay2' in layer_settings:
+            overlay2_settings = layer_settings['overlay2']
+            if hasattr(self, 'overlay2_checkbox'):
+                self.overlay2_checkbox.setChecked(overlay2_settings.get('enabled', False))
+            if hasattr(self, 'overlay2_edit'):
+                self.overlay2_edit.setText(overlay2_settings.get('path', ''))
+            if hasattr(self, 'overlay2_size_percent'):
+                self.overlay2_size_percent = overlay2_settings.get('size_percent', 10)
+            if hasattr(self, 'overlay2_x_percent'):
+                self.overlay2_x_percent = overlay2_settings.get('x_percent', 75)
+            if hasattr(self, 'overlay2_y_percent'):
+                self.overlay2_y_percent = overlay2_settings.get('y_percent', 0)
+            
             
-            # Apply resolution
-            if 'resolution' in video_settings:
-                resolution = video_settings['resolution']
-                for i in range(self.resolution_combo.count()):
-                    if self.resolution_combo.itemData(i) == resolution:
-                        self.resolution_combo.setCurrentIndex(i)
+            if hasattr(self, 'overlay2_size_combo'):
+                size = overlay2_settings.get('size_percent', 10)
+                for i in range(self.overlay2_size_combo.count()):
+                    if self.overlay2_size_combo.itemData(i) == size:
+                        self.overlay2_size_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay2_x_combo'):
+                x = overlay2_settings.get('x_percent', 75)
+                for i in range(self.overlay2_x_combo.count()):
+                    if self.overlay2_x_combo.itemData(i) == x:
+                        self.overlay2_x_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay2_y_combo'):
+                y = overlay2_settings.get('y_percent', 0)
+                for i in range(self.overlay2_y_combo.count()):
+                    if self.overlay2_y_combo.itemData(i) == y:
+                        self.overlay2_y_combo.setCurrentIndex(i)
+                        break
+
+        if 'overlay3' in layer_settings:
+            overlay3_settings = layer_settings['overlay3']
+            if hasattr(self, 'overlay3_checkbox'):
+                self.overlay3_checkbox.setChecked(overlay3_settings.get('enabled', False))
+            if hasattr(self, 'overlay3_edit'):
+                self.overlay3_edit.setText(overlay3_settings.get('path', ''))
+            if hasattr(self, 'overlay3_size_percent'):
+                self.overlay3_size_percent = overlay3_settings.get('size_percent', 50)
+            if hasattr(self, 'overlay3_x_percent'):
+                self.overlay3_x_percent = overlay3_settings.get('x_percent', 75)
+            if hasattr(self, 'overlay3_y_percent'):
+                self.overlay3_y_percent = overlay3_settings.get('y_percent', 0)
+            
+            # Update UI controls to reflect the restored values
+            if hasattr(self, 'overlay3_size_combo'):
+                size = overlay3_settings.get('size_percent', 50)
+                for i in range(self.overlay3_size_combo.count()):
+                    if self.overlay3_size_combo.itemData(i) == size:
+                        self.overlay3_size_combo.setCurrentIndex(i)
                         break
+            if hasattr(self, 'overlay3_x_combo'):
+                x = overlay3_settings.get('x_percent', 75)
+                for i in range(self.overlay3_x_combo.count()):
+                    if self.overlay3_x_combo.itemData(i) == x:
+                        self.overlay3_x_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay3_y_combo'):
+                y = overlay3_settings.get('y_percent', 0)
+                for i in range(self.overlay3_y_combo.count()):
+                    if self.overlay3_y_combo.itemData(i) == y:
+                        self.overlay3_y_combo.setCurrentIndex(i)
+                        break
+        if 'overlay4' in layer_settings:
+            overlay4_settings = layer_settings['overlay4']
+            if hasattr(self, 'overlay4_checkbox'):
+                self.overlay4_checkbox.setChecked(overlay4_settings.get('enabled', False))
+            if hasattr(self, 'overlay4_edit'):
+                self.overlay4_edit.setText(overlay4_settings.get('path', ''))
+            if hasattr(self, 'overlay4_size_percent'):
+                self.overlay4_size_percent = overlay4_settings.get('size_percent', 50)
+            if hasattr(self, 'overlay4_x_percent'):
+                self.overlay4_x_percent = overlay4_settings.get('x_percent', 75)
+            if hasattr(self, 'overlay4_y_percent'):
+                self.overlay4_y_percent = overlay4_settings.get('y_percent', 0)
+            
+            # Update UI controls to reflect the restored values
+            if hasattr(self, 'overlay4_size_combo'):
+                size = overlay4_settings.get('size_percent', 50)
+                for i in range(self.overlay4_size_combo.count()):
+                    if self.overlay4_size_combo.itemData(i) == size:
+                        self.overlay4_size_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay4_x_combo'):
+                x = overlay4_settings.get('x_percent', 75)
+                for i in range(self.overlay4_x_combo.count()):
+                    if self.overlay4_x_combo.itemData(i) == x:
+                        self.overlay4_x_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay4_y_combo'):
+                y = overlay4_settings.get('y_percent', 0)
+                for i in range(self.overlay4_y_combo.count()):
+                    if self.overlay4_y_combo.itemData(i) == y:
+                        self.overlay4_y_combo.setCurrentIndex(i)
+                        break
+        if 'overlay5' in layer_settings:
+            overlay5_settings = layer_settings['overlay5']
+            if hasattr(self, 'overlay5_checkbox'):
+                self.overlay5_checkbox.setChecked(overlay5_settings.get('enabled', False))
+            if hasattr(self, 'overlay5_edit'):
+                self.overlay5_edit.setText(overlay5_settings.get('path', ''))
+            if hasattr(self, 'overlay5_size_percent'):
+                self.overlay5_size_percent = overlay5_settings.get('size_percent', 50)
+            if hasattr(self, 'overlay5_x_percent'):
+                self.overlay5_x_percent = overlay5_settings.get('x_percent', 75)
+            if hasattr(self, 'overlay5_y_percent'):
+                self.overlay5_y_percent = overlay5_settings.get('y_percent', 0)
+            
+            # Update UI controls to reflect the restored values
+            if hasattr(self, 'overlay5_size_combo'):
+                size = overlay5_settings.get('size_percent', 50)
+                for i in range(self.overlay5_size_combo.count()):
+                    if self.overlay5_size_combo.itemData(i) == size:
+                        self.overlay5_size_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay5_x_combo'):
+                x = overlay5_settings.get('x_percent', 75)
+                for i in range(self.overlay5_x_combo.count()):
+                    if self.overlay5_x_combo.itemData(i) == x:
+                        self.overlay5_x_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay5_y_combo'):
+                y = overlay5_settings.get('y_percent', 0)
+                for i in range(self.overlay5_y_combo.count()):
+                    if self.overlay5_y_combo.itemData(i) == y:
+                        self.overlay5_y_combo.setCurrentIndex(i)
+                        break
+        if 'overlay6' in layer_settings:
+            overlay6_settings = layer_settings['overlay6']
+            if hasattr(self, 'overlay6_checkbox'):
+                self.overlay6_checkbox.setChecked(overlay6_settings.get('enabled', False))
+            if hasattr(self, 'overlay6_edit'):
+                self.overlay6_edit.setText(overlay6_settings.get('path', ''))
+            if hasattr(self, 'overlay6_size_percent'):
+                self.overlay6_size_percent = overlay6_settings.get('size_percent', 50)
+            if hasattr(self, 'overlay6_x_percent'):
+                self.overlay6_x_percent = overlay6_settings.get('x_percent', 75)
+            if hasattr(self, 'overlay6_y_percent'):
+                self.overlay6_y_percent = overlay6_settings.get('y_percent', 0)
+            
+            # Update UI controls to reflect the restored values
+            if hasattr(self, 'overlay6_size_combo'):
+                size = overlay6_settings.get('size_percent', 50)
+                for i in range(self.overlay6_size_combo.count()):
+                    if self.overlay6_size_combo.itemData(i) == size:
+                        self.overlay6_size_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay6_x_combo'):
+                x = overlay6_settings.get('x_percent', 75)
+                for i in range(self.overlay6_x_combo.count()):
+                    if self.overlay6_x_combo.itemData(i) == x:
+                        self.overlay6_x_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay6_y_combo'):
+                y = overlay6_settings.get('y_percent', 0)
+                for i in range(self.overlay6_y_combo.count()):
+                    if self.overlay6_y_combo.itemData(i) == y:
+                        self.overlay6_y_combo.setCurrentIndex(i)
+                        break
+        if 'overlay7' in layer_settings:
+            overlay7_settings = layer_settings['overlay7']
+            if hasattr(self, 'overlay7_checkbox'):
+                self.overlay7_checkbox.setChecked(overlay7_settings.get('enabled', False))
+            if hasattr(self, 'overlay7_edit'):
+                self.overlay7_edit.setText(overlay7_settings.get('path', ''))
+            if hasattr(self, 'overlay7_size_percent'):
+                self.overlay7_size_percent = overlay7_settings.get('size_percent', 50)
+            if hasattr(self, 'overlay7_x_percent'):
+                self.overlay7_x_percent = overlay7_settings.get('x_percent', 75)
+            if hasattr(self, 'overlay7_y_percent'):
+                self.overlay7_y_percent = overlay7_settings.get('y_percent', 0)
+            
+            # Update UI controls to reflect the restored values
+            if hasattr(self, 'overlay7_size_combo'):
+                size = overlay7_settings.get('size_percent', 50)
+                for i in range(self.overlay7_size_combo.count()):
+                    if self.overlay7_size_combo.itemData(i) == size:
+                        self.overlay7_size_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay7_x_combo'):
+                x = overlay7_settings.get('x_percent', 75)
+                for i in range(self.overlay7_x_combo.count()):
+                    if self.overlay7_x_combo.itemData(i) == x:
+                        self.overlay7_x_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay7_y_combo'):
+                y = overlay7_settings.get('y_percent', 0)
+                for i in range(self.overlay7_y_combo.count()):
+                    if self.overlay7_y_combo.itemData(i) == y:
+                        self.overlay7_y_combo.setCurrentIndex(i)
+                        break
+        if 'overlay8' in layer_settings:
+            overlay8_settings = layer_settings['overlay8']
+            if hasattr(self, 'overlay8_checkbox'):
+                self.overlay8_checkbox.setChecked(overlay8_settings.get('enabled', False))
+            if hasattr(self, 'overlay8_edit'):
+                self.overlay8_edit.setText(overlay8_settings.get('path', ''))
+            if hasattr(self, 'overlay8_path'):
+                self.overlay8_path = overlay8_settings.get('path', '')
+            if hasattr(self, 'overlay8_size_percent'):
+                self.overlay8_size_percent = overlay8_settings.get('size_percent', 50)
+            if hasattr(self, 'overlay8_x_percent'):
+                self.overlay8_x_percent = overlay8_settings.get('x_percent', 0)
+            if hasattr(self, 'overlay8_y_percent'):
+                self.overlay8_y_percent = overlay8_settings.get('y_percent', 0)
+            if hasattr(self, 'selected_overlay8_effect'):
+                self.selected_overlay8_effect = overlay8_settings.get('effect', 'fadein')
+            if hasattr(self, 'overlay8_duration'):
+                self.overlay8_duration = overlay8_settings.get('duration', 6)
+            if hasattr(self, 'overlay8_start_percent'):
+                self.overlay8_start_percent = overlay8_settings.get('start_at', 5)
+            if hasattr(self, 'overlay8_start_from_percent'):
+                self.overlay8_start_from_percent = overlay8_settings.get('start_from', 0)
+            if hasattr(self, 'overlay8_popup_start_at_percent'):
+                self.overlay8_popup_start_at_percent = overlay8_settings.get('popup_start_at', 5)
+            if hasattr(self, 'overlay8_popup_num'):
+                self.overlay8_popup_num = overlay8_settings.get('popup_num', 1)
+            
+            # Update UI controls to reflect the restored values
+            if hasattr(self, 'overlay8_size_combo'):
+                size = overlay8_settings.get('size_percent', 50)
+                for i in range(self.overlay8_size_combo.count()):
+                    if self.overlay8_size_combo.itemData(i) == size:
+                        self.overlay8_size_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay8_x_combo'):
+                x = overlay8_settings.get('x_percent', 0)
+                for i in range(self.overlay8_x_combo.count()):
+                    if self.overlay8_x_combo.itemData(i) == x:
+                        self.overlay8_x_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay8_y_combo'):
+                y = overlay8_settings.get('y_percent', 0)
+                for i in range(self.overlay8_y_combo.count()):
+                    if self.overlay8_y_combo.itemData(i) == y:
+                        self.overlay8_y_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay8_duration_edit'):
+                self.overlay8_duration_edit.setText(str(overlay8_settings.get('duration', 6)))
+            if hasattr(self, 'overlay8_duration_full_checkbox'):
+                self.overlay8_duration_full_checkbox.setChecked(overlay8_settings.get('duration_full', True))
+            if hasattr(self, 'overlay8_start_at_checkbox'):
+                self.overlay8_start_at_checkbox.setChecked(overlay8_settings.get('start_checkbox', True))
+            if hasattr(self, 'overlay8_popup_checkbox'):
+                self.overlay8_popup_checkbox.setChecked(overlay8_settings.get('popup_checkbox', False))
+            if hasattr(self, 'overlay8_popup_start_at_combo'):
+                popup_start_at = overlay8_settings.get('popup_start_at', 5)
+                for i in range(self.overlay8_popup_start_at_combo.count()):
+                    if self.overlay8_popup_start_at_combo.itemData(i) == popup_start_at:
+                        self.overlay8_popup_start_at_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay8_popup_num_combo'):
+                popup_num = overlay8_settings.get('popup_num', 1)
+                for i in range(self.overlay8_popup_num_combo.count()):
+                    if self.overlay8_popup_num_combo.itemData(i) == popup_num:
+                        self.overlay8_popup_num_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay8_start_combo'):
+                start_at = overlay8_settings.get('start_at', 5)
+                for i in range(self.overlay8_start_combo.count()):
+                    if self.overlay8_start_combo.itemData(i) == start_at:
+                        self.overlay8_start_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay8_start_from_combo'):
+                start_from = overlay8_settings.get('start_from', 0)
+                for i in range(self.overlay8_start_from_combo.count()):
+                    if self.overlay8_start_from_combo.itemData(i) == start_from:
+                        self.overlay8_start_from_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay8_effect_combo'):
+                effect = overlay8_settings.get('effect', 'fadein')
+                for i in range(self.overlay8_effect_combo.count()):
+                    if self.overlay8_effect_combo.itemData(i) == effect:
+                        self.overlay8_effect_combo.setCurrentIndex(i)
+                        break
+        if 'overlay9' in layer_settings:
+            overlay9_settings = layer_settings['overlay9']
+            if hasattr(self, 'overlay9_checkbox'):
+                self.overlay9_checkbox.setChecked(overlay9_settings.get('enabled', False))
+            if hasattr(self, 'overlay9_edit'):
+                self.overlay9_edit.setText(overlay9_settings.get('path', ''))
+            if hasattr(self, 'overlay9_path'):
+                self.overlay9_path = overlay9_settings.get('path', '')
+            if hasattr(self, 'overlay9_size_percent'):
+                self.overlay9_size_percent = overlay9_settings.get('size_percent', 50)
+            if hasattr(self, 'overlay9_x_percent'):
+                self.overlay9_x_percent = overlay9_settings.get('x_percent', 0)
+            if hasattr(self, 'overlay9_y_percent'):
+                self.overlay9_y_percent = overlay9_settings.get('y_percent', 0)
+            if hasattr(self, 'selected_overlay9_effect'):
+                self.selected_overlay9_effect = overlay9_settings.get('effect', 'fadein')
+            if hasattr(self, 'overlay9_duration'):
+                self.overlay9_duration = overlay9_settings.get('duration', 6)
+            if hasattr(self, 'overlay9_start_percent'):
+                self.overlay9_start_percent = overlay9_settings.get('start_at', 5)
+            if hasattr(self, 'overlay9_start_from_percent'):
+                self.overlay9_start_from_percent = overlay9_settings.get('start_from', 0)
+            if hasattr(self, 'overlay9_popup_start_at_percent'):
+                self.overlay9_popup_start_at_percent = overlay9_settings.get('popup_start_at', 5)
+            if hasattr(self, 'overlay9_popup_num'):
+                self.overlay9_popup_num = overlay9_settings.get('popup_num', 1)
+            
+            # Update UI controls to reflect the restored values
+            if hasattr(self, 'overlay9_size_combo'):
+                size = overlay9_settings.get('size_percent', 50)
+                for i in range(self.overlay9_size_combo.count()):
+                    if self.overlay9_size_combo.itemData(i) == size:
+                        self.overlay9_size_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay9_x_combo'):
+                x = overlay9_settings.get('x_percent', 0)
+                for i in range(self.overlay9_x_combo.count()):
+                    if self.overlay9_x_combo.itemData(i) == x:
+                        self.overlay9_x_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay9_y_combo'):
+                y = overlay9_settings.get('y_percent', 0)
+                for i in range(self.overlay9_y_combo.count()):
+                    if self.overlay9_y_combo.itemData(i) == y:
+                        self.overlay9_y_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay9_duration_edit'):
+                self.overlay9_duration_edit.setText(str(overlay9_settings.get('duration', 6)))
+            if hasattr(self, 'overlay9_duration_full_checkbox'):
+                self.overlay9_duration_full_checkbox.setChecked(overlay9_settings.get('duration_full', True))
+            if hasattr(self, 'overlay9_start_at_checkbox'):
+                self.overlay9_start_at_checkbox.setChecked(overlay9_settings.get('start_checkbox', True))
+            if hasattr(self, 'overlay9_popup_checkbox'):
+                self.overlay9_popup_checkbox.setChecked(overlay9_settings.get('popup_checkbox', False))
+            if hasattr(self, 'overlay9_popup_start_at_combo'):
+                popup_start_at = overlay9_settings.get('popup_start_at', 5)
+                for i in range(self.overlay9_popup_start_at_combo.count()):
+                    if self.overlay9_popup_start_at_combo.itemData(i) == popup_start_at:
+                        self.overlay9_popup_start_at_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay9_popup_num_combo'):
+                popup_num = overlay9_settings.get('popup_num', 1)
+                for i in range(self.overlay9_popup_num_combo.count()):
+                    if self.overlay9_popup_num_combo.itemData(i) == popup_num:
+                        self.overlay9_popup_num_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay9_start_combo'):
+                start_at = overlay9_settings.get('start_at', 5)
+                for i in range(self.overlay9_start_combo.count()):
+                    if self.overlay9_start_combo.itemData(i) == start_at:
+                        self.overlay9_start_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay9_start_from_combo'):
+                start_from = overlay9_settings.get('start_from', 0)
+                for i in range(self.overlay9_start_from_combo.count()):
+                    if self.overlay9_start_from_combo.itemData(i) == start_from:
+                        self.overlay9_start_from_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay9_effect_combo'):
+                effect = overlay9_settings.get('effect', 'fadein')
+                for i in range(self.overlay9_effect_combo.count()):
+                    if self.overlay9_effect_combo.itemData(i) == effect:
+                        self.overlay9_effect_combo.setCurrentIndex(i)
+                        break
+        if 'overlay10' in layer_settings:
+            overlay10_settings = layer_settings['overlay10']
+            if hasattr(self, 'overlay10_checkbox'):
+                self.overlay10_checkbox.setChecked(overlay10_settings.get('enabled', False))
+            if hasattr(self, 'overlay10_edit'):
+                self.overlay10_edit.setText(overlay10_settings.get('path', ''))
+            if hasattr(self, 'overlay10_path'):
+                self.overlay10_path = overlay10_settings.get('path', '')
+            if hasattr(self, 'overlay10_size_percent'):
+                self.overlay10_size_percent = overlay10_settings.get('size_percent', 50)
+            if hasattr(self, 'overlay10_x_percent'):
+                self.overlay10_x_percent = overlay10_settings.get('x_percent', 0)
+            if hasattr(self, 'overlay10_y_percent'):
+                self.overlay10_y_percent = overlay10_settings.get('y_percent', 0)
+            if hasattr(self, 'selected_overlay10_effect'):
+                self.selected_overlay10_effect = overlay10_settings.get('effect', 'fadein')
+            if hasattr(self, 'overlay10_duration'):
+                self.overlay10_duration = overlay10_settings.get('duration', 6)
+            if hasattr(self, 'overlay10_start_time'):
+                self.overlay10_start_time = overlay10_settings.get('start_time', 5)
+            if hasattr(self, 'overlay10_start_time_percent'):
+                self.overlay10_start_time_percent = overlay10_settings.get('start_time_percent', 0)
+            if hasattr(self, 'overlay10_start_end_value'):
+                self.overlay10_start_end_value = overlay10_settings.get('start_end_value', 'start')
+            
+            # Update UI controls to reflect the restored values
+            if hasattr(self, 'overlay10_size_combo'):
+                size = overlay10_settings.get('size_percent', 50)
+                for i in range(self.overlay10_size_combo.count()):
+                    if self.overlay10_size_combo.itemData(i) == size:
+                        self.overlay10_size_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay10_x_combo'):
+                x = overlay10_settings.get('x_percent', 0)
+                for i in range(self.overlay10_x_combo.count()):
+                    if self.overlay10_x_combo.itemData(i) == x:
+                        self.overlay10_x_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay10_y_combo'):
+                y = overlay10_settings.get('y_percent', 0)
+                for i in range(self.overlay10_y_combo.count()):
+                    if self.overlay10_y_combo.itemData(i) == y:
+                        self.overlay10_y_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay10_duration_edit'):
+                self.overlay10_duration_edit.setText(str(overlay10_settings.get('duration', 6)))
+            if hasattr(self, 'overlay10_start_edit'):
+                self.overlay10_start_edit.setText(str(overlay10_settings.get('start_time', 5)))
+            if hasattr(self, 'overlay10_start_percent_combo'):
+                start_time_percent = overlay10_settings.get('start_time_percent', 0)
+                for i in range(self.overlay10_start_percent_combo.count()):
+                    if self.overlay10_start_percent_combo.itemData(i) == start_time_percent:
+                        self.overlay10_start_percent_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay10_song_start_end'):
+                self.overlay10_song_start_end.setChecked(overlay10_settings.get('song_start_end_checked', False))
+            if hasattr(self, 'overlay10_start_end_combo'):
+                start_end_value = overlay10_settings.get('start_end_value', 'start')
+                for i in range(self.overlay10_start_end_combo.count()):
+                    if self.overlay10_start_end_combo.itemData(i) == start_end_value:
+                        self.overlay10_start_end_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay10_effect_combo'):
+                effect = overlay10_settings.get('effect', 'fadein')
+                for i in range(self.overlay10_effect_combo.count()):
+                    if self.overlay10_effect_combo.itemData(i) == effect:
+                        self.overlay10_effect_combo.setCurrentIndex(i)
+                        break
+        if 'intro' in layer_settings:
+            intro_settings = layer_settings['intro']
+            if hasattr(self, 'intro_checkbox'):
+                self.intro_checkbox.setChecked(intro_settings.get('enabled', False))
+            if hasattr(self, 'intro_start_checkbox'):
+                self.intro_start_checkbox.setChecked(intro_settings.get('start_checkbox', False))
+            if hasattr(self, 'intro_start_at'):
+                self.intro_start_at = intro_settings.get('start_at', 0)
+            if hasattr(self, 'intro_start_from'):
+                self.intro_start_from = intro_settings.get('start_from', 0)
+            if hasattr(self, 'intro_duration'):
+                self.intro_duration = intro_settings.get('duration', 6)
+            if hasattr(self, 'intro_duration_full_checkbox'):
+                self.intro_duration_full_checkbox.setChecked(intro_settings.get('duration_full', False))
+            if hasattr(self, 'intro_effect'):
+                self.intro_effect = intro_settings.get('effect', 'fadeout')
+            if hasattr(self, 'intro_size_percent'):
+                self.intro_size_percent = intro_settings.get('size_percent', 50)
+            if hasattr(self, 'intro_x_percent'):
+                self.intro_x_percent = intro_settings.get('x_percent', 50)
+            if hasattr(self, 'intro_y_percent'):
+                self.intro_y_percent = intro_settings.get('y_percent', 50)
+            if hasattr(self, 'intro_edit'):
+                self.intro_edit.setText(intro_settings.get('path', ''))
             
-            # Apply FPS
-            if 'fps' in video_settings:
-                fps = video_settings['fps']
-                for i in range(self.fps_combo.count()):
-                    if self.fps_combo.itemData(i) == fps:
-                        self.fps_combo.setCurrentIndex(i)
+            # Update UI controls to reflect the restored values
+            if hasattr(self, 'intro_start_edit'):
+                self.intro_start_edit.setText(str(intro_settings.get('start_at', 0)))
+            if hasattr(self, 'intro_start_from_edit'):
+                self.intro_start_from_edit.setText(str(intro_settings.get('start_from', 0)))
+            if hasattr(self, 'intro_duration_edit'):
+                self.intro_duration_edit.setText(str(intro_settings.get('duration', 6)))
+            if hasattr(self, 'intro_effect_combo'):
+                effect = intro_settings.get('effect', 'fadeout')
+                for i in range(self.intro_effect_combo.count()):
+                    if self.intro_effect_combo.itemData(i) == effect:
+                        self.intro_effect_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'intro_size_combo'):
+                size = intro_settings.get('size_percent', 50)
+                for i in range(self.intro_size_combo.count()):
+                    if self.intro_size_combo.itemData(i) == size:
+                        self.intro_size_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'intro_x_combo'):
+                x = intro_settings.get('x_percent', 50)
+                for i in range(self.intro_x_combo.count()):
+                    if self.intro_x_combo.itemData(i) == x:
+                        self.intro_x_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'intro_y_combo'):
+                y = intro_settings.get('y_percent', 50)
+                for i in range(self.intro_y_combo.count()):
+                    if self.intro_y_combo.itemData(i) == y:
+                        self.intro_y_combo.setCurrentIndex(i)
+                        break
+        if 'frame_box' in layer_settings:
+            frame_box_settings = layer_settings['frame_box']
+            if hasattr(self, 'frame_box_checkbox'):
+                self.frame_box_checkbox.setChecked(frame_box_settings.get('enabled', False))
+            if hasattr(self, 'frame_box_custom_image_checkbox'):
+                self.frame_box_custom_image_checkbox.setChecked(frame_box_settings.get('custom_image_checkbox', False))
+            if hasattr(self, 'frame_box_custom_image_path'):
+                self.frame_box_custom_image_path = frame_box_settings.get('custom_image_path', None)
+            if hasattr(self, 'frame_box_custom_image_edit'):
+                custom_path = frame_box_settings.get('custom_image_path', '')
+                if custom_path:
+                    self.frame_box_custom_image_edit.setText(custom_path)
+            if hasattr(self, 'frame_box_size_percent'):
+                self.frame_box_size_percent = frame_box_settings.get('size_percent', 50)
+            if hasattr(self, 'frame_box_x_percent'):
+                self.frame_box_x_percent = frame_box_settings.get('x_percent', 0)
+            if hasattr(self, 'frame_box_y_percent'):
+                self.frame_box_y_percent = frame_box_settings.get('y_percent', 0)
+            if hasattr(self, 'frame_box_path'):
+                self.frame_box_path = frame_box_settings.get('path', '')
+            if hasattr(self, 'selected_frame_box_effect'):
+                self.selected_frame_box_effect = frame_box_settings.get('effect', 'fadein')
+            if hasattr(self, 'frame_box_duration'):
+                self.frame_box_duration = frame_box_settings.get('duration', 6)
+            if hasattr(self, 'frame_box_start_time'):
+                self.frame_box_start_time = frame_box_settings.get('start_time', 5)
+            if hasattr(self, 'frame_box_color'):
+                self.frame_box_color = frame_box_settings.get('color', (255, 255, 255))
+            if hasattr(self, 'frame_box_opacity'):
+                self.frame_box_opacity = frame_box_settings.get('opacity', 1.0)
+            if hasattr(self, 'frame_box_pad_left'):
+                self.frame_box_pad_left = frame_box_settings.get('pad_left', 12)
+            if hasattr(self, 'frame_box_pad_right'):
+                self.frame_box_pad_right = frame_box_settings.get('pad_right', 12)
+            if hasattr(self, 'frame_box_pad_top'):
+                self.frame_box_pad_top = frame_box_settings.get('pad_top', 12)
+            if hasattr(self, 'frame_box_pad_bottom'):
+                self.frame_box_pad_bottom = frame_box_settings.get('pad_bottom', 48)
+            if hasattr(self, 'frame_box_caption_checkbox'):
+                self.frame_box_caption_checkbox.setChecked(frame_box_settings.get('caption_checkbox', False))
+            if hasattr(self, 'frame_box_caption_position'):
+                self.frame_box_caption_position = frame_box_settings.get('caption_position', 'bottom_center')
+            if hasattr(self, 'frame_box_caption_type'):
+                self.frame_box_caption_type = frame_box_settings.get('caption_type', 'text')
+            if hasattr(self, 'frame_box_caption_text'):
+                self.frame_box_caption_text = frame_box_settings.get('caption_text', 'Caption')
+            if hasattr(self, 'frame_box_caption_png_path'):
+                self.frame_box_caption_png_path = frame_box_settings.get('caption_png_path', None)
+            if hasattr(self, 'frame_box_caption_font'):
+                self.frame_box_caption_font = frame_box_settings.get('caption_font', '')
+            if hasattr(self, 'frame_box_caption_font_size'):
+                self.frame_box_caption_font_size = frame_box_settings.get('caption_font_size', 72)
+            if hasattr(self, 'frame_box_caption_color'):
+                self.frame_box_caption_color = frame_box_settings.get('caption_color', (255, 255, 255))
+            if hasattr(self, 'frame_box_caption_effect'):
+                self.frame_box_caption_effect = frame_box_settings.get('caption_effect', 'none')
+            if hasattr(self, 'frame_box_caption_effect_color'):
+                self.frame_box_caption_effect_color = frame_box_settings.get('caption_effect_color', (255, 255, 255))
+            if hasattr(self, 'frame_box_caption_effect_intensity'):
+                self.frame_box_caption_effect_intensity = frame_box_settings.get('caption_effect_intensity', 5)
+            
+            # Update UI controls
+            if hasattr(self, 'frame_box_size_combo'):
+                size = frame_box_settings.get('size_percent', 50)
+                for i in range(self.frame_box_size_combo.count()):
+                    if self.frame_box_size_combo.itemData(i) == size:
+                        self.frame_box_size_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'frame_box_x_combo'):
+                x = frame_box_settings.get('x_percent', 0)
+                for i in range(self.frame_box_x_combo.count()):
+                    if self.frame_box_x_combo.itemData(i) == x:
+                        self.frame_box_x_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'frame_box_y_combo'):
+                y = frame_box_settings.get('y_percent', 0)
+                for i in range(self.frame_box_y_combo.count()):
+                    if self.frame_box_y_combo.itemData(i) == y:
+                        self.frame_box_y_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'frame_box_effect_combo'):
+                effect = frame_box_settings.get('effect', 'fadein')
+                for i in range(self.frame_box_effect_combo.count()):
+                    if self.frame_box_effect_combo.itemData(i) == effect:
+                        self.frame_box_effect_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'frame_box_duration_edit'):
+                self.frame_box_duration_edit.setText(str(frame_box_settings.get('duration', 6)))
+            if hasattr(self, 'frame_box_duration_full_checkbox'):
+                self.frame_box_duration_full_checkbox.setChecked(frame_box_settings.get('duration_full', True))
+            if hasattr(self, 'frame_box_start_edit'):
+                self.frame_box_start_edit.setText(str(frame_box_settings.get('start_time', 5)))
+            if hasattr(self, 'frame_box_opacity_combo'):
+                opacity = frame_box_settings.get('opacity', 1.0)
+                for i in range(self.frame_box_opacity_combo.count()):
+                    if self.frame_box_opacity_combo.itemData(i) == opacity:
+                        self.frame_box_opacity_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'frame_box_pad_left_combo'):
+                pad_left = frame_box_settings.get('pad_left', 12)
+                for i in range(self.frame_box_pad_left_combo.count()):
+                    if self.frame_box_pad_left_combo.itemData(i) == pad_left:
+                        self.frame_box_pad_left_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'frame_box_pad_right_combo'):
+                pad_right = frame_box_settings.get('pad_right', 12)
+                for i in range(self.frame_box_pad_right_combo.count()):
+                    if self.frame_box_pad_right_combo.itemData(i) == pad_right:
+                        self.frame_box_pad_right_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'frame_box_pad_top_combo'):
+                pad_top = frame_box_settings.get('pad_top', 12)
+                for i in range(self.frame_box_pad_top_combo.count()):
+                    if self.frame_box_pad_top_combo.itemData(i) == pad_top:
+                        self.frame_box_pad_top_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'frame_box_pad_bottom_combo'):
+                pad_bottom = frame_box_settings.get('pad_bottom', 48)
+                for i in range(self.frame_box_pad_bottom_combo.count()):
+                    if self.frame_box_pad_bottom_combo.itemData(i) == pad_bottom:
+                        self.frame_box_pad_bottom_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'frame_box_caption_position_combo'):
+                caption_position = frame_box_settings.get('caption_position', 'bottom_center')
+                for i in range(self.frame_box_caption_position_combo.count()):
+                    if self.frame_box_caption_position_combo.itemData(i) == caption_position:
+                        self.frame_box_caption_position_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'frame_box_caption_text_edit'):
+                self.frame_box_caption_text_edit.setText(frame_box_settings.get('caption_text', 'Caption'))
+            if hasattr(self, 'frame_box_caption_png_edit'):
+                png_path = frame_box_settings.get('caption_png_path', '')
+                if png_path:
+                    self.frame_box_caption_png_edit.setText(png_path)
+            if hasattr(self, 'frame_box_caption_font_combo'):
+                caption_font = frame_box_settings.get('caption_font', '')
+                for i in range(self.frame_box_caption_font_combo.count()):
+                    if self.frame_box_caption_font_combo.itemData(i) == caption_font:
+                        self.frame_box_caption_font_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'frame_box_caption_font_size_combo'):
+                caption_font_size = frame_box_settings.get('caption_font_size', 72)
+                for i in range(self.frame_box_caption_font_size_combo.count()):
+                    if self.frame_box_caption_font_size_combo.itemData(i) == caption_font_size:
+                        self.frame_box_caption_font_size_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'frame_box_caption_effect_combo'):
+                caption_effect = frame_box_settings.get('caption_effect', 'none')
+                for i in range(self.frame_box_caption_effect_combo.count()):
+                    if self.frame_box_caption_effect_combo.itemData(i) == caption_effect:
+                        self.frame_box_caption_effect_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'frame_box_caption_effect_intensity_combo'):
+                caption_effect_intensity = frame_box_settings.get('caption_effect_intensity', 5)
+                for i in range(self.frame_box_caption_effect_intensity_combo.count()):
+                    if self.frame_box_caption_effect_intensity_combo.itemData(i) == caption_effect_intensity:
+                        self.frame_box_caption_effect_intensity_combo.setCurrentIndex(i)
                         break
             
-            # Apply preset
-            if 'preset' in video_settings:
-                preset = video_settings['preset']
-                for i in range(self.preset_combo.count()):
-                    if self.preset_combo.itemData(i) == preset:
-                        self.preset_combo.setCurrentIndex(i)
+            # Update color buttons
+            if hasattr(self, 'frame_box_color_btn'):
+                color = frame_box_settings.get('color', (255, 255, 255))
+                self.frame_box_color_btn.setStyleSheet(f"background-color: rgb({color[0]}, {color[1]}, {color[2]}); border: 1px solid #ccc; padding: 0px; margin: 0px;")
+            if hasattr(self, 'frame_box_caption_color_btn'):
+                caption_color = frame_box_settings.get('caption_color', (255, 255, 255))
+                self.frame_box_caption_color_btn.setStyleSheet(f"background-color: rgb({caption_color[0]}, {caption_color[1]}, {caption_color[2]}); border: 1px solid #ccc; padding: 0px; margin: 0px;")
+            if hasattr(self, 'frame_box_caption_effect_color_btn'):
+                caption_effect_color = frame_box_settings.get('caption_effect_color', (255, 255, 255))
+                self.frame_box_caption_effect_color_btn.setStyleSheet(f"background-color: rgb({caption_effect_color[0]}, {caption_effect_color[1]}, {caption_effect_color[2]}); border: 1px solid #ccc; padding: 0px; margin: 0px;")
+        if 'frame_mp3cover' in layer_settings:
+            frame_mp3cover_settings = layer_settings['frame_mp3cover']
+            if hasattr(self, 'frame_mp3cover_checkbox'):
+                self.frame_mp3cover_checkbox.setChecked(frame_mp3cover_settings.get('enabled', False))
+            if hasattr(self, 'frame_mp3cover_custom_image_checkbox'):
+                self.frame_mp3cover_custom_image_checkbox.setChecked(frame_mp3cover_settings.get('custom_image_checkbox', False))
+            if hasattr(self, 'frame_mp3cover_custom_image_path'):
+                self.frame_mp3cover_custom_image_path = frame_mp3cover_settings.get('custom_image_path', None)
+            if hasattr(self, 'frame_mp3cover_custom_image_edit'):
+                custom_path = frame_mp3cover_settings.get('custom_image_path', '')
+                if custom_path:
+                    self.frame_mp3cover_custom_image_edit.setText(custom_path)
+            if hasattr(self, 'frame_mp3cover_size_percent'):
+                self.frame_mp3cover_size_percent = frame_mp3cover_settings.get('size_percent', 50)
+            if hasattr(self, 'frame_mp3cover_x_percent'):
+                self.frame_mp3cover_x_percent = frame_mp3cover_settings.get('x_percent', 0)
+            if hasattr(self, 'frame_mp3cover_y_percent'):
+                self.frame_mp3cover_y_percent = frame_mp3cover_settings.get('y_percent', 0)
+            if hasattr(self, 'selected_frame_mp3cover_effect'):
+                self.selected_frame_mp3cover_effect = frame_mp3cover_settings.get('effect', 'fadein')
+            if hasattr(self, 'frame_mp3cover_duration'):
+                self.frame_mp3cover_duration = frame_mp3cover_settings.get('duration', 6)
+            if hasattr(self, 'frame_mp3cover_start_time'):
+                self.frame_mp3cover_start_time = frame_mp3cover_settings.get('start_time', 5)
+            
+            # Update UI controls to reflect the restored values
+            if hasattr(self, 'frame_mp3cover_size_combo'):
+                size = frame_mp3cover_settings.get('size_percent', 50)
+                for i in range(self.frame_mp3cover_size_combo.count()):
+                    if self.frame_mp3cover_size_combo.itemData(i) == size:
+                        self.frame_mp3cover_size_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'frame_mp3cover_x_combo'):
+                x = frame_mp3cover_settings.get('x_percent', 0)
+                for i in range(self.frame_mp3cover_x_combo.count()):
+                    if self.frame_mp3cover_x_combo.itemData(i) == x:
+                        self.frame_mp3cover_x_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'frame_mp3cover_y_combo'):
+                y = frame_mp3cover_settings.get('y_percent', 0)
+                for i in range(self.frame_mp3cover_y_combo.count()):
+                    if self.frame_mp3cover_y_combo.itemData(i) == y:
+                        self.frame_mp3cover_y_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'frame_mp3cover_duration_edit'):
+                self.frame_mp3cover_duration_edit.setText(str(frame_mp3cover_settings.get('duration', 6)))
+            if hasattr(self, 'frame_mp3cover_duration_full_checkbox'):
+                self.frame_mp3cover_duration_full_checkbox.setChecked(frame_mp3cover_settings.get('duration_full', True))
+            if hasattr(self, 'frame_mp3cover_start_edit'):
+                self.frame_mp3cover_start_edit.setText(str(frame_mp3cover_settings.get('start_time', 5)))
+            if hasattr(self, 'frame_mp3cover_effect_combo'):
+                effect = frame_mp3cover_settings.get('effect', 'fadein')
+                for i in range(self.frame_mp3cover_effect_combo.count()):
+                    if self.frame_mp3cover_effect_combo.itemData(i) == effect:
+                        self.frame_mp3cover_effect_combo.setCurrentIndex(i)
+                        break
+        if 'mp3_cover_overlay' in layer_settings:
+            mp3_cover_overlay_settings = layer_settings['mp3_cover_overlay']
+            if hasattr(self, 'mp3_cover_overlay_checkbox'):
+                self.mp3_cover_overlay_checkbox.setChecked(mp3_cover_overlay_settings.get('enabled', False))
+            if hasattr(self, 'mp3_cover_custom_image_checkbox'):
+                self.mp3_cover_custom_image_checkbox.setChecked(mp3_cover_overlay_settings.get('custom_image_checkbox', False))
+            if hasattr(self, 'mp3_cover_custom_image_path'):
+                self.mp3_cover_custom_image_path = mp3_cover_overlay_settings.get('custom_image_path', None)
+            if hasattr(self, 'mp3_cover_custom_image_edit'):
+                custom_path = mp3_cover_overlay_settings.get('custom_image_path', '')
+                if custom_path:
+                    self.mp3_cover_custom_image_edit.setText(custom_path)
+            if hasattr(self, 'mp3_cover_size_percent'):
+                self.mp3_cover_size_percent = mp3_cover_overlay_settings.get('size_percent', 20)
+            if hasattr(self, 'mp3_cover_x_percent'):
+                self.mp3_cover_x_percent = mp3_cover_overlay_settings.get('x_percent', 75)
+            if hasattr(self, 'mp3_cover_y_percent'):
+                self.mp3_cover_y_percent = mp3_cover_overlay_settings.get('y_percent', 75)
+            if hasattr(self, 'selected_mp3_cover_effect'):
+                self.selected_mp3_cover_effect = mp3_cover_overlay_settings.get('effect', 'fadeinout')
+            if hasattr(self, 'mp3_cover_duration'):
+                self.mp3_cover_duration = mp3_cover_overlay_settings.get('duration', 6)
+            if hasattr(self, 'mp3_cover_start_at'):
+                self.mp3_cover_start_at = mp3_cover_overlay_settings.get('start_at', 0)
+            if hasattr(self, 'mp3_cover_frame_color'):
+                self.mp3_cover_frame_color = mp3_cover_overlay_settings.get('frame_color', (0, 0, 0))
+            if hasattr(self, 'mp3_cover_frame_size'):
+                self.mp3_cover_frame_size = mp3_cover_overlay_settings.get('frame_size', 10)
+            
+            # Update UI controls to reflect the restored values
+            if hasattr(self, 'mp3_cover_size_combo'):
+                size = mp3_cover_overlay_settings.get('size_percent', 20)
+                for i in range(self.mp3_cover_size_combo.count()):
+                    if self.mp3_cover_size_combo.itemData(i) == size:
+                        self.mp3_cover_size_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'mp3_cover_x_combo'):
+                x = mp3_cover_overlay_settings.get('x_percent', 75)
+                for i in range(self.mp3_cover_x_combo.count()):
+                    if self.mp3_cover_x_combo.itemData(i) == x:
+                        self.mp3_cover_x_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'mp3_cover_y_combo'):
+                y = mp3_cover_overlay_settings.get('y_percent', 75)
+                for i in range(self.mp3_cover_y_combo.count()):
+                    if self.mp3_cover_y_combo.itemData(i) == y:
+                        self.mp3_cover_y_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'mp3_cover_duration_edit'):
+                self.mp3_cover_duration_edit.setText(str(mp3_cover_overlay_settings.get('duration', 6)))
+            if hasattr(self, 'mp3_cover_duration_full_checkbox'):
+                self.mp3_cover_duration_full_checkbox.setChecked(mp3_cover_overlay_settings.get('duration_full', True))
+            if hasattr(self, 'mp3_cover_start_edit'):
+                self.mp3_cover_start_edit.setText(str(mp3_cover_overlay_settings.get('start_at', 0)))
+            if hasattr(self, 'mp3_cover_effect_combo'):
+                effect = mp3_cover_overlay_settings.get('effect', 'fadeinout')
+                for i in range(self.mp3_cover_effect_combo.count()):
+                    if self.mp3_cover_effect_combo.itemData(i) == effect:
+                        self.mp3_cover_effect_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'mp3_cover_frame_color_btn'):
+                frame_color = mp3_cover_overlay_settings.get('frame_color', (0, 0, 0))
+                self.mp3_cover_frame_color_btn.setStyleSheet(f"background-color: rgb({frame_color[0]}, {frame_color[1]}, {frame_color[2]}); border: 1px solid #ccc; padding: 0px; margin: 0px;")
+            if hasattr(self, 'mp3_cover_frame_size_combo'):
+                frame_size = mp3_cover_overlay_settings.get('frame_size', 10)
+                for i in range(self.mp3_cover_frame_size_combo.count()):
+                    if self.mp3_cover_frame_size_combo.itemData(i) == frame_size:
+                        self.mp3_cover_frame_size_combo.setCurrentIndex(i)
+                        break
+        if 'song_titles' in layer_settings:
+            song_titles_settings = layer_settings['song_titles']
+            if hasattr(self, 'song_title_checkbox'):
+                self.song_title_checkbox.setChecked(song_titles_settings.get('enabled', False))
+            if hasattr(self, 'song_titles_label_edit'):
+                self.song_titles_label_edit.setText(song_titles_settings.get('label', ' Song Titles :'))
+            if hasattr(self, 'song_title_effect'):
+                self.song_title_effect = song_titles_settings.get('effect', 'fadeinout')
+            if hasattr(self, 'song_title_font'):
+                self.song_title_font = song_titles_settings.get('font', 'default')
+            if hasattr(self, 'song_title_font_size'):
+                self.song_title_font_size = song_titles_settings.get('font_size', 220)
+            if hasattr(self, 'song_title_scale_percent'):
+                self.song_title_scale_percent = song_titles_settings.get('scale_percent', 50)
+            if hasattr(self, 'song_title_color'):
+                self.song_title_color = song_titles_settings.get('color', (255, 255, 255))
+            if hasattr(self, 'song_title_bg'):
+                self.song_title_bg = song_titles_settings.get('bg', 'transparent')
+            if hasattr(self, 'song_title_bg_color'):
+                self.song_title_bg_color = song_titles_settings.get('bg_color', (0, 0, 0))
+            if hasattr(self, 'song_title_opacity'):
+                self.song_title_opacity = song_titles_settings.get('opacity', 0.20)
+            if hasattr(self, 'song_title_x_percent'):
+                self.song_title_x_percent = song_titles_settings.get('x_percent', 50)
+            if hasattr(self, 'song_title_y_percent'):
+                self.song_title_y_percent = song_titles_settings.get('y_percent', 20)
+            if hasattr(self, 'song_title_start_at'):
+                self.song_title_start_at = song_titles_settings.get('start_at', 5)
+            if hasattr(self, 'song_title_text_effect'):
+                self.song_title_text_effect = song_titles_settings.get('text_effect', 'none')
+            if hasattr(self, 'song_title_text_effect_color'):
+                self.song_title_text_effect_color = song_titles_settings.get('text_effect_color', (0, 0, 0))
+            if hasattr(self, 'song_title_text_effect_intensity'):
+                self.song_title_text_effect_intensity = song_titles_settings.get('text_effect_intensity', 20)
+            
+            # Update UI controls
+            if hasattr(self, 'song_title_font_combo'):
+                font = song_titles_settings.get('font', 'default')
+                for i in range(self.song_title_font_combo.count()):
+                    if self.song_title_font_combo.itemData(i) == font:
+                        self.song_title_font_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'song_title_scale_combo'):
+                scale = song_titles_settings.get('scale_percent', 50)
+                for i in range(self.song_title_scale_combo.count()):
+                    if self.song_title_scale_combo.itemData(i) == scale:
+                        self.song_title_scale_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'song_title_bg_combo'):
+                bg = song_titles_settings.get('bg', 'transparent')
+                for i in range(self.song_title_bg_combo.count()):
+                    if self.song_title_bg_combo.itemData(i) == bg:
+                        self.song_title_bg_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'song_title_opacity_combo'):
+                opacity = song_titles_settings.get('opacity', 0.20)
+                for i in range(self.song_title_opacity_combo.count()):
+                    if self.song_title_opacity_combo.itemData(i) == opacity:
+                        self.song_title_opacity_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'song_title_x_combo'):
+                x = song_titles_settings.get('x_percent', 50)
+                for i in range(self.song_title_x_combo.count()):
+                    if self.song_title_x_combo.itemData(i) == x:
+                        self.song_title_x_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'song_title_y_combo'):
+                y = song_titles_settings.get('y_percent', 20)
+                for i in range(self.song_title_y_combo.count()):
+                    if self.song_title_y_combo.itemData(i) == y:
+                        self.song_title_y_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'song_title_effect_combo'):
+                effect = song_titles_settings.get('effect', 'fadeinout')
+                for i in range(self.song_title_effect_combo.count()):
+                    if self.song_title_effect_combo.itemData(i) == effect:
+                        self.song_title_effect_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'song_title_start_edit'):
+                self.song_title_start_edit.setText(str(song_titles_settings.get('start_at', 5)))
+            if hasattr(self, 'song_title_text_effect_combo'):
+                effect = song_titles_settings.get('text_effect', 'none')
+                for i in range(self.song_title_text_effect_combo.count()):
+                    if self.song_title_text_effect_combo.itemData(i) == effect:
+                        self.song_title_text_effect_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'song_title_text_effect_intensity_combo'):
+                intensity = song_titles_settings.get('text_effect_intensity', 20)
+                for i in range(self.song_title_text_effect_intensity_combo.count()):
+                    if self.song_title_text_effect_intensity_combo.itemData(i) == intensity:
+                        self.song_title_text_effect_intensity_combo.setCurrentIndex(i)
                         break
             
-            # Apply bitrate settings to application settings
-            if 'audio_bitrate' in video_settings:
-                self.settings.setValue('default_ffmpeg_audio_bitrate', video_settings['audio_bitrate'])
-            if 'video_bitrate' in video_settings:
-                self.settings.setValue('default_ffmpeg_video_bitrate', video_settings['video_bitrate'])
-            if 'maxrate' in video_settings:
-                self.settings.setValue('default_ffmpeg_maxrate', video_settings['maxrate'])
-            if 'bufsize' in video_settings:
-                self.settings.setValue('default_ffmpeg_bufsize', video_settings['bufsize'])
-            
-            # Apply layer order
-            if 'layer_order' in template_data:
-                self.layer_order = template_data['layer_order']
-            
-            # Apply layer settings
-            layer_settings = template_data.get('layer_settings', {})
-            if 'overlay1' in layer_settings:
-                overlay1_settings = layer_settings['overlay1']
-                if hasattr(self, 'overlay_checkbox'):
-                    self.overlay_checkbox.setChecked(overlay1_settings.get('enabled', False))
-                if hasattr(self, 'overlay1_edit'):
-                    self.overlay1_edit.setText(overlay1_settings.get('path', ''))
-                if hasattr(self, 'overlay1_size_percent'):
-                    self.overlay1_size_percent = overlay1_settings.get('size_percent', 50)
-                if hasattr(self, 'overlay1_x_percent'):
-                    self.overlay1_x_percent = overlay1_settings.get('x_percent', 0)
-                if hasattr(self, 'overlay1_y_percent'):
-                    self.overlay1_y_percent = overlay1_settings.get('y_percent', 75)
-                
-                # Update UI controls to reflect the restored values
-                if hasattr(self, 'overlay1_size_combo'):
-                    size = overlay1_settings.get('size_percent', 50)
-                    for i in range(self.overlay1_size_combo.count()):
-                        if self.overlay1_size_combo.itemData(i) == size:
-                            self.overlay1_size_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay1_x_combo'):
-                    x = overlay1_settings.get('x_percent', 0)
-                    for i in range(self.overlay1_x_combo.count()):
-                        if self.overlay1_x_combo.itemData(i) == x:
-                            self.overlay1_x_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay1_y_combo'):
-                    y = overlay1_settings.get('y_percent', 75)
-                    for i in range(self.overlay1_y_combo.count()):
-                        if self.overlay1_y_combo.itemData(i) == y:
-                            self.overlay1_y_combo.setCurrentIndex(i)
-                            break
-            if 'overlay2' in layer_settings:
-                overlay2_settings = layer_settings['overlay2']
-                if hasattr(self, 'overlay2_checkbox'):
-                    self.overlay2_checkbox.setChecked(overlay2_settings.get('enabled', False))
-                if hasattr(self, 'overlay2_edit'):
-                    self.overlay2_edit.setText(overlay2_settings.get('path', ''))
-                if hasattr(self, 'overlay2_size_percent'):
-                    self.overlay2_size_percent = overlay2_settings.get('size_percent', 10)
-                if hasattr(self, 'overlay2_x_percent'):
-                    self.overlay2_x_percent = overlay2_settings.get('x_percent', 75)
-                if hasattr(self, 'overlay2_y_percent'):
-                    self.overlay2_y_percent = overlay2_settings.get('y_percent', 0)
-                
-                
-                if hasattr(self, 'overlay2_size_combo'):
-                    size = overlay2_settings.get('size_percent', 10)
-                    for i in range(self.overlay2_size_combo.count()):
-                        if self.overlay2_size_combo.itemData(i) == size:
-                            self.overlay2_size_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay2_x_combo'):
-                    x = overlay2_settings.get('x_percent', 75)
-                    for i in range(self.overlay2_x_combo.count()):
-                        if self.overlay2_x_combo.itemData(i) == x:
-                            self.overlay2_x_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay2_y_combo'):
-                    y = overlay2_settings.get('y_percent', 0)
-                    for i in range(self.overlay2_y_combo.count()):
-                        if self.overlay2_y_combo.itemData(i) == y:
-                            self.overlay2_y_combo.setCurrentIndex(i)
-                            break
-
-            if 'overlay3' in layer_settings:
-                overlay3_settings = layer_settings['overlay3']
-                if hasattr(self, 'overlay3_checkbox'):
-                    self.overlay3_checkbox.setChecked(overlay3_settings.get('enabled', False))
-                if hasattr(self, 'overlay3_edit'):
-                    self.overlay3_edit.setText(overlay3_settings.get('path', ''))
-                if hasattr(self, 'overlay3_size_percent'):
-                    self.overlay3_size_percent = overlay3_settings.get('size_percent', 50)
-                if hasattr(self, 'overlay3_x_percent'):
-                    self.overlay3_x_percent = overlay3_settings.get('x_percent', 75)
-                if hasattr(self, 'overlay3_y_percent'):
-                    self.overlay3_y_percent = overlay3_settings.get('y_percent', 0)
-                
-                # Update UI controls to reflect the restored values
-                if hasattr(self, 'overlay3_size_combo'):
-                    size = overlay3_settings.get('size_percent', 50)
-                    for i in range(self.overlay3_size_combo.count()):
-                        if self.overlay3_size_combo.itemData(i) == size:
-                            self.overlay3_size_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay3_x_combo'):
-                    x = overlay3_settings.get('x_percent', 75)
-                    for i in range(self.overlay3_x_combo.count()):
-                        if self.overlay3_x_combo.itemData(i) == x:
-                            self.overlay3_x_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay3_y_combo'):
-                    y = overlay3_settings.get('y_percent', 0)
-                    for i in range(self.overlay3_y_combo.count()):
-                        if self.overlay3_y_combo.itemData(i) == y:
-                            self.overlay3_y_combo.setCurrentIndex(i)
-                            break
-            if 'overlay4' in layer_settings:
-                overlay4_settings = layer_settings['overlay4']
-                if hasattr(self, 'overlay4_checkbox'):
-                    self.overlay4_checkbox.setChecked(overlay4_settings.get('enabled', False))
-                if hasattr(self, 'overlay4_edit'):
-                    self.overlay4_edit.setText(overlay4_settings.get('path', ''))
-                if hasattr(self, 'overlay4_size_percent'):
-                    self.overlay4_size_percent = overlay4_settings.get('size_percent', 50)
-                if hasattr(self, 'overlay4_x_percent'):
-                    self.overlay4_x_percent = overlay4_settings.get('x_percent', 75)
-                if hasattr(self, 'overlay4_y_percent'):
-                    self.overlay4_y_percent = overlay4_settings.get('y_percent', 0)
-                
-                # Update UI controls to reflect the restored values
-                if hasattr(self, 'overlay4_size_combo'):
-                    size = overlay4_settings.get('size_percent', 50)
-                    for i in range(self.overlay4_size_combo.count()):
-                        if self.overlay4_size_combo.itemData(i) == size:
-                            self.overlay4_size_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay4_x_combo'):
-                    x = overlay4_settings.get('x_percent', 75)
-                    for i in range(self.overlay4_x_combo.count()):
-                        if self.overlay4_x_combo.itemData(i) == x:
-                            self.overlay4_x_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay4_y_combo'):
-                    y = overlay4_settings.get('y_percent', 0)
-                    for i in range(self.overlay4_y_combo.count()):
-                        if self.overlay4_y_combo.itemData(i) == y:
-                            self.overlay4_y_combo.setCurrentIndex(i)
-                            break
-            if 'overlay5' in layer_settings:
-                overlay5_settings = layer_settings['overlay5']
-                if hasattr(self, 'overlay5_checkbox'):
-                    self.overlay5_checkbox.setChecked(overlay5_settings.get('enabled', False))
-                if hasattr(self, 'overlay5_edit'):
-                    self.overlay5_edit.setText(overlay5_settings.get('path', ''))
-                if hasattr(self, 'overlay5_size_percent'):
-                    self.overlay5_size_percent = overlay5_settings.get('size_percent', 50)
-                if hasattr(self, 'overlay5_x_percent'):
-                    self.overlay5_x_percent = overlay5_settings.get('x_percent', 75)
-                if hasattr(self, 'overlay5_y_percent'):
-                    self.overlay5_y_percent = overlay5_settings.get('y_percent', 0)
-                
-                # Update UI controls to reflect the restored values
-                if hasattr(self, 'overlay5_size_combo'):
-                    size = overlay5_settings.get('size_percent', 50)
-                    for i in range(self.overlay5_size_combo.count()):
-                        if self.overlay5_size_combo.itemData(i) == size:
-                            self.overlay5_size_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay5_x_combo'):
-                    x = overlay5_settings.get('x_percent', 75)
-                    for i in range(self.overlay5_x_combo.count()):
-                        if self.overlay5_x_combo.itemData(i) == x:
-                            self.overlay5_x_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay5_y_combo'):
-                    y = overlay5_settings.get('y_percent', 0)
-                    for i in range(self.overlay5_y_combo.count()):
-                        if self.overlay5_y_combo.itemData(i) == y:
-                            self.overlay5_y_combo.setCurrentIndex(i)
-                            break
-            if 'overlay6' in layer_settings:
-                overlay6_settings = layer_settings['overlay6']
-                if hasattr(self, 'overlay6_checkbox'):
-                    self.overlay6_checkbox.setChecked(overlay6_settings.get('enabled', False))
-                if hasattr(self, 'overlay6_edit'):
-                    self.overlay6_edit.setText(overlay6_settings.get('path', ''))
-                if hasattr(self, 'overlay6_size_percent'):
-                    self.overlay6_size_percent = overlay6_settings.get('size_percent', 50)
-                if hasattr(self, 'overlay6_x_percent'):
-                    self.overlay6_x_percent = overlay6_settings.get('x_percent', 75)
-                if hasattr(self, 'overlay6_y_percent'):
-                    self.overlay6_y_percent = overlay6_settings.get('y_percent', 0)
-                
-                # Update UI controls to reflect the restored values
-                if hasattr(self, 'overlay6_size_combo'):
-                    size = overlay6_settings.get('size_percent', 50)
-                    for i in range(self.overlay6_size_combo.count()):
-                        if self.overlay6_size_combo.itemData(i) == size:
-                            self.overlay6_size_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay6_x_combo'):
-                    x = overlay6_settings.get('x_percent', 75)
-                    for i in range(self.overlay6_x_combo.count()):
-                        if self.overlay6_x_combo.itemData(i) == x:
-                            self.overlay6_x_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay6_y_combo'):
-                    y = overlay6_settings.get('y_percent', 0)
-                    for i in range(self.overlay6_y_combo.count()):
-                        if self.overlay6_y_combo.itemData(i) == y:
-                            self.overlay6_y_combo.setCurrentIndex(i)
-                            break
-            if 'overlay7' in layer_settings:
-                overlay7_settings = layer_settings['overlay7']
-                if hasattr(self, 'overlay7_checkbox'):
-                    self.overlay7_checkbox.setChecked(overlay7_settings.get('enabled', False))
-                if hasattr(self, 'overlay7_edit'):
-                    self.overlay7_edit.setText(overlay7_settings.get('path', ''))
-                if hasattr(self, 'overlay7_size_percent'):
-                    self.overlay7_size_percent = overlay7_settings.get('size_percent', 50)
-                if hasattr(self, 'overlay7_x_percent'):
-                    self.overlay7_x_percent = overlay7_settings.get('x_percent', 75)
-                if hasattr(self, 'overlay7_y_percent'):
-                    self.overlay7_y_percent = overlay7_settings.get('y_percent', 0)
-                
-                # Update UI controls to reflect the restored values
-                if hasattr(self, 'overlay7_size_combo'):
-                    size = overlay7_settings.get('size_percent', 50)
-                    for i in range(self.overlay7_size_combo.count()):
-                        if self.overlay7_size_combo.itemData(i) == size:
-                            self.overlay7_size_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay7_x_combo'):
-                    x = overlay7_settings.get('x_percent', 75)
-                    for i in range(self.overlay7_x_combo.count()):
-                        if self.overlay7_x_combo.itemData(i) == x:
-                            self.overlay7_x_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay7_y_combo'):
-                    y = overlay7_settings.get('y_percent', 0)
-                    for i in range(self.overlay7_y_combo.count()):
-                        if self.overlay7_y_combo.itemData(i) == y:
-                            self.overlay7_y_combo.setCurrentIndex(i)
-                            break
-            if 'overlay8' in layer_settings:
-                overlay8_settings = layer_settings['overlay8']
-                if hasattr(self, 'overlay8_checkbox'):
-                    self.overlay8_checkbox.setChecked(overlay8_settings.get('enabled', False))
-                if hasattr(self, 'overlay8_edit'):
-                    self.overlay8_edit.setText(overlay8_settings.get('path', ''))
-                if hasattr(self, 'overlay8_path'):
-                    self.overlay8_path = overlay8_settings.get('path', '')
-                if hasattr(self, 'overlay8_size_percent'):
-                    self.overlay8_size_percent = overlay8_settings.get('size_percent', 50)
-                if hasattr(self, 'overlay8_x_percent'):
-                    self.overlay8_x_percent = overlay8_settings.get('x_percent', 0)
-                if hasattr(self, 'overlay8_y_percent'):
-                    self.overlay8_y_percent = overlay8_settings.get('y_percent', 0)
-                if hasattr(self, 'selected_overlay8_effect'):
-                    self.selected_overlay8_effect = overlay8_settings.get('effect', 'fadein')
-                if hasattr(self, 'overlay8_duration'):
-                    self.overlay8_duration = overlay8_settings.get('duration', 6)
-                if hasattr(self, 'overlay8_start_percent'):
-                    self.overlay8_start_percent = overlay8_settings.get('start_at', 5)
-                if hasattr(self, 'overlay8_start_from_percent'):
-                    self.overlay8_start_from_percent = overlay8_settings.get('start_from', 0)
-                if hasattr(self, 'overlay8_popup_start_at_percent'):
-                    self.overlay8_popup_start_at_percent = overlay8_settings.get('popup_start_at', 5)
-                if hasattr(self, 'overlay8_popup_num'):
-                    self.overlay8_popup_num = overlay8_settings.get('popup_num', 1)
-                
-                # Update UI controls to reflect the restored values
-                if hasattr(self, 'overlay8_size_combo'):
-                    size = overlay8_settings.get('size_percent', 50)
-                    for i in range(self.overlay8_size_combo.count()):
-                        if self.overlay8_size_combo.itemData(i) == size:
-                            self.overlay8_size_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay8_x_combo'):
-                    x = overlay8_settings.get('x_percent', 0)
-                    for i in range(self.overlay8_x_combo.count()):
-                        if self.overlay8_x_combo.itemData(i) == x:
-                            self.overlay8_x_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay8_y_combo'):
-                    y = overlay8_settings.get('y_percent', 0)
-                    for i in range(self.overlay8_y_combo.count()):
-                        if self.overlay8_y_combo.itemData(i) == y:
-                            self.overlay8_y_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay8_duration_edit'):
-                    self.overlay8_duration_edit.setText(str(overlay8_settings.get('duration', 6)))
-                if hasattr(self, 'overlay8_duration_full_checkbox'):
-                    self.overlay8_duration_full_checkbox.setChecked(overlay8_settings.get('duration_full', True))
-                if hasattr(self, 'overlay8_start_at_checkbox'):
-                    self.overlay8_start_at_checkbox.setChecked(overlay8_settings.get('start_checkbox', True))
-                if hasattr(self, 'overlay8_popup_checkbox'):
-                    self.overlay8_popup_checkbox.setChecked(overlay8_settings.get('popup_checkbox', False))
-                if hasattr(self, 'overlay8_popup_start_at_combo'):
-                    popup_start_at = overlay8_settings.get('popup_start_at', 5)
-                    for i in range(self.overlay8_popup_start_at_combo.count()):
-                        if self.overlay8_popup_start_at_combo.itemData(i) == popup_start_at:
-                            self.overlay8_popup_start_at_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay8_popup_num_combo'):
-                    popup_num = overlay8_settings.get('popup_num', 1)
-                    for i in range(self.overlay8_popup_num_combo.count()):
-                        if self.overlay8_popup_num_combo.itemData(i) == popup_num:
-                            self.overlay8_popup_num_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay8_start_combo'):
-                    start_at = overlay8_settings.get('start_at', 5)
-                    for i in range(self.overlay8_start_combo.count()):
-                        if self.overlay8_start_combo.itemData(i) == start_at:
-                            self.overlay8_start_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay8_start_from_combo'):
-                    start_from = overlay8_settings.get('start_from', 0)
-                    for i in range(self.overlay8_start_from_combo.count()):
-                        if self.overlay8_start_from_combo.itemData(i) == start_from:
-                            self.overlay8_start_from_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay8_effect_combo'):
-                    effect = overlay8_settings.get('effect', 'fadein')
-                    for i in range(self.overlay8_effect_combo.count()):
-                        if self.overlay8_effect_combo.itemData(i) == effect:
-                            self.overlay8_effect_combo.setCurrentIndex(i)
-                            break
-            if 'overlay9' in layer_settings:
-                overlay9_settings = layer_settings['overlay9']
-                if hasattr(self, 'overlay9_checkbox'):
-                    self.overlay9_checkbox.setChecked(overlay9_settings.get('enabled', False))
-                if hasattr(self, 'overlay9_edit'):
-                    self.overlay9_edit.setText(overlay9_settings.get('path', ''))
-                if hasattr(self, 'overlay9_path'):
-                    self.overlay9_path = overlay9_settings.get('path', '')
-                if hasattr(self, 'overlay9_size_percent'):
-                    self.overlay9_size_percent = overlay9_settings.get('size_percent', 50)
-                if hasattr(self, 'overlay9_x_percent'):
-                    self.overlay9_x_percent = overlay9_settings.get('x_percent', 0)
-                if hasattr(self, 'overlay9_y_percent'):
-                    self.overlay9_y_percent = overlay9_settings.get('y_percent', 0)
-                if hasattr(self, 'selected_overlay9_effect'):
-                    self.selected_overlay9_effect = overlay9_settings.get('effect', 'fadein')
-                if hasattr(self, 'overlay9_duration'):
-                    self.overlay9_duration = overlay9_settings.get('duration', 6)
-                if hasattr(self, 'overlay9_start_percent'):
-                    self.overlay9_start_percent = overlay9_settings.get('start_at', 5)
-                if hasattr(self, 'overlay9_start_from_percent'):
-                    self.overlay9_start_from_percent = overlay9_settings.get('start_from', 0)
-                if hasattr(self, 'overlay9_popup_start_at_percent'):
-                    self.overlay9_popup_start_at_percent = overlay9_settings.get('popup_start_at', 5)
-                if hasattr(self, 'overlay9_popup_num'):
-                    self.overlay9_popup_num = overlay9_settings.get('popup_num', 1)
-                
-                # Update UI controls to reflect the restored values
-                if hasattr(self, 'overlay9_size_combo'):
-                    size = overlay9_settings.get('size_percent', 50)
-                    for i in range(self.overlay9_size_combo.count()):
-                        if self.overlay9_size_combo.itemData(i) == size:
-                            self.overlay9_size_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay9_x_combo'):
-                    x = overlay9_settings.get('x_percent', 0)
-                    for i in range(self.overlay9_x_combo.count()):
-                        if self.overlay9_x_combo.itemData(i) == x:
-                            self.overlay9_x_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay9_y_combo'):
-                    y = overlay9_settings.get('y_percent', 0)
-                    for i in range(self.overlay9_y_combo.count()):
-                        if self.overlay9_y_combo.itemData(i) == y:
-                            self.overlay9_y_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay9_duration_edit'):
-                    self.overlay9_duration_edit.setText(str(overlay9_settings.get('duration', 6)))
-                if hasattr(self, 'overlay9_duration_full_checkbox'):
-                    self.overlay9_duration_full_checkbox.setChecked(overlay9_settings.get('duration_full', True))
-                if hasattr(self, 'overlay9_start_at_checkbox'):
-                    self.overlay9_start_at_checkbox.setChecked(overlay9_settings.get('start_checkbox', True))
-                if hasattr(self, 'overlay9_popup_checkbox'):
-                    self.overlay9_popup_checkbox.setChecked(overlay9_settings.get('popup_checkbox', False))
-                if hasattr(self, 'overlay9_popup_start_at_combo'):
-                    popup_start_at = overlay9_settings.get('popup_start_at', 5)
-                    for i in range(self.overlay9_popup_start_at_combo.count()):
-                        if self.overlay9_popup_start_at_combo.itemData(i) == popup_start_at:
-                            self.overlay9_popup_start_at_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay9_popup_num_combo'):
-                    popup_num = overlay9_settings.get('popup_num', 1)
-                    for i in range(self.overlay9_popup_num_combo.count()):
-                        if self.overlay9_popup_num_combo.itemData(i) == popup_num:
-                            self.overlay9_popup_num_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay9_start_combo'):
-                    start_at = overlay9_settings.get('start_at', 5)
-                    for i in range(self.overlay9_start_combo.count()):
-                        if self.overlay9_start_combo.itemData(i) == start_at:
-                            self.overlay9_start_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay9_start_from_combo'):
-                    start_from = overlay9_settings.get('start_from', 0)
-                    for i in range(self.overlay9_start_from_combo.count()):
-                        if self.overlay9_start_from_combo.itemData(i) == start_from:
-                            self.overlay9_start_from_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay9_effect_combo'):
-                    effect = overlay9_settings.get('effect', 'fadein')
-                    for i in range(self.overlay9_effect_combo.count()):
-                        if self.overlay9_effect_combo.itemData(i) == effect:
-                            self.overlay9_effect_combo.setCurrentIndex(i)
-                            break
-            if 'overlay10' in layer_settings:
-                overlay10_settings = layer_settings['overlay10']
-                if hasattr(self, 'overlay10_checkbox'):
-                    self.overlay10_checkbox.setChecked(overlay10_settings.get('enabled', False))
-                if hasattr(self, 'overlay10_edit'):
-                    self.overlay10_edit.setText(overlay10_settings.get('path', ''))
-                if hasattr(self, 'overlay10_path'):
-                    self.overlay10_path = overlay10_settings.get('path', '')
-                if hasattr(self, 'overlay10_size_percent'):
-                    self.overlay10_size_percent = overlay10_settings.get('size_percent', 50)
-                if hasattr(self, 'overlay10_x_percent'):
-                    self.overlay10_x_percent = overlay10_settings.get('x_percent', 0)
-                if hasattr(self, 'overlay10_y_percent'):
-                    self.overlay10_y_percent = overlay10_settings.get('y_percent', 0)
-                if hasattr(self, 'selected_overlay10_effect'):
-                    self.selected_overlay10_effect = overlay10_settings.get('effect', 'fadein')
-                if hasattr(self, 'overlay10_duration'):
-                    self.overlay10_duration = overlay10_settings.get('duration', 6)
-                if hasattr(self, 'overlay10_start_time'):
-                    self.overlay10_start_time = overlay10_settings.get('start_time', 5)
-                if hasattr(self, 'overlay10_start_time_percent'):
-                    self.overlay10_start_time_percent = overlay10_settings.get('start_time_percent', 0)
-                if hasattr(self, 'overlay10_start_end_value'):
-                    self.overlay10_start_end_value = overlay10_settings.get('start_end_value', 'start')
-                
-                # Update UI controls to reflect the restored values
-                if hasattr(self, 'overlay10_size_combo'):
-                    size = overlay10_settings.get('size_percent', 50)
-                    for i in range(self.overlay10_size_combo.count()):
-                        if self.overlay10_size_combo.itemData(i) == size:
-                            self.overlay10_size_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay10_x_combo'):
-                    x = overlay10_settings.get('x_percent', 0)
-                    for i in range(self.overlay10_x_combo.count()):
-                        if self.overlay10_x_combo.itemData(i) == x:
-                            self.overlay10_x_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay10_y_combo'):
-                    y = overlay10_settings.get('y_percent', 0)
-                    for i in range(self.overlay10_y_combo.count()):
-                        if self.overlay10_y_combo.itemData(i) == y:
-                            self.overlay10_y_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay10_duration_edit'):
-                    self.overlay10_duration_edit.setText(str(overlay10_settings.get('duration', 6)))
-                if hasattr(self, 'overlay10_start_edit'):
-                    self.overlay10_start_edit.setText(str(overlay10_settings.get('start_time', 5)))
-                if hasattr(self, 'overlay10_start_percent_combo'):
-                    start_time_percent = overlay10_settings.get('start_time_percent', 0)
-                    for i in range(self.overlay10_start_percent_combo.count()):
-                        if self.overlay10_start_percent_combo.itemData(i) == start_time_percent:
-                            self.overlay10_start_percent_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay10_song_start_end'):
-                    self.overlay10_song_start_end.setChecked(overlay10_settings.get('song_start_end_checked', False))
-                if hasattr(self, 'overlay10_start_end_combo'):
-                    start_end_value = overlay10_settings.get('start_end_value', 'start')
-                    for i in range(self.overlay10_start_end_combo.count()):
-                        if self.overlay10_start_end_combo.itemData(i) == start_end_value:
-                            self.overlay10_start_end_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay10_effect_combo'):
-                    effect = overlay10_settings.get('effect', 'fadein')
-                    for i in range(self.overlay10_effect_combo.count()):
-                        if self.overlay10_effect_combo.itemData(i) == effect:
-                            self.overlay10_effect_combo.setCurrentIndex(i)
-                            break
-            if 'intro' in layer_settings:
-                intro_settings = layer_settings['intro']
-                if hasattr(self, 'intro_checkbox'):
-                    self.intro_checkbox.setChecked(intro_settings.get('enabled', False))
-                if hasattr(self, 'intro_start_checkbox'):
-                    self.intro_start_checkbox.setChecked(intro_settings.get('start_checkbox', False))
-                if hasattr(self, 'intro_start_at'):
-                    self.intro_start_at = intro_settings.get('start_at', 0)
-                if hasattr(self, 'intro_start_from'):
-                    self.intro_start_from = intro_settings.get('start_from', 0)
-                if hasattr(self, 'intro_duration'):
-                    self.intro_duration = intro_settings.get('duration', 6)
-                if hasattr(self, 'intro_duration_full_checkbox'):
-                    self.intro_duration_full_checkbox.setChecked(intro_settings.get('duration_full', False))
-                if hasattr(self, 'intro_effect'):
-                    self.intro_effect = intro_settings.get('effect', 'fadeout')
-                if hasattr(self, 'intro_size_percent'):
-                    self.intro_size_percent = intro_settings.get('size_percent', 50)
-                if hasattr(self, 'intro_x_percent'):
-                    self.intro_x_percent = intro_settings.get('x_percent', 50)
-                if hasattr(self, 'intro_y_percent'):
-                    self.intro_y_percent = intro_settings.get('y_percent', 50)
-                if hasattr(self, 'intro_edit'):
-                    self.intro_edit.setText(intro_settings.get('path', ''))
-                
-                # Update UI controls to reflect the restored values
-                if hasattr(self, 'intro_start_edit'):
-                    self.intro_start_edit.setText(str(intro_settings.get('start_at', 0)))
-                if hasattr(self, 'intro_start_from_edit'):
-                    self.intro_start_from_edit.setText(str(intro_settings.get('start_from', 0)))
-                if hasattr(self, 'intro_duration_edit'):
-                    self.intro_duration_edit.setText(str(intro_settings.get('duration', 6)))
-                if hasattr(self, 'intro_effect_combo'):
-                    effect = intro_settings.get('effect', 'fadeout')
-                    for i in range(self.intro_effect_combo.count()):
-                        if self.intro_effect_combo.itemData(i) == effect:
-                            self.intro_effect_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'intro_size_combo'):
-                    size = intro_settings.get('size_percent', 50)
-                    for i in range(self.intro_size_combo.count()):
-                        if self.intro_size_combo.itemData(i) == size:
-                            self.intro_size_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'intro_x_combo'):
-                    x = intro_settings.get('x_percent', 50)
-                    for i in range(self.intro_x_combo.count()):
-                        if self.intro_x_combo.itemData(i) == x:
-                            self.intro_x_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'intro_y_combo'):
-                    y = intro_settings.get('y_percent', 50)
-                    for i in range(self.intro_y_combo.count()):
-                        if self.intro_y_combo.itemData(i) == y:
-                            self.intro_y_combo.setCurrentIndex(i)
-                            break
-            if 'frame_box' in layer_settings:
-                frame_box_settings = layer_settings['frame_box']
-                if hasattr(self, 'frame_box_checkbox'):
-                    self.frame_box_checkbox.setChecked(frame_box_settings.get('enabled', False))
-                if hasattr(self, 'frame_box_custom_image_checkbox'):
-                    self.frame_box_custom_image_checkbox.setChecked(frame_box_settings.get('custom_image_checkbox', False))
-                if hasattr(self, 'frame_box_custom_image_path'):
-                    self.frame_box_custom_image_path = frame_box_settings.get('custom_image_path', None)
-                if hasattr(self, 'frame_box_custom_image_edit'):
-                    custom_path = frame_box_settings.get('custom_image_path', '')
-                    if custom_path:
-                        self.frame_box_custom_image_edit.setText(custom_path)
-                if hasattr(self, 'frame_box_size_percent'):
-                    self.frame_box_size_percent = frame_box_settings.get('size_percent', 50)
-                if hasattr(self, 'frame_box_x_percent'):
-                    self.frame_box_x_percent = frame_box_settings.get('x_percent', 0)
-                if hasattr(self, 'frame_box_y_percent'):
-                    self.frame_box_y_percent = frame_box_settings.get('y_percent', 0)
-                if hasattr(self, 'frame_box_path'):
-                    self.frame_box_path = frame_box_settings.get('path', '')
-                if hasattr(self, 'selected_frame_box_effect'):
-                    self.selected_frame_box_effect = frame_box_settings.get('effect', 'fadein')
-                if hasattr(self, 'frame_box_duration'):
-                    self.frame_box_duration = frame_box_settings.get('duration', 6)
-                if hasattr(self, 'frame_box_start_time'):
-                    self.frame_box_start_time = frame_box_settings.get('start_time', 5)
-                if hasattr(self, 'frame_box_color'):
-                    self.frame_box_color = frame_box_settings.get('color', (255, 255, 255))
-                if hasattr(self, 'frame_box_opacity'):
-                    self.frame_box_opacity = frame_box_settings.get('opacity', 1.0)
-                if hasattr(self, 'frame_box_pad_left'):
-                    self.frame_box_pad_left = frame_box_settings.get('pad_left', 12)
-                if hasattr(self, 'frame_box_pad_right'):
-                    self.frame_box_pad_right = frame_box_settings.get('pad_right', 12)
-                if hasattr(self, 'frame_box_pad_top'):
-                    self.frame_box_pad_top = frame_box_settings.get('pad_top', 12)
-                if hasattr(self, 'frame_box_pad_bottom'):
-                    self.frame_box_pad_bottom = frame_box_settings.get('pad_bottom', 48)
-                if hasattr(self, 'frame_box_caption_checkbox'):
-                    self.frame_box_caption_checkbox.setChecked(frame_box_settings.get('caption_checkbox', False))
-                if hasattr(self, 'frame_box_caption_position'):
-                    self.frame_box_caption_position = frame_box_settings.get('caption_position', 'bottom_center')
-                if hasattr(self, 'frame_box_caption_type'):
-                    self.frame_box_caption_type = frame_box_settings.get('caption_type', 'text')
-                if hasattr(self, 'frame_box_caption_text'):
-                    self.frame_box_caption_text = frame_box_settings.get('caption_text', 'Caption')
-                if hasattr(self, 'frame_box_caption_png_path'):
-                    self.frame_box_caption_png_path = frame_box_settings.get('caption_png_path', None)
-                if hasattr(self, 'frame_box_caption_font'):
-                    self.frame_box_caption_font = frame_box_settings.get('caption_font', '')
-                if hasattr(self, 'frame_box_caption_font_size'):
-                    self.frame_box_caption_font_size = frame_box_settings.get('caption_font_size', 72)
-                if hasattr(self, 'frame_box_caption_color'):
-                    self.frame_box_caption_color = frame_box_settings.get('caption_color', (255, 255, 255))
-                if hasattr(self, 'frame_box_caption_effect'):
-                    self.frame_box_caption_effect = frame_box_settings.get('caption_effect', 'none')
-                if hasattr(self, 'frame_box_caption_effect_color'):
-                    self.frame_box_caption_effect_color = frame_box_settings.get('caption_effect_color', (255, 255, 255))
-                if hasattr(self, 'frame_box_caption_effect_intensity'):
-                    self.frame_box_caption_effect_intensity = frame_box_settings.get('caption_effect_intensity', 5)
-                
-                # Update UI controls
-                if hasattr(self, 'frame_box_size_combo'):
-                    size = frame_box_settings.get('size_percent', 50)
-                    for i in range(self.frame_box_size_combo.count()):
-                        if self.frame_box_size_combo.itemData(i) == size:
-                            self.frame_box_size_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'frame_box_x_combo'):
-                    x = frame_box_settings.get('x_percent', 0)
-                    for i in range(self.frame_box_x_combo.count()):
-                        if self.frame_box_x_combo.itemData(i) == x:
-                            self.frame_box_x_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'frame_box_y_combo'):
-                    y = frame_box_settings.get('y_percent', 0)
-                    for i in range(self.frame_box_y_combo.count()):
-                        if self.frame_box_y_combo.itemData(i) == y:
-                            self.frame_box_y_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'frame_box_effect_combo'):
-                    effect = frame_box_settings.get('effect', 'fadein')
-                    for i in range(self.frame_box_effect_combo.count()):
-                        if self.frame_box_effect_combo.itemData(i) == effect:
-                            self.frame_box_effect_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'frame_box_duration_edit'):
-                    self.frame_box_duration_edit.setText(str(frame_box_settings.get('duration', 6)))
-                if hasattr(self, 'frame_box_duration_full_checkbox'):
-                    self.frame_box_duration_full_checkbox.setChecked(frame_box_settings.get('duration_full', True))
-                if hasattr(self, 'frame_box_start_edit'):
-                    self.frame_box_start_edit.setText(str(frame_box_settings.get('start_time', 5)))
-                if hasattr(self, 'frame_box_opacity_combo'):
-                    opacity = frame_box_settings.get('opacity', 1.0)
-                    for i in range(self.frame_box_opacity_combo.count()):
-                        if self.frame_box_opacity_combo.itemData(i) == opacity:
-                            self.frame_box_opacity_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'frame_box_pad_left_combo'):
-                    pad_left = frame_box_settings.get('pad_left', 12)
-                    for i in range(self.frame_box_pad_left_combo.count()):
-                        if self.frame_box_pad_left_combo.itemData(i) == pad_left:
-                            self.frame_box_pad_left_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'frame_box_pad_right_combo'):
-                    pad_right = frame_box_settings.get('pad_right', 12)
-                    for i in range(self.frame_box_pad_right_combo.count()):
-                        if self.frame_box_pad_right_combo.itemData(i) == pad_right:
-                            self.frame_box_pad_right_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'frame_box_pad_top_combo'):
-                    pad_top = frame_box_settings.get('pad_top', 12)
-                    for i in range(self.frame_box_pad_top_combo.count()):
-                        if self.frame_box_pad_top_combo.itemData(i) == pad_top:
-                            self.frame_box_pad_top_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'frame_box_pad_bottom_combo'):
-                    pad_bottom = frame_box_settings.get('pad_bottom', 48)
-                    for i in range(self.frame_box_pad_bottom_combo.count()):
-                        if self.frame_box_pad_bottom_combo.itemData(i) == pad_bottom:
-                            self.frame_box_pad_bottom_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'frame_box_caption_position_combo'):
-                    caption_position = frame_box_settings.get('caption_position', 'bottom_center')
-                    for i in range(self.frame_box_caption_position_combo.count()):
-                        if self.frame_box_caption_position_combo.itemData(i) == caption_position:
-                            self.frame_box_caption_position_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'frame_box_caption_text_edit'):
-                    self.frame_box_caption_text_edit.setText(frame_box_settings.get('caption_text', 'Caption'))
-                if hasattr(self, 'frame_box_caption_png_edit'):
-                    png_path = frame_box_settings.get('caption_png_path', '')
-                    if png_path:
-                        self.frame_box_caption_png_edit.setText(png_path)
-                if hasattr(self, 'frame_box_caption_font_combo'):
-                    caption_font = frame_box_settings.get('caption_font', '')
-                    for i in range(self.frame_box_caption_font_combo.count()):
-                        if self.frame_box_caption_font_combo.itemData(i) == caption_font:
-                            self.frame_box_caption_font_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'frame_box_caption_font_size_combo'):
-                    caption_font_size = frame_box_settings.get('caption_font_size', 72)
-                    for i in range(self.frame_box_caption_font_size_combo.count()):
-                        if self.frame_box_caption_font_size_combo.itemData(i) == caption_font_size:
-                            self.frame_box_caption_font_size_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'frame_box_caption_effect_combo'):
-                    caption_effect = frame_box_settings.get('caption_effect', 'none')
-                    for i in range(self.frame_box_caption_effect_combo.count()):
-                        if self.frame_box_caption_effect_combo.itemData(i) == caption_effect:
-                            self.frame_box_caption_effect_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'frame_box_caption_effect_intensity_combo'):
-                    caption_effect_intensity = frame_box_settings.get('caption_effect_intensity', 5)
-                    for i in range(self.frame_box_caption_effect_intensity_combo.count()):
-                        if self.frame_box_caption_effect_intensity_combo.itemData(i) == caption_effect_intensity:
-                            self.frame_box_caption_effect_intensity_combo.setCurrentIndex(i)
-                            break
-                
-                # Update color buttons
-                if hasattr(self, 'frame_box_color_btn'):
-                    color = frame_box_settings.get('color', (255, 255, 255))
-                    self.frame_box_color_btn.setStyleSheet(f"background-color: rgb({color[0]}, {color[1]}, {color[2]}); border: 1px solid #ccc; padding: 0px; margin: 0px;")
-                if hasattr(self, 'frame_box_caption_color_btn'):
-                    caption_color = frame_box_settings.get('caption_color', (255, 255, 255))
-                    self.frame_box_caption_color_btn.setStyleSheet(f"background-color: rgb({caption_color[0]}, {caption_color[1]}, {caption_color[2]}); border: 1px solid #ccc; padding: 0px; margin: 0px;")
-                if hasattr(self, 'frame_box_caption_effect_color_btn'):
-                    caption_effect_color = frame_box_settings.get('caption_effect_color', (255, 255, 255))
-                    self.frame_box_caption_effect_color_btn.setStyleSheet(f"background-color: rgb({caption_effect_color[0]}, {caption_effect_color[1]}, {caption_effect_color[2]}); border: 1px solid #ccc; padding: 0px; margin: 0px;")
-            if 'frame_mp3cover' in layer_settings:
-                frame_mp3cover_settings = layer_settings['frame_mp3cover']
-                if hasattr(self, 'frame_mp3cover_checkbox'):
-                    self.frame_mp3cover_checkbox.setChecked(frame_mp3cover_settings.get('enabled', False))
-                if hasattr(self, 'frame_mp3cover_custom_image_checkbox'):
-                    self.frame_mp3cover_custom_image_checkbox.setChecked(frame_mp3cover_settings.get('custom_image_checkbox', False))
-                if hasattr(self, 'frame_mp3cover_custom_image_path'):
-                    self.frame_mp3cover_custom_image_path = frame_mp3cover_settings.get('custom_image_path', None)
-                if hasattr(self, 'frame_mp3cover_custom_image_edit'):
-                    custom_path = frame_mp3cover_settings.get('custom_image_path', '')
-                    if custom_path:
-                        self.frame_mp3cover_custom_image_edit.setText(custom_path)
-                if hasattr(self, 'frame_mp3cover_size_percent'):
-                    self.frame_mp3cover_size_percent = frame_mp3cover_settings.get('size_percent', 50)
-                if hasattr(self, 'frame_mp3cover_x_percent'):
-                    self.frame_mp3cover_x_percent = frame_mp3cover_settings.get('x_percent', 0)
-                if hasattr(self, 'frame_mp3cover_y_percent'):
-                    self.frame_mp3cover_y_percent = frame_mp3cover_settings.get('y_percent', 0)
-                if hasattr(self, 'selected_frame_mp3cover_effect'):
-                    self.selected_frame_mp3cover_effect = frame_mp3cover_settings.get('effect', 'fadein')
-                if hasattr(self, 'frame_mp3cover_duration'):
-                    self.frame_mp3cover_duration = frame_mp3cover_settings.get('duration', 6)
-                if hasattr(self, 'frame_mp3cover_start_time'):
-                    self.frame_mp3cover_start_time = frame_mp3cover_settings.get('start_time', 5)
-                
-                # Update UI controls to reflect the restored values
-                if hasattr(self, 'frame_mp3cover_size_combo'):
-                    size = frame_mp3cover_settings.get('size_percent', 50)
-                    for i in range(self.frame_mp3cover_size_combo.count()):
-                        if self.frame_mp3cover_size_combo.itemData(i) == size:
-                            self.frame_mp3cover_size_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'frame_mp3cover_x_combo'):
-                    x = frame_mp3cover_settings.get('x_percent', 0)
-                    for i in range(self.frame_mp3cover_x_combo.count()):
-                        if self.frame_mp3cover_x_combo.itemData(i) == x:
-                            self.frame_mp3cover_x_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'frame_mp3cover_y_combo'):
-                    y = frame_mp3cover_settings.get('y_percent', 0)
-                    for i in range(self.frame_mp3cover_y_combo.count()):
-                        if self.frame_mp3cover_y_combo.itemData(i) == y:
-                            self.frame_mp3cover_y_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'frame_mp3cover_duration_edit'):
-                    self.frame_mp3cover_duration_edit.setText(str(frame_mp3cover_settings.get('duration', 6)))
-                if hasattr(self, 'frame_mp3cover_duration_full_checkbox'):
-                    self.frame_mp3cover_duration_full_checkbox.setChecked(frame_mp3cover_settings.get('duration_full', True))
-                if hasattr(self, 'frame_mp3cover_start_edit'):
-                    self.frame_mp3cover_start_edit.setText(str(frame_mp3cover_settings.get('start_time', 5)))
-                if hasattr(self, 'frame_mp3cover_effect_combo'):
-                    effect = frame_mp3cover_settings.get('effect', 'fadein')
-                    for i in range(self.frame_mp3cover_effect_combo.count()):
-                        if self.frame_mp3cover_effect_combo.itemData(i) == effect:
-                            self.frame_mp3cover_effect_combo.setCurrentIndex(i)
-                            break
-            if 'mp3_cover_overlay' in layer_settings:
-                mp3_cover_overlay_settings = layer_settings['mp3_cover_overlay']
-                if hasattr(self, 'mp3_cover_overlay_checkbox'):
-                    self.mp3_cover_overlay_checkbox.setChecked(mp3_cover_overlay_settings.get('enabled', False))
-                if hasattr(self, 'mp3_cover_custom_image_checkbox'):
-                    self.mp3_cover_custom_image_checkbox.setChecked(mp3_cover_overlay_settings.get('custom_image_checkbox', False))
-                if hasattr(self, 'mp3_cover_custom_image_path'):
-                    self.mp3_cover_custom_image_path = mp3_cover_overlay_settings.get('custom_image_path', None)
-                if hasattr(self, 'mp3_cover_custom_image_edit'):
-                    custom_path = mp3_cover_overlay_settings.get('custom_image_path', '')
-                    if custom_path:
-                        self.mp3_cover_custom_image_edit.setText(custom_path)
-                if hasattr(self, 'mp3_cover_size_percent'):
-                    self.mp3_cover_size_percent = mp3_cover_overlay_settings.get('size_percent', 20)
-                if hasattr(self, 'mp3_cover_x_percent'):
-                    self.mp3_cover_x_percent = mp3_cover_overlay_settings.get('x_percent', 75)
-                if hasattr(self, 'mp3_cover_y_percent'):
-                    self.mp3_cover_y_percent = mp3_cover_overlay_settings.get('y_percent', 75)
-                if hasattr(self, 'selected_mp3_cover_effect'):
-                    self.selected_mp3_cover_effect = mp3_cover_overlay_settings.get('effect', 'fadeinout')
-                if hasattr(self, 'mp3_cover_duration'):
-                    self.mp3_cover_duration = mp3_cover_overlay_settings.get('duration', 6)
-                if hasattr(self, 'mp3_cover_start_at'):
-                    self.mp3_cover_start_at = mp3_cover_overlay_settings.get('start_at', 0)
-                if hasattr(self, 'mp3_cover_frame_color'):
-                    self.mp3_cover_frame_color = mp3_cover_overlay_settings.get('frame_color', (0, 0, 0))
-                if hasattr(self, 'mp3_cover_frame_size'):
-                    self.mp3_cover_frame_size = mp3_cover_overlay_settings.get('frame_size', 10)
-                
-                # Update UI controls to reflect the restored values
-                if hasattr(self, 'mp3_cover_size_combo'):
-                    size = mp3_cover_overlay_settings.get('size_percent', 20)
-                    for i in range(self.mp3_cover_size_combo.count()):
-                        if self.mp3_cover_size_combo.itemData(i) == size:
-                            self.mp3_cover_size_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'mp3_cover_x_combo'):
-                    x = mp3_cover_overlay_settings.get('x_percent', 75)
-                    for i in range(self.mp3_cover_x_combo.count()):
-                        if self.mp3_cover_x_combo.itemData(i) == x:
-                            self.mp3_cover_x_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'mp3_cover_y_combo'):
-                    y = mp3_cover_overlay_settings.get('y_percent', 75)
-                    for i in range(self.mp3_cover_y_combo.count()):
-                        if self.mp3_cover_y_combo.itemData(i) == y:
-                            self.mp3_cover_y_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'mp3_cover_duration_edit'):
-                    self.mp3_cover_duration_edit.setText(str(mp3_cover_overlay_settings.get('duration', 6)))
-                if hasattr(self, 'mp3_cover_duration_full_checkbox'):
-                    self.mp3_cover_duration_full_checkbox.setChecked(mp3_cover_overlay_settings.get('duration_full', True))
-                if hasattr(self, 'mp3_cover_start_edit'):
-                    self.mp3_cover_start_edit.setText(str(mp3_cover_overlay_settings.get('start_at', 0)))
-                if hasattr(self, 'mp3_cover_effect_combo'):
-                    effect = mp3_cover_overlay_settings.get('effect', 'fadeinout')
-                    for i in range(self.mp3_cover_effect_combo.count()):
-                        if self.mp3_cover_effect_combo.itemData(i) == effect:
-                            self.mp3_cover_effect_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'mp3_cover_frame_color_btn'):
-                    frame_color = mp3_cover_overlay_settings.get('frame_color', (0, 0, 0))
-                    self.mp3_cover_frame_color_btn.setStyleSheet(f"background-color: rgb({frame_color[0]}, {frame_color[1]}, {frame_color[2]}); border: 1px solid #ccc; padding: 0px; margin: 0px;")
-                if hasattr(self, 'mp3_cover_frame_size_combo'):
-                    frame_size = mp3_cover_overlay_settings.get('frame_size', 10)
-                    for i in range(self.mp3_cover_frame_size_combo.count()):
-                        if self.mp3_cover_frame_size_combo.itemData(i) == frame_size:
-                            self.mp3_cover_frame_size_combo.setCurrentIndex(i)
-                            break
-            if 'song_titles' in layer_settings:
-                song_titles_settings = layer_settings['song_titles']
-                if hasattr(self, 'song_title_checkbox'):
-                    self.song_title_checkbox.setChecked(song_titles_settings.get('enabled', False))
-                if hasattr(self, 'song_titles_label_edit'):
-                    self.song_titles_label_edit.setText(song_titles_settings.get('label', ' Song Titles :'))
-                if hasattr(self, 'song_title_effect'):
-                    self.song_title_effect = song_titles_settings.get('effect', 'fadeinout')
-                if hasattr(self, 'song_title_font'):
-                    self.song_title_font = song_titles_settings.get('font', 'default')
-                if hasattr(self, 'song_title_font_size'):
-                    self.song_title_font_size = song_titles_settings.get('font_size', 220)
-                if hasattr(self, 'song_title_scale_percent'):
-                    self.song_title_scale_percent = song_titles_settings.get('scale_percent', 50)
-                if hasattr(self, 'song_title_color'):
-                    self.song_title_color = song_titles_settings.get('color', (255, 255, 255))
-                if hasattr(self, 'song_title_bg'):
-                    self.song_title_bg = song_titles_settings.get('bg', 'transparent')
-                if hasattr(self, 'song_title_bg_color'):
-                    self.song_title_bg_color = song_titles_settings.get('bg_color', (0, 0, 0))
-                if hasattr(self, 'song_title_opacity'):
-                    self.song_title_opacity = song_titles_settings.get('opacity', 0.20)
-                if hasattr(self, 'song_title_x_percent'):
-                    self.song_title_x_percent = song_titles_settings.get('x_percent', 50)
-                if hasattr(self, 'song_title_y_percent'):
-                    self.song_title_y_percent = song_titles_settings.get('y_percent', 20)
-                if hasattr(self, 'song_title_start_at'):
-                    self.song_title_start_at = song_titles_settings.get('start_at', 5)
-                if hasattr(self, 'song_title_text_effect'):
-                    self.song_title_text_effect = song_titles_settings.get('text_effect', 'none')
-                if hasattr(self, 'song_title_text_effect_color'):
-                    self.song_title_text_effect_color = song_titles_settings.get('text_effect_color', (0, 0, 0))
-                if hasattr(self, 'song_title_text_effect_intensity'):
-                    self.song_title_text_effect_intensity = song_titles_settings.get('text_effect_intensity', 20)
-                
-                # Update UI controls
-                if hasattr(self, 'song_title_font_combo'):
-                    font = song_titles_settings.get('font', 'default')
-                    for i in range(self.song_title_font_combo.count()):
-                        if self.song_title_font_combo.itemData(i) == font:
-                            self.song_title_font_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'song_title_scale_combo'):
-                    scale = song_titles_settings.get('scale_percent', 50)
-                    for i in range(self.song_title_scale_combo.count()):
-                        if self.song_title_scale_combo.itemData(i) == scale:
-                            self.song_title_scale_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'song_title_bg_combo'):
-                    bg = song_titles_settings.get('bg', 'transparent')
-                    for i in range(self.song_title_bg_combo.count()):
-                        if self.song_title_bg_combo.itemData(i) == bg:
-                            self.song_title_bg_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'song_title_opacity_combo'):
-                    opacity = song_titles_settings.get('opacity', 0.20)
-                    for i in range(self.song_title_opacity_combo.count()):
-                        if self.song_title_opacity_combo.itemData(i) == opacity:
-                            self.song_title_opacity_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'song_title_x_combo'):
-                    x = song_titles_settings.get('x_percent', 50)
-                    for i in range(self.song_title_x_combo.count()):
-                        if self.song_title_x_combo.itemData(i) == x:
-                            self.song_title_x_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'song_title_y_combo'):
-                    y = song_titles_settings.get('y_percent', 20)
-                    for i in range(self.song_title_y_combo.count()):
-                        if self.song_title_y_combo.itemData(i) == y:
-                            self.song_title_y_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'song_title_effect_combo'):
-                    effect = song_titles_settings.get('effect', 'fadeinout')
-                    for i in range(self.song_title_effect_combo.count()):
-                        if self.song_title_effect_combo.itemData(i) == effect:
-                            self.song_title_effect_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'song_title_start_edit'):
-                    self.song_title_start_edit.setText(str(song_titles_settings.get('start_at', 5)))
-                if hasattr(self, 'song_title_text_effect_combo'):
-                    effect = song_titles_settings.get('text_effect', 'none')
-                    for i in range(self.song_title_text_effect_combo.count()):
-                        if self.song_title_text_effect_combo.itemData(i) == effect:
-                            self.song_title_text_effect_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'song_title_text_effect_intensity_combo'):
-                    intensity = song_titles_settings.get('text_effect_intensity', 20)
-                    for i in range(self.song_title_text_effect_intensity_combo.count()):
-                        if self.song_title_text_effect_intensity_combo.itemData(i) == intensity:
-                            self.song_title_text_effect_intensity_combo.setCurrentIndex(i)
-                            break
-                
-                # Update color buttons
-                if hasattr(self, 'song_title_color_btn'):
-                    color = song_titles_settings.get('color', (255, 255, 255))
-                    self.song_title_color_btn.setStyleSheet(f"background-color: rgb({color[0]}, {color[1]}, {color[2]}); border: 1px solid #ccc; padding: 0px; margin: 0px;")
-                if hasattr(self, 'song_title_bg_color_btn'):
-                    bg_color = song_titles_settings.get('bg_color', (0, 0, 0))
-                    self.song_title_bg_color_btn.setStyleSheet(f"background-color: rgb({bg_color[0]}, {bg_color[1]}, {bg_color[2]}); border: 1px solid #ccc; padding: 0px; margin: 0px;")
-                if hasattr(self, 'song_title_text_effect_color_btn'):
-                    effect_color = song_titles_settings.get('text_effect_color', (0, 0, 0))
-                    self.song_title_text_effect_color_btn.setStyleSheet(f"background-color: rgb({effect_color[0]}, {effect_color[1]}, {effect_color[2]}); border: 1px solid #ccc; padding: 0px; margin: 0px;")
-            if 'soundwave' in layer_settings:
-                soundwave_settings = layer_settings['soundwave']
-                if hasattr(self, 'soundwave_checkbox'):
-                    self.soundwave_checkbox.setChecked(soundwave_settings.get('enabled', False))
-                
-                # Update soundwave method
-                if hasattr(self, 'soundwave_method_combo'):
-                    method = soundwave_settings.get('method', 'bars')
-                    for i in range(self.soundwave_method_combo.count()):
-                        if self.soundwave_method_combo.itemData(i) == method:
-                            self.soundwave_method_combo.setCurrentIndex(i)
-                            break
-                    # Update instance variable
-                    if hasattr(self, 'soundwave_method'):
-                        self.soundwave_method = method
-                
-                # Update soundwave color
-                if hasattr(self, 'soundwave_color_combo'):
-                    color = soundwave_settings.get('color', 'hue_rotate')
-                    for i in range(self.soundwave_color_combo.count()):
-                        if self.soundwave_color_combo.itemData(i) == color:
-                            self.soundwave_color_combo.setCurrentIndex(i)
-                            break
-                    # Update instance variable
-                    if hasattr(self, 'soundwave_color'):
-                        self.soundwave_color = color
-                
-                # Update soundwave size
-                if hasattr(self, 'soundwave_size_combo'):
-                    size = soundwave_settings.get('size_percent', 50)
-                    for i in range(self.soundwave_size_combo.count()):
-                        if self.soundwave_size_combo.itemData(i) == size:
-                            self.soundwave_size_combo.setCurrentIndex(i)
-                            break
-                    # Update instance variable
-                    if hasattr(self, 'soundwave_size_percent'):
-                        self.soundwave_size_percent = size
-                
-                # Update soundwave X position
-                if hasattr(self, 'soundwave_x_combo'):
-                    x = soundwave_settings.get('x_percent', 50)
-                    for i in range(self.soundwave_x_combo.count()):
-                        if self.soundwave_x_combo.itemData(i) == x:
-                            self.soundwave_x_combo.setCurrentIndex(i)
-                            break
-                    # Update instance variable
-                    if hasattr(self, 'soundwave_x_percent'):
-                        self.soundwave_x_percent = x
-                
-                # Update soundwave Y position
-                if hasattr(self, 'soundwave_y_combo'):
-                    y = soundwave_settings.get('y_percent', 50)
-                    for i in range(self.soundwave_y_combo.count()):
-                        if self.soundwave_y_combo.itemData(i) == y:
-                            self.soundwave_y_combo.setCurrentIndex(i)
-                            break
-                    # Update instance variable
-                    if hasattr(self, 'soundwave_y_percent'):
-                        self.soundwave_y_percent = y
-            
-            # Apply overlay1_2_effect_settings
-            if 'overlay1_2_effect_settings' in template_data:
-                overlay1_2_effect_settings = template_data['overlay1_2_effect_settings']
-                
-                # Update variables
-                if hasattr(self, 'selected_overlay1_2_effect'):
-                    self.selected_overlay1_2_effect = overlay1_2_effect_settings.get('effect', 'fadein')
-                if hasattr(self, 'overlay1_2_duration'):
-                    self.overlay1_2_duration = overlay1_2_effect_settings.get('duration', 6)
-                if hasattr(self, 'overlay_start_at'):
-                    self.overlay_start_at = overlay1_2_effect_settings.get('start_at', 5)
-                if hasattr(self, 'overlay1_2_start_from'):
-                    self.overlay1_2_start_from = overlay1_2_effect_settings.get('start_from', 0)
-                
-                # Update checkboxes
-                if hasattr(self, 'overlay1_2_duration_full_checkbox'):
-                    self.overlay1_2_duration_full_checkbox.setChecked(overlay1_2_effect_settings.get('duration_full', True))
-                if hasattr(self, 'overlay1_2_start_at_checkbox'):
-                    self.overlay1_2_start_at_checkbox.setChecked(overlay1_2_effect_settings.get('start_at_checkbox', True))
-                
-                # Update UI controls
-                if hasattr(self, 'effect_combo'):
-                    effect = overlay1_2_effect_settings.get('effect', 'fadein')
-                    for i in range(self.effect_combo.count()):
-                        if self.effect_combo.itemData(i) == effect:
-                            self.effect_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay1_2_duration_edit'):
-                    self.overlay1_2_duration_edit.setText(str(overlay1_2_effect_settings.get('duration', 6)))
-                if hasattr(self, 'overlay1_2_start_at_edit'):
-                    self.overlay1_2_start_at_edit.setText(str(overlay1_2_effect_settings.get('start_at', 5)))
-                if hasattr(self, 'overlay1_2_start_from_edit'):
-                    self.overlay1_2_start_from_edit.setText(str(overlay1_2_effect_settings.get('start_from', 0)))
-            
-            # Apply overlay4_5_effect_settings
-            if 'overlay4_5_effect_settings' in template_data:
-                overlay4_5_effect_settings = template_data['overlay4_5_effect_settings']
-                
-                # Update variables
-                if hasattr(self, 'selected_overlay4_5_effect'):
-                    self.selected_overlay4_5_effect = overlay4_5_effect_settings.get('effect', 'fadein')
-                if hasattr(self, 'overlay4_5_duration'):
-                    self.overlay4_5_duration = overlay4_5_effect_settings.get('duration', 6)
-                if hasattr(self, 'overlay4_5_start_at'):
-                    self.overlay4_5_start_at = overlay4_5_effect_settings.get('start_at', 5)
-                if hasattr(self, 'overlay4_5_start_from'):
-                    self.overlay4_5_start_from = overlay4_5_effect_settings.get('start_from', 0)
-                
-                # Update checkboxes
-                if hasattr(self, 'overlay4_5_duration_full_checkbox'):
-                    self.overlay4_5_duration_full_checkbox.setChecked(overlay4_5_effect_settings.get('duration_full', True))
-                if hasattr(self, 'overlay4_5_start_at_checkbox'):
-                    self.overlay4_5_start_at_checkbox.setChecked(overlay4_5_effect_settings.get('start_at_checkbox', True))
-                
-                # Update UI controls
-                if hasattr(self, 'overlay4_5_effect_combo'):
-                    effect = overlay4_5_effect_settings.get('effect', 'fadein')
-                    for i in range(self.overlay4_5_effect_combo.count()):
-                        if self.overlay4_5_effect_combo.itemData(i) == effect:
-                            self.overlay4_5_effect_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay4_5_duration_edit'):
-                    self.overlay4_5_duration_edit.setText(str(overlay4_5_effect_settings.get('duration', 6)))
-                if hasattr(self, 'overlay4_5_start_edit'):
-                    self.overlay4_5_start_edit.setText(str(overlay4_5_effect_settings.get('start_at', 5)))
-                if hasattr(self, 'overlay4_5_start_from_edit'):
-                    self.overlay4_5_start_from_edit.setText(str(overlay4_5_effect_settings.get('start_from', 0)))
-            
-            # Apply overlay6_7_effect_settings
-            if 'overlay6_7_effect_settings' in template_data:
-                overlay6_7_effect_settings = template_data['overlay6_7_effect_settings']
-                
-                # Update variables
-                if hasattr(self, 'selected_overlay6_7_effect'):
-                    self.selected_overlay6_7_effect = overlay6_7_effect_settings.get('effect', 'fadein')
-                if hasattr(self, 'overlay6_7_duration'):
-                    self.overlay6_7_duration = overlay6_7_effect_settings.get('duration', 6)
-                if hasattr(self, 'overlay6_7_start_at'):
-                    self.overlay6_7_start_at = overlay6_7_effect_settings.get('start_at', 5)
-                if hasattr(self, 'overlay6_7_start_from'):
-                    self.overlay6_7_start_from = overlay6_7_effect_settings.get('start_from', 0)
-                
-                # Update checkboxes
-                if hasattr(self, 'overlay6_7_duration_full_checkbox'):
-                    self.overlay6_7_duration_full_checkbox.setChecked(overlay6_7_effect_settings.get('duration_full', True))
-                if hasattr(self, 'overlay6_7_start_at_checkbox'):
-                    self.overlay6_7_start_at_checkbox.setChecked(overlay6_7_effect_settings.get('start_at_checkbox', True))
-                
-                # Update UI controls
-                if hasattr(self, 'overlay6_7_effect_combo'):
-                    effect = overlay6_7_effect_settings.get('effect', 'fadein')
-                    for i in range(self.overlay6_7_effect_combo.count()):
-                        if self.overlay6_7_effect_combo.itemData(i) == effect:
-                            self.overlay6_7_effect_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay6_7_duration_edit'):
-                    self.overlay6_7_duration_edit.setText(str(overlay6_7_effect_settings.get('duration', 6)))
-                if hasattr(self, 'overlay6_7_start_edit'):
-                    self.overlay6_7_start_edit.setText(str(overlay6_7_effect_settings.get('start_at', 5)))
-                if hasattr(self, 'overlay6_7_start_from_edit'):
-                    self.overlay6_7_start_from_edit.setText(str(overlay6_7_effect_settings.get('start_from', 0)))
-            
-            # Apply overlay3_soundwave_effect_settings
-            if 'overlay3_soundwave_effect_settings' in template_data:
-                overlay3_soundwave_effect_settings = template_data['overlay3_soundwave_effect_settings']
-                
-                # Update variables
-                if hasattr(self, 'selected_overlay3_soundwave_effect'):
-                    self.selected_overlay3_soundwave_effect = overlay3_soundwave_effect_settings.get('effect', 'fadein')
-                if hasattr(self, 'overlay3_soundwave_start_time'):
-                    self.overlay3_soundwave_start_time = overlay3_soundwave_effect_settings.get('start_time', 5)
-                
-                # Update UI controls
-                if hasattr(self, 'overlay3_soundwave_effect_combo'):
-                    effect = overlay3_soundwave_effect_settings.get('effect', 'fadein')
-                    for i in range(self.overlay3_soundwave_effect_combo.count()):
-                        if self.overlay3_soundwave_effect_combo.itemData(i) == effect:
-                            self.overlay3_soundwave_effect_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'overlay3_soundwave_start_edit'):
-                    self.overlay3_soundwave_start_edit.setText(str(overlay3_soundwave_effect_settings.get('start_time', 5)))
-            
-            # Apply background_layer_settings
-            if 'background_layer_settings' in template_data:
-                background_layer_settings = template_data['background_layer_settings']
-                
-                # Update variables
-                if hasattr(self, 'bg_scale_percent'):
-                    self.bg_scale_percent = background_layer_settings.get('scale_percent', 100)
-                if hasattr(self, 'bg_crop_position'):
-                    self.bg_crop_position = background_layer_settings.get('crop_position', 'center')
-                if hasattr(self, 'bg_effect'):
-                    self.bg_effect = background_layer_settings.get('effect', 'none')
-                if hasattr(self, 'bg_intensity'):
-                    self.bg_intensity = background_layer_settings.get('intensity', 50)
-                
-                # Update checkboxes - but don't let background layer checkbox affect layer manager
-                if hasattr(self, 'bg_layer_checkbox'):
-                    self.bg_layer_checkbox.setChecked(background_layer_settings.get('enabled', False))
-                
-                # Update UI controls
-                if hasattr(self, 'bg_scale_combo'):
-                    scale_percent = background_layer_settings.get('scale_percent', 100)
-                    for i in range(self.bg_scale_combo.count()):
-                        if self.bg_scale_combo.itemData(i) == scale_percent:
-                            self.bg_scale_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'bg_crop_position_combo'):
-                    crop_position = background_layer_settings.get('crop_position', 'center')
-                    # Convert from snake_case to Title Case for UI
-                    crop_position_title = crop_position.replace('_', ' ').title()
-                    for i in range(self.bg_crop_position_combo.count()):
-                        if self.bg_crop_position_combo.itemText(i) == crop_position_title:
-                            self.bg_crop_position_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'bg_effect_combo'):
-                    effect = background_layer_settings.get('effect', 'none')
-                    for i in range(self.bg_effect_combo.count()):
-                        if self.bg_effect_combo.itemData(i) == effect:
-                            self.bg_effect_combo.setCurrentIndex(i)
-                            break
-                if hasattr(self, 'bg_intensity_combo'):
-                    intensity = background_layer_settings.get('intensity', 50)
-                    for i in range(self.bg_intensity_combo.count()):
-                        if self.bg_intensity_combo.itemData(i) == intensity:
-                            self.bg_intensity_combo.setCurrentIndex(i)
-                            break
-            
-            # Apply UI settings
-            ui_settings = template_data.get('ui_settings', {})
-            for setting_name, value in ui_settings.items():
-                self.settings.setValue(setting_name, value)
-            
-            # Apply checkbox labels
-            checkbox_labels = template_data.get('checkbox_labels', {})
-            for label_name, label_value in checkbox_labels.items():
-                self.settings.setValue(label_name, label_value)
-            
-            # Update layer manager labels if it exists
-            if hasattr(self, 'layer_manager_dialog') and self.layer_manager_dialog is not None:
-                self.layer_manager_dialog.update_layer_labels()
-            
-            # Apply settings to update UI visibility and checkbox labels
-            self.apply_settings()
+            # Update color buttons
+            if hasattr(self, 'song_title_color_btn'):
+                color = song_titles_settings.get('color', (255, 255, 255))
+                self.song_title_color_btn.setStyleSheet(f"background-color: rgb({color[0]}, {color[1]}, {color[2]}); border: 1px solid #ccc; padding: 0px; margin: 0px;")
+            if hasattr(self, 'song_title_bg_color_btn'):
+                bg_color = song_titles_settings.get('bg_color', (0, 0, 0))
+                self.song_title_bg_color_btn.setStyleSheet(f"background-color: rgb({bg_color[0]}, {bg_color[1]}, {bg_color[2]}); border: 1px solid #ccc; padding: 0px; margin: 0px;")
+            if hasattr(self, 'song_title_text_effect_color_btn'):
+                effect_color = song_titles_settings.get('text_effect_color', (0, 0, 0))
+                self.song_title_text_effect_color_btn.setStyleSheet(f"background-color: rgb({effect_color[0]}, {effect_color[1]}, {effect_color[2]}); border: 1px solid #ccc; padding: 0px; margin: 0px;")
+        if 'soundwave' in layer_settings:
+            soundwave_settings = layer_settings['soundwave']
+            if hasattr(self, 'soundwave_checkbox'):
+                self.soundwave_checkbox.setChecked(soundwave_settings.get('enabled', False))
+            
+            # Update soundwave method
+            if hasattr(self, 'soundwave_method_combo'):
+                method = soundwave_settings.get('method', 'bars')
+                for i in range(self.soundwave_method_combo.count()):
+                    if self.soundwave_method_combo.itemData(i) == method:
+                        self.soundwave_method_combo.setCurrentIndex(i)
+                        break
+                # Update instance variable
+                if hasattr(self, 'soundwave_method'):
+                    self.soundwave_method = method
+            
+            # Update soundwave color
+            if hasattr(self, 'soundwave_color_combo'):
+                color = soundwave_settings.get('color', 'hue_rotate')
+                for i in range(self.soundwave_color_combo.count()):
+                    if self.soundwave_color_combo.itemData(i) == color:
+                        self.soundwave_color_combo.setCurrentIndex(i)
+                        break
+                # Update instance variable
+                if hasattr(self, 'soundwave_color'):
+                    self.soundwave_color = color
+            
+            # Update soundwave size
+            if hasattr(self, 'soundwave_size_combo'):
+                size = soundwave_settings.get('size_percent', 50)
+                for i in range(self.soundwave_size_combo.count()):
+                    if self.soundwave_size_combo.itemData(i) == size:
+                        self.soundwave_size_combo.setCurrentIndex(i)
+                        break
+                # Update instance variable
+                if hasattr(self, 'soundwave_size_percent'):
+                    self.soundwave_size_percent = size
+            
+            # Update soundwave X position
+            if hasattr(self, 'soundwave_x_combo'):
+                x = soundwave_settings.get('x_percent', 50)
+                for i in range(self.soundwave_x_combo.count()):
+                    if self.soundwave_x_combo.itemData(i) == x:
+                        self.soundwave_x_combo.setCurrentIndex(i)
+                        break
+                # Update instance variable
+                if hasattr(self, 'soundwave_x_percent'):
+                    self.soundwave_x_percent = x
+            
+            # Update soundwave Y position
+            if hasattr(self, 'soundwave_y_combo'):
+                y = soundwave_settings.get('y_percent', 50)
+                for i in range(self.soundwave_y_combo.count()):
+                    if self.soundwave_y_combo.itemData(i) == y:
+                        self.soundwave_y_combo.setCurrentIndex(i)
+                        break
+                # Update instance variable
+                if hasattr(self, 'soundwave_y_percent'):
+                    self.soundwave_y_percent = y
+        
+        # Apply overlay1_2_effect_settings
+        if 'overlay1_2_effect_settings' in template_data:
+            overlay1_2_effect_settings = template_data['overlay1_2_effect_settings']
+            
+            # Update variables
+            if hasattr(self, 'selected_overlay1_2_effect'):
+                self.selected_overlay1_2_effect = overlay1_2_effect_settings.get('effect', 'fadein')
+            if hasattr(self, 'overlay1_2_duration'):
+                self.overlay1_2_duration = overlay1_2_effect_settings.get('duration', 6)
+            if hasattr(self, 'overlay_start_at'):
+                self.overlay_start_at = overlay1_2_effect_settings.get('start_at', 5)
+            if hasattr(self, 'overlay1_2_start_from'):
+                self.overlay1_2_start_from = overlay1_2_effect_settings.get('start_from', 0)
+            
+            # Update checkboxes
+            if hasattr(self, 'overlay1_2_duration_full_checkbox'):
+                self.overlay1_2_duration_full_checkbox.setChecked(overlay1_2_effect_settings.get('duration_full', True))
+            if hasattr(self, 'overlay1_2_start_at_checkbox'):
+                self.overlay1_2_start_at_checkbox.setChecked(overlay1_2_effect_settings.get('start_at_checkbox', True))
+            
+            # Update UI controls
+            if hasattr(self, 'effect_combo'):
+                effect = overlay1_2_effect_settings.get('effect', 'fadein')
+                for i in range(self.effect_combo.count()):
+                    if self.effect_combo.itemData(i) == effect:
+                        self.effect_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay1_2_duration_edit'):
+                self.overlay1_2_duration_edit.setText(str(overlay1_2_effect_settings.get('duration', 6)))
+            if hasattr(self, 'overlay1_2_start_at_edit'):
+                self.overlay1_2_start_at_edit.setText(str(overlay1_2_effect_settings.get('start_at', 5)))
+            if hasattr(self, 'overlay1_2_start_from_edit'):
+                self.overlay1_2_start_from_edit.setText(str(overlay1_2_effect_settings.get('start_from', 0)))
+        
+        # Apply overlay4_5_effect_settings
+        if 'overlay4_5_effect_settings' in template_data:
+            overlay4_5_effect_settings = template_data['overlay4_5_effect_settings']
+            
+            # Update variables
+            if hasattr(self, 'selected_overlay4_5_effect'):
+                self.selected_overlay4_5_effect = overlay4_5_effect_settings.get('effect', 'fadein')
+            if hasattr(self, 'overlay4_5_duration'):
+                self.overlay4_5_duration = overlay4_5_effect_settings.get('duration', 6)
+            if hasattr(self, 'overlay4_5_start_at'):
+                self.overlay4_5_start_at = overlay4_5_effect_settings.get('start_at', 5)
+            if hasattr(self, 'overlay4_5_start_from'):
+                self.overlay4_5_start_from = overlay4_5_effect_settings.get('start_from', 0)
+            
+            # Update checkboxes
+            if hasattr(self, 'overlay4_5_duration_full_checkbox'):
+                self.overlay4_5_duration_full_checkbox.setChecked(overlay4_5_effect_settings.get('duration_full', True))
+            if hasattr(self, 'overlay4_5_start_at_checkbox'):
+                self.overlay4_5_start_at_checkbox.setChecked(overlay4_5_effect_settings.get('start_at_checkbox', True))
+            
+            # Update UI controls
+            if hasattr(self, 'overlay4_5_effect_combo'):
+                effect = overlay4_5_effect_settings.get('effect', 'fadein')
+                for i in range(self.overlay4_5_effect_combo.count()):
+                    if self.overlay4_5_effect_combo.itemData(i) == effect:
+                        self.overlay4_5_effect_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay4_5_duration_edit'):
+                self.overlay4_5_duration_edit.setText(str(overlay4_5_effect_settings.get('duration', 6)))
+            if hasattr(self, 'overlay4_5_start_edit'):
+                self.overlay4_5_start_edit.setText(str(overlay4_5_effect_settings.get('start_at', 5)))
+            if hasattr(self, 'overlay4_5_start_from_edit'):
+                self.overlay4_5_start_from_edit.setText(str(overlay4_5_effect_settings.get('start_from', 0)))
+        
+        # Apply overlay6_7_effect_settings
+        if 'overlay6_7_effect_settings' in template_data:
+            overlay6_7_effect_settings = template_data['overlay6_7_effect_settings']
+            
+            # Update variables
+            if hasattr(self, 'selected_overlay6_7_effect'):
+                self.selected_overlay6_7_effect = overlay6_7_effect_settings.get('effect', 'fadein')
+            if hasattr(self, 'overlay6_7_duration'):
+                self.overlay6_7_duration = overlay6_7_effect_settings.get('duration', 6)
+            if hasattr(self, 'overlay6_7_start_at'):
+                self.overlay6_7_start_at = overlay6_7_effect_settings.get('start_at', 5)
+            if hasattr(self, 'overlay6_7_start_from'):
+                self.overlay6_7_start_from = overlay6_7_effect_settings.get('start_from', 0)
+            
+            # Update checkboxes
+            if hasattr(self, 'overlay6_7_duration_full_checkbox'):
+                self.overlay6_7_duration_full_checkbox.setChecked(overlay6_7_effect_settings.get('duration_full', True))
+            if hasattr(self, 'overlay6_7_start_at_checkbox'):
+                self.overlay6_7_start_at_checkbox.setChecked(overlay6_7_effect_settings.get('start_at_checkbox', True))
+            
+            # Update UI controls
+            if hasattr(self, 'overlay6_7_effect_combo'):
+                effect = overlay6_7_effect_settings.get('effect', 'fadein')
+                for i in range(self.overlay6_7_effect_combo.count()):
+                    if self.overlay6_7_effect_combo.itemData(i) == effect:
+                        self.overlay6_7_effect_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay6_7_duration_edit'):
+                self.overlay6_7_duration_edit.setText(str(overlay6_7_effect_settings.get('duration', 6)))
+            if hasattr(self, 'overlay6_7_start_edit'):
+                self.overlay6_7_start_edit.setText(str(overlay6_7_effect_settings.get('start_at', 5)))
+            if hasattr(self, 'overlay6_7_start_from_edit'):
+                self.overlay6_7_start_from_edit.setText(str(overlay6_7_effect_settings.get('start_from', 0)))
+        
+        # Apply overlay3_soundwave_effect_settings
+        if 'overlay3_soundwave_effect_settings' in template_data:
+            overlay3_soundwave_effect_settings = template_data['overlay3_soundwave_effect_settings']
+            
+            # Update variables
+            if hasattr(self, 'selected_overlay3_soundwave_effect'):
+                self.selected_overlay3_soundwave_effect = overlay3_soundwave_effect_settings.get('effect', 'fadein')
+            if hasattr(self, 'overlay3_soundwave_start_time'):
+                self.overlay3_soundwave_start_time = overlay3_soundwave_effect_settings.get('start_time', 5)
+            
+            # Update UI controls
+            if hasattr(self, 'overlay3_soundwave_effect_combo'):
+                effect = overlay3_soundwave_effect_settings.get('effect', 'fadein')
+                for i in range(self.overlay3_soundwave_effect_combo.count()):
+                    if self.overlay3_soundwave_effect_combo.itemData(i) == effect:
+                        self.overlay3_soundwave_effect_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'overlay3_soundwave_start_edit'):
+                self.overlay3_soundwave_start_edit.setText(str(overlay3_soundwave_effect_settings.get('start_time', 5)))
+        
+        # Apply background_layer_settings
+        if 'background_layer_settings' in template_data:
+            background_layer_settings = template_data['background_layer_settings']
+            
+            # Update variables
+            if hasattr(self, 'bg_scale_percent'):
+                self.bg_scale_percent = background_layer_settings.get('scale_percent', 100)
+            if hasattr(self, 'bg_crop_position'):
+                self.bg_crop_position = background_layer_settings.get('crop_position', 'center')
+            if hasattr(self, 'bg_effect'):
+                self.bg_effect = background_layer_settings.get('effect', 'none')
+            if hasattr(self, 'bg_intensity'):
+                self.bg_intensity = background_layer_settings.get('intensity', 50)
+            
+            # Update checkboxes - but don't let background layer checkbox affect layer manager
+            if hasattr(self, 'bg_layer_checkbox'):
+                self.bg_layer_checkbox.setChecked(background_layer_settings.get('enabled', False))
+            
+            # Update UI controls
+            if hasattr(self, 'bg_scale_combo'):
+                scale_percent = background_layer_settings.get('scale_percent', 100)
+                for i in range(self.bg_scale_combo.count()):
+                    if self.bg_scale_combo.itemData(i) == scale_percent:
+                        self.bg_scale_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'bg_crop_position_combo'):
+                crop_position = background_layer_settings.get('crop_position', 'center')
+                # Convert from snake_case to Title Case for UI
+                crop_position_title = crop_position.replace('_', ' ').title()
+                for i in range(self.bg_crop_position_combo.count()):
+                    if self.bg_crop_position_combo.itemText(i) == crop_position_title:
+                        self.bg_crop_position_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'bg_effect_combo'):
+                effect = background_layer_settings.get('effect', 'none')
+                for i in range(self.bg_effect_combo.count()):
+                    if self.bg_effect_combo.itemData(i) == effect:
+                        self.bg_effect_combo.setCurrentIndex(i)
+                        break
+            if hasattr(self, 'bg_intensity_combo'):
+                intensity = background_layer_settings.get('intensity', 50)
+                for i in range(self.bg_intensity_combo.count()):
+                    if self.bg_intensity_combo.itemData(i) == intensity:
+                        self.bg_intensity_combo.setCurrentIndex(i)
+                        break
+
+    def apply_template(self, template_data, show_success_dialog=True):
+        """Apply a template to current settings, updating only what differs from the current state"""
+        from src.template_utils import create_template_from_current_settings, diff_template
+        try:
+            # Diff against what the UI holds now; unbuilt sections are not read (they get the full template)
+            with self._lazy_sections.deferred():
+                current = create_template_from_current_settings('', '', '', self.get_current_settings())
+            changes = diff_template(current, template_data)
+            # Repaint once at the end instead of after every widget update
+            self.setUpdatesEnabled(False)
+            try:
+                with self._batched_widget_signals():
+                    self._apply_template_changes(template_data, changes)
+            finally:
+                self.setUpdatesEnabled(True)
             
             # Update the template combo to show the applied template
             template_name = template_data.get('name', 'Unknown Template')
@@ -11912,7 +12373,6 @@ class SuperCutUI(QWidget):
             # Print enabled layers (those with 'enabled': True in layer_settings)
             enabled_layers = []
             layer_settings = template_data.get('layer_settings', {})
-            background_layer_settings = template_data.get('background_layer_settings', {})
             
             for lname in self.layer_order:
                 key = lname.lower().replace(' ', '_')
@@ -11931,15 +12391,124 @@ class SuperCutUI(QWidget):
             # Reconnect the signal
             self.template_combo.currentTextChanged.connect(self.on_template_selected)
             
-            # Apply settings to update UI visibility
-            self.apply_settings()
-            
             if show_success_dialog:
                 QMessageBox.information(self, "Template Applied", f"Template '{template_name}' has been applied successfully!")
             
         except Exception as e:
             QMessageBox.warning(self, "Template Error", f"Error applying template: {str(e)}")
     
+    @contextmanager
+    def _batched_widget_signals(self):
+        """Block change signals of the built input widgets, then emit one per widget that ended up changed.
+
+        A template apply may set a widget several times (set from the template,
+        then unchecked by apply_settings); its handlers now run once, with the
+        final value, instead of on every intermediate update.
+        """
+        def value(widget):
+            if isinstance(widget, QtWidgets.QCheckBox):
+                return widget.checkState()
+            if isinstance(widget, QComboBox):
+                return widget.currentIndex()
+            return widget.text()
+
+        widgets = [widget for widget_type in (QtWidgets.QCheckBox, QComboBox, QLineEdit)
+                   for widget in self.findChildren(widget_type) if widget is not self.template_combo]
+        before = {widget: (value(widget), widget.blockSignals(True)) for widget in widgets}
+        try:
+            yield
+        finally:
+            changed = []
+            for widget, (old_value, was_blocked) in before.items():
+                try:
+                    widget.blockSignals(was_blocked)
+                    if not was_blocked and value(widget) != old_value:
+                        changed.append(widget)
+                except RuntimeError:
+                    continue  # Deleted during the apply
+            for widget in changed:
+                if isinstance(widget, QtWidgets.QCheckBox):
+                    widget.stateChanged.emit(widget.checkState().value)
+                elif isinstance(widget, QComboBox):
+                    widget.currentIndexChanged.emit(widget.currentIndex())
+                    widget.currentTextChanged.emit(widget.currentText())
+                else:
+                    widget.textChanged.emit(widget.text())
+
+    def _apply_template_changes(self, template_data, changes):
+        """Apply the changed parts of a template (see src.template_utils.diff_template)"""
+        # Apply video settings
+        video_settings = changes.get('video_settings', {})
+        
+        # Apply codec
+        if 'codec' in video_settings:
+            codec = video_settings['codec']
+            for i in range(self.codec_combo.count()):
+                if self.codec_combo.itemData(i) == codec:
+                    self.codec_combo.setCurrentIndex(i)
+                    break
+        
+        # Apply resolution
+        if 'resolution' in video_settings:
+            resolution = video_settings['resolution']
+            for i in range(self.resolution_combo.count()):
+                if self.resolution_combo.itemData(i) == resolution:
+                    self.resolution_combo.setCurrentIndex(i)
+                    break
+        
+        # Apply FPS
+        if 'fps' in video_settings:
+            fps = video_settings['fps']
+            for i in range(self.fps_combo.count()):
+                if self.fps_combo.itemData(i) == fps:
+                    self.fps_combo.setCurrentIndex(i)
+                    break
+        
+        # Apply preset
+        if 'preset' in video_settings:
+            preset = video_settings['preset']
+            for i in range(self.preset_combo.count()):
+                if self.preset_combo.itemData(i) == preset:
+                    self.preset_combo.setCurrentIndex(i)
+                    break
+        
+        # Apply bitrate settings to application settings
+        if 'audio_bitrate' in video_settings:
+            self.settings.setValue('default_ffmpeg_audio_bitrate', video_settings['audio_bitrate'])
+        if 'video_bitrate' in video_settings:
+            self.settings.setValue('default_ffmpeg_video_bitrate', video_settings['video_bitrate'])
+        if 'maxrate' in video_settings:
+            self.settings.setValue('default_ffmpeg_maxrate', video_settings['maxrate'])
+        if 'bufsize' in video_settings:
+            self.settings.setValue('default_ffmpeg_bufsize', video_settings['bufsize'])
+        
+        # Apply layer order
+        if 'layer_order' in changes:
+            self.layer_order = template_data['layer_order']
+        
+        # Apply layer settings; unbuilt sections keep their part until they are built
+        self._lazy_sections.remember_template(template_data)
+        with self._lazy_sections.deferred():
+            self._apply_template_layer_settings(changes)
+        
+        # Apply UI settings
+        ui_settings = changes.get('ui_settings', {})
+        for setting_name, value in ui_settings.items():
+            self.settings.setValue(setting_name, value)
+        
+        # Apply checkbox labels
+        checkbox_labels = changes.get('checkbox_labels', {})
+        for label_name, label_value in checkbox_labels.items():
+            self.settings.setValue(label_name, label_value)
+        
+        # Update layer manager labels if it exists
+        if checkbox_labels and hasattr(self, 'layer_manager_dialog') and self.layer_manager_dialog is not None:
+            self.layer_manager_dialog.update_layer_labels()
+        
+        # Apply settings to update UI visibility and checkbox labels (hidden sections uncheck their layers)
+        if changes.keys() & {'ui_settings', 'checkbox_labels', 'layer_settings'}:
+            self.apply_settings()
+
     def save_current_as_template(self):
         """Save current settings as a new template"""
         from src.template_utils import create_template_from_current_settings
@@ -12576,10 +13145,12 @@ X: {self.song_title_x_percent}% | Y: {self.song_title_y_percent}% | Start: {self
         dry_run_btn = QPushButton("Dry Run")
         dry_run_btn.setFixedSize(80, 28)  # Bigger button
         dry_run_btn.setStyleSheet("background-color: #4CAF50; color: white; border-radius: 6px;")
-        def run_dry_run():
-            # Close the preview dialog first
-            dlg.close()
-            dlg.accept()
+        def run_dry_run(preview_time=None):
+            # preview_time set: render only that frame for the frame preview, keep the dialog open
+            if preview_time is None:
+                # Close the preview dialog first
+                dlg.close()
+                dlg.accept()
             
             import os
             
@@ -12646,7 +13217,8 @@ X: {self.song_title_x_percent}% | Y: {self.song_title_y_percent}% | Start: {self
                     return
             
             # Disable preview button during dry run
-            self.preview_btn.setEnabled(False)
+            if preview_time is None:
+                self.preview_btn.setEnabled(False)
             
             from PyQt6.QtCore import QObject, QThread, pyqtSignal
             from src.ffmpeg_utils import create_video_with_ffmpeg
@@ -12825,6 +13397,14 @@ X: {self.song_title_x_percent}% | Y: {self.song_title_y_percent}% | Start: {self
                             
                             extra_overlays[0]['duration'] = overlay_duration
                         
+                        # Proxy Dry Run: same layers, smaller output, fastest preset, optionally only the transitions
+                        dry_run_mode = self.params.get('dry_run_mode', 'full')
+                        proxy_scale = self.params['proxy_scale'] if dry_run_mode != 'full' else None
+                        time_window = None
+                        if dry_run_mode == 'proxy_transitions':
+                            from src.ffmpeg_utils import TRANSITIONS_WINDOW
+                            time_window = TRANSITIONS_WINDOW
+                        
                         success, err = create_video_with_ffmpeg(
                             dry_img, dry_mp3, dry_out, resolution, fps, codec,
                             use_overlay, overlay1_path, overlay1_size_percent, overlay1_x_percent, overlay1_y_percent,
@@ -12878,7 +13458,13 @@ X: {self.song_title_x_percent}% | Y: {self.song_title_y_percent}% | Start: {self
                             overlay1_start_at=overlay1_start_at,
                             overlay2_start_at=overlay2_start_at,
                             # --- Add layer order parameter ---
-                            layer_order=layer_order
+                            layer_order=layer_order,
+                            # --- Add preview parameter ---
+                            preview_time=self.params.get('preview_time'),
+                            # --- Add proxy parameters ---
+                            proxy_scale=proxy_scale,
+                            time_window=time_window,
+                            audio_duration=total_duration
                         )
                         self.finished.emit(success, err if not success else dry_out)
                     except Exception as e:
@@ -13027,8 +13613,17 @@ X: {self.song_title_x_percent}% | Y: {self.song_title_y_percent}% | Start: {self
                 song_title_text_effect_color=self.song_title_text_effect_color,
                 song_title_text_effect_intensity=self.song_title_text_effect_intensity,
                 # --- Add layer order parameter ---
-                layer_order=getattr(self, 'layer_order', None)
+                layer_order=getattr(self, 'layer_order', None),
+                # --- Add preview parameter ---
+                preview_time=preview_time,
+                # --- Add proxy parameters ---
+                dry_run_mode=self.settings.value('dry_run_mode', DEFAULT_DRY_RUN_MODE, type=str),
+                proxy_scale=DRY_RUN_PROXY_SCALE
             )
+            if preview_time is not None:
+                params['dry_out'] = os.path.join(PROJECT_ROOT, "src", "Dry Run", "Dry Run Frame.png")
+                self._start_frame_preview(DryRunWorker(params), preview_time)
+                return
             worker = DryRunWorker(params)
             thread = QThread()
             worker.moveToThread(thread)
@@ -13099,7 +13694,25 @@ X: {self.song_title_x_percent}% | Y: {self.song_title_y_percent}% | Start: {self
             worker.finished.connect(thread.quit)
             thread.started.connect(worker.run)
             thread.start()
-        dry_run_btn.clicked.connect(run_dry_run)
+        dry_run_btn.clicked.connect(lambda: run_dry_run())
+
+        # Frame preview: composes single frames of the dry run at any time, without encoding
+        frame_btn = QPushButton("Frame")
+        frame_btn.setFixedSize(80, 28)
+        frame_btn.setStyleSheet("background-color: #8e44ad; color: white; border-radius: 6px;")
+        frame_btn.setToolTip("Preview single frames of the Dry Run without encoding")
+        def open_frame_preview():
+            from src.ffmpeg_utils import get_audio_duration
+            duration = get_audio_duration(os.path.join(PROJECT_ROOT, "src", "Dry Run", "Dry Run.mp3"))
+            if self._frame_preview_dialog is not None:
+                self._frame_preview_dialog.close()
+            start_time = min(10.0, duration)
+            frame_dlg = FramePreviewDialog(self, duration=duration, start_time=start_time)
+            frame_dlg.frame_requested.connect(lambda seconds: run_dry_run(preview_time=seconds))
+            self._frame_preview_dialog = frame_dlg
+            frame_dlg.show()
+            frame_dlg.request_frame(start_time)
+        frame_btn.clicked.connect(open_frame_preview)
         
         # Add Close button (renamed from OK)
         close_btn = QPushButton("Close")
@@ -13111,6 +13724,8 @@ X: {self.song_title_x_percent}% | Y: {self.song_title_y_percent}% | Start: {self
         btn_layout.addStretch()
         btn_layout.addWidget(dry_run_btn)
         btn_layout.addSpacing(10)
+        btn_layout.addWidget(frame_btn)
+        btn_layout.addSpacing(10)
         btn_layout.addWidget(close_btn)
         btn_layout.addStretch()
         
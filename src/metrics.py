@@ -0,0 +1,222 @@
+# This file uses PyQt6
+"""
+In-process performance metrics with a local HTTP endpoint.
+
+Every log_stage()/timed_stage() call (merge, plan, preprocess, title and
+cover rendering, soundwave, encode, finalize, farm and queue jobs) is also
+folded into a per-stage timer here. ffprobe calls, ffmpeg speed and fps,
+bytes written and temp bytes in use are recorded directly.
+
+The endpoint serves:
+
+    /metrics        Prometheus text format
+    /metrics.json   JSON snapshot
+
+It listens on 127.0.0.1 only. It is started from the Metrics Port setting,
+with --metrics-port on the render farm and render queue command lines, or
+with SUPERCUT_METRICS_PORT=<port>.
+"""
+import os
+import json
+import time
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional, Tuple
+
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT_ENV = "SUPERCUT_METRICS_PORT"
+METRICS_PREFIX = "supercut_"
+
+METRIC_HELP = {
+    "stage_duration_seconds": "Time spent per pipeline stage",
+    "stage_duration_seconds_max": "Longest single run of each pipeline stage",
+    "stage_last_duration_seconds": "Duration of the most recent run of each pipeline stage",
+    "batches_total": "Finished batches by result",
+    "output_bytes_total": "Bytes of video written (main output and renditions)",
+    "ffmpeg_speed": "Encode speed of each running ffmpeg relative to realtime",
+    "ffmpeg_fps": "Frames per second of each running ffmpeg",
+    "temp_bytes_in_use": "Bytes held by active temp workspaces",
+    "start_time_seconds": "Unix time the process started",
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: dict) -> LabelKey:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(labels: LabelKey) -> str:
+    if not labels:
+        return ""
+    escaped = (f'{key}="{value.replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+               for key, value in labels)
+    return "{" + ",".join(escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class MetricsRegistry:
+    """Thread-safe stage timers, counters and gauges"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: Dict[str, dict] = {}
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._gauges: Dict[str, Dict[LabelKey, float]] = {}
+        self._callbacks: Dict[str, Callable[[], float]] = {}
+        self.start_time = time.time()
+
+    def observe_stage(self, stage: str, duration: float):
+        with self._lock:
+            entry = self._stages.setdefault(stage, {"count": 0, "sum": 0.0, "max": 0.0, "last": 0.0})
+            entry["count"] += 1
+            entry["sum"] += duration
+            entry["max"] = max(entry["max"], duration)
+            entry["last"] = duration
+
+    def inc(self, name: str, value: float = 1, **labels):
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            key = _labels(labels)
+            series[key] = series.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels):
+        with self._lock:
+            self._gauges.setdefault(name, {})[_labels(labels)] = value
+
+    def remove_gauge(self, name: str, **labels):
+        """Drop one labelled series, e.g. when the encode it tracked ends"""
+        with self._lock:
+            self._gauges.get(name, {}).pop(_labels(labels), None)
+
+    def register_gauge(self, name: str, callback: Callable[[], float]):
+        """Gauge computed when metrics are read"""
+        self._callbacks[name] = callback
+
+    def _gauge_values(self) -> Dict[str, Dict[LabelKey, float]]:
+        with self._lock:
+            gauges = {name: dict(series) for name, series in self._gauges.items()}
+        for name, callback in list(self._callbacks.items()):
+            try:
+                gauges[name] = {(): float(callback())}
+            except Exception:
+                continue
+        gauges["start_time_seconds"] = {(): self.start_time}
+        return gauges
+
+    def snapshot(self) -> dict:
+        """Everything as plain JSON-friendly data"""
+        gauges = self._gauge_values()
+        with self._lock:
+            stages = {stage: dict(entry) for stage, entry in self._stages.items()}
+            counters = {name: dict(series) for name, series in self._counters.items()}
+
+        def plain(series):
+            return {",".join(f"{k}={v}" for k, v in key) or "value": value for key, value in series.items()}
+        return {
+            "host": socket.gethostname(),
+            "pid": os.getpid(),
+            "time": time.time(),
+            "stages": stages,
+            "counters": {name: plain(series) for name, series in counters.items()},
+            "gauges": {name: plain(series) for name, series in gauges.items()},
+        }
+
+    def prometheus_text(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)"""
+        gauges = self._gauge_values()
+        with self._lock:
+            stages = {stage: dict(entry) for stage, entry in self._stages.items()}
+            counters = {name: dict(series) for name, series in self._counters.items()}
+        lines = []
+
+        def header(name: str, kind: str):
+            lines.append(f"# HELP {METRICS_PREFIX}{name} {METRIC_HELP.get(name, name.replace('_', ' '))}")
+            lines.append(f"# TYPE {METRICS_PREFIX}{name} {kind}")
+
+        if stages:
+            header("stage_duration_seconds", "summary")
+            for stage, entry in sorted(stages.items()):
+                labels = _format_labels((("stage", stage),))
+                lines.append(f"{METRICS_PREFIX}stage_duration_seconds_sum{labels} {entry['sum']:.6f}")
+                lines.append(f"{METRICS_PREFIX}stage_duration_seconds_count{labels} {entry['count']}")
+            for name, key in (("stage_duration_seconds_max", "max"), ("stage_last_duration_seconds", "last")):
+                header(name, "gauge")
+                for stage, entry in sorted(stages.items()):
+                    lines.append(f"{METRICS_PREFIX}{name}{_format_labels((('stage', stage),))} {entry[key]:.6f}")
+        for name, series in sorted(counters.items()):
+            header(name, "counter")
+            for key, value in sorted(series.items()):
+                lines.append(f"{METRICS_PREFIX}{name}{_format_labels(key)} {_format_value(value)}")
+        for name, series in sorted(gauges.items()):
+            header(name, "gauge")
+            for key, value in sorted(series.items()):
+                lines.append(f"{METRICS_PREFIX}{name}{_format_labels(key)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if path == "/metrics":
+            body = metrics.prometheus_text().encode("utf-8")
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        elif path in ("/metrics.json", ""):
+            body = json.dumps(metrics.snapshot()).encode("utf-8")
+            content_type = "application/json"
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scrapes every few seconds would flood the console
+        pass
+
+
+_server: Optional[ThreadingHTTPServer] = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(port: int, host: str = METRICS_HOST) -> bool:
+    """Serve metrics on host:port (port 0 stops the endpoint); returns False if it could not start"""
+    global _server
+    from src.logger import logger
+    with _server_lock:
+        if _server is not None:
+            if port and _server.server_address[1] == port:
+                return True
+            _server.shutdown()
+            _server.server_close()
+            _server = None
+        if not port:
+            return True
+        try:
+            _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        except OSError as e:
+            logger.warning(f"Could not start metrics endpoint on {host}:{port}: {e}")
+            return False
+        _server.daemon_threads = True
+        threading.Thread(target=_server.serve_forever, name="metrics-server", daemon=True).start()
+    print(f"📈 Metrics at http://{host}:{port}/metrics (JSON: /metrics.json)")
+    return True
+
+
+def start_metrics_from_env() -> bool:
+    """Start the endpoint if SUPERCUT_METRICS_PORT is set"""
+    try:
+        port = int(os.environ.get(METRICS_PORT_ENV, "0"))
+    except ValueError:
+        return False
+    return start_metrics_server(port) if port else False
@@ -0,0 +1,149 @@
+# This file uses PyQt6
+"""
+Pre-transcoded cache for animated overlay layers.
+
+GIF and video overlays used to be decoded, converted to RGBA, resampled to
+30 fps (GIFs) and rescaled on every frame of every video. Each animated
+overlay is now transcoded once per (source content, size, fps) into a
+loop-ready QuickTime RLE file with alpha at its final on-screen size, and the
+render graph only fades and blends it. Cached files carry the "supercut_"
+prefix, which the graph already treats as "preprocessed, use as is".
+
+The cache lives in cache/overlays and is trimmed to OVERLAY_CACHE_MAX_BYTES,
+least recently used first.
+"""
+import os
+import hashlib
+import subprocess
+import threading
+from typing import Dict, Tuple
+from src.config import FFMPEG_BINARY, PROJECT_ROOT
+from src.logger import logger
+from src.resource_governor import resource_governor
+
+OVERLAY_CACHE_DIR = os.path.join(PROJECT_ROOT, "cache", "overlays")
+OVERLAY_CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024
+ANIMATED_OVERLAY_EXTENSIONS = ('.gif', '.mp4', '.mov', '.mkv')
+GIF_OVERLAY_FPS = 30  # Same rate the render graph forces on GIF overlays
+CACHE_FORMAT_VERSION = 1  # Bump when the transcode settings change
+TRANSCODE_TIMEOUT = 600
+
+
+class OverlayCache:
+    """Transcodes animated overlays once and hands out the cached file"""
+
+    def __init__(self, cache_dir: str = OVERLAY_CACHE_DIR, max_bytes: int = OVERLAY_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._hashes: Dict[Tuple[str, int, int], str] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def source_hash(self, path: str) -> str:
+        """Content hash of a source file, remembered per (path, size, mtime)"""
+        st = os.stat(path)
+        key = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+        digest = self._hashes.get(key)
+        if digest is None:
+            sha = hashlib.sha1()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    sha.update(chunk)
+            digest = sha.hexdigest()
+            self._hashes[key] = digest
+        return digest
+
+    def get(self, path: str, size_percent: int) -> str:
+        """
+        Path to use for an overlay: the cached transcode for animated overlays,
+        the original path for anything else or if transcoding fails.
+        """
+        ext = os.path.splitext(path)[1].lower() if path else ''
+        if ext not in ANIMATED_OVERLAY_EXTENSIONS or not os.path.isfile(path):
+            return path
+        fps = GIF_OVERLAY_FPS if ext == '.gif' else None
+        try:
+            digest = self.source_hash(path)
+        except OSError as e:
+            logger.warning(f"Could not hash overlay {path}, using it directly: {e}")
+            return path
+        name = f"supercut_ovc_{digest[:16]}_{size_percent}_{fps or 'src'}_v{CACHE_FORMAT_VERSION}.mov"
+        cached = os.path.join(self.cache_dir, name)
+        with self._lock:
+            key_lock = self._locks.setdefault(name, threading.Lock())
+        with key_lock:
+            if os.path.exists(cached):
+                try:
+                    os.utime(cached)  # Mark as recently used
+                except OSError:
+                    pass
+                return cached
+            if not self._transcode(path, cached, size_percent, fps):
+                return path
+        self._evict(keep=cached)
+        return cached
+
+    def _transcode(self, source: str, target: str, size_percent: int, fps) -> bool:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        scale = size_percent / 100.0
+        # Same steps, in the same order, as the per-frame chain in create_video_with_ffmpeg
+        filters = [f"fps={fps}"] if fps else []
+        filters.append("format=rgba")
+        if size_percent != 100:
+            filters.append(f"scale=iw*{scale:.3f}:ih*{scale:.3f}")
+        temp_target = target + ".part.mov"
+        cmd = [
+            FFMPEG_BINARY, "-hide_banner", "-loglevel", "error",
+            "-i", source,
+            "-vf", ",".join(filters),
+            "-an", "-c:v", "qtrle", "-pix_fmt", "argb",
+            "-y", temp_target
+        ]
+        print(f"🔧 Caching overlay {os.path.basename(source)} at {size_percent}%...")
+        try:
+            result = resource_governor.run(cmd, capture_output=True, text=True, timeout=TRANSCODE_TIMEOUT)
+            if result.returncode != 0:
+                logger.warning(f"Overlay transcode failed for {source}, using it directly: {result.stderr.strip()[-300:]}")
+                return False
+            os.replace(temp_target, target)
+            return True
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.warning(f"Overlay transcode failed for {source}, using it directly: {e}")
+            return False
+        finally:
+            if os.path.exists(temp_target):
+                try:
+                    os.remove(temp_target)
+                except OSError:
+                    pass
+
+    def _evict(self, keep: str):
+        """Delete least recently used entries until the cache fits its budget"""
+        try:
+            entries = []
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith('.mov') and not entry.name.endswith('.part.mov'):
+                        st = entry.stat()
+                        entries.append((st.st_mtime, st.st_size, entry.path))
+        except OSError:
+            return
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if entry_path == keep:
+                continue
+            try:
+                os.remove(entry_path)
+                total -= size
+            except OSError as e:
+                logger.warning(f"Could not remove cached overlay {entry_path}: {e}")
+
+
+overlay_cache = OverlayCache()
+
+
+def get_cached_overlay(path: str, size_percent: int) -> str:
+    """Cached final-size transcode of an animated overlay (original path otherwise)"""
+    return overlay_cache.get(path, size_percent)
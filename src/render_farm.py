@@ -0,0 +1,417 @@
+# This file uses PyQt6
+"""
+Local render farm: a coordinator hands planned batches to pull-based workers.
+
+The queue is a shared directory, so workers can run on this machine or on
+any host that mounts it (media, output and farm paths must resolve the same
+on every host):
+
+    pending/<job>.json            waiting to be claimed
+    leased/<job>__<worker>.json   claimed by a worker (atomic rename)
+    done/<job>.json               result record (ok or error)
+    assets/<run>/                 generated assets (frame box PNG) shared by a run's jobs
+    workers/<worker>.json         worker heartbeat, rewritten every few seconds
+
+Each job is self-contained: the VideoWorker settings of the run plus one
+planned batch (inputs, render plan, output name). A worker whose heartbeat
+goes stale loses its leases; the coordinator moves them back to pending
+until a job has been tried FARM_MAX_ATTEMPTS times.
+
+Run local workers with:  python -m src.render_farm worker --farm-dir DIR --workers 3
+
+Add --metrics-port 9464 to chart farm throughput: each worker serves its
+stage timings on its own port (9464, 9465, ...), see src.metrics.
+"""
+import os
+import sys
+import time
+import uuid
+import shutil
+import socket
+import argparse
+import threading
+from typing import Callable, Dict, List, Optional
+from src.logger import logger, log_stage
+from src.settings_store import atomic_write_json, read_json
+from src.metrics import start_metrics_server, start_metrics_from_env
+
+FARM_HEARTBEAT_INTERVAL = 5  # Seconds between worker heartbeats
+FARM_LEASE_TIMEOUT = 30  # A lease expires once its worker's heartbeat is this old
+FARM_MAX_ATTEMPTS = 3  # Claims per job before it is failed
+FARM_POLL_INTERVAL = 1.0
+
+PENDING, LEASED, DONE, WORKERS, ASSETS = "pending", "leased", "done", "workers", "assets"
+
+
+class FarmQueue:
+    """Directory-backed job queue shared by the coordinator and the workers"""
+
+    def __init__(self, farm_dir: str):
+        self.farm_dir = os.path.abspath(farm_dir)
+        for sub in (PENDING, LEASED, DONE, WORKERS):
+            os.makedirs(os.path.join(self.farm_dir, sub), exist_ok=True)
+
+    def _path(self, sub: str, name: str) -> str:
+        return os.path.join(self.farm_dir, sub, name)
+
+    def _list(self, sub: str) -> List[str]:
+        try:
+            return sorted(name for name in os.listdir(os.path.join(self.farm_dir, sub)) if name.endswith('.json'))
+        except OSError:
+            return []
+
+    # --- Coordinator side ---
+    def submit(self, spec: dict) -> str:
+        """Queue a job spec; returns its job id"""
+        job_id = spec.setdefault("job_id", uuid.uuid4().hex[:12])
+        spec.setdefault("attempts", 0)
+        spec.setdefault("priority", 0)
+        spec["submitted"] = time.time()
+        if not atomic_write_json(self._path(PENDING, f"{job_id}.json"), spec):
+            raise OSError(f"Could not queue farm job {job_id}")
+        return job_id
+
+    def result(self, job_id: str) -> Optional[dict]:
+        return read_json(self._path(DONE, f"{job_id}.json"))
+
+    def cancel(self, job_id: str) -> bool:
+        """Remove a job that has not been claimed yet"""
+        try:
+            os.remove(self._path(PENDING, f"{job_id}.json"))
+            return True
+        except OSError:
+            return False
+
+    def withdraw(self, job_id: str) -> bool:
+        """Remove a job whether pending or leased; a worker rendering it loses its lease and discards its output"""
+        removed = self.cancel(job_id)
+        for name in self._list(LEASED):
+            if name.startswith(f"{job_id}__"):
+                try:
+                    os.remove(self._path(LEASED, name))
+                    removed = True
+                except OSError:
+                    pass  # Completed or reaped meanwhile
+        return removed
+
+    def live_workers(self) -> Dict[str, dict]:
+        """Workers whose heartbeat is younger than the lease timeout"""
+        now = time.time()
+        workers = {}
+        for name in self._list(WORKERS):
+            info = read_json(self._path(WORKERS, name))
+            if info and now - info.get("heartbeat", 0) < FARM_LEASE_TIMEOUT:
+                workers[name[:-5]] = info
+        return workers
+
+    def reap_expired(self) -> List[str]:
+        """Re-queue (or fail) jobs leased by workers that stopped heartbeating"""
+        live = self.live_workers()
+        requeued = []
+        for name in self._list(LEASED):
+            job_id, _, worker_id = name[:-5].partition("__")
+            if worker_id in live:
+                continue
+            leased_path = self._path(LEASED, name)
+            spec = read_json(leased_path)
+            if spec is None:
+                continue
+            if spec.get("attempts", 0) >= FARM_MAX_ATTEMPTS:
+                self._write_result(job_id, False, error=f"Gave up after {spec['attempts']} attempts (last worker {worker_id})")
+                target = None
+            else:
+                target = self._path(PENDING, f"{job_id}.json")
+            try:
+                if target:
+                    os.replace(leased_path, target)
+                    print(f"⚠️ Render farm: worker {worker_id} stopped responding, re-queued job {job_id}")
+                else:
+                    os.remove(leased_path)
+                requeued.append(job_id)
+            except OSError:
+                pass  # The worker finished or another coordinator pass got there first
+        return requeued
+
+    def counts(self) -> Dict[str, int]:
+        return {sub: len(self._list(sub)) for sub in (PENDING, LEASED, DONE)} | {"workers": len(self.live_workers())}
+
+    # --- Worker side ---
+    def heartbeat(self, worker_id: str, current_job: Optional[str] = None):
+        atomic_write_json(self._path(WORKERS, f"{worker_id}.json"), {
+            "worker": worker_id, "host": socket.gethostname(), "pid": os.getpid(),
+            "job": current_job, "heartbeat": time.time(),
+        })
+
+    def retire(self, worker_id: str):
+        try:
+            os.remove(self._path(WORKERS, f"{worker_id}.json"))
+        except OSError:
+            pass
+
+    def claim(self, worker_id: str) -> Optional[dict]:
+        """Atomically take the highest-priority pending job, or None"""
+        candidates = []
+        for name in self._list(PENDING):
+            spec = read_json(self._path(PENDING, name))
+            if spec is not None:
+                candidates.append((-spec.get("priority", 0), spec.get("submitted", 0), name))
+        for _, _, name in sorted(candidates):
+            job_id = name[:-5]
+            leased_path = self._path(LEASED, f"{job_id}__{worker_id}.json")
+            try:
+                os.rename(self._path(PENDING, name), leased_path)
+            except OSError:
+                continue  # Another worker won the race
+            spec = read_json(leased_path)
+            if spec is None:
+                continue
+            spec["attempts"] = spec.get("attempts", 0) + 1
+            atomic_write_json(leased_path, spec)
+            return spec
+        return None
+
+    def holds_lease(self, worker_id: str, job_id: str) -> bool:
+        """Heartbeat and confirm the lease is still ours before touching shared files"""
+        self.heartbeat(worker_id, job_id)
+        return os.path.exists(self._path(LEASED, f"{job_id}__{worker_id}.json"))
+
+    def complete(self, worker_id: str, job_id: str, ok: bool, error: Optional[str] = None, **fields) -> bool:
+        """Record a finished job; False if the lease was lost (the job was re-queued meanwhile)"""
+        leased_path = self._path(LEASED, f"{job_id}__{worker_id}.json")
+        if not os.path.exists(leased_path):
+            return False
+        self._write_result(job_id, ok, error=error, worker=worker_id, **fields)
+        try:
+            os.remove(leased_path)
+        except OSError:
+            pass
+        return True
+
+    def _write_result(self, job_id: str, ok: bool, **fields):
+        atomic_write_json(self._path(DONE, f"{job_id}.json"), dict(fields, job_id=job_id, ok=ok, finished=time.time()))
+
+
+class RenderFarmCoordinator:
+    """Submits planned batches as farm jobs and waits for the workers to finish them"""
+
+    def __init__(self, farm_dir: str):
+        self.queue = FarmQueue(farm_dir)
+        self.jobs: Dict[str, dict] = {}  # job id -> planned batch
+        # Generated assets (frame box PNG) live in local temp; workers on other hosts read these copies
+        self.asset_dir = os.path.join(self.queue.farm_dir, ASSETS, uuid.uuid4().hex[:12])
+
+    def submit_batches(self, settings: dict, batches: List[dict], total_batches: int, priority: int = 0):
+        from src.utils import persist_temp_assets
+        settings = persist_temp_assets(settings, self.asset_dir)
+        for batch in batches:
+            spec = {"job_id": batch["farm_job"]} if batch.get("farm_job") else {}
+            job_id = self.queue.submit(dict(spec, **{
+                "settings": settings,
+                "batch": batch,
+                "total_batches": total_batches,
+                "priority": priority,
+            }))
+            self.jobs[job_id] = batch
+        print(f"🔧 Render farm: queued {len(batches)} jobs in {self.queue.farm_dir}")
+
+    def wait(self, on_result: Optional[Callable[[dict, dict], None]] = None,
+             should_stop: Optional[Callable[[], bool]] = None) -> List[dict]:
+        """
+        Block until every submitted job has a result.
+
+        Args:
+            on_result: Called with (batch, result) as each job finishes
+            should_stop: Polled; when it returns True unclaimed jobs are cancelled
+
+        Returns:
+            Results in completion order
+        """
+        remaining = dict(self.jobs)
+        results = []
+        warned_idle = False
+        while remaining:
+            for job_id in list(remaining):
+                result = self.queue.result(job_id)
+                if result is not None:
+                    batch = remaining.pop(job_id)
+                    results.append(result)
+                    if on_result:
+                        on_result(batch, result)
+            if not remaining:
+                break
+            if should_stop and should_stop():
+                for job_id in list(remaining):
+                    if self.queue.cancel(job_id):
+                        remaining.pop(job_id)
+                if not remaining:
+                    break
+            self.queue.reap_expired()
+            if not self.queue.live_workers() and not warned_idle:
+                print("⚠️ Render farm: no live workers. Start some with: python -m src.render_farm worker "
+                      f"--farm-dir \"{self.queue.farm_dir}\"")
+                warned_idle = True
+            time.sleep(FARM_POLL_INTERVAL)
+        if not self.queue._list(LEASED):
+            shutil.rmtree(self.asset_dir, ignore_errors=True)
+        return results
+
+
+class _StagedFinalizer:
+    """Holds a job's finalize tasks until the worker knows it still owns the job"""
+
+    def __init__(self):
+        self.tasks = []
+
+    def submit(self, task):
+        self.tasks.append(task)
+
+    def close(self) -> List[str]:
+        return []
+
+
+def run_job(spec: dict, holds_lease: Optional[Callable[[], bool]] = None) -> tuple:
+    """
+    Render one farm job in this process; returns (ok, error message).
+
+    Outputs are rendered into a per-attempt staging folder next to the real
+    output folder. Only if the lease is still held afterwards are they
+    renamed into place and the inputs moved to bin, so a job that was
+    re-queued meanwhile never has its inputs consumed or its output
+    overwritten by a late worker.
+    """
+    from src.video_worker import VideoWorker
+    from src.file_finalizer import FileFinalizer
+    from src.utils import TempWorkspace
+    folder = spec["settings"]["folder"]
+    staging = os.path.join(folder, f".farm_{spec['job_id']}_{spec.get('attempts', 0)}_{os.getpid()}")
+    os.makedirs(staging, exist_ok=True)
+    settings = dict(spec["settings"], resume=False, farm_dir=None, folder=staging)
+    worker = VideoWorker(**settings)
+    errors = []
+    worker.error.connect(errors.append)
+    worker._finalizer = _StagedFinalizer()
+    batch = spec["batch"]
+    try:
+        try:
+            with TempWorkspace(use_ram_disk=worker.use_ram_temp):
+                ok, _ = worker._process_batch(batch, batch["batch"], spec.get("total_batches", batch["batch"] + 1))
+        except Exception as e:
+            ok = False
+            errors.append(str(e))
+        if not ok:
+            return False, errors[-1] if errors else "Render failed"
+        if holds_lease is not None and not holds_lease():
+            return False, "Lease lost before finalizing"
+        for name in os.listdir(staging):
+            os.replace(os.path.join(staging, name), os.path.join(folder, name))
+        finalizer = FileFinalizer()
+        for task in worker._finalizer.tasks:
+            task.output_path = os.path.join(folder, os.path.basename(task.output_path))
+            finalizer.submit(task)
+        failed_moves = finalizer.close()
+        if failed_moves:
+            logger.warning(f"Render farm job {spec['job_id']}: could not move {len(failed_moves)} files")
+        return True, None
+    except OSError as e:
+        return False, f"Could not publish farm job output: {e}"
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def run_worker(farm_dir: str, worker_id: Optional[str] = None, idle_exit: Optional[float] = None,
+               metrics_port: int = 0):
+    """
+    Pull and render jobs until stopped.
+
+    Args:
+        farm_dir: Shared farm directory
+        worker_id: Unique id (default host-pid)
+        idle_exit: Exit after this many seconds without work (None = run forever)
+        metrics_port: Serve this worker's metrics on 127.0.0.1:<port> (0 = off)
+    """
+    if metrics_port:
+        start_metrics_server(metrics_port)
+    else:
+        start_metrics_from_env()
+    queue = FarmQueue(farm_dir)
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    state = {"job": None}
+    stop = threading.Event()
+
+    def beat():
+        while not stop.wait(FARM_HEARTBEAT_INTERVAL):
+            queue.heartbeat(worker_id, state["job"])
+
+    queue.heartbeat(worker_id)
+    threading.Thread(target=beat, daemon=True).start()
+    print(f"🔧 Render farm worker {worker_id} polling {queue.farm_dir}")
+    idle_since = time.time()
+    try:
+        while True:
+            spec = queue.claim(worker_id)
+            if spec is None:
+                if idle_exit is not None and time.time() - idle_since > idle_exit:
+                    break
+                time.sleep(FARM_POLL_INTERVAL)
+                continue
+            job_id = spec["job_id"]
+            state["job"] = job_id
+            queue.heartbeat(worker_id, job_id)
+            output = spec["batch"].get("output_filename")
+            print(f"🎬 Worker {worker_id}: job {job_id} ({output}), attempt {spec['attempts']}")
+            start = time.perf_counter()
+            ok, error = run_job(spec, lambda: queue.holds_lease(worker_id, job_id))
+            log_stage("farm_job", batch=spec["batch"].get("batch"), duration=time.perf_counter() - start,
+                      worker=worker_id, ok=ok)
+            if not queue.complete(worker_id, job_id, ok, error=error, output=output):
+                print(f"⚠️ Worker {worker_id}: lease on job {job_id} expired, result discarded")
+            state["job"] = None
+            idle_since = time.time()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        queue.retire(worker_id)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(prog="python -m src.render_farm", description="SuperCut render farm")
+    sub = parser.add_subparsers(dest="command", required=True)
+    worker_parser = sub.add_parser("worker", help="Render jobs from a farm directory")
+    worker_parser.add_argument("--farm-dir", required=True)
+    worker_parser.add_argument("--workers", type=int, default=1, help="Local worker processes to start")
+    worker_parser.add_argument("--idle-exit", type=float, default=None, help="Exit after this many idle seconds")
+    worker_parser.add_argument("--metrics-port", type=int, default=0,
+                               help="Serve metrics on this port (worker N of --workers uses port + N)")
+    status_parser = sub.add_parser("status", help="Show queue and worker counts")
+    status_parser.add_argument("--farm-dir", required=True)
+    args = parser.parse_args(argv)
+
+    if args.command == "status":
+        queue = FarmQueue(args.farm_dir)
+        counts = queue.counts()
+        print(f"Pending: {counts[PENDING]}  Leased: {counts[LEASED]}  Done: {counts[DONE]}  Workers: {counts['workers']}")
+        for worker_id, info in queue.live_workers().items():
+            print(f"  {worker_id} on {info.get('host')}: {info.get('job') or 'idle'}")
+        return 0
+
+    if args.workers <= 1:
+        run_worker(args.farm_dir, idle_exit=args.idle_exit, metrics_port=args.metrics_port)
+        return 0
+    import subprocess
+    cmd = [sys.executable, "-m", "src.render_farm", "worker", "--farm-dir", args.farm_dir]
+    if args.idle_exit is not None:
+        cmd += ["--idle-exit", str(args.idle_exit)]
+    processes = [subprocess.Popen(cmd + (["--metrics-port", str(args.metrics_port + i)] if args.metrics_port else []))
+                 for i in range(args.workers)]
+    try:
+        for process in processes:
+            process.wait()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
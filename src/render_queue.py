@@ -0,0 +1,388 @@
+# This file uses PyQt6
+"""
+Persistent render queue.
+
+Jobs are complete VideoWorker settings (media folder, output folder and the
+whole layer setup) with a priority. The queue lives in
+config/render_queue.json and is written atomically on every change, so it
+survives restarts; generated assets such as the frame box PNG are copied to
+config/render_queue_assets/<job> because temp files do not. A job that was
+running when the app or machine went down is queued again and resumes from
+its media folder's job journal.
+
+The queue is run unattended by QueueRunner, from the Render Queue dialog or
+headless:
+
+    python -m src.render_queue list
+    python -m src.render_queue add --from JOB --media-folder DIR [--output-folder DIR] [--priority N]
+    python -m src.render_queue priority JOB N | remove JOB | retry JOB
+    python -m src.render_queue run [--concurrent N] [--metrics-port PORT]
+"""
+import os
+import sys
+import time
+import uuid
+import shutil
+import socket
+import argparse
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+from src.config import PROJECT_ROOT
+from src.logger import logger, log_stage
+from src.metrics import start_metrics_server, start_metrics_from_env
+from src.settings_store import atomic_write_json, read_json, file_lock
+from src.utils import persist_temp_assets
+
+RENDER_QUEUE_FILE = os.path.join(PROJECT_ROOT, "config", "render_queue.json")
+RENDER_QUEUE_ASSETS_DIR = os.path.join(PROJECT_ROOT, "config", "render_queue_assets")  # Generated PNGs per job
+RENDER_QUEUE_POLL_INTERVAL = 2.0
+RENDER_QUEUE_HEARTBEAT_INTERVAL = 10  # Seconds between owner heartbeats on running jobs
+RENDER_QUEUE_OWNER_TIMEOUT = 60  # A running job whose owner has not beaten for this long is re-queued
+
+QUEUED, RUNNING, DONE, FAILED, STOPPED = "queued", "running", "done", "failed", "stopped"
+
+
+def _process_alive(pid: int) -> bool:
+    if sys.platform == 'win32':
+        return True  # os.kill would terminate it; rely on the heartbeat
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        pass  # Exists but belongs to someone else, or the platform can not tell
+    return True
+
+
+class RenderQueue:
+    """
+    Priority-ordered jobs persisted to a JSON file.
+
+    The UI and headless runners may use the same queue at once: every change
+    is a read-modify-write under a lock file, and running jobs carry their
+    runner (host, pid) and a heartbeat so only jobs of dead runners are
+    re-queued.
+    """
+
+    def __init__(self, path: str = RENDER_QUEUE_FILE):
+        self.path = path
+        self.lock_path = path + ".lock"
+        self._lock = threading.RLock()
+        self._jobs: Optional[List[dict]] = None
+        self._mtime = None
+
+    def _load(self) -> List[dict]:
+        # Re-read when another process (UI or headless runner) changed the file
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            mtime = None
+        if self._jobs is None or mtime != self._mtime:
+            data = read_json(self.path) if mtime is not None else None
+            self._jobs = data.get("jobs", []) if isinstance(data, dict) else []
+            self._mtime = mtime
+        return self._jobs
+
+    def _save(self):
+        if atomic_write_json(self.path, {"jobs": self._jobs}):
+            try:
+                self._mtime = os.stat(self.path).st_mtime_ns
+            except OSError:
+                self._mtime = None
+
+    @contextmanager
+    def _transaction(self):
+        """Exclusive access across threads and processes, with the jobs freshly read from disk"""
+        with self._lock, file_lock(self.lock_path):
+            self._jobs = None
+            self._load()
+            yield
+
+    def _find(self, job_id: str) -> Optional[dict]:
+        return next((job for job in self._load() if job["id"] == job_id or job["id"].startswith(job_id)), None)
+
+    # --- Managing jobs ---
+    def jobs(self) -> List[dict]:
+        """All jobs, next to run first"""
+        with self._lock:
+            order = {QUEUED: 0, RUNNING: 0, STOPPED: 1, FAILED: 1, DONE: 2}
+            return sorted((dict(job) for job in self._load()),
+                          key=lambda job: (order.get(job["state"], 1), -job.get("priority", 0), job.get("created", 0)))
+
+    def add(self, settings: dict, priority: int = 0, name: str = "", template: Optional[str] = None) -> str:
+        """Queue a job; returns its id"""
+        job_id = uuid.uuid4().hex[:8]
+        settings = persist_temp_assets(settings, os.path.join(RENDER_QUEUE_ASSETS_DIR, job_id),
+                                       roots=[tempfile.gettempdir(), RENDER_QUEUE_ASSETS_DIR])
+        with self._transaction():
+            self._load().append({
+                "id": job_id,
+                "name": name or os.path.basename(os.path.normpath(settings.get("media_sources", ""))),
+                "template": template,
+                "priority": priority,
+                "state": QUEUED,
+                "settings": settings,
+                "created": time.time(),
+                "started": None,
+                "finished": None,
+                "error": None,
+                "owner": None,
+            })
+            self._save()
+            return job_id
+
+    def remove(self, job_id: str) -> bool:
+        with self._transaction():
+            job = self._find(job_id)
+            if job is None or job["state"] == RUNNING:
+                return False
+            self._jobs.remove(job)
+            self._save()
+        self._remove_assets(job["id"])
+        return True
+
+    def set_priority(self, job_id: str, priority: int) -> bool:
+        with self._transaction():
+            job = self._find(job_id)
+            if job is None:
+                return False
+            job["priority"] = priority
+            self._save()
+            return True
+
+    def retry(self, job_id: str) -> bool:
+        """Queue a failed or stopped job again; it resumes from its job journal"""
+        with self._transaction():
+            job = self._find(job_id)
+            if job is None or job["state"] not in (FAILED, STOPPED):
+                return False
+            job.update(state=QUEUED, error=None, finished=None)
+            job["settings"]["resume"] = True
+            self._save()
+            return True
+
+    def _owner_stale(self, owner: Optional[dict], now: float) -> bool:
+        if not owner:
+            return True
+        if owner.get("host") == socket.gethostname() and not _process_alive(owner.get("pid", 0)):
+            return True
+        return now - owner.get("heartbeat", 0) > RENDER_QUEUE_OWNER_TIMEOUT
+
+    def recover(self):
+        """Re-queue running jobs whose runner crashed or stopped heartbeating"""
+        with self._transaction():
+            now = time.time()
+            changed = False
+            for job in self._load():
+                if job["state"] == RUNNING and self._owner_stale(job.get("owner"), now):
+                    job.update(state=QUEUED, owner=None)
+                    job["settings"]["resume"] = True
+                    changed = True
+            if changed:
+                self._save()
+
+    # --- Running ---
+    def claim_next(self, runner_id: str, busy_folders: set) -> Optional[dict]:
+        """Mark the highest-priority queued job as running for this runner and return it"""
+        with self._transaction():
+            running_folders = {job["settings"].get("media_sources") for job in self._load() if job["state"] == RUNNING}
+            candidates = [job for job in self._load()
+                          if job["state"] == QUEUED and job["settings"].get("media_sources") not in busy_folders | running_folders]
+            if not candidates:
+                return None
+            job = min(candidates, key=lambda job: (-job.get("priority", 0), job.get("created", 0)))
+            job.update(state=RUNNING, started=time.time(), error=None, owner={
+                "runner": runner_id, "host": socket.gethostname(), "pid": os.getpid(), "heartbeat": time.time(),
+            })
+            self._save()
+            return dict(job)
+
+    def heartbeat(self, runner_id: str):
+        """Refresh the owner heartbeat of this runner's running jobs"""
+        with self._transaction():
+            owned = [job for job in self._load()
+                     if job["state"] == RUNNING and (job.get("owner") or {}).get("runner") == runner_id]
+            for job in owned:
+                job["owner"]["heartbeat"] = time.time()
+            if owned:
+                self._save()
+
+    def finish(self, job_id: str, state: str, error: Optional[str] = None, runner_id: Optional[str] = None) -> bool:
+        """Record a job's outcome; False if another runner owns it now"""
+        with self._transaction():
+            job = self._find(job_id)
+            if job is None:
+                return False
+            if runner_id is not None and (job.get("owner") or {}).get("runner") != runner_id:
+                return False
+            job.update(state=state, finished=time.time(), error=error, owner=None)
+            self._save()
+        if state == DONE:
+            # Done jobs can not be retried, so their assets are no longer needed
+            self._remove_assets(job_id)
+        return True
+
+    @staticmethod
+    def _remove_assets(job_id: str):
+        shutil.rmtree(os.path.join(RENDER_QUEUE_ASSETS_DIR, job_id), ignore_errors=True)
+
+
+class QueueRunner:
+    """Runs queued jobs back to back, or several at once up to max_concurrent"""
+
+    def __init__(self, queue: RenderQueue, max_concurrent: int = 1):
+        self.queue = queue
+        self.max_concurrent = max(1, max_concurrent)
+        self._running: Dict[str, tuple] = {}  # job id -> (thread, worker, media folder)
+        self.runner_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def active(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Run the queue on a background thread"""
+        if self.active:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop starting jobs and ask the running ones to stop after their current batch"""
+        self._stop.set()
+        for _, worker, _ in list(self._running.values()):
+            worker.stop()
+
+    def run(self, exit_when_empty: bool = False):
+        last_beat = 0.0
+        while not self._stop.is_set():
+            for job_id, (thread, _, _) in list(self._running.items()):
+                if not thread.is_alive():
+                    del self._running[job_id]
+            if time.time() - last_beat >= RENDER_QUEUE_HEARTBEAT_INTERVAL:
+                # Keep our jobs owned and pick up jobs of runners that died
+                self.queue.heartbeat(self.runner_id)
+                self.queue.recover()
+                last_beat = time.time()
+            while len(self._running) < self.max_concurrent and not self._stop.is_set():
+                busy_folders = {folder for _, _, folder in self._running.values()}
+                job = self.queue.claim_next(self.runner_id, busy_folders)
+                if job is None:
+                    break
+                self._start_job(job)
+            if exit_when_empty and not self._running and not any(job["state"] == QUEUED for job in self.queue.jobs()):
+                break
+            self._stop.wait(RENDER_QUEUE_POLL_INTERVAL)
+        # Running jobs finish their current batch; keep them owned meanwhile
+        for thread, _, _ in list(self._running.values()):
+            while thread.is_alive():
+                thread.join(RENDER_QUEUE_HEARTBEAT_INTERVAL)
+                self.queue.heartbeat(self.runner_id)
+
+    def _start_job(self, job: dict):
+        from PyQt6.QtCore import Qt
+        from src.video_worker import VideoWorker
+        worker = VideoWorker(**job["settings"])
+        outcome = {}
+        # The worker emits from run_job's thread, which has no event loop to deliver
+        # queued calls; a direct connection records the outcome as it is emitted
+        worker.error.connect(lambda message: outcome.setdefault("error", message), Qt.ConnectionType.DirectConnection)
+        worker.finished.connect(lambda *args: outcome.setdefault("finished", True), Qt.ConnectionType.DirectConnection)
+
+        def run_job():
+            print(f"🎬 Render queue: starting {job['name']} (priority {job['priority']})")
+            start = time.perf_counter()
+            try:
+                worker.run()
+            except Exception as e:
+                outcome.setdefault("error", str(e))
+            if "error" in outcome:
+                state = FAILED
+            elif self._stop.is_set():
+                state = STOPPED
+            else:
+                state = DONE
+            if not self.queue.finish(job["id"], state, outcome.get("error"), runner_id=self.runner_id):
+                logger.warning(f"Render queue job {job['id']} was taken over by another runner; result not recorded")
+            log_stage("queue_job", duration=time.perf_counter() - start, job=job["id"], state=state)
+            print(f"{'✅' if state == DONE else '⚠️'} Render queue: {job['name']} {state}")
+            if state == FAILED:
+                logger.error(f"Render queue job {job['id']} failed: {outcome.get('error')}")
+
+        thread = threading.Thread(target=run_job, daemon=True)
+        self._running[job["id"]] = (thread, worker, job["settings"].get("media_sources"))
+        thread.start()
+
+
+render_queue = RenderQueue()
+
+
+def _format_job(job: dict) -> str:
+    when = time.strftime('%Y-%m-%d %H:%M', time.localtime(job.get("created") or 0))
+    template = f" [{job['template']}]" if job.get("template") else ""
+    error = f" - {job['error']}" if job.get("error") else ""
+    return f"{job['id']}  {job['state']:<8} p={job.get('priority', 0):<3} {when}  {job['name']}{template}{error}"
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(prog="python -m src.render_queue", description="SuperCut render queue")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="Show queued, running and finished jobs")
+    add_parser = sub.add_parser("add", help="Queue a copy of an existing job for another folder")
+    add_parser.add_argument("--from", dest="source", required=True, help="Job id whose settings are reused")
+    add_parser.add_argument("--media-folder", required=True)
+    add_parser.add_argument("--output-folder")
+    add_parser.add_argument("--priority", type=int, default=0)
+    priority_parser = sub.add_parser("priority", help="Change a job's priority")
+    priority_parser.add_argument("job")
+    priority_parser.add_argument("priority", type=int)
+    for command in ("remove", "retry"):
+        sub.add_parser(command).add_argument("job")
+    run_parser = sub.add_parser("run", help="Run queued jobs until the queue is empty")
+    run_parser.add_argument("--concurrent", type=int, default=1)
+    run_parser.add_argument("--metrics-port", type=int, default=0, help="Serve metrics on this port")
+    args = parser.parse_args(argv)
+
+    queue = render_queue
+    if args.command == "list":
+        for job in queue.jobs():
+            print(_format_job(job))
+        return 0
+    if args.command == "add":
+        source = queue._find(args.source)
+        if source is None:
+            print(f"❌ No job {args.source}")
+            return 1
+        settings = dict(source["settings"], media_sources=os.path.abspath(args.media_folder), resume=False)
+        if args.output_folder:
+            settings["folder"] = os.path.abspath(args.output_folder)
+        print(f"✅ Queued {queue.add(settings, args.priority, template=source.get('template'))}")
+        return 0
+    if args.command == "priority":
+        ok = queue.set_priority(args.job, args.priority)
+    elif args.command == "remove":
+        ok = queue.remove(args.job)
+    elif args.command == "retry":
+        ok = queue.retry(args.job)
+    else:
+        if args.metrics_port:
+            start_metrics_server(args.metrics_port)
+        else:
+            start_metrics_from_env()
+        runner = QueueRunner(queue, args.concurrent)
+        try:
+            runner.run(exit_when_empty=True)
+        except KeyboardInterrupt:
+            runner.stop()
+        return 0
+    print("✅ Done" if ok else f"❌ Could not {args.command} job {args.job}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
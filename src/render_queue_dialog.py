@@ -0,0 +1,172 @@
+# This file uses PyQt6
+"""
+Render Queue Dialog for SuperCut
+Lists queued jobs and runs them unattended while the main window stays free
+"""
+
+import time
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QListWidget, QListWidgetItem, QSpinBox, QMessageBox
+)
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QColor
+
+from src.render_queue import render_queue, QueueRunner, QUEUED, RUNNING, DONE, FAILED, STOPPED
+
+STATE_COLORS = {QUEUED: "#333", RUNNING: "#4a90e2", DONE: "#2e7d32", FAILED: "#c00", STOPPED: "#e67e22"}
+
+
+class RenderQueueDialog(QDialog):
+    """Dialog for managing the persistent render queue"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.main_window = parent
+        self.init_ui()
+        self.refresh()
+        # The queue can be changed by the runner threads or a headless runner
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh_timer.start(1000)
+
+    @property
+    def runner(self) -> QueueRunner:
+        # Owned by the main window so the queue keeps running when the dialog closes
+        if getattr(self.main_window, 'queue_runner', None) is None:
+            self.main_window.queue_runner = QueueRunner(render_queue)
+        return self.main_window.queue_runner
+
+    def init_ui(self):
+        """Initialize the user interface"""
+        self.setWindowTitle("Render Queue")
+        self.setFixedSize(590, 420)
+
+        layout = QVBoxLayout(self)
+        title_label = QLabel("Render Queue")
+        title_label.setStyleSheet("font-size: 18px; font-weight: bold; margin-bottom: 10px;")
+        layout.addWidget(title_label)
+
+        self.job_list = QListWidget()
+        self.job_list.currentItemChanged.connect(lambda *args: self.update_buttons())
+        layout.addWidget(self.job_list)
+
+        # Job buttons
+        job_layout = QHBoxLayout()
+        self.add_btn = QPushButton("Add Current")
+        self.add_btn.setToolTip("Queue the current media folder and settings")
+        self.add_btn.clicked.connect(self.add_current_job)
+        job_layout.addWidget(self.add_btn)
+        job_layout.addWidget(QLabel("Priority:"))
+        self.priority_spin = QSpinBox()
+        self.priority_spin.setRange(-99, 99)
+        self.priority_spin.setToolTip("Higher priority jobs run first")
+        self.priority_spin.valueChanged.connect(self.set_priority)
+        job_layout.addWidget(self.priority_spin)
+        job_layout.addStretch()
+        self.retry_btn = QPushButton("Retry")
+        self.retry_btn.clicked.connect(self.retry_job)
+        job_layout.addWidget(self.retry_btn)
+        self.remove_btn = QPushButton("Remove")
+        self.remove_btn.clicked.connect(self.remove_job)
+        job_layout.addWidget(self.remove_btn)
+        layout.addLayout(job_layout)
+
+        # Runner controls
+        run_layout = QHBoxLayout()
+        run_layout.addWidget(QLabel("Concurrent jobs:"))
+        self.concurrent_spin = QSpinBox()
+        self.concurrent_spin.setRange(1, 8)
+        settings = getattr(self.main_window, 'settings', None)
+        self.concurrent_spin.setValue(settings.value('render_queue_concurrent', 1, type=int) if settings else 1)
+        run_layout.addWidget(self.concurrent_spin)
+        run_layout.addStretch()
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet("color: #666; font-size: 12px;")
+        run_layout.addWidget(self.status_label)
+        self.run_btn = QPushButton("Run Queue")
+        self.run_btn.setFixedWidth(100)
+        self.run_btn.clicked.connect(self.toggle_runner)
+        run_layout.addWidget(self.run_btn)
+        layout.addLayout(run_layout)
+
+    def selected_job_id(self):
+        item = self.job_list.currentItem()
+        return item.data(Qt.ItemDataRole.UserRole) if item else None
+
+    def refresh(self):
+        """Reload the job list, keeping the selection"""
+        selected = self.selected_job_id()
+        jobs = render_queue.jobs()
+        self.job_list.blockSignals(True)
+        self.job_list.clear()
+        for job in jobs:
+            label = f"[{job['state']}]  {job['name']}"
+            if job.get('template'):
+                label += f"  ({job['template']})"
+            label += f"  •  priority {job.get('priority', 0)}"
+            if job.get('error'):
+                label += f"  •  {job['error']}"
+            item = QListWidgetItem(label)
+            item.setData(Qt.ItemDataRole.UserRole, job['id'])
+            item.setForeground(QColor(STATE_COLORS.get(job['state'], "#666")))
+            item.setToolTip(f"{job['settings'].get('media_sources', '')}\n→ {job['settings'].get('folder', '')}\n"
+                            f"Added {time.strftime('%Y-%m-%d %H:%M', time.localtime(job.get('created') or 0))}")
+            self.job_list.addItem(item)
+            if job['id'] == selected:
+                self.job_list.setCurrentItem(item)
+        self.job_list.blockSignals(False)
+        queued = sum(1 for job in jobs if job['state'] == QUEUED)
+        running = sum(1 for job in jobs if job['state'] == RUNNING)
+        self.status_label.setText(f"{running} running, {queued} queued")
+        self.run_btn.setText("Stop Queue" if self.runner.active else "Run Queue")
+        self.update_buttons()
+
+    def update_buttons(self):
+        job = next((job for job in render_queue.jobs() if job['id'] == self.selected_job_id()), None)
+        self.priority_spin.setEnabled(job is not None and job['state'] == QUEUED)
+        if job is not None:
+            self.priority_spin.blockSignals(True)
+            self.priority_spin.setValue(job.get('priority', 0))
+            self.priority_spin.blockSignals(False)
+        self.retry_btn.setEnabled(job is not None and job['state'] not in (QUEUED, RUNNING, DONE))
+        self.remove_btn.setEnabled(job is not None and job['state'] != RUNNING)
+
+    def add_current_job(self):
+        if self.main_window is not None:
+            self.main_window.enqueue_current_job(self.priority_spin.value())
+            self.refresh()
+
+    def set_priority(self, value):
+        job_id = self.selected_job_id()
+        if job_id:
+            render_queue.set_priority(job_id, value)
+            self.refresh()
+
+    def retry_job(self):
+        job_id = self.selected_job_id()
+        if job_id and render_queue.retry(job_id):
+            self.refresh()
+
+    def remove_job(self):
+        job_id = self.selected_job_id()
+        if job_id and render_queue.remove(job_id):
+            self.refresh()
+
+    def toggle_runner(self):
+        runner = self.runner
+        if runner.active:
+            reply = QMessageBox.question(
+                self, "Stop Queue",
+                "Stop the queue? Running jobs stop after their current batch and can be retried later.",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+            if reply == QMessageBox.StandardButton.Yes:
+                runner.stop()
+        else:
+            runner.max_concurrent = self.concurrent_spin.value()
+            settings = getattr(self.main_window, 'settings', None)
+            if settings:
+                settings.setValue('render_queue_concurrent', self.concurrent_spin.value())
+            runner.start()
+        self.refresh()
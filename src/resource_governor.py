@@ -0,0 +1,364 @@
+# This file uses PyQt6
+"""
+Resource governor for ffmpeg/ffprobe child processes.
+
+Every child started through the governor runs at a lower CPU priority (nice
+value on Linux/macOS, below-normal priority class on Windows) and, on Linux,
+a lower I/O priority. A sampler thread watches system CPU, RAM and disk I/O
+while encodes run:
+
+- a new encode is admitted only while the system is below the configured
+  ceilings and fewer than max_encodes encodes run in this process (with
+  none running, only RAM and disk I/O are checked); an encode that has
+  waited GOVERNOR_MAX_WAIT seconds is admitted anyway, so a busy host can
+  not starve a render forever;
+- while RAM or disk I/O is above its ceiling, all but the oldest running
+  encode are paused (SIGSTOP, or psutil suspend on Windows) and resumed once
+  usage is GOVERNOR_RESUME_MARGIN points below the ceilings again. CPU
+  contention between running encodes is left to the lowered priority.
+
+Limits come from the Resource Limits setting, e.g. "nice=10, encodes=2,
+cpu=90, ram=85, io=90" (0 disables a ceiling). psutil is used when it is
+installed; otherwise samples come from /proc (Linux) or the load average.
+"""
+import os
+import sys
+import time
+import platform
+import threading
+import subprocess
+from typing import Dict, List, Optional
+from src.logger import logger, log_stage
+
+GOVERNOR_SAMPLE_INTERVAL = 2.0  # Seconds between resource samples
+GOVERNOR_MAX_WAIT = 600  # Seconds an encode waits for admission before it is started anyway
+GOVERNOR_RESUME_MARGIN = 10  # Percentage points below the ceilings before paused encodes resume
+BELOW_NORMAL_PRIORITY_CLASS = 0x00004000
+IOPRIO_CLASS_BE = 2
+IOPRIO_WHO_PROCESS = 1
+IOPRIO_SET_SYSCALLS = {'x86_64': 251, 'amd64': 251, 'aarch64': 30, 'arm64': 30, 'i386': 289, 'i686': 289}
+
+DEFAULT_RESOURCE_LIMITS = {
+    'nice': 10,  # CPU niceness of child processes (0 = unchanged)
+    'io_priority': 7,  # Linux best-effort I/O priority 0 (high) - 7 (low); -1 = unchanged
+    'encodes': 0,  # Concurrent encodes in this process (0 = no limit)
+    'cpu': 90,  # Admission ceilings in percent (0 = ignore)
+    'ram': 85,
+    'io': 90,
+}
+# Short names accepted in the Resource Limits setting
+RESOURCE_LIMIT_ALIASES = {'ionice': 'io_priority', 'max_encodes': 'encodes', 'memory': 'ram', 'disk': 'io'}
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def parse_resource_limits(text: str) -> Dict[str, int]:
+    """Parse "nice=10, encodes=2, cpu=90" into a limits dict; unknown keys are ignored"""
+    limits = {}
+    for part in (text or "").replace(';', ',').split(','):
+        key, sep, value = part.partition('=')
+        key = RESOURCE_LIMIT_ALIASES.get(key.strip().lower(), key.strip().lower())
+        if not sep or key not in DEFAULT_RESOURCE_LIMITS:
+            continue
+        try:
+            limits[key] = int(value.strip().rstrip('%'))
+        except ValueError:
+            logger.warning(f"Ignoring resource limit '{part.strip()}'")
+    return limits
+
+
+def format_resource_limits(limits: Dict[str, int]) -> str:
+    return ", ".join(f"{key}={value}" for key, value in limits.items())
+
+
+class ResourceSampler:
+    """System CPU, RAM and disk busy percentages, sampled on a background thread"""
+
+    def __init__(self, interval: float = GOVERNOR_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.cpu: Optional[float] = None
+        self.ram: Optional[float] = None
+        self.io: Optional[float] = None
+        self._last_cpu = None
+        self._last_io = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self.sample()
+                self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            self.sample()
+
+    def sample(self):
+        try:
+            self.cpu = self._sample_cpu()
+            self.ram = self._sample_ram()
+            self.io = self._sample_io()
+        except Exception as e:
+            logger.warning(f"Resource sampling failed: {e}")
+
+    def _sample_cpu(self) -> Optional[float]:
+        if psutil is not None:
+            return psutil.cpu_percent(interval=None)
+        try:
+            with open('/proc/stat', 'r') as f:
+                values = [int(v) for v in f.readline().split()[1:]]
+            idle, total = values[3] + (values[4] if len(values) > 4 else 0), sum(values)
+            last, self._last_cpu = self._last_cpu, (idle, total)
+            if last is None or total == last[1]:
+                return None
+            return 100.0 * (1 - (idle - last[0]) / (total - last[1]))
+        except (OSError, ValueError, IndexError):
+            pass
+        if hasattr(os, 'getloadavg'):
+            return min(100.0, 100.0 * os.getloadavg()[0] / (os.cpu_count() or 1))
+        return None
+
+    def _sample_ram(self) -> Optional[float]:
+        if psutil is not None:
+            return psutil.virtual_memory().percent
+        try:
+            meminfo = {}
+            with open('/proc/meminfo', 'r') as f:
+                for line in f:
+                    key, _, value = line.partition(':')
+                    meminfo[key] = int(value.split()[0])
+            return 100.0 * (1 - meminfo['MemAvailable'] / meminfo['MemTotal'])
+        except (OSError, ValueError, KeyError, IndexError, ZeroDivisionError):
+            return None
+
+    def _sample_io(self) -> Optional[float]:
+        """Busy percentage of the busiest disk since the last sample"""
+        now = time.monotonic()
+        busy_ms = {}
+        if psutil is not None:
+            try:
+                for name, counters in psutil.disk_io_counters(perdisk=True).items():
+                    if hasattr(counters, 'busy_time'):
+                        busy_ms[name] = counters.busy_time
+            except (RuntimeError, OSError):
+                pass
+        if not busy_ms:
+            try:
+                with open('/proc/diskstats', 'r') as f:
+                    for line in f:
+                        fields = line.split()
+                        if len(fields) > 12 and not fields[2].startswith(('loop', 'ram')):
+                            busy_ms[fields[2]] = int(fields[12])
+            except (OSError, ValueError):
+                return None
+        last, self._last_io = self._last_io, (now, busy_ms)
+        if last is None or not busy_ms or now <= last[0]:
+            return None
+        elapsed_ms = (now - last[0]) * 1000
+        return min(100.0, max((busy_ms[name] - last[1].get(name, busy_ms[name])) / elapsed_ms * 100
+                              for name in busy_ms))
+
+
+class EncodeSlot:
+    """An admitted encode; its child processes are tracked for throttling"""
+
+    def __init__(self, governor: "ResourceGovernor"):
+        self.governor = governor
+        self.processes: List[subprocess.Popen] = []
+        self.throttled = False
+
+    def live_processes(self) -> List[subprocess.Popen]:
+        """Children still running; exited ones are dropped so their PIDs are never signalled again"""
+        self.processes = [process for process in self.processes if process.poll() is None]
+        return self.processes
+
+    def release(self):
+        self.governor._release(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+class ResourceGovernor:
+    """Lowers child process priority and admits/throttles encodes against ceilings"""
+
+    def __init__(self):
+        self.limits = dict(DEFAULT_RESOURCE_LIMITS)
+        self.sampler = ResourceSampler()
+        self._slots: List[EncodeSlot] = []
+        self._current = threading.local()
+        self._cond = threading.Condition()
+        self._throttle_thread: Optional[threading.Thread] = None
+
+    def configure(self, limits: Optional[Dict[str, int]] = None):
+        """Apply limits on top of the defaults"""
+        self.limits = dict(DEFAULT_RESOURCE_LIMITS)
+        self.limits.update({key: value for key, value in (limits or {}).items() if key in DEFAULT_RESOURCE_LIMITS})
+        with self._cond:
+            self._cond.notify_all()
+
+    # --- Child processes ---
+    def popen(self, cmd: List[str], **kwargs) -> subprocess.Popen:
+        """subprocess.Popen at the governed CPU and I/O priority"""
+        if sys.platform == 'win32' and self.limits['nice'] > 0:
+            kwargs['creationflags'] = kwargs.get('creationflags', 0) | BELOW_NORMAL_PRIORITY_CLASS
+        process = subprocess.Popen(cmd, **kwargs)
+        self.lower_priority(process.pid)
+        slot = getattr(self._current, 'slot', None)
+        if slot is not None:
+            slot.processes.append(process)
+            if slot.throttled:
+                self._pause(process, True)
+        return process
+
+    def run(self, cmd: List[str], timeout: Optional[float] = None, capture_output: bool = False,
+            check: bool = False, **kwargs) -> subprocess.CompletedProcess:
+        """subprocess.run at the governed CPU and I/O priority"""
+        if capture_output:
+            kwargs['stdout'] = kwargs['stderr'] = subprocess.PIPE
+        with self.popen(cmd, **kwargs) as process:
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                raise
+        if check and process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, cmd, stdout, stderr)
+        return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+
+    def lower_priority(self, pid: int):
+        if sys.platform != 'win32' and self.limits['nice'] > 0:
+            try:
+                os.setpriority(os.PRIO_PROCESS, pid, self.limits['nice'])
+            except OSError as e:
+                logger.debug(f"Could not set priority of process {pid}: {e}")
+        if sys.platform.startswith('linux') and self.limits['io_priority'] >= 0:
+            self._set_io_priority(pid, min(7, self.limits['io_priority']))
+
+    def _set_io_priority(self, pid: int, level: int):
+        try:
+            if psutil is not None:
+                psutil.Process(pid).ionice(IOPRIO_CLASS_BE, level)
+                return
+            syscall_nr = IOPRIO_SET_SYSCALLS.get(platform.machine().lower())
+            if syscall_nr is None:
+                return
+            import ctypes
+            libc = ctypes.CDLL(None, use_errno=True)
+            if libc.syscall(syscall_nr, IOPRIO_WHO_PROCESS, pid, (IOPRIO_CLASS_BE << 13) | level) != 0:
+                logger.debug(f"Could not set I/O priority of process {pid}: errno {ctypes.get_errno()}")
+        except Exception as e:
+            logger.debug(f"Could not set I/O priority of process {pid}: {e}")
+
+    # --- Encode admission ---
+    def over_ceiling(self, margin: int = 0, resources=('cpu', 'ram', 'io')) -> Optional[str]:
+        """The first resource at or above its ceiling (minus margin), or None"""
+        for name in resources:
+            value, ceiling = getattr(self.sampler, name), self.limits[name]
+            if ceiling > 0 and value is not None and value >= ceiling - margin:
+                return f"{name} {value:.0f}% >= {ceiling}%"
+        return None
+
+    def admit_encode(self) -> EncodeSlot:
+        """Block until an encode may start; returns its slot (release it when done)"""
+        self.sampler.start()
+        self._start_throttle()
+        start = time.monotonic()
+        reported = False
+        with self._cond:
+            while True:
+                max_encodes = self.limits['encodes']
+                at_limit = max_encodes > 0 and len(self._slots) >= max_encodes
+                # A lone encode is only held back by memory or disk pressure
+                pressure = self.over_ceiling() if self._slots else self.over_ceiling(resources=('ram', 'io'))
+                waited = time.monotonic() - start
+                if not at_limit and (pressure is None or waited >= GOVERNOR_MAX_WAIT):
+                    break
+                if not reported:
+                    reason = f"{len(self._slots)} encodes running" if at_limit else pressure
+                    print(f"⏳ Waiting to start encode ({reason})...")
+                    reported = True
+                self._cond.wait(GOVERNOR_SAMPLE_INTERVAL)
+            slot = EncodeSlot(self)
+            self._slots.append(slot)
+        self._current.slot = slot
+        waited = time.monotonic() - start
+        self._current.admission_wait = self.admission_wait_seconds() + waited
+        if reported:
+            log_stage("encode_admission_wait", duration=waited)
+        return slot
+
+    def admission_wait_seconds(self) -> float:
+        """Total time this thread has spent waiting in admit_encode()"""
+        return getattr(self._current, 'admission_wait', 0.0)
+
+    def _release(self, slot: EncodeSlot):
+        with self._cond:
+            if slot in self._slots:
+                self._slots.remove(slot)
+            self._cond.notify_all()
+        if slot.throttled:
+            self._throttle(slot, False)
+        if getattr(self._current, 'slot', None) is slot:
+            self._current.slot = None
+
+    # --- Throttling ---
+    def _start_throttle(self):
+        with self._cond:
+            if self._throttle_thread is None or not self._throttle_thread.is_alive():
+                self._throttle_thread = threading.Thread(target=self._throttle_loop, name="resource-throttle", daemon=True)
+                self._throttle_thread.start()
+
+    def _throttle_loop(self):
+        while True:
+            time.sleep(GOVERNOR_SAMPLE_INTERVAL)
+            with self._cond:
+                slots = list(self._slots)
+                # Wake admissions waiting on pressure that may have dropped
+                self._cond.notify_all()
+            pressure = self.over_ceiling(resources=('ram', 'io'))
+            relieved = self.over_ceiling(GOVERNOR_RESUME_MARGIN, resources=('ram', 'io')) is None
+            # The oldest encode always keeps running so work progresses; when it
+            # finishes, the next one (possibly paused) becomes the oldest and resumes
+            for index, slot in enumerate(slots):
+                if index == 0:
+                    if slot.throttled:
+                        logger.info("Resuming paused encode (now the oldest)")
+                        self._throttle(slot, False)
+                elif pressure is not None and not slot.throttled:
+                    logger.info(f"Pausing encode ({pressure})")
+                    self._throttle(slot, True)
+                elif relieved and slot.throttled:
+                    logger.info("Resuming paused encode")
+                    self._throttle(slot, False)
+
+    def _throttle(self, slot: EncodeSlot, pause: bool):
+        slot.throttled = pause
+        for process in slot.live_processes():
+            self._pause(process, pause)
+
+    def _pause(self, process: subprocess.Popen, pause: bool):
+        try:
+            if psutil is not None:
+                # psutil refuses to signal a PID that now belongs to another process
+                child = psutil.Process(process.pid)
+                child.suspend() if pause else child.resume()
+            elif sys.platform != 'win32':
+                import signal
+                # send_signal does nothing once the process has been reaped
+                process.send_signal(signal.SIGSTOP if pause else signal.SIGCONT)
+        except Exception as e:  # Process already gone (or psutil.NoSuchProcess)
+            logger.debug(f"Could not {'pause' if pause else 'resume'} process {process.pid}: {e}")
+
+
+resource_governor = ResourceGovernor()
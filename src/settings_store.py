@@ -0,0 +1,180 @@
+# This file uses PyQt6
+"""
+In-memory user settings with debounced, atomic writes.
+
+config/user_settings.json is read once and then kept in memory. Changes
+only mark the store dirty and (re)start a short debounce timer, so a burst
+of UI changes becomes one write. Writes go to a temp file in the same
+directory which is fsync'd and renamed over the original, so a crash
+mid-write leaves either the old or the new file, never a torn one.
+Pending changes are flushed at exit.
+"""
+import os
+import json
+import time
+import uuid
+import atexit
+import socket
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Any, Optional, Tuple
+from src.logger import logger
+
+SETTINGS_WRITE_DELAY = 0.5  # Seconds of quiet before pending changes are written
+FILE_LOCK_STALE = 10  # A lock file older than this was left by a crashed process
+FILE_LOCK_TIMEOUT = 30
+
+
+def atomic_write_json(path: str, data: Any, indent: int = 2) -> bool:
+    """Write JSON via temp file + fsync + rename; returns False on failure"""
+    directory = os.path.dirname(os.path.abspath(path))
+    temp_path = None
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=".tmp_", suffix=".json", dir=directory)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+        temp_path = None
+        return True
+    except (OSError, TypeError, ValueError) as e:
+        logger.error(f"Could not write {path}: {e}")
+        return False
+    finally:
+        if temp_path and os.path.exists(temp_path):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
+def read_json(path: str) -> Optional[Any]:
+    """Parsed JSON from path, or None if it is missing or unreadable"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _lock_identity(path: str) -> Optional[Tuple[int, int, str]]:
+    """(inode, mtime, holder token) of a lock file, or None if there is none"""
+    try:
+        st = os.stat(path)
+        with open(path, 'r', encoding='utf-8') as f:
+            return st.st_ino, st.st_mtime_ns, f.read()
+    except OSError:
+        return None
+
+
+@contextmanager
+def file_lock(path: str, stale: float = FILE_LOCK_STALE, timeout: float = FILE_LOCK_TIMEOUT):
+    """
+    Exclusive lock across processes: a lock file created with O_EXCL.
+
+    A lock older than stale seconds is broken, but only if it is still the
+    same file (inode, mtime and holder token) that was judged stale, so a
+    waiter can not delete a fresh lock another waiter took meanwhile. The
+    holder only removes the lock if it still carries its own token.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    token = f"{socket.gethostname()} {os.getpid()} {uuid.uuid4().hex}"
+    deadline = time.time() + timeout
+    while True:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            holder = _lock_identity(path)
+            if holder is None:
+                continue  # Released meanwhile
+            if time.time() - holder[1] / 1e9 > stale:
+                if _lock_identity(path) == holder:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                continue
+            if time.time() > deadline:
+                raise OSError(f"{path} is locked by {holder[2] or 'another process'}")
+            time.sleep(0.05)
+            continue
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(token)
+        break
+    try:
+        yield
+    finally:
+        holder = _lock_identity(path)
+        if holder is not None and holder[2] == token:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+class UserSettingsStore:
+    """Settings kept in memory and written to a JSON file on a debounce timer"""
+
+    def __init__(self, path: str, write_delay: float = SETTINGS_WRITE_DELAY):
+        self.path = path
+        self.write_delay = write_delay
+        self._data: Optional[dict] = None
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
+        atexit.register(self.flush)
+
+    def _load(self) -> dict:
+        if self._data is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self._data = data if isinstance(data, dict) else {}
+            except FileNotFoundError:
+                self._data = {}
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read {self.path}, starting with empty settings: {e}")
+                self._data = {}
+        return self._data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            return self._load().get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        """Change a value in memory and schedule a write"""
+        with self._lock:
+            data = self._load()
+            if key in data and data[key] == value:
+                return
+            data[key] = value
+            self._schedule_write()
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            if self._load().pop(key, None) is not None:
+                self._schedule_write()
+
+    def _schedule_write(self) -> None:
+        self._dirty = True
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(self.write_delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self) -> bool:
+        """Write pending changes now; returns False if the write failed"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return True
+            if atomic_write_json(self.path, self._data):
+                self._dirty = False
+                return True
+            return False
@@ -7,40 +7,48 @@ Integrates py-sound-viewer functionality to generate soundwave MP4 files with tr
 import os
 import sys
 import wave
-import subprocess
 import tempfile
 from typing import Optional, Tuple
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend to avoid GUI issues
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-from matplotlib import collections as mc
-import numpy as np
-import colorsys
 from src.logger import logger
 from src.utils import create_temp_file
+from src.resource_governor import resource_governor
 from src.config import FFMPEG_BINARY
 
-# Import py-sound-viewer compute functions
-try:
-    sys.path.append(os.path.join(os.path.dirname(__file__), 'py-sound-viewer-main'))
-    from compute import compute, WIDTH, HEIGHT, SAMPLE_SIZE, CHANNELS, RATE, FPS  # type: ignore
-except ImportError as e:
-    logger.error(f"Failed to import py-sound-viewer compute functions: {e}")
-    logger.error("Make sure the py-sound-viewer-main folder is in the src directory")
-    # Set default values if import fails
-    WIDTH = 1280
-    HEIGHT = 720
-    SAMPLE_SIZE = 2
-    CHANNELS = 2
-    RATE = 44100
-    FPS = 25.0
+# Defaults matching py-sound-viewer; replaced by its values once it is loaded
+WIDTH = 1280
+HEIGHT = 720
+SAMPLE_SIZE = 2
+CHANNELS = 2
+RATE = 44100
+FPS = 25.0
+
+# matplotlib, numpy and py-sound-viewer are only imported when a soundwave is rendered
+_sound_viewer = None
+
+
+def _load_sound_viewer():
+    """Import matplotlib and the py-sound-viewer compute function on first use"""
+    global _sound_viewer, WIDTH, HEIGHT, SAMPLE_SIZE, CHANNELS, RATE, FPS
+    if _sound_viewer is not None:
+        return _sound_viewer
+    import matplotlib
+    matplotlib.use('Agg')  # Use non-interactive backend to avoid GUI issues
+    import matplotlib.pyplot as plt
     compute = None
+    try:
+        sys.path.append(os.path.join(os.path.dirname(__file__), 'py-sound-viewer-main'))
+        from compute import compute, WIDTH, HEIGHT, SAMPLE_SIZE, CHANNELS, RATE, FPS  # type: ignore
+    except ImportError as e:
+        logger.error(f"Failed to import py-sound-viewer compute functions: {e}")
+        logger.error("Make sure the py-sound-viewer-main folder is in the src directory")
+    _sound_viewer = (plt, compute)
+    return _sound_viewer
 
 class SoundwaveGenerator:
     """Generate soundwave MP4 files with transparent backgrounds"""
     
     def __init__(self):
+        self.plt, self.compute = _load_sound_viewer()
         self.width = WIDTH
         self.height = HEIGHT
         self.sample_size = SAMPLE_SIZE
@@ -65,7 +73,7 @@ class SoundwaveGenerator:
                 wav_path
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = resource_governor.run(cmd, capture_output=True, text=True)
             if result.returncode == 0:
                 return wav_path
             else:
@@ -110,23 +118,23 @@ class SoundwaveGenerator:
                     return False
             
             # Create matplotlib figure with transparent background
-            dpi = plt.rcParams['figure.dpi']
-            plt.rcParams['savefig.dpi'] = 300
-            plt.rcParams['figure.figsize'] = (1.0 * self.width / dpi, 1.0 * self.height / dpi)
+            dpi = self.plt.rcParams['figure.dpi']
+            self.plt.rcParams['savefig.dpi'] = 300
+            self.plt.rcParams['figure.figsize'] = (1.0 * self.width / dpi, 1.0 * self.height / dpi)
             
             # Set figure background to transparent if requested
             if transparent_bg:
-                fig = plt.figure(facecolor='none', edgecolor='none')
+                fig = self.plt.figure(facecolor='none', edgecolor='none')
             else:
-                fig = plt.figure(facecolor='black', edgecolor='black')
+                fig = self.plt.figure(facecolor='black', edgecolor='black')
             
             # Generate animation using py-sound-viewer
-            if compute is None:
+            if self.compute is None:
                 logger.error("py-sound-viewer compute function not available")
                 return False
                 
             with wave.open(wav_path, 'rb') as wf:
-                ani = compute(method, color, fig, wf)
+                ani = self.compute(method, color, fig, wf)
                 if ani is None:
                     logger.error(f"Failed to create animation for method: {method}")
                     return False
@@ -0,0 +1,133 @@
+# This file uses PyQt6
+"""
+Startup time profiler.
+
+Measures named init phases and, when enabled, every module imported during
+startup (cumulative and self time), then reports time-to-window against a
+budget so regressions are visible. Uses only the standard library so it can
+be imported first in main.py, before any heavy module.
+
+Enable the full report with SUPERCUT_PROFILE_STARTUP=1 or --profile-startup;
+otherwise only a one-line time-to-window summary is printed.
+"""
+import os
+import sys
+import time
+import builtins
+import threading
+from contextlib import contextmanager
+
+STARTUP_PROFILE_ENV = 'SUPERCUT_PROFILE_STARTUP'
+STARTUP_PROFILE_ARG = '--profile-startup'
+STARTUP_BUDGET_SECONDS = 2.0  # Target time from process start to the main window
+STARTUP_REPORT_TOP = 15  # Imports listed in the report
+
+
+class StartupProfiler:
+    """Records init phases and startup imports"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.start_time = time.perf_counter()
+        self.phases = []  # (start, name, depth, seconds, interactive)
+        self.imports = {}  # module -> (cumulative seconds, self seconds, depth)
+        self._phase_depth = 0
+        self._import_stack = []
+        self._original_import = None
+        self._thread_id = threading.get_ident()
+        self.finished = False
+
+    # --- Import tracking ---
+    def start_import_tracking(self):
+        """Time every module imported on the main thread until finish()"""
+        if not self.enabled or self._original_import is not None:
+            return
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def stop_import_tracking(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original_import
+        if original is None or level or name in sys.modules or threading.get_ident() != self._thread_id:
+            return (original or builtins.__import__)(name, globals, locals, fromlist, level)
+        depth = len(self._import_stack)
+        self._import_stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._import_stack.pop()
+            if self._import_stack:
+                self._import_stack[-1] += elapsed
+            self.imports.setdefault(name, (elapsed, elapsed - children, depth))
+
+    # --- Phases ---
+    @contextmanager
+    def phase(self, name: str, interactive: bool = False):
+        """
+        Time an init phase.
+
+        Args:
+            name: Phase name shown in the report
+            interactive: Phase waits on the user (e.g. a dialog); excluded from time-to-window
+        """
+        depth = self._phase_depth
+        self._phase_depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phase_depth -= 1
+            self.phases.append((start, name, depth, time.perf_counter() - start, interactive))
+
+    def time_to_window(self) -> float:
+        """Seconds since startup, not counting interactive phases"""
+        waiting = sum(seconds for _, _, depth, seconds, interactive in self.phases if interactive and depth == 0)
+        return time.perf_counter() - self.start_time - waiting
+
+    # --- Report ---
+    def report(self, total: float) -> str:
+        lines = [f"⏱️ Startup profile: {total:.2f}s to window (budget {STARTUP_BUDGET_SECONDS:.2f}s)"]
+        if self.phases:
+            lines.append("  Phases:")
+            # Phases are recorded when they end; list them in start order
+            for _, name, depth, seconds, interactive in sorted(self.phases):
+                note = " (waiting on user, excluded)" if interactive else ""
+                lines.append(f"    {'  ' * depth}{name:<{28 - 2 * depth}} {seconds:7.3f}s{note}")
+        if self.imports:
+            top = sorted(self.imports.items(), key=lambda item: item[1][0], reverse=True)
+            top = [item for item in top if item[1][2] == 0][:STARTUP_REPORT_TOP]
+            lines.append("  Slowest top-level imports (cumulative / self):")
+            for name, (cumulative, own, _) in top:
+                lines.append(f"    {name:<28} {cumulative:7.3f}s / {own:.3f}s")
+            heaviest = sorted(self.imports.items(), key=lambda item: item[1][1], reverse=True)[:STARTUP_REPORT_TOP]
+            lines.append("  Heaviest modules (self time):")
+            for name, (_, own, _) in heaviest:
+                lines.append(f"    {name:<28} {own:7.3f}s")
+        return "\n".join(lines)
+
+    def finish(self):
+        """Stop tracking and print the report; call once the window is up"""
+        if self.finished:
+            return
+        self.finished = True
+        self.stop_import_tracking()
+        total = self.time_to_window()
+        from src.logger import logger
+        if self.enabled:
+            print(self.report(total))
+        else:
+            print(f"⏱️ Startup: {total:.2f}s to window")
+        logger.info(f"Startup took {total:.2f}s to window")
+        if total > STARTUP_BUDGET_SECONDS:
+            hint = "" if self.enabled else f"; run with {STARTUP_PROFILE_ARG} for details"
+            logger.warning(f"Startup exceeded its {STARTUP_BUDGET_SECONDS:.2f}s budget ({total:.2f}s){hint}")
+
+
+startup_profiler = StartupProfiler(
+    enabled=os.environ.get(STARTUP_PROFILE_ENV) == '1' or STARTUP_PROFILE_ARG in sys.argv)
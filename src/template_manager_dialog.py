@@ -17,7 +17,6 @@ from typing import Dict, List, Optional, Any
 import os
 
 from src.template_utils import (
-    get_available_templates,
     get_templates_by_category,
     get_template_by_name,
     create_template_from_current_settings,
@@ -27,7 +26,8 @@ from src.template_utils import (
     import_template,
     get_template_preview_info
 )
-from src.config import get_template_categories, save_template, delete_template, load_template
+from src.config import save_template, delete_template, load_template, get_available_templates
+from src.template_store import template_store
 from src.layer_manager import LayerManagerWidget
 
 class TemplateManagerDialog(QDialog):
@@ -286,7 +286,7 @@ class TemplateManagerDialog(QDialog):
         self.category_combo.addItem("All Categories", "all")
         
         # Load categories
-        categories = get_template_categories()
+        categories = template_store.categories()
         for category_id, category_info in categories.get('categories', {}).items():
             icon = category_info.get('icon', '')
             name = category_info.get('name', category_id)
@@ -643,40 +643,20 @@ class TemplateManagerDialog(QDialog):
         
     def filter_templates(self):
         """Filter templates based on category, search, and advanced filters"""
+        self.template_list.setUpdatesEnabled(False)
         self.template_list.clear()
         
-        selected_category = self.category_combo.currentData()
-        search_text = self.search_edit.text().lower()
-        selected_resolution = self.resolution_filter.currentData()
-        selected_fps = self.fps_filter.currentData()
+        # Filters are answered from the store's indexes; files were re-checked in load_templates
+        templates = template_store.query(
+            category=self.category_combo.currentData(),
+            resolution=self.resolution_filter.currentData(),
+            fps=self.fps_filter.currentData(),
+            text=self.search_edit.text(),
+            refresh=False,
+        )
+        categories = template_store.categories().get('categories', {})
         
-        for template in self.templates:
-            # Filter by category
-            if selected_category != "all" and template.get('category', '') != selected_category:
-                continue
-                
-            # Filter by search text
-            template_name = template.get('name', '').lower()
-            template_desc = template.get('description', '').lower()
-            if search_text and search_text not in template_name and search_text not in template_desc:
-                continue
-                
-            # Filter by resolution
-            if selected_resolution:
-                video_settings = template.get('video_settings', {})
-                template_resolution = video_settings.get('resolution', '')
-                if template_resolution != selected_resolution:
-                    continue
-                    
-            # Filter by FPS
-            if selected_fps:
-                video_settings = template.get('video_settings', {})
-                template_fps = str(video_settings.get('fps', ''))
-                if template_fps != selected_fps:
-                    continue
-                    
-
-                
+        for template in templates:
             # Add to list
             item = QListWidgetItem()
             template_name = template.get('name', 'Unknown Template')
@@ -685,13 +665,13 @@ class TemplateManagerDialog(QDialog):
             item.setData(Qt.ItemDataRole.UserRole, template)
             
             # Add category icon
-            categories = get_template_categories()
-            category_info = categories.get('categories', {}).get(template.get('category', ''), {})
+            category_info = categories.get(template.get('category', ''), {})
             icon = category_info.get('icon', '')
             if icon:
                 item.setText(f"{icon} {template_name}")
             
             self.template_list.addItem(item)
+        self.template_list.setUpdatesEnabled(True)
             
     def on_template_selected(self, item):
         """Handle template selection"""
@@ -710,7 +690,7 @@ class TemplateManagerDialog(QDialog):
         self.template_desc_label.setText(template_data.get('description', 'No description'))
         
         # Get category info
-        categories = get_template_categories()
+        categories = template_store.categories()
         category_info = categories.get('categories', {}).get(template_data.get('category', ''), {})
         category_name = category_info.get('name', template_data.get('category', 'Unknown'))
         category_icon = category_info.get('icon', '')
@@ -785,7 +765,7 @@ class TemplateManagerDialog(QDialog):
         desc_edit.setPlaceholderText("Enter template description")
         
         category_combo = QComboBox()
-        categories = get_template_categories()
+        categories = template_store.categories()
         for category_id, category_info in categories.get('categories', {}).items():
             icon = category_info.get('icon', '')
             name = category_info.get('name', category_id)
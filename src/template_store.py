@@ -0,0 +1,180 @@
+# This file uses PyQt6
+"""
+Indexed in-memory template store.
+
+Each template file in config/templates is parsed once and kept in memory
+together with its mtime and size. A refresh only re-reads files whose
+stat changed and drops files that disappeared, so listing templates costs
+one directory scan instead of a json.load per file. Templates are indexed
+by name, category, resolution and fps so filtering a large library does
+not walk every template. Category metadata is cached the same way.
+
+Returned template dicts are shared with the cache; treat them as read-only.
+"""
+import os
+import json
+import threading
+from typing import Any, Dict, List, Optional
+from src.config import get_templates_dir, get_template_categories
+from src.logger import logger
+
+TEMPLATE_EXTENSION = '.json'
+
+
+class _TemplateEntry:
+    __slots__ = ('key', 'mtime_ns', 'size', 'data', 'search_text')
+
+    def __init__(self, key: str, mtime_ns: int, size: int, data: Dict[str, Any]):
+        self.key = key
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.data = data
+        self.search_text = f"{data.get('name', '')}\n{data.get('description', '')}".lower()
+
+
+def _index_add(index: Dict[str, set], value, key: str):
+    index.setdefault(str(value), set()).add(key)
+
+
+class TemplateStore:
+    """Caches parsed templates and indexes them by name, category, resolution and fps"""
+
+    def __init__(self, templates_dir: Optional[str] = None):
+        self._templates_dir = templates_dir
+        self._entries: Dict[str, _TemplateEntry] = {}  # file name without .json -> entry
+        self._by_name: Dict[str, str] = {}
+        self._by_category: Dict[str, set] = {}
+        self._by_resolution: Dict[str, set] = {}
+        self._by_fps: Dict[str, set] = {}
+        self._order: List[str] = []
+        self._categories = None
+        self._categories_mtime = None
+        self._lock = threading.Lock()
+
+    @property
+    def templates_dir(self) -> str:
+        return self._templates_dir or get_templates_dir()
+
+    # --- Cache maintenance ---
+    def refresh(self) -> bool:
+        """Re-read changed template files. Returns True if anything changed."""
+        templates_dir = self.templates_dir
+        seen = {}
+        try:
+            with os.scandir(templates_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(TEMPLATE_EXTENSION) and entry.is_file():
+                        st = entry.stat()
+                        seen[entry.name[:-len(TEMPLATE_EXTENSION)]] = (st.st_mtime_ns, st.st_size)
+        except OSError as e:
+            logger.error(f"Error listing templates in {templates_dir}: {e}")
+            return False
+
+        with self._lock:
+            changed = False
+            for key in list(self._entries):
+                if key not in seen:
+                    del self._entries[key]
+                    changed = True
+            for key, (mtime_ns, size) in seen.items():
+                cached = self._entries.get(key)
+                if cached is not None and cached.mtime_ns == mtime_ns and cached.size == size:
+                    continue
+                data = self._read(os.path.join(templates_dir, key + TEMPLATE_EXTENSION))
+                if data:
+                    self._entries[key] = _TemplateEntry(key, mtime_ns, size, data)
+                else:
+                    self._entries.pop(key, None)
+                changed = True
+            if changed:
+                self._rebuild_indexes()
+            return changed
+
+    @staticmethod
+    def _read(path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else None
+        except (OSError, ValueError) as e:
+            print(f"Error loading template {os.path.basename(path)}: {e}")
+            return None
+
+    def _rebuild_indexes(self):
+        self._by_name = {}
+        self._by_category = {}
+        self._by_resolution = {}
+        self._by_fps = {}
+        self._order = sorted(self._entries)
+        for key in self._order:
+            data = self._entries[key].data
+            video_settings = data.get('video_settings', {})
+            self._by_name.setdefault(str(data.get('name', '')).lower(), key)
+            _index_add(self._by_category, data.get('category', ''), key)
+            _index_add(self._by_resolution, video_settings.get('resolution', ''), key)
+            _index_add(self._by_fps, video_settings.get('fps', ''), key)
+
+    def invalidate(self, template_key: Optional[str] = None):
+        """Forget one cached template file (or all) so the next refresh re-reads it"""
+        with self._lock:
+            if template_key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(template_key, None)
+            self._rebuild_indexes()
+
+    # --- Queries ---
+    def all(self) -> List[Dict[str, Any]]:
+        """All templates, sorted by file name"""
+        self.refresh()
+        return [self._entries[key].data for key in self._order]
+
+    def get(self, template_name: str) -> Optional[Dict[str, Any]]:
+        """Template by file name, normalized file name or display name"""
+        self.refresh()
+        normalized = template_name.lower().replace(' ', '_').replace('-', '_')
+        for key in (template_name, normalized, self._by_name.get(template_name.lower())):
+            if key and key in self._entries:
+                return self._entries[key].data
+        return None
+
+    def query(self, category: Optional[str] = None, resolution: Optional[str] = None,
+              fps=None, text: str = '', refresh: bool = True) -> List[Dict[str, Any]]:
+        """
+        Templates matching every given filter.
+
+        Args:
+            category / resolution / fps: Exact matches; None, "" or "all" means any
+            text: Case-insensitive substring of the name or description
+            refresh: Re-check files first; pass False while filtering interactively
+        """
+        if refresh:
+            self.refresh()
+        keys = None
+        for index, value in ((self._by_category, category), (self._by_resolution, resolution), (self._by_fps, fps)):
+            if value in (None, '', 'all'):
+                continue
+            matches = index.get(str(value), set())
+            keys = set(matches) if keys is None else keys & matches
+        candidates = self._order if keys is None else [key for key in self._order if key in keys]
+        text = text.lower()
+        return [self._entries[key].data for key in candidates
+                if not text or text in self._entries[key].search_text]
+
+    def categories(self) -> Dict[str, Any]:
+        """Category metadata, re-read only when template_categories.json changes"""
+        categories_file = os.path.join(os.path.dirname(self.templates_dir), "template_categories.json")
+        try:
+            mtime = os.stat(categories_file).st_mtime_ns
+        except OSError:
+            mtime = None
+        if self._categories is None or mtime is None or mtime != self._categories_mtime:
+            self._categories = get_template_categories()
+            try:
+                self._categories_mtime = os.stat(categories_file).st_mtime_ns
+            except OSError:
+                self._categories_mtime = None
+        return self._categories
+
+
+template_store = TemplateStore()
@@ -11,37 +11,19 @@ from datetime import datetime
 from src.config import (
     get_templates_dir, 
     save_template, 
-    load_template, 
-    get_available_templates,
     delete_template,
     get_template_categories
 )
+from src.template_store import template_store
 
 def get_template_by_name(template_name: str) -> Optional[Dict[str, Any]]:
     """Get template by name, handling different naming conventions"""
-    # Try exact name first
-    template = load_template(template_name)
-    if template:
-        return template
-    
-    # Try converting name to filename format
-    filename = template_name.lower().replace(' ', '_').replace('-', '_')
-    template = load_template(filename)
-    if template:
-        return template
-    
-    # Try searching through all templates
-    templates = get_available_templates()
-    for template_data in templates:
-        if template_data.get('name', '').lower() == template_name.lower():
-            return template_data
-    
-    return None
+    # Exact file name, then file name format, then display name (all indexed)
+    return template_store.get(template_name)
 
 def get_templates_by_category(category: str) -> List[Dict[str, Any]]:
     """Get all templates in a specific category"""
-    templates = get_available_templates()
-    return [t for t in templates if t.get('category', '') == category]
+    return template_store.query(category=category)
 
 def create_template_from_current_settings(
     name: str,
@@ -78,6 +60,32 @@ def create_template_from_current_settings(
     }
     return template
 
+def diff_template(current: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The parts of a template that differ from the current state, in template form.
+
+    video_settings, ui_settings and checkbox_labels are diffed per key,
+    layer_settings per layer; other sections (layer order, effect settings)
+    are kept whole when anything in them changed. Applying the result has the
+    same effect as applying the whole template.
+
+    A layer or section is only skipped when it equals the current state
+    exactly. Applying a layer resets every field the template leaves out to
+    its default (e.g. {'enabled': False} also resets size and position), so a
+    partial entry that merely agrees on the fields it lists is still applied.
+    """
+    patch = {}
+    for key, value in new.items():
+        old = current.get(key)
+        if key in ('video_settings', 'ui_settings', 'checkbox_labels', 'layer_settings') and isinstance(value, dict):
+            old = old if isinstance(old, dict) else {}
+            changed = {k: v for k, v in value.items() if old.get(k) != v}
+            if changed:
+                patch[key] = changed
+        elif old != value:
+            patch[key] = value
+    return patch
+
 def apply_template_to_settings(template_data: Dict[str, Any]) -> Dict[str, Any]:
     """Convert template data to application settings format"""
     settings = {}
@@ -15,43 +15,92 @@ from PyQt6.QtCore import (
     QTimer, pyqtSignal, QThread, pyqtSlot, QPoint, Qt
 )
 from PyQt6.QtGui import QFont, QTextCursor, QPalette, QColor, QIcon, QCursor, QMouseEvent, QKeySequence, QPainter, QBrush, QShortcut
-import queue
 import threading
 import time
+from collections import deque
+
+# Lines kept in the terminal; older output is dropped
+TERMINAL_MAX_LINES = 5000
+# Terminal repaint interval (10 fps)
+TERMINAL_REFRESH_MS = 100
+# Minimum gap between flushes of the real stdout for progress-only writes
+STDOUT_FLUSH_INTERVAL = 0.25
+
+class TerminalBuffer:
+    """Thread-safe ring buffer of output lines waiting to be rendered"""
+    
+    def __init__(self, max_lines=TERMINAL_MAX_LINES):
+        self._lock = threading.Lock()
+        self._pending = deque(maxlen=max_lines)  # Completed lines not yet rendered
+        self._current = ""  # Last, still open line (overwritten by \r)
+        self._dirty = False
+        
+    def write(self, text):
+        """Add text, collapsing carriage-return updates to the latest value"""
+        if not text:
+            return
+        with self._lock:
+            segments = text.split('\n')
+            last = len(segments) - 1
+            for i, segment in enumerate(segments):
+                if i < last and segment.endswith('\r'):
+                    segment = segment[:-1]  # \r\n line ending
+                if '\r' in segment:
+                    # Progress update: only the text after the last \r survives
+                    self._current = segment.rsplit('\r', 1)[1]
+                else:
+                    self._current += segment
+                if i < last:
+                    self._pending.append(self._current)
+                    self._current = ""
+            self._dirty = True
+            
+    def take(self):
+        """
+        Collect everything written since the last call.
+        
+        Returns:
+            None if nothing changed, otherwise (completed_lines, current_line).
+            The first completed line includes the open line shown last time.
+        """
+        with self._lock:
+            if not self._dirty:
+                return None
+            lines = list(self._pending)
+            self._pending.clear()
+            self._dirty = False
+            return lines, self._current
+            
+    def reset(self):
+        """Drop pending output and the open line"""
+        with self._lock:
+            self._pending.clear()
+            self._current = ""
+            self._dirty = False
 
 class ConsoleCapture:
-    """Captures stdout and stderr to a queue"""
+    """Captures stdout and stderr into a TerminalBuffer"""
     
-    def __init__(self, queue):
-        self.queue = queue
+    def __init__(self, buffer):
+        self.buffer = buffer
         self.original_stdout = sys.stdout
         self.original_stderr = sys.stderr
-        self.current_line = ""
+        self._last_flush = 0.0
         
     def write(self, text):
-        # Handle carriage return for progress bars
-        if '\r' in text:
-            # Split by carriage return and get the last part
-            parts = text.split('\r')
-            if len(parts) > 1:
-                # The last part after \r is the new content
-                self.current_line = parts[-1]
-                # Send the full line to be displayed
-                self.queue.put(('stdout', f'\r{self.current_line}'))
-            else:
-                # Just a carriage return, clear the line
-                self.current_line = ""
-                self.queue.put(('stdout', '\r'))
-        else:
-            # Regular text, append to current line
-            self.current_line += text
-            self.queue.put(('stdout', text))
-            
+        self.buffer.write(text)
+        if self.original_stdout is None:
+            return
         self.original_stdout.write(text)
-        self.original_stdout.flush()
+        # Progress updates arrive many times a second; only flush those periodically
+        now = time.monotonic()
+        if '\n' in text or now - self._last_flush >= STDOUT_FLUSH_INTERVAL:
+            self._last_flush = now
+            self.original_stdout.flush()
         
     def flush(self):
-        self.original_stdout.flush()
+        if self.original_stdout is not None:
+            self.original_stdout.flush()
         
     def restore(self):
         sys.stdout = self.original_stdout
@@ -99,11 +148,11 @@ class TerminalWidget(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.output_queue = queue.Queue()
+        self.output_buffer = TerminalBuffer()
         self.console_capture = None
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.process_queue)
-        self.update_timer.start(100)  # Update every 100ms
+        self.update_timer.start(TERMINAL_REFRESH_MS)  # Repaint at a fixed rate
         
         self.init_ui()
         self.start_capture()
@@ -287,6 +336,9 @@ class TerminalWidget(QWidget):
         self.terminal_output = QTextEdit()
         self.terminal_output.setReadOnly(True)
         self.terminal_output.setLineWrapMode(QTextEdit.LineWrapMode.WidgetWidth)
+        self.terminal_output.setUndoRedoEnabled(False)
+        # Cap retained lines; the oldest blocks are dropped automatically
+        self.terminal_output.document().setMaximumBlockCount(TERMINAL_MAX_LINES)
         
         # Disable horizontal scrollbar
         self.terminal_output.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
@@ -335,6 +387,7 @@ class TerminalWidget(QWidget):
         # Add initial message
         self.append_output("💫 SuperCut is ready... \n")
         self.append_output("-" * 25+ "\n")
+        self.process_queue()
         
     def close_terminal(self):
         """Close the terminal widget"""
@@ -342,7 +395,7 @@ class TerminalWidget(QWidget):
         
     def start_capture(self):
         """Start capturing stdout and stderr"""
-        self.console_capture = ConsoleCapture(self.output_queue)
+        self.console_capture = ConsoleCapture(self.output_buffer)
         sys.stdout = self.console_capture
         sys.stderr = self.console_capture
         
@@ -352,47 +405,30 @@ class TerminalWidget(QWidget):
             self.console_capture.restore()
             
     def process_queue(self):
-        """Process queued output"""
-        try:
-            while True:
-                output_type, text = self.output_queue.get_nowait()
-                self.append_output(text)
-        except queue.Empty:
-            pass
-            
-    def append_output(self, text):
-        """Append text to terminal output"""
-        cursor = self.terminal_output.textCursor()
-        
-        # Handle carriage return for progress bars
-        if '\r' in text:
-            # Move to the beginning of the last line
-            cursor.movePosition(QTextCursor.MoveOperation.End)
-            cursor.movePosition(QTextCursor.MoveOperation.StartOfLine, QTextCursor.MoveMode.KeepAnchor)
-            
-            # Get the text after the carriage return
-            parts = text.split('\r')
-            if len(parts) > 1:
-                new_content = parts[-1]
-                # Replace the current line with new content
-                cursor.insertText(new_content)
-            else:
-                # Just clear the line
-                cursor.removeSelectedText()
-        else:
-            # Regular text, append normally
-            cursor.movePosition(QTextCursor.MoveOperation.End)
-            self.terminal_output.setTextCursor(cursor)
-            
-            # Insert the full text without truncation
-            self.terminal_output.insertPlainText(text)
+        """Render everything buffered since the last tick in one edit"""
+        update = self.output_buffer.take()
+        if update is None:
+            return
+        lines, current = update
+        
+        # Replace the open last line with the completed lines and the new open line
+        cursor = QTextCursor(self.terminal_output.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.movePosition(QTextCursor.MoveOperation.StartOfBlock, QTextCursor.MoveMode.KeepAnchor)
+        cursor.insertText("\n".join(lines + [current]))
         
         # Auto-scroll if enabled
         if self.auto_scroll_btn.isChecked():
-            self.terminal_output.ensureCursorVisible()
+            scrollbar = self.terminal_output.verticalScrollBar()
+            scrollbar.setValue(scrollbar.maximum())
+            
+    def append_output(self, text):
+        """Append text to terminal output (shown on the next repaint)"""
+        self.output_buffer.write(text)
         
     def clear_output(self):
         """Clear terminal output"""
+        self.output_buffer.reset()
         self.terminal_output.clear()
         self.append_output("Terminal cleared.\n")
         
@@ -7,10 +7,10 @@ from PyQt6.QtWidgets import (
     QDialog, QLabel, QVBoxLayout, QHBoxLayout, QPushButton, 
     QSpacerItem, QSizePolicy, QLineEdit, QProgressBar, QWidget,
     QScrollArea, QFrame, QTextEdit, QTableWidget, QTableWidgetItem, QHeaderView,
-    QComboBox
+    QComboBox, QSlider
 )
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QMovie, QIcon, QFont, QShortcut, QKeySequence, QWheelEvent, QFontDatabase
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QMovie, QIcon, QFont, QShortcut, QKeySequence, QWheelEvent, QFontDatabase, QPixmap
 
 from src.utils import clean_file_path
 
@@ -772,6 +772,104 @@ class DryRunSuccessDialog(QDialog):
         self.close()
         return None
 
+class FramePreviewDialog(QDialog):
+    """Shows single composed frames of the dry run; the slider scrubs through the timeline"""
+    frame_requested = pyqtSignal(float)
+
+    SCRUB_DELAY_MS = 150  # Wait this long after the slider stops before rendering
+
+    def __init__(self, parent=None, duration=0.0, start_time=0.0):
+        super().__init__(parent)
+        self.setWindowTitle("Frame Preview")
+        self.setMinimumSize(680, 460)
+        self._busy = False
+        self._pending_time = None
+        self._pixmap = None
+
+        vbox = QVBoxLayout(self)
+        vbox.setContentsMargins(12, 12, 12, 12)
+        vbox.setSpacing(8)
+
+        self.image_label = QLabel("Rendering...")
+        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.image_label.setMinimumSize(640, 360)
+        self.image_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.image_label.setStyleSheet("background: #222; color: #ccc; border-radius: 6px;")
+        vbox.addWidget(self.image_label)
+
+        # Slider works in tenths of a second
+        self.slider = QSlider(Qt.Orientation.Horizontal)
+        self.slider.setRange(0, max(1, int(duration * 10)))
+        self.slider.setValue(int(start_time * 10))
+        vbox.addWidget(self.slider)
+
+        status_row = QHBoxLayout()
+        self.time_label = QLabel()
+        self.status_label = QLabel()
+        self.status_label.setStyleSheet("color: #666;")
+        status_row.addWidget(self.time_label)
+        status_row.addStretch()
+        status_row.addWidget(self.status_label)
+        vbox.addLayout(status_row)
+
+        self._duration = duration
+        self._scrub_timer = QTimer(self)
+        self._scrub_timer.setSingleShot(True)
+        self._scrub_timer.timeout.connect(lambda: self.request_frame(self.slider.value() / 10))
+        self.slider.valueChanged.connect(self._on_slider_changed)
+        self._update_time_label()
+
+        QShortcut(QKeySequence("Ctrl+W"), self, self.close)
+
+    @staticmethod
+    def _format_time(seconds):
+        minutes, seconds = divmod(seconds, 60)
+        return f"{int(minutes):02d}:{seconds:04.1f}"
+
+    def _update_time_label(self):
+        self.time_label.setText(f"{self._format_time(self.slider.value() / 10)} / {self._format_time(self._duration)}")
+
+    def _on_slider_changed(self, _value):
+        self._update_time_label()
+        self._scrub_timer.start(self.SCRUB_DELAY_MS)
+
+    def request_frame(self, seconds):
+        """Ask for the frame at seconds; while one renders, only the latest request is kept"""
+        if self._busy:
+            self._pending_time = seconds
+            return
+        self._busy = True
+        self.status_label.setText(f"Rendering {self._format_time(seconds)}...")
+        self.frame_requested.emit(seconds)
+
+    def _finish_request(self):
+        self._busy = False
+        if self._pending_time is not None:
+            seconds, self._pending_time = self._pending_time, None
+            self.request_frame(seconds)
+
+    def set_frame(self, image_path, seconds, elapsed=None):
+        """Show a rendered frame"""
+        self._pixmap = QPixmap(image_path)
+        self._show_pixmap()
+        took = f" ({elapsed:.2f}s)" if elapsed is not None else ""
+        self.status_label.setText(f"Frame at {self._format_time(seconds)}{took}")
+        self._finish_request()
+
+    def set_error(self, message):
+        self.status_label.setText("Preview failed")
+        self.image_label.setToolTip(message)
+        self._finish_request()
+
+    def _show_pixmap(self):
+        if self._pixmap is not None and not self._pixmap.isNull():
+            self.image_label.setPixmap(self._pixmap.scaled(
+                self.image_label.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._show_pixmap()
+
 class ScrollableErrorDialog(QDialog):
     """Dialog for displaying long error messages/logs in a scrollable area."""
     def __init__(self, parent=None, title="Error Log", message=""):
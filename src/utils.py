@@ -1,23 +1,35 @@
 # This file uses PyQt6
 import os
 import re
-import ctypes
 import tempfile
 import atexit
-from typing import Set
+import threading
+import time
+from typing import Dict, List, Set, Optional
 from src.logger import logger
+from src.resource_governor import resource_governor
+from src.metrics import metrics
 import shutil
-from mutagen.easyid3 import EasyID3
-from mutagen.mp3 import MP3
-from mutagen.id3 import ID3
-from mutagen.id3._frames import APIC
-from PIL import Image, ImageDraw, ImageFont
+# PIL and mutagen are imported inside the functions that use them, so
+# importing this module (and starting the UI) does not load them
 
 # Global set to track temporary files
 TEMP_FILES: Set[str] = set()
 
 MIN_FREE_SPACE_BYTES = 100 * 1024 * 1024  # 100MB
 
+# Per-batch temp workspace limits
+TEMP_WORKSPACE_BUDGET_BYTES = 20 * 1024 * 1024 * 1024  # 20GB (merged audio, soundwave movies)
+TEMP_WORKSPACE_RAM_BUDGET_BYTES = 256 * 1024 * 1024  # 256MB of small assets on tmpfs
+RAM_DISK_DIR = "/dev/shm"
+# Small assets that may be placed on the RAM disk; large intermediates stay on disk
+RAM_DISK_SUFFIXES = ('.png', '.jpg', '.jpeg', '.txt')
+WORKSPACE_PREFIX = "supercut_ws_"
+
+# Workspace active on the current thread (create_temp_file places files there)
+_workspace_state = threading.local()
+_ACTIVE_WORKSPACES: Set["TempWorkspace"] = set()
+
 def sanitize_filename(name: str) -> str:
     """Remove invalid filename characters: <>:"/\\|?*"""
     return re.sub(r'[<>:"/\\|?*]', '_', name)
@@ -59,16 +71,6 @@ def get_desktop_folder() -> str:
     """Get the desktop folder path"""
     return os.path.join(os.path.expanduser("~"), "Desktop")
 
-def set_low_priority():
-    """Set process priority to below normal (Windows only)"""
-    try:
-        p = ctypes.windll.kernel32.GetCurrentProcess()
-        ctypes.windll.kernel32.SetPriorityClass(p, 0x00004000)  # BELOW_NORMAL_PRIORITY_CLASS
-    except AttributeError as e:
-        logger.warning(f"ctypes.windll not available: {e}")
-    except OSError as e:
-        logger.warning(f"OS error setting low priority: {e}")
-
 def has_enough_disk_space(path: str, required_bytes: int) -> bool:
     """Check if the filesystem containing 'path' has at least required_bytes free."""
     try:
@@ -84,8 +86,140 @@ def has_enough_disk_space(path: str, required_bytes: int) -> bool:
         logger.warning(f"OS error checking disk space for {path}: {e}")
         return False
 
+class TempWorkspace:
+    """Scoped temp directory for one batch with a byte budget.
+
+    While entered, create_temp_file on the same thread puts files in this
+    workspace instead of the shared temp dir. Everything is deleted as soon
+    as the workspace exits, so a long run never accumulates temp files.
+    Small assets (PNG/JPG/list files) can optionally live on a RAM disk.
+
+    Usage is a running count of the files this workspace handed out: each
+    new_file() stats only the files created since the previous call, and
+    used_bytes() re-stats them all when a stage finishes.
+    """
+
+    def __init__(self, budget_bytes: int = TEMP_WORKSPACE_BUDGET_BYTES, use_ram_disk: bool = False,
+                 ram_budget_bytes: int = TEMP_WORKSPACE_RAM_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self.ram_budget_bytes = ram_budget_bytes
+        self.use_ram_disk = use_ram_disk
+        self.disk_dir: Optional[str] = None
+        self.ram_dir: Optional[str] = None
+        self._previous: Optional["TempWorkspace"] = None
+        self._lock = threading.Lock()
+        self._sizes: Dict[str, int] = {}
+        self._pending: List[str] = []
+        self._dir_bytes: Dict[str, int] = {}
+
+    def __enter__(self) -> "TempWorkspace":
+        temp_root = tempfile.gettempdir()
+        # One free-space check per workspace instead of one per temp file
+        if not has_enough_disk_space(temp_root, MIN_FREE_SPACE_BYTES):
+            logger.error(f"Not enough disk space to create temp workspace in {temp_root}. At least {MIN_FREE_SPACE_BYTES // (1024*1024)}MB required.")
+            raise OSError(f"Not enough disk space to create temp workspace in {temp_root}.")
+        self.disk_dir = tempfile.mkdtemp(prefix=WORKSPACE_PREFIX, dir=temp_root)
+        if self.use_ram_disk:
+            if os.path.isdir(RAM_DISK_DIR) and os.access(RAM_DISK_DIR, os.W_OK):
+                self.ram_dir = tempfile.mkdtemp(prefix=WORKSPACE_PREFIX, dir=RAM_DISK_DIR)
+            else:
+                logger.info(f"RAM disk {RAM_DISK_DIR} not available, using {temp_root} for all temp files")
+        self._previous = getattr(_workspace_state, 'current', None)
+        _workspace_state.current = self
+        _ACTIVE_WORKSPACES.add(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+    def _measure(self, paths: List[str]):
+        """Update the running counters with the current size of paths (caller holds the lock)"""
+        for path in paths:
+            try:
+                size = os.stat(path).st_size
+            except OSError:
+                size = None
+            directory = os.path.dirname(path)
+            self._dir_bytes[directory] = self._dir_bytes.get(directory, 0) + (size or 0) - self._sizes.get(path, 0)
+            if size is None:
+                # Deleted by its stage; no longer counted
+                self._sizes.pop(path, None)
+            else:
+                self._sizes[path] = size
+
+    def used_bytes(self, ram: bool = False) -> int:
+        """Bytes currently held by this workspace's files on disk (or on the RAM disk)"""
+        with self._lock:
+            self._measure(list(self._sizes) + self._pending)
+            self._pending = []
+            return self._dir_bytes.get(self.ram_dir if ram else self.disk_dir, 0)
+
+    def new_file(self, suffix: str = "") -> str:
+        """Create an empty file in the workspace, enforcing the byte budget"""
+        with self._lock:
+            # Files handed out earlier are written by now; only those are stat'ed
+            self._measure(self._pending)
+            self._pending = []
+            target_dir = self.disk_dir
+            if self.ram_dir and suffix.lower().endswith(RAM_DISK_SUFFIXES):
+                if self._dir_bytes.get(self.ram_dir, 0) < self.ram_budget_bytes:
+                    target_dir = self.ram_dir
+            if target_dir == self.disk_dir and self._dir_bytes.get(self.disk_dir, 0) >= self.budget_bytes:
+                logger.error(f"Temp workspace budget of {self.budget_bytes // (1024*1024)}MB exceeded in {self.disk_dir}.")
+                raise OSError(f"Temp workspace budget exceeded ({self.budget_bytes // (1024*1024)}MB).")
+            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix, prefix="supercut_", dir=target_dir) as tmp:
+                self._pending.append(tmp.name)
+                return tmp.name
+
+    def release(self):
+        """Delete the workspace directories and restore the previous workspace"""
+        for path in (self.ram_dir, self.disk_dir):
+            if path and os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+        self.ram_dir = None
+        self.disk_dir = None
+        with self._lock:
+            self._sizes.clear()
+            self._pending = []
+            self._dir_bytes.clear()
+        if getattr(_workspace_state, 'current', None) is self:
+            _workspace_state.current = self._previous
+        _ACTIVE_WORKSPACES.discard(self)
+
+def cleanup_stale_workspaces(max_age_hours: float = 12):
+    """Remove workspace directories left behind by a crashed run"""
+    cutoff = time.time() - max_age_hours * 3600
+    for root in (tempfile.gettempdir(), RAM_DISK_DIR):
+        if not os.path.isdir(root):
+            continue
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    try:
+                        if entry.name.startswith(WORKSPACE_PREFIX) and entry.is_dir() and entry.stat().st_mtime < cutoff:
+                            shutil.rmtree(entry.path, ignore_errors=True)
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.warning(f"Could not scan {root} for stale temp workspaces: {e}")
+
+def temp_bytes_in_use() -> int:
+    """Bytes held by all active temp workspaces (RAM disk included)"""
+    return sum(workspace.used_bytes() + workspace.used_bytes(ram=True) for workspace in list(_ACTIVE_WORKSPACES))
+
+metrics.register_gauge("temp_bytes_in_use", temp_bytes_in_use)
+
+def current_workspace() -> Optional[TempWorkspace]:
+    """The TempWorkspace active on this thread, if any"""
+    return getattr(_workspace_state, 'current', None)
+
 def create_temp_file(suffix: str = "", prefix: str = "") -> str:
-    """Create a temporary file and track it for cleanup. Checks for minimum free disk space."""
+    """Create a temporary file. Inside a TempWorkspace the file lives in the workspace;
+    otherwise it is tracked for cleanup after checking for minimum free disk space."""
+    workspace = getattr(_workspace_state, 'current', None)
+    if workspace is not None:
+        return workspace.new_file(suffix)
     unique_prefix = "supercut_"
     temp_dir = tempfile.gettempdir()
     if not has_enough_disk_space(temp_dir, MIN_FREE_SPACE_BYTES):
@@ -96,6 +230,28 @@ def create_temp_file(suffix: str = "", prefix: str = "") -> str:
         TEMP_FILES.add(temp_path)
         return temp_path
 
+def persist_temp_assets(settings: dict, asset_dir: str, roots: Optional[list] = None) -> dict:
+    """Copy generated temp files referenced by job settings (e.g. the frame box PNG) into asset_dir.
+
+    Temp files are deleted when the app exits, so a job kept for later (render
+    queue) or handed to another host (render farm) needs its own copies.
+    Returns the settings with those paths rewritten.
+    """
+    roots = [os.path.realpath(root) for root in (roots or [tempfile.gettempdir()])]
+    persisted = dict(settings)
+    for key, value in settings.items():
+        if not isinstance(value, str) or not value or not os.path.isfile(value):
+            continue
+        real = os.path.realpath(value)
+        if not any(real.startswith(root + os.sep) for root in roots):
+            continue
+        os.makedirs(asset_dir, exist_ok=True)
+        target = os.path.join(os.path.abspath(asset_dir), os.path.basename(value))
+        if os.path.realpath(target) != real:
+            shutil.copy2(value, target)
+        persisted[key] = target
+    return persisted
+
 def cleanup_temp_files():
     """Clean up all tracked temporary files that start with our unique prefix.
     Note: This only runs on normal interpreter exit. If the app is killed abruptly (e.g., SIGKILL), temp files may remain. Consider providing a manual cleanup utility if this is a concern.
@@ -113,6 +269,8 @@ def cleanup_temp_files():
             logger.warning(f"OS error removing temp file {file_path}: {e}")
         TEMP_FILES.discard(file_path)
     TEMP_FILES.clear()
+    for workspace in list(_ACTIVE_WORKSPACES):
+        workspace.release()
 
 def open_folder_in_explorer(folder_path: str):
     """Open a folder in the system's file explorer"""
@@ -152,8 +310,7 @@ def is_overlay_file(filename: str) -> bool:
 def is_video_valid(path):
     """Check if a video file is valid using ffprobe"""
     try:
-        import subprocess
-        result = subprocess.run(['ffprobe', '-v', 'quiet', '-print_format', 'json', '-show_format', '-show_streams', path], 
+        result = resource_governor.run(['ffprobe', '-v', 'quiet', '-print_format', 'json', '-show_format', '-show_streams', path], 
                               capture_output=True, text=True, timeout=10)
         return result.returncode == 0
     except Exception:
@@ -205,6 +362,7 @@ def validate_inputs(media_sources: str, export_name: str, number: str) -> tuple[
     return True, ""
 
 def is_image_valid(path):
+    from PIL import Image
     try:
         with Image.open(path) as img:
             img.verify()
@@ -213,6 +371,7 @@ def is_image_valid(path):
         return False
 
 def is_mp3_valid(path):
+    from mutagen.mp3 import MP3
     try:
         MP3(path)
         return True
@@ -237,6 +396,8 @@ def extract_mp3_title(mp3_path):
     Extract the song title from an MP3 file's metadata.
     Returns the title as a string, or the filename (without extension) if not found.
     """
+    from mutagen.easyid3 import EasyID3
+    from mutagen.mp3 import MP3
     try:
         audio = MP3(mp3_path, ID3=EasyID3)
         title = audio.get('title', None)
@@ -269,6 +430,7 @@ def create_song_title_png(title, output_path, width=400, height=40, font_size=12
         text_effect_intensity (int): Intensity of the text effect (0-100).
         bottom_padding (int): Extra transparent pixels to add at the bottom.
     """
+    from PIL import Image, ImageDraw, ImageFont
     from src.config import PROJECT_ROOT
     total_height = height + bottom_padding
     # Create image with background
@@ -456,7 +618,6 @@ def extract_mp3_cover_with_ffmpeg(mp3_path, output_path):
     """
     try:
         from src.config import FFMPEG_BINARY
-        import subprocess
         
         # Try different stream mappings as cover art can be at different indexes
         stream_mappings = ["0:v:0", "0:1", "0:2", "0:v"]
@@ -473,7 +634,7 @@ def extract_mp3_cover_with_ffmpeg(mp3_path, output_path):
                 "-y"  # Overwrite output file
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = resource_governor.run(cmd, capture_output=True, text=True)
             
             if result.returncode == 0:
                 # Check if file was actually created and has content
@@ -507,6 +668,8 @@ def extract_mp3_cover_image(mp3_path):
         else:
             # Fallback to mutagen if FFmpeg fails
             try:
+                from mutagen.id3 import ID3
+                from mutagen.mp3 import MP3
                 audio = MP3(mp3_path, ID3=ID3)
                 
                 # Look for attached picture frames
@@ -545,6 +708,7 @@ def create_framed_cover_image(cover_data_or_path, output_path, frame_width=10, f
         frame_width: Width of the frame in pixels (default 10px)
         frame_color: RGB tuple for frame color (default white)
     """
+    from PIL import Image, ImageDraw
     try:
         # Load the image
         if isinstance(cover_data_or_path, bytes):
@@ -642,7 +806,6 @@ def preprocess_background_image(image_path: str, resolution: str, scale_percent:
     """
     try:
         from PIL import Image, ImageFilter, ImageEnhance
-        import subprocess
         from src.config import FFMPEG_BINARY
         from src.logger import logger
         
@@ -715,7 +878,7 @@ def preprocess_background_image(image_path: str, resolution: str, scale_percent:
         ]
         
         # Execute FFmpeg command
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = resource_governor.run(cmd, capture_output=True, text=True)
         if result.returncode != 0:
             logger.error(f"FFmpeg preprocessing failed: {result.stderr}")
             # Fallback to original image
@@ -744,7 +907,6 @@ def preprocess_overlay1_image(image_path: str, size_percent: int = 100) -> str:
         Path to the processed temporary file or original path if no preprocessing
     """
     try:
-        import subprocess
         from src.config import FFMPEG_BINARY
         from src.logger import logger
         
@@ -781,7 +943,7 @@ def preprocess_overlay1_image(image_path: str, size_percent: int = 100) -> str:
                 temp_processed_path
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = resource_governor.run(cmd, capture_output=True, text=True)
             if result.returncode != 0:
                 logger.error(f"FFmpeg overlay1 preprocessing failed: {result.stderr}")
                 # Fallback to original image
@@ -810,7 +972,6 @@ def preprocess_overlay2_image(image_path: str, size_percent: int = 10) -> str:
         Path to the processed temporary file or original path if no preprocessing
     """
     try:
-        import subprocess
         from src.config import FFMPEG_BINARY
         from src.logger import logger
         
@@ -847,7 +1008,7 @@ def preprocess_overlay2_image(image_path: str, size_percent: int = 10) -> str:
                 temp_processed_path
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = resource_governor.run(cmd, capture_output=True, text=True)
             if result.returncode != 0:
                 logger.error(f"FFmpeg overlay2 preprocessing failed: {result.stderr}")
                 # Fallback to original image
@@ -877,7 +1038,6 @@ def preprocess_overlay3_image(image_path: str, size_percent: int = 10) -> str:
         Path to the processed temporary file or original path if no preprocessing
     """
     try:
-        import subprocess
         from src.config import FFMPEG_BINARY
         from src.logger import logger
         
@@ -914,7 +1074,7 @@ def preprocess_overlay3_image(image_path: str, size_percent: int = 10) -> str:
                 temp_processed_path
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = resource_governor.run(cmd, capture_output=True, text=True)
             if result.returncode != 0:
                 logger.error(f"FFmpeg overlay3 preprocessing failed: {result.stderr}")
                 # Fallback to original image
@@ -944,7 +1104,6 @@ def preprocess_overlay4_image(image_path: str, size_percent: int = 10) -> str:
         Path to the processed temporary file or original path if no preprocessing
     """
     try:
-        import subprocess
         from src.config import FFMPEG_BINARY
         from src.logger import logger
         
@@ -981,7 +1140,7 @@ def preprocess_overlay4_image(image_path: str, size_percent: int = 10) -> str:
                 temp_processed_path
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = resource_governor.run(cmd, capture_output=True, text=True)
             if result.returncode != 0:
                 logger.error(f"FFmpeg overlay4 preprocessing failed: {result.stderr}")
                 # Fallback to original image
@@ -1011,7 +1170,6 @@ def preprocess_overlay5_image(image_path: str, size_percent: int = 10) -> str:
         Path to the processed temporary file or original path if no preprocessing
     """
     try:
-        import subprocess
         from src.config import FFMPEG_BINARY
         from src.logger import logger
         
@@ -1048,7 +1206,7 @@ def preprocess_overlay5_image(image_path: str, size_percent: int = 10) -> str:
                 temp_processed_path
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = resource_governor.run(cmd, capture_output=True, text=True)
             if result.returncode != 0:
                 logger.error(f"FFmpeg overlay5 preprocessing failed: {result.stderr}")
                 # Fallback to original image
@@ -1078,7 +1236,6 @@ def preprocess_overlay6_image(image_path: str, size_percent: int = 10) -> str:
         Path to the processed temporary file or original path if no preprocessing
     """
     try:
-        import subprocess
         from src.config import FFMPEG_BINARY
         from src.logger import logger
         
@@ -1115,7 +1272,7 @@ def preprocess_overlay6_image(image_path: str, size_percent: int = 10) -> str:
                 temp_processed_path
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = resource_governor.run(cmd, capture_output=True, text=True)
             if result.returncode != 0:
                 logger.error(f"FFmpeg overlay6 preprocessing failed: {result.stderr}")
                 # Fallback to original image
@@ -1145,7 +1302,6 @@ def preprocess_overlay7_image(image_path: str, size_percent: int = 10) -> str:
         Path to the processed temporary file or original path if no preprocessing
     """
     try:
-        import subprocess
         from src.config import FFMPEG_BINARY
         from src.logger import logger
         
@@ -1182,7 +1338,7 @@ def preprocess_overlay7_image(image_path: str, size_percent: int = 10) -> str:
                 temp_processed_path
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = resource_governor.run(cmd, capture_output=True, text=True)
             if result.returncode != 0:
                 logger.error(f"FFmpeg overlay7 preprocessing failed: {result.stderr}")
                 # Fallback to original image
@@ -1212,7 +1368,6 @@ def preprocess_intro_image(image_path: str, size_percent: int = 10) -> str:
         Path to the processed temporary file or original path if no preprocessing
     """
     try:
-        import subprocess
         from src.config import FFMPEG_BINARY
         from src.logger import logger
         
@@ -1249,7 +1404,7 @@ def preprocess_intro_image(image_path: str, size_percent: int = 10) -> str:
                 temp_processed_path
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = resource_governor.run(cmd, capture_output=True, text=True)
             if result.returncode != 0:
                 logger.error(f"FFmpeg intro preprocessing failed: {result.stderr}")
                 # Fallback to original image
@@ -1278,7 +1433,6 @@ def preprocess_overlay8_image(image_path: str, size_percent: int = 10) -> str:
         Path to the processed temporary file or original path if no preprocessing
     """
     try:
-        import subprocess
         from src.config import FFMPEG_BINARY
         from src.logger import logger
         
@@ -1315,7 +1469,7 @@ def preprocess_overlay8_image(image_path: str, size_percent: int = 10) -> str:
                 temp_processed_path
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = resource_governor.run(cmd, capture_output=True, text=True)
             if result.returncode != 0:
                 logger.error(f"FFmpeg overlay8 preprocessing failed: {result.stderr}")
                 # Fallback to original image
@@ -1345,7 +1499,6 @@ def preprocess_overlay9_image(image_path: str, size_percent: int = 10) -> str:
         Path to the processed temporary file or original path if no preprocessing
     """
     try:
-        import subprocess
         from src.config import FFMPEG_BINARY
         from src.logger import logger
         
@@ -1382,7 +1535,7 @@ def preprocess_overlay9_image(image_path: str, size_percent: int = 10) -> str:
                 temp_processed_path
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = resource_governor.run(cmd, capture_output=True, text=True)
             if result.returncode != 0:
                 logger.error(f"FFmpeg overlay9 preprocessing failed: {result.stderr}")
                 # Fallback to original image
@@ -1412,7 +1565,6 @@ def preprocess_framebox_image(image_path: str, size_percent: int = 50) -> str:
         Path to the processed temporary file or original path if no preprocessing
     """
     try:
-        import subprocess
         from src.config import FFMPEG_BINARY
         from src.logger import logger
         
@@ -1449,7 +1601,7 @@ def preprocess_framebox_image(image_path: str, size_percent: int = 50) -> str:
                 temp_processed_path
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = resource_governor.run(cmd, capture_output=True, text=True)
             if result.returncode != 0:
                 logger.error(f"FFmpeg framebox preprocessing failed: {result.stderr}")
                 # Fallback to original image
@@ -1479,7 +1631,6 @@ def preprocess_frame_mp3cover_image(image_path: str, size_percent: int = 50) ->
         Path to the processed temporary file or original path if no preprocessing
     """
     try:
-        import subprocess
         from src.config import FFMPEG_BINARY
         from src.logger import logger
         
@@ -1516,7 +1667,7 @@ def preprocess_frame_mp3cover_image(image_path: str, size_percent: int = 50) ->
                 temp_processed_path
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = resource_governor.run(cmd, capture_output=True, text=True)
             if result.returncode != 0:
                 logger.error(f"FFmpeg frame_mp3cover preprocessing failed: {result.stderr}")
                 # Fallback to original image
@@ -1546,7 +1697,6 @@ def preprocess_overlay10_image(image_path: str, size_percent: int = 10) -> str:
         Path to the processed temporary file or original path if no preprocessing
     """
     try:
-        import subprocess
         from src.config import FFMPEG_BINARY
         from src.logger import logger
         
@@ -1583,7 +1733,7 @@ def preprocess_overlay10_image(image_path: str, size_percent: int = 10) -> str:
                 temp_processed_path
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = resource_governor.run(cmd, capture_output=True, text=True)
             if result.returncode != 0:
                 logger.error(f"FFmpeg overlay10 preprocessing failed: {result.stderr}")
                 # Fallback to original image
@@ -1610,7 +1760,6 @@ def preprocess_song_title_png(png_path: str, scale_percent: int = 100) -> str:
         Path to the processed temporary PNG file (with supercut_ prefix for cleanup)
     """
     try:
-        import subprocess
         from src.config import FFMPEG_BINARY
         from src.logger import logger
         
@@ -1636,7 +1785,7 @@ def preprocess_song_title_png(png_path: str, scale_percent: int = 100) -> str:
             temp_processed_path
         ]
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = resource_governor.run(cmd, capture_output=True, text=True)
         if result.returncode != 0:
             logger.error(f"Song title preprocessing failed: {result.stderr}")
             return png_path  # Fallback to original
@@ -1661,7 +1810,6 @@ def preprocess_mp3_cover_png(png_path: str, scale_percent: int = 20) -> str:
         Path to the processed temporary PNG file (with supercut_ prefix for cleanup)
     """
     try:
-        import subprocess
         from src.config import FFMPEG_BINARY
         from src.logger import logger
         
@@ -1686,7 +1834,7 @@ def preprocess_mp3_cover_png(png_path: str, scale_percent: int = 20) -> str:
             temp_processed_path
         ]
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = resource_governor.run(cmd, capture_output=True, text=True)
         if result.returncode != 0:
             logger.error(f"FFmpeg MP3 cover preprocessing failed: {result.stderr}")
             # Fallback to original PNG
@@ -1,13 +1,15 @@
 # This file uses PyQt6
 import os
-import random
-import shutil
+import uuid
 from PyQt6.QtCore import QObject, pyqtSignal
 from typing import List, Optional
-from src.ffmpeg_utils import merge_random_mp3s, create_video_with_ffmpeg
-from src.utils import set_low_priority, create_temp_file
+from src.ffmpeg_utils import merge_random_mp3s, create_video_with_ffmpeg, scale_bitrate
+from src.layer_timeline import popup_intervals, song_boundary_intervals
+from src.utils import create_temp_file, current_workspace, TempWorkspace
+from src.resource_governor import resource_governor
 import time
-from src.logger import logger
+from src.logger import logger, log_stage, timed_stage
+from src.metrics import metrics
 
 class VideoWorker(QObject):
     """Worker class for processing video creation in background thread. Supports GIF, PNG, and MP4 overlay for Overlay 1. Optionally supports a name list for output naming."""
@@ -104,8 +106,20 @@ class VideoWorker(QObject):
                  soundwave_effect: str = "fadein",
                  soundwave_start_time: int = 5,
                  layer_order: Optional[List[str]] = None,
-                 filter_complex_alt_mode: bool = False):
+                 filter_complex_alt_mode: bool = False,
+                 frame_rate_mode: str = "cfr",
+                 resume: bool = False,
+                 use_ram_temp: bool = False,
+                 plan_seed: Optional[int] = None,
+                 renditions: Optional[List[str]] = None,
+                 farm_dir: Optional[str] = None,
+                 resource_limits: Optional[dict] = None,
+                 capacity_policy: str = "split",
+                 loudness_target: str = "off"):
+        # Constructor arguments, so a render farm worker can rebuild this worker for one batch
+        job_settings = {k: v for k, v in locals().items() if k not in ('self', '__class__')}
         super().__init__()
+        self.job_settings = job_settings
         self.media_sources = media_sources
         self.export_name = export_name
         self.number = number
@@ -314,6 +328,19 @@ class VideoWorker(QObject):
         self.soundwave_start_time = soundwave_start_time
         self.layer_order = layer_order
         self.filter_complex_alt_mode = filter_complex_alt_mode
+        self.frame_rate_mode = frame_rate_mode
+        self.resume = resume
+        self.use_ram_temp = use_ram_temp
+        self.renditions = renditions or []
+        self.farm_dir = farm_dir
+        self.resource_limits = resource_limits
+        self.capacity_policy = capacity_policy
+        self.loudness_target = loudness_target
+        self._journal = None
+        self._finalizer = None
+        self.plan_seed = plan_seed
+        self.batch_plan: List[dict] = []
+        self._consumed_inputs = set()
                 
         # Debug layer order
 
@@ -324,7 +351,8 @@ class VideoWorker(QObject):
 
     def run(self):
         """Main processing method"""
-        # set_low_priority()  # Removed to keep normal priority
+        # Child ffmpeg/ffprobe processes run at the governed priority and ceilings
+        resource_governor.configure(self.resource_limits)
         try:
             # Get media files
             from src.utils import get_files_by_type
@@ -345,38 +373,240 @@ class VideoWorker(QObject):
                 logger.warning(f"Invalid start number '{self.number}': {e}")
                 start_number = 1
                 
-            current_number = start_number
-            used_images = set()
             total_batches = min(len(image_files), len(mp3_files) // self.min_mp3_count)
             batch_count = 0
+            all_failed_moves = []
+            scheduled = []
+            taken = set()
+
+            # Job journal: resume an interrupted run or start a fresh record
+            from src.job_journal import JobJournal
+            self._journal = JobJournal(self.media_sources)
+            interrupted = self._journal.load_interrupted_job() if self.resume else None
+            if interrupted:
+                job = interrupted["job"]
+                total_batches = job.get("total_batches", total_batches)
+                start_number = job.get("start_number", start_number)
+                batch_count, scheduled, all_failed_moves = self._resume_batches(interrupted, total_batches)
+                # Indices (and with them numbers and output names) of finished and re-queued batches stay theirs
+                taken = {idx for idx, batch in interrupted["batches"].items() if batch["state"] == "finalized"}
+                taken.update(batch["batch"] for batch in scheduled)
+                self.progress.emit(batch_count, total_batches)
+
+            # Plan every remaining batch up front from O(1) pools
+            from src.batch_planner import plan_batches
+            reserved = set(self._consumed_inputs)
+            for batch in scheduled:
+                reserved.update(batch["mp3s"])
+                reserved.add(batch["image"])
+            plan_start = time.perf_counter()
+            plan = plan_batches(
+                mp3_files,
+                image_files,
+                self.min_mp3_count,
+                start_number=start_number,
+                export_name=self.export_name,
+                name_list=self.name_list,
+                max_batches=total_batches - batch_count - len(scheduled),
+                seed=self.plan_seed,
+                skip_indices=taken,
+                reserved=reserved,
+            )
+            self.batch_plan = scheduled + plan["batches"]
+            log_stage("plan", duration=time.perf_counter() - plan_start,
+                      batches=len(self.batch_plan), seed=plan["seed"])
+            if not self._check_capacity():
+                return
+            if self._loudness_target_lufs() is not None and not self.farm_dir:
+                # Measure new tracks once up front; farm workers measure theirs on first use
+                from src.loudness import loudness_index
+                loudness_index.scan([mp3 for batch in self.batch_plan for mp3 in batch["mp3s"]])
+            total_batches = batch_count + len(self.batch_plan)
+            if not interrupted:
+                self._journal.start_job({
+                    "export_name": self.export_name,
+                    "folder": self.folder,
+                    "start_number": start_number,
+                    "total_batches": total_batches,
+                    "min_mp3_count": self.min_mp3_count,
+                    "seed": plan["seed"],
+                    "farm_dir": self.farm_dir,
+                })
 
             # Print export summary
             self._print_export_summary(total_batches)
+            print(f"🎲 Batch plan seed: {plan['seed']}")
 
-            all_failed_moves = []
-            while len(mp3_files) >= self.min_mp3_count and batch_count < total_batches:
+            if self.farm_dir:
+                self._run_on_farm(mp3_files, batch_count, total_batches, all_failed_moves)
+                return
+
+            from src.file_finalizer import FileFinalizer
+            self._finalizer = FileFinalizer()
+
+            for batch in self.batch_plan:
                 if self._stop:
-                    self.finished.emit(mp3_files, list(self._used_images), all_failed_moves)
+                    all_failed_moves.extend(self._finalizer.close())
+                    self.finished.emit(self._leftover_mp3s(mp3_files), list(self._used_images), all_failed_moves)
                     return
-                success, failed_moves = self._process_batch(
-                    mp3_files, image_files, used_images, 
-                    current_number, batch_count, total_batches
-                )
+                # Each batch gets its own temp workspace, removed as soon as the batch ends
+                with TempWorkspace(use_ram_disk=self.use_ram_temp):
+                    success, failed_moves = self._process_batch(batch, batch_count, total_batches)
+                metrics.inc("batches_total", result="ok" if success else "failed")
                 all_failed_moves.extend(failed_moves)
                 if not success:
-                    self.finished.emit(mp3_files, list(self._used_images), all_failed_moves)
+                    all_failed_moves.extend(self._finalizer.close())
+                    self.finished.emit(self._leftover_mp3s(mp3_files), list(self._used_images), all_failed_moves)
                     return
-                current_number += 1
                 batch_count += 1
                 self.progress.emit(batch_count, total_batches)
+            # Wait for the last batches' moves before reporting completion
+            all_failed_moves.extend(self._finalizer.close())
+            self._journal.finish_job()
             print(f"\n💫 All {total_batches} batches completed successfully!")
             print(f"📂 Output folder: {self.folder}")
-            self.finished.emit(mp3_files, list(self._used_images), all_failed_moves)
+            self.finished.emit(self._leftover_mp3s(mp3_files), list(self._used_images), all_failed_moves)
             
         except Exception as e:
             error_msg = f"Error during video creation: {str(e)}"
             print(f"❌ {error_msg}")
             self.error.emit(error_msg)
+        finally:
+            if self._finalizer is not None:
+                self._finalizer.close()
+                self._finalizer = None
+
+    def _resume_batches(self, interrupted: dict, total_batches: int) -> tuple:
+        """
+        Pick up an interrupted job's batches from its journal.
+
+        Finished batches are kept, encoded ones with an intact output are
+        finalized now, and every other batch is queued again with its own
+        inputs, index and output name (or left to the plan if its inputs are
+        gone). Render farm jobs the crashed run left behind are collected if a
+        worker finished them, otherwise withdrawn so they are not rendered twice.
+
+        Returns:
+            (finished batch count, batches to render again, failed moves)
+        """
+        from src.job_journal import JobJournal
+        job = interrupted["job"]
+        batches = interrupted["batches"]
+        failed_moves = []
+        if job.get("farm_dir"):
+            from src.render_farm import FarmQueue
+            farm = FarmQueue(job["farm_dir"])
+            for idx, batch in batches.items():
+                if batch["state"] == "finalized" or not batch.get("farm_job"):
+                    continue
+                result = farm.result(batch["farm_job"])
+                if result and result.get("ok"):
+                    # A worker finished it (output published, inputs moved) after we went down
+                    self._journal.mark_finalized(idx)
+                    batch["state"] = "finalized"
+                elif farm.withdraw(batch["farm_job"]):
+                    print(f"🗑️ Withdrew render farm job {batch['farm_job']} of the interrupted run")
+        finalized, reusable, redo = JobJournal.split_batches(batches)
+        print(f"🔁 Resuming interrupted run: {len(finalized)}/{total_batches} batches already finished")
+        for idx in reusable:
+            batch = batches[idx]
+            # Encode finished before the crash; only the log and moves are missing
+            print(f"✅ Reusing finished output: {os.path.basename(batch['output_path'])}")
+            failed_moves.extend(self._create_log_and_move_files(
+                os.path.basename(batch["output_path"]), batch["output_path"], batch["image"], batch["mp3s"]
+            ))
+            self._journal.mark_finalized(idx)
+            batch["state"] = "finalized"
+        scheduled = []
+        for idx in redo:
+            batch = batches[idx]
+            # Encode was cut short: drop the partial file and redo it with the same inputs
+            JobJournal.discard_partial_output(batch)
+            if all(os.path.exists(p) for p in batch["mp3s"] + [batch["image"]]):
+                scheduled.append(dict(batch, batch=idx, output_filename=os.path.basename(batch["output_path"])))
+            else:
+                print(f"⚠️ Inputs of batch {idx + 1} are gone; it is planned again from the remaining files")
+        return len(finalized) + len(reusable), scheduled, failed_moves
+
+    def _capacity_signature(self) -> str:
+        from src.capacity_planner import render_signature
+        return render_signature(self.codec, self.resolution, self.fps, self.preset, self.renditions,
+                                self.use_soundwave_overlay, self.frame_rate_mode)
+
+    def _check_capacity(self) -> bool:
+        """
+        Estimate output, temp and time for the planned batches before rendering.
+
+        If they do not fit on disk, either refuse the job or cut the plan down
+        to the leading batches that fit (capacity_policy). Returns False when
+        the job must not start.
+        """
+        if self.capacity_policy == "off" or not self.batch_plan:
+            return True
+        from src.capacity_planner import estimate_job, describe_estimate
+        main_width, main_height = map(int, self.resolution.split('x'))
+        rendition_bitrates = []
+        for rendition_resolution in self.renditions:
+            if rendition_resolution != self.resolution:
+                rendition_width, rendition_height = map(int, rendition_resolution.split('x'))
+                factor = min(1.0, (rendition_width * rendition_height) / (main_width * main_height))
+                rendition_bitrates.append(scale_bitrate(self.video_bitrate, factor))
+        with timed_stage("capacity_plan", batches=len(self.batch_plan)):
+            estimate = estimate_job(
+                self.batch_plan, self._capacity_signature(), self.video_bitrate, self.audio_bitrate,
+                rendition_bitrates, self.use_soundwave_overlay, self.folder,
+                # Farm workers use their own temp disks
+                check_temp=not self.farm_dir,
+            )
+        print(describe_estimate(estimate))
+        fits = estimate["fits"]
+        if fits >= len(self.batch_plan):
+            return True
+        message = (f"Not enough disk space for all {len(self.batch_plan)} batches: "
+                   f"only {fits} fit on the output and temp disks.")
+        if self.capacity_policy == "refuse" or fits == 0:
+            logger.error(message)
+            self.error.emit(message + " Free up space or choose another output folder.")
+            return False
+        print(f"⚠️ {message} Rendering those {fits} now; the remaining inputs stay in the media folder.")
+        logger.warning(f"{message} Job split to {fits} batches.")
+        self.batch_plan = self.batch_plan[:fits]
+        return True
+
+    def _run_on_farm(self, mp3_files: List[str], batch_count: int, total_batches: int, all_failed_moves: list):
+        """Hand the planned batches to render farm workers (see src.render_farm) and wait for them"""
+        from src.render_farm import RenderFarmCoordinator
+        coordinator = RenderFarmCoordinator(self.farm_dir)
+        for batch in self.batch_plan:
+            # Journaled with its farm job id, so a resume can collect or withdraw the job
+            batch["farm_job"] = uuid.uuid4().hex[:12]
+            self._journal.plan_batch(batch["batch"], batch["number"], os.path.join(self.folder, batch["output_filename"]),
+                                     batch["mp3s"], batch["image"], farm_job=batch["farm_job"])
+        coordinator.submit_batches(self.job_settings, self.batch_plan, total_batches)
+        completed = [batch_count]
+        failures = []
+
+        def on_result(batch: dict, result: dict):
+            if result.get("ok"):
+                # The farm worker already moved the inputs to bin
+                self._consumed_inputs.update(batch["mp3s"])
+                self._used_images.add(batch["image"])
+                self._journal.mark_finalized(batch["batch"])
+                completed[0] += 1
+                print(f"✔️  Farm job done: {batch['output_filename']} ({result.get('worker')})")
+                self.progress.emit(completed[0], total_batches)
+            else:
+                failures.append(f"{batch['output_filename']}: {result.get('error')}")
+
+        coordinator.wait(on_result, should_stop=lambda: self._stop)
+        if failures:
+            self.error.emit("Render farm jobs failed:\n" + "\n".join(failures))
+            return
+        if not self._stop:
+            self._journal.finish_job()
+            print(f"\n💫 All {total_batches} batches completed successfully!")
+            print(f"📂 Output folder: {self.folder}")
+        self.finished.emit(self._leftover_mp3s(mp3_files), list(self._used_images), all_failed_moves)
 
     def _print_export_summary(self, total_batches: int):
         """Print export configuration summary"""
@@ -389,17 +619,26 @@ class VideoWorker(QObject):
         print(f"Total Batches: {total_batches}")
         print("--------------------------\n")
 
-    def _process_batch(self, mp3_files: List[str], image_files: List[str], 
-                      used_images: set, current_number: int, batch_count: int, total_batches: int) -> tuple[bool, list]:
-        """Process a single batch of video creation"""
+    def _loudness_target_lufs(self) -> Optional[float]:
+        try:
+            return None if self.loudness_target in (None, "", "off") else float(self.loudness_target)
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring invalid loudness target {self.loudness_target!r}")
+            return None
+
+    def _process_batch(self, batch: dict, batch_count: int, total_batches: int) -> tuple[bool, list]:
+        """Process a single planned batch of video creation (see src.batch_planner)"""
         batch_start_time = time.time()
-        # Select random MP3s
-        selected_mp3s = random.sample(mp3_files, self.min_mp3_count)
+        current_number = batch["number"]
+        # Journal index; differs from batch_count (batches finished so far) on resume
+        batch_index = batch.get("batch", batch_count)
+        selected_mp3s = list(batch["mp3s"])
 
         # --- Song Title Overlays: Extract title and create PNG for each selected MP3 ---
         song_title_pngs = []
         if self.use_song_title_overlay:
             from src.utils import extract_mp3_title, create_song_title_png, preprocess_song_title_png
+            stage_start = time.perf_counter()
             for idx, mp3_path in enumerate(selected_mp3s, start=16):  # overlay16, overlay17, ...
                 title = extract_mp3_title(mp3_path)
                 # Create a temp PNG file for the overlay
@@ -414,12 +653,14 @@ class VideoWorker(QObject):
                 
                 # Add x/y percent and start_at to overlay dict for ffmpeg_utils
                 song_title_pngs.append({'path': processed_png_path, 'title': title, 'x_percent': self.song_title_x_percent, 'y_percent': self.song_title_y_percent, 'start_at': self.song_title_start_at})
+            log_stage("title_render", batch=batch_count, duration=time.perf_counter() - stage_start, titles=len(song_title_pngs))
         # --- End Song Title Overlays ---
 
         # --- MP3 Cover Overlays: Extract cover and create framed PNG for each selected MP3 ---
         mp3_cover_pngs = []
         if self.use_mp3_cover_overlay:
             from src.utils import extract_and_frame_mp3_cover, preprocess_mp3_cover_png
+            stage_start = time.perf_counter()
             for idx, mp3_path in enumerate(selected_mp3s, start=100):  # mp3cover100, mp3cover101, ...
                 # Create a temp PNG file for the MP3 cover overlay
                 temp_cover_path = create_temp_file(suffix=f'_mp3cover{idx}.png', prefix='supercut_')
@@ -448,19 +689,12 @@ class VideoWorker(QObject):
                     })
                 else:
                     logger.warning(f"Failed to create MP3 cover overlay for {mp3_path}")
+            log_stage("cover", batch=batch_count, duration=time.perf_counter() - stage_start, covers=len(mp3_cover_pngs))
         # --- End MP3 Cover Overlays ---
         
-        # Select available image
-        available_images = [img for img in image_files if img not in used_images]
-        if not available_images:
-            used_images.clear()
-            available_images = image_files[:]
-        if not available_images:
-            return False, []
-            
-        selected_image = random.choice(available_images)  # This is now a full path
-        used_images.add(selected_image)  # Store full path
+        selected_image = batch["image"]  # Full path
         self._used_images.add(selected_image)
+        stage_start = time.perf_counter()
         
         # Preprocess background image (always done in advance)
         from src.utils import preprocess_background_image
@@ -719,14 +953,20 @@ class VideoWorker(QObject):
                 # For GIFs and videos, use original path - FFmpeg will handle scaling
                 processed_frame_mp3cover_path = self.frame_mp3cover_path
         
+        log_stage("preprocess", batch=batch_count, duration=time.perf_counter() - stage_start)
+
         # Create output filename
-        if self.name_list and batch_count < len(self.name_list):
+        if batch.get("output_filename"):
+            output_filename = batch["output_filename"]
+        elif self.name_list and batch_index < len(self.name_list):
             from src.utils import sanitize_filename
-            name = sanitize_filename(self.name_list[batch_count])
+            name = sanitize_filename(self.name_list[batch_index])
             output_filename = f"{name}.mp4"
         else:
             output_filename = f"{self.export_name}_{current_number}.mp4"
         output_path = os.path.join(self.folder, output_filename)
+        if self._journal:
+            self._journal.plan_batch(batch_index, current_number, output_path, selected_mp3s, selected_image)
 
         # Print batch info
         print(f"--- 📄 Batch {batch_count + 1}/{total_batches} ---")
@@ -736,34 +976,21 @@ class VideoWorker(QObject):
 
         # Merge MP3s
         try:
-            merged_audio_path, audio_duration = merge_random_mp3s(selected_mp3s)
+            with timed_stage("merge_audio", batch=batch_count, mp3s=len(selected_mp3s)):
+                gains = None
+                target_lufs = self._loudness_target_lufs()
+                if target_lufs is not None:
+                    from src.loudness import loudness_index
+                    gains = loudness_index.gains(selected_mp3s, target_lufs)
+                merged_audio_path, total_duration, song_durations = merge_random_mp3s(selected_mp3s, gains)
         except (OSError, ValueError) as e:
             self.error.emit(f"Exception merging MP3 files: {e}")
             return False, []
 
-        if not merged_audio_path or audio_duration <= 0:
+        if not merged_audio_path or total_duration <= 0:
             self.error.emit(f"Failed to merge MP3 files or get duration")
             return False, []
 
-        # Get total duration from merged audio
-        from src.ffmpeg_utils import get_audio_duration
-        total_duration = get_audio_duration(merged_audio_path)
-        
-        # --- Calculate song durations only if needed by overlays ---
-        song_durations = []
-        needs_song_durations = (
-            self.use_song_title_overlay or 
-            self.use_mp3_cover_overlay or 
-            (self.use_overlay10 and self.overlay10_song_start_end_checked)
-        )
-        
-        if needs_song_durations:
-            cumulative_time = 0.0
-            for mp3_path in selected_mp3s:
-                duration = get_audio_duration(mp3_path)
-                song_durations.append((cumulative_time, duration))
-                cumulative_time += duration
-
         # --- Generate soundwave overlay if enabled ---
         soundwave_overlay_path = None
         try:
@@ -833,6 +1060,7 @@ class VideoWorker(QObject):
                 try:
                     from src.soundwave_generator import create_soundwave_from_merged_audio
                     print("🎵 Calling soundwave generation function...")
+                    stage_start = time.perf_counter()
                     soundwave_overlay_path = create_soundwave_from_merged_audio(
                         merged_audio_path=merged_audio_path,
                         method=self.soundwave_method,
@@ -841,6 +1069,8 @@ class VideoWorker(QObject):
                         x_percent=self.soundwave_x_percent,
                         y_percent=self.soundwave_y_percent
                     )
+                    log_stage("soundwave", batch=batch_count, duration=time.perf_counter() - stage_start,
+                              ok=bool(soundwave_overlay_path))
                     if soundwave_overlay_path:
                         print(f"✅ Soundwave overlay generated successfully: {soundwave_overlay_path}")
                         logger.info(f"Soundwave overlay generated successfully: {soundwave_overlay_path}")
@@ -922,29 +1152,7 @@ class VideoWorker(QObject):
                     # Calculate spacing so that the last interval ends exactly at video end
                     # Formula: spacing = (total_duration - first_start) / popup_num (only account for first start time)
                     if self.overlay8_popup_num > 0 and remaining_duration > 0:
-                        # Calculate spacing to ensure last interval ends at video end
-                        spacing = (total_duration - first_start) / self.overlay8_popup_num
-                        overlay8_intervals = []
-                        
-                        # Add first interval
-                        overlay8_intervals.append((first_start, self.overlay8_duration))
-                        
-                        # Add additional intervals based on popup number
-                        for i in range(self.overlay8_popup_num):
-                            if i == 0:
-                                # Special case for second popup: use first popup start time
-                                interval_start = first_start + spacing - self.overlay8_duration
-                            else:
-                                # For third and subsequent popups: use previous end
-                                previous_end = overlay8_intervals[-1][0] + self.overlay8_duration
-                                interval_start = previous_end + spacing - self.overlay8_duration
-                            
-                            interval_start = int(interval_start)
-                            # Ensure interval doesn't exceed video duration
-                            if interval_start + self.overlay8_duration <= total_duration:
-                                overlay8_intervals.append((interval_start, self.overlay8_duration))
-                            else:
-                                break  # Stop if we exceed video duration
+                        overlay8_intervals = popup_intervals(first_start, self.overlay8_duration, self.overlay8_popup_num, total_duration)
                     else:
                         # Single interval at popup start time
                         actual_overlay8_start_at = first_start
@@ -995,29 +1203,7 @@ class VideoWorker(QObject):
                     # Calculate spacing so that the last interval ends exactly at video end
                     # Formula: spacing = (total_duration - first_start) / popup_num (only account for first start time)
                     if self.overlay9_popup_num > 0 and remaining_duration > 0:
-                        # Calculate spacing to ensure last interval ends at video end
-                        spacing = (total_duration - first_start) / self.overlay9_popup_num
-                        overlay9_intervals = []
-                        
-                        # Add first interval
-                        overlay9_intervals.append((first_start, self.overlay9_duration))
-                        
-                        # Add additional intervals based on popup number
-                        for i in range(self.overlay9_popup_num):
-                            if i == 0:
-                                # Special case for second popup: use first popup start time
-                                interval_start = first_start + spacing - self.overlay9_duration
-                            else:
-                                # For third and subsequent popups: use previous end
-                                previous_end = overlay9_intervals[-1][0] + self.overlay9_duration
-                                interval_start = previous_end + spacing - self.overlay9_duration
-                            
-                            interval_start = int(interval_start)
-                            # Ensure interval doesn't exceed video duration
-                            if interval_start + self.overlay9_duration <= total_duration:
-                                overlay9_intervals.append((interval_start, self.overlay9_duration))
-                            else:
-                                break  # Stop if we exceed video duration
+                        overlay9_intervals = popup_intervals(first_start, self.overlay9_duration, self.overlay9_popup_num, total_duration)
                     else:
                         # Single interval at popup start time
                         actual_overlay9_start_at = first_start
@@ -1055,20 +1241,10 @@ class VideoWorker(QObject):
             overlay10_intervals = None
             if self.use_overlay10:
                 if self.overlay10_song_start_end_checked and song_durations:
-                    overlay10_intervals = []
-                    if getattr(self, 'overlay10_start_end_value', 'start') == 'end':
-                        # End Mode: overlay10 appears at the end of each song for the specified duration
-                        for song_start, song_duration in song_durations:
-                            song_end = song_start + song_duration
-                            start = song_end - self.overlay10_duration
-                            end = song_end
-                            overlay10_intervals.append((start, self.overlay10_duration))
-                    else:
-                        # Start Mode: first overlay10 at user input, then at each song start, all with same duration
-                        first_start = self.overlay10_start_time
-                        overlay10_intervals.append((first_start, self.overlay10_duration))
-                        for i, (song_start, song_duration) in enumerate(song_durations[1:], start=1):
-                            overlay10_intervals.append((song_start, self.overlay10_duration))
+                    # End Mode: the last seconds of each song; Start Mode: user start, then each song start
+                    overlay10_intervals = song_boundary_intervals(
+                        song_durations, self.overlay10_duration, self.overlay10_start_time,
+                        at_end=getattr(self, 'overlay10_start_end_value', 'start') == 'end')
                     overlay10_effect_to_use = 'null'  # No effect when using start/end
                 else:
                     # Single mode: start at percentage of total merged song duration
@@ -1086,7 +1262,27 @@ class VideoWorker(QObject):
             
             
 
+            # Extra renditions (e.g. 720p, vertical) come out of the same composite pass,
+            # with bitrates scaled to their pixel count
+            main_width, main_height = map(int, self.resolution.split('x'))
+            output_base, output_ext = os.path.splitext(output_path)
+            renditions = []
+            for rendition_resolution in self.renditions:
+                if rendition_resolution == self.resolution:
+                    continue
+                rendition_width, rendition_height = map(int, rendition_resolution.split('x'))
+                factor = min(1.0, (rendition_width * rendition_height) / (main_width * main_height))
+                renditions.append({
+                    'output_path': f"{output_base}_{rendition_resolution}{output_ext}",
+                    'resolution': rendition_resolution,
+                    'video_bitrate': scale_bitrate(self.video_bitrate, factor),
+                    'maxrate': scale_bitrate(self.maxrate, factor),
+                    'bufsize': scale_bitrate(self.bufsize, factor)
+                })
+
             # Create video (Overlay 1: GIF/PNG, with size)
+            encode_start = time.perf_counter()
+            admission_wait_start = resource_governor.admission_wait_seconds()
             success, err = create_video_with_ffmpeg(
                 processed_image_path, merged_audio_path, output_path, self.resolution, self.fps, self.codec,
                 use_overlay=self.use_overlay,
@@ -1242,11 +1438,32 @@ class VideoWorker(QObject):
                 # --- Add layer order parameter ---
                 layer_order=self.layer_order,
                 # --- Add filter complex alt mode parameter ---
-                filter_complex_alt_mode=self.filter_complex_alt_mode
+                filter_complex_alt_mode=self.filter_complex_alt_mode,
+                # --- Add frame rate mode parameter ---
+                frame_rate_mode=self.frame_rate_mode,
+                # --- Add renditions parameter ---
+                renditions=renditions,
+                # --- Merge already measured the track, so no ffprobe of the merged audio ---
+                audio_duration=total_duration
             )
+            # Time queued behind other encodes is not encode time (it would skew capacity plans)
+            encode_seconds = (time.perf_counter() - encode_start
+                              - (resource_governor.admission_wait_seconds() - admission_wait_start))
+            log_stage("encode", batch=batch_count, duration=encode_seconds,
+                      audio_seconds=round(total_duration, 1), ok=success)
             if not success:
                 self.error.emit(err or f"Failed to create video: {output_filename}")
                 return False, []
+            # Measured sizes and speed sharpen the next capacity plan
+            from src.capacity_planner import capacity_history
+            workspace = current_workspace()
+            output_bytes = sum(os.path.getsize(path) for path in [output_path] + [r['output_path'] for r in renditions]
+                               if os.path.exists(path))
+            capacity_history.record(self._capacity_signature(), total_duration, encode_seconds, output_bytes,
+                                    workspace.used_bytes() if workspace else 0)
+            metrics.inc("output_bytes_total", output_bytes)
+            if self._journal:
+                self._journal.mark_encoded(batch_index, output_path)
         except (OSError, ValueError) as e:
             self.error.emit(f"Exception creating video: {e}")
             return False, []
@@ -1344,14 +1561,19 @@ class VideoWorker(QObject):
                 except:
                     pass
             
-        # Create log and move files
-        failed_moves = self._create_log_and_move_files(
-            output_filename, output_path, selected_image, 
-            selected_mp3s, mp3_files, image_files, selected_image
-        )
+        # Create log and move files in the background while the next batch encodes
+        from src.file_finalizer import FinalizeTask
+        self._consumed_inputs.update(selected_mp3s)
+        journal = self._journal
+        self._finalizer.submit(FinalizeTask(
+            self.media_sources, output_filename, output_path, selected_image, selected_mp3s,
+            on_done=(lambda failed, idx=batch_index: journal.mark_finalized(idx)) if journal else None
+        ))
+        failed_moves = []
         
         # Print completion message with time spent
         batch_time_spent = time.time() - batch_start_time
+        log_stage("batch", batch=batch_count, duration=batch_time_spent, output=output_filename)
         if batch_time_spent >= 60:
             mins = int(batch_time_spent // 60)
             secs = int(batch_time_spent % 60)
@@ -1375,63 +1597,15 @@ class VideoWorker(QObject):
                 logger.warning(f"OS error removing temp audio file {audio_path}: {e}")
 
     def _create_log_and_move_files(self, output_filename: str, output_path: str, 
-                                  selected_image: str, selected_mp3s: List[str], 
-                                  mp3_files: List[str], image_files: List[str], 
-                                  selected_image_path: str) -> list:
-        """Create log file and move processed files to bin folder. Returns list of failed moves."""
-        # Create log file
-        output_base_name = os.path.splitext(output_filename)[0]
-        log_path = os.path.join(self.media_sources, f"{output_base_name}.log")
-        
-        with open(log_path, "w", encoding="utf-8") as logf:
-            logf.write(f"Output video: {output_path}\n")
-            logf.write(f"Image used: {selected_image}\n")
-            logf.write("MP3s used:\n")
-            for mp3 in selected_mp3s:
-                logf.write(f"  {mp3}\n")
-        
-        # Create bin folder and move files
-        bin_folder = os.path.join(self.media_sources, "bin")
-        os.makedirs(bin_folder, exist_ok=True)
-        
-        # Move log file
-        shutil.move(log_path, os.path.join(bin_folder, f"{output_base_name}.log"))
-        
-        failed_moves = []
-        # Move MP3 files
-        output_base = os.path.splitext(os.path.basename(output_path))[0]
-        for idx, mp3 in enumerate(selected_mp3s, 1):
-            new_name = f"{output_base}+{idx}.mp3"
-            try:
-                shutil.move(mp3, os.path.join(bin_folder, new_name))
-                if mp3 in mp3_files:
-                    mp3_files.remove(mp3)
-            except FileNotFoundError:
-                logger.error(f"File {mp3} not found for moving.")
-                failed_moves.append(mp3)
-            except PermissionError:
-                logger.error(f"No permission to move file {mp3}.")
-                failed_moves.append(mp3)
-            except OSError as move_err:
-                logger.error(f"OS error moving {mp3} to {os.path.join(bin_folder, new_name)}: {move_err}")
-                failed_moves.append(mp3)
-        # Move image file
-        try:
-            img_ext = os.path.splitext(selected_image_path)[1]
-            img_new_name = f"{output_base}{img_ext}"
-            shutil.move(selected_image_path, os.path.join(bin_folder, img_new_name))
-        except FileNotFoundError:
-            logger.error(f"File {selected_image_path} not found for moving.")
-            failed_moves.append(selected_image_path)
-        except PermissionError:
-            logger.error(f"No permission to move file {selected_image_path}.")
-            failed_moves.append(selected_image_path)
-        except OSError as move_err:
-            logger.error(f"OS error moving {selected_image_path} to {os.path.join(bin_folder, img_new_name)}: {move_err}")
-            failed_moves.append(selected_image_path)
-        finally:
-            if selected_image_path in image_files:
-                image_files.remove(selected_image_path)
-        if failed_moves:
-            logger.warning(f"Some files could not be moved to bin: {failed_moves}")
-        return failed_moves 
\ No newline at end of file
+                                  selected_image: str, selected_mp3s: List[str]) -> list:
+        """Create log file and move processed files to bin folder synchronously. Returns list of failed moves."""
+        from src.file_finalizer import FinalizeTask, finalize_batch_files
+        self._consumed_inputs.update(selected_mp3s)
+        self._consumed_inputs.add(selected_image)
+        return finalize_batch_files(FinalizeTask(
+            self.media_sources, output_filename, output_path, selected_image, selected_mp3s
+        ))
+
+    def _leftover_mp3s(self, mp3_files: List[str]) -> List[str]:
+        """MP3s not consumed by a finished batch"""
+        return [mp3 for mp3 in mp3_files if mp3 not in self._consumed_inputs]
@@ -0,0 +1,60 @@
+import random
+
+from src.batch_planner import MediaPool, plan_batches
+
+MP3S = [f"/media/song{i:02d}.mp3" for i in range(20)]
+IMAGES = [f"/media/bg{i:02d}.png" for i in range(6)]
+
+
+def test_same_seed_gives_same_plan_regardless_of_listing_order():
+    shuffled_mp3s = list(reversed(MP3S))
+    first = plan_batches(MP3S, IMAGES, 3, start_number=1, export_name="mix", seed=42)
+    second = plan_batches(shuffled_mp3s, list(reversed(IMAGES)), 3, start_number=1, export_name="mix", seed=42)
+    assert first == second
+    assert plan_batches(MP3S, IMAGES, 3, start_number=1, export_name="mix", seed=43)["batches"] != first["batches"]
+
+
+def test_plan_uses_each_input_once_and_reports_leftovers():
+    plan = plan_batches(MP3S, IMAGES, 3, start_number=5, export_name="mix", seed=1)
+    batches = plan["batches"]
+    assert len(batches) == 6  # 6 images, 20 // 3 = 6 MP3 groups
+    used_mp3s = [mp3 for batch in batches for mp3 in batch["mp3s"]]
+    assert len(used_mp3s) == len(set(used_mp3s)) == 18
+    assert sorted(used_mp3s + plan["leftover_mp3s"]) == MP3S
+    assert [b["number"] for b in batches] == [5, 6, 7, 8, 9, 10]
+    assert [b["output_filename"] for b in batches][:2] == ["mix_5.mp4", "mix_6.mp4"]
+    assert plan["leftover_images"] == []
+
+
+def test_name_list_and_max_batches():
+    plan = plan_batches(MP3S, IMAGES, 2, start_number=1, export_name="mix", seed=3,
+                        name_list=["Intro: Part 1", "Second"], max_batches=3)
+    assert [b["output_filename"] for b in plan["batches"]] == ["Intro_ Part 1.mp4", "Second.mp4", "mix_3.mp4"]
+
+
+def test_reserved_inputs_are_never_drawn_and_plan_stays_seeded():
+    reserved = set(MP3S[:4]) | {IMAGES[0]}
+    plan = plan_batches(MP3S, IMAGES, 4, start_number=1, export_name="mix", seed=9, reserved=reserved)
+    drawn = {mp3 for batch in plan["batches"] for mp3 in batch["mp3s"]} | {b["image"] for b in plan["batches"]}
+    assert not drawn & reserved
+    assert len(plan["batches"]) == 4  # 16 free MP3s / 4
+    again = plan_batches(MP3S, IMAGES, 4, start_number=1, export_name="mix", seed=9, reserved=list(reserved))
+    assert again == plan
+
+
+def test_skip_indices_keep_numbers_tied_to_indices():
+    plan = plan_batches(MP3S, IMAGES, 3, start_number=10, export_name="mix", seed=5,
+                        skip_indices={0, 2}, max_batches=3)
+    assert [(b["batch"], b["number"]) for b in plan["batches"]] == [(1, 11), (3, 13), (4, 14)]
+
+
+def test_media_pool_draw_and_remove():
+    pool = MediaPool(["c", "a", "b", "a"], random.Random(0))
+    assert len(pool) == 3
+    assert "a" in pool
+    assert pool.remove("a")
+    assert not pool.remove("a")
+    assert "a" not in pool
+    drawn = pool.draw_many(2)
+    assert sorted(drawn) == ["b", "c"]
+    assert len(pool) == 0
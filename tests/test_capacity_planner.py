@@ -0,0 +1,63 @@
+import pytest
+
+from src import capacity_planner
+from src.capacity_planner import CAPACITY_RESERVE_BYTES, CAPACITY_SAFETY_MARGIN, estimate_job
+
+MB = 1024 * 1024
+# 2 songs of 100s per batch: ~230MB output and ~115MB temp each with the safety margin
+HISTORY = {"output_bytes_per_second": MB, "temp_bytes_per_second": MB / 2, "speed": 2.0}
+OUTPUT_PER_BATCH = int(200 * MB * CAPACITY_SAFETY_MARGIN)
+TEMP_PER_BATCH = int(200 * MB / 2 * CAPACITY_SAFETY_MARGIN)
+BATCHES = [{"mp3s": [f"/media/b{i}_a.mp3", f"/media/b{i}_b.mp3"]} for i in range(5)]
+
+
+@pytest.fixture
+def disks(monkeypatch):
+    free = {}
+    monkeypatch.setattr(capacity_planner.capacity_history, "get", lambda signature: HISTORY)
+    monkeypatch.setattr(capacity_planner, "media_duration", lambda path: 100.0)
+    monkeypatch.setattr(capacity_planner, "free_bytes", lambda path: free.get(path))
+    monkeypatch.setattr(capacity_planner, "_same_device", lambda a, b: free.get("shared", False))
+    return free
+
+
+def estimate(**kwargs):
+    return estimate_job(BATCHES, "sig", "12M", "384k", [], False, "/out", temp_dir="/tmp", **kwargs)
+
+
+def test_totals_come_from_history(disks):
+    result = estimate()
+    assert result["from_history"]
+    assert result["audio_seconds"] == [200.0] * 5
+    assert result["output_bytes"] == 5 * OUTPUT_PER_BATCH
+    assert result["peak_temp_bytes"] == TEMP_PER_BATCH
+    assert result["wall_seconds"] == 500.0
+    # Unknown free space never limits the job
+    assert result["fits"] == 5
+
+
+def test_fits_counts_leading_batches_on_separate_disks(disks):
+    disks["/out"] = CAPACITY_RESERVE_BYTES + 3 * OUTPUT_PER_BATCH + 100 * MB
+    disks["/tmp"] = CAPACITY_RESERVE_BYTES + TEMP_PER_BATCH
+    assert estimate()["fits"] == 3
+
+
+def test_shared_disk_subtracts_temp_peak(disks):
+    free = CAPACITY_RESERVE_BYTES + 3 * OUTPUT_PER_BATCH + 100 * MB
+    disks.update({"/out": free, "/tmp": free, "shared": True})
+    # The third batch's temp files no longer fit next to two finished outputs
+    assert estimate()["fits"] == 2
+
+
+def test_temp_disk_limits_fit_unless_skipped(disks):
+    disks["/out"] = CAPACITY_RESERVE_BYTES + 10 * OUTPUT_PER_BATCH
+    disks["/tmp"] = CAPACITY_RESERVE_BYTES + TEMP_PER_BATCH - 1
+    assert estimate()["fits"] == 0
+    unchecked = estimate(check_temp=False)
+    assert unchecked["temp_free"] is None
+    assert unchecked["fits"] == 5
+
+
+def test_nothing_fits_inside_the_reserve(disks):
+    disks["/out"] = CAPACITY_RESERVE_BYTES
+    assert estimate()["fits"] == 0
@@ -0,0 +1,128 @@
+import os
+
+from src.batch_planner import plan_batches
+from src.job_journal import JobJournal
+from src.render_farm import FarmQueue, PENDING, LEASED
+
+
+def make_inputs(folder, count, suffix):
+    paths = []
+    for i in range(count):
+        path = os.path.join(folder, f"{suffix}{i}.{suffix}")
+        with open(path, "w") as f:
+            f.write(suffix)
+        paths.append(path)
+    return paths
+
+
+def journal_batches(journal, out_dir, mp3s, images, indices, start_number=1):
+    for idx in indices:
+        journal.plan_batch(idx, start_number + idx, os.path.join(out_dir, f"video_{start_number + idx}.mp4"),
+                           mp3s[idx * 2:idx * 2 + 2], images[idx])
+
+
+def test_resume_keeps_numbers_of_batches_finished_out_of_order(tmp_path):
+    media, out = tmp_path / "media", tmp_path / "out"
+    media.mkdir()
+    out.mkdir()
+    mp3s = make_inputs(str(media), 16, "mp3")
+    images = make_inputs(str(media), 8, "png")
+    journal = JobJournal(str(media))
+    journal.start_job({"start_number": 1, "total_batches": 8})
+    journal_batches(journal, str(out), mp3s, images, range(6))
+    # Farm workers finished batches 1-5; batch 0 was still rendering at the crash
+    for idx in range(1, 6):
+        journal.mark_finalized(idx)
+
+    state = JobJournal(str(media)).load_interrupted_job()
+    finalized, reusable, redo = JobJournal.split_batches(state["batches"])
+    assert (finalized, reusable, redo) == ([1, 2, 3, 4, 5], [], [0])
+
+    taken = set(finalized) | set(redo)
+    reserved = {path for idx in taken for path in state["batches"][idx]["mp3s"] + [state["batches"][idx]["image"]]}
+    plan = plan_batches(mp3s, images, 2, start_number=1, export_name="video", max_batches=8 - len(taken),
+                        seed=7, skip_indices=taken, reserved=reserved)
+
+    assert [b["batch"] for b in plan["batches"]] == [6, 7]
+    assert [b["output_filename"] for b in plan["batches"]] == ["video_7.mp4", "video_8.mp4"]
+    finished_names = {os.path.basename(state["batches"][idx]["output_path"]) for idx in taken}
+    assert not finished_names & {b["output_filename"] for b in plan["batches"]}
+
+
+def test_intact_encoded_output_is_reused_and_torn_one_redone(tmp_path):
+    media = tmp_path / "media"
+    media.mkdir()
+    mp3s = make_inputs(str(media), 6, "mp3")
+    images = make_inputs(str(media), 3, "png")
+    journal = JobJournal(str(media))
+    journal.start_job({"start_number": 1, "total_batches": 3})
+    journal_batches(journal, str(tmp_path), mp3s, images, range(3))
+    for idx in (0, 2):
+        path = os.path.join(str(tmp_path), f"video_{idx + 1}.mp4")
+        with open(path, "wb") as f:
+            f.write(b"video" * 100)
+        journal.mark_encoded(idx, path)
+    # Batch 2's output changed after it was journaled (torn by the crash)
+    with open(os.path.join(str(tmp_path), "video_3.mp4"), "ab") as f:
+        f.write(b"partial")
+
+    state = journal.load_interrupted_job()
+    assert JobJournal.split_batches(state["batches"]) == ([], [0], [1, 2])
+
+
+def test_withdraw_removes_pending_and_leased_farm_jobs(tmp_path):
+    queue = FarmQueue(str(tmp_path))
+    pending = queue.submit({"batch": {"batch": 0}})
+    leased = queue.submit({"batch": {"batch": 1}})
+    claimed = queue.claim("worker-a")
+    assert claimed["job_id"] in (pending, leased)
+
+    assert queue.withdraw(pending)
+    assert queue.withdraw(leased)
+    assert os.listdir(tmp_path / PENDING) == []
+    assert os.listdir(tmp_path / LEASED) == []
+    # The worker that held the lease must not publish its output
+    assert not queue.holds_lease("worker-a", claimed["job_id"])
+    assert not queue.withdraw(pending)
+
+
+def test_replay_tracks_batch_states_and_completion(tmp_path):
+    journal = JobJournal(str(tmp_path))
+    assert journal.load() is None
+    journal.start_job({"start_number": 3, "total_batches": 2})
+    journal.plan_batch(0, 3, "/out/a.mp4", ["/m/1.mp3"], "/m/a.png")
+    journal.plan_batch(1, 4, "/out/b.mp4", ["/m/2.mp3"], "/m/b.png", farm_job="abc")
+    journal.mark_finalized(0)
+
+    state = journal.load_interrupted_job()
+    assert state["job"] == {"start_number": 3, "total_batches": 2}
+    assert state["batches"][0]["state"] == "finalized"
+    assert state["batches"][1] == {"state": "planned", "number": 4, "output_path": "/out/b.mp4",
+                                   "mp3s": ["/m/2.mp3"], "image": "/m/b.png", "farm_job": "abc"}
+
+    journal.mark_finalized(1)
+    journal.finish_job()
+    assert journal.load()["done"] is True
+    assert journal.load_interrupted_job() is None
+
+
+def test_replay_survives_a_torn_last_line_and_keeps_appending(tmp_path):
+    journal = JobJournal(str(tmp_path))
+    journal.start_job({"total_batches": 2})
+    journal.plan_batch(0, 1, "/out/a.mp4", [], "/m/a.png")
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"event": "batch_final')  # Crash mid-write
+
+    assert journal.load()["batches"][0]["state"] == "planned"
+    journal.mark_finalized(0)
+    assert journal.load()["batches"][0]["state"] == "finalized"
+
+
+def test_start_job_discards_the_previous_journal(tmp_path):
+    journal = JobJournal(str(tmp_path))
+    journal.start_job({"total_batches": 1})
+    journal.plan_batch(0, 1, "/out/a.mp4", [], "/m/a.png")
+    journal.start_job({"total_batches": 5})
+    state = journal.load()
+    assert state["job"] == {"total_batches": 5}
+    assert state["batches"] == {}
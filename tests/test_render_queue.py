@@ -0,0 +1,134 @@
+import os
+import sys
+import time
+import types
+
+import pytest
+
+import src.render_queue as rq
+from src.render_queue import RenderQueue, QueueRunner, QUEUED, RUNNING, DONE, FAILED
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    monkeypatch.setattr(rq, "RENDER_QUEUE_ASSETS_DIR", str(tmp_path / "assets"))
+    return RenderQueue(str(tmp_path / "render_queue.json"))
+
+
+def add_job(queue, folder, priority=0):
+    return queue.add({"media_sources": folder, "folder": folder}, priority=priority)
+
+
+def state(queue, job_id):
+    return next(job for job in queue.jobs() if job["id"] == job_id)
+
+
+def test_claim_next_takes_highest_priority_and_skips_running_folders(queue):
+    low = add_job(queue, "/media/a")
+    high = add_job(queue, "/media/b", priority=5)
+    same_folder = add_job(queue, "/media/b", priority=9)
+
+    first = queue.claim_next("runner-1", set())
+    assert first["id"] == same_folder
+    assert state(queue, same_folder)["owner"]["runner"] == "runner-1"
+
+    # /media/b is running, so the other job for that folder has to wait
+    second = queue.claim_next("runner-2", set())
+    assert second["id"] == low
+    assert queue.claim_next("runner-2", set()) is None
+    assert state(queue, high)["state"] == QUEUED
+
+
+def test_claim_next_is_seen_by_another_process_view(queue):
+    job_id = add_job(queue, "/media/a")
+    other = RenderQueue(queue.path)
+    assert queue.claim_next("runner-1", set())["id"] == job_id
+    assert other.claim_next("runner-2", set()) is None
+
+
+def test_finish_only_by_owner_and_done_removes_assets(queue):
+    job_id = add_job(queue, "/media/a")
+    assets = os.path.join(rq.RENDER_QUEUE_ASSETS_DIR, job_id)
+    os.makedirs(assets)
+    queue.claim_next("runner-1", set())
+
+    assert not queue.finish(job_id, DONE, runner_id="runner-2")
+    assert state(queue, job_id)["state"] == RUNNING
+
+    assert queue.finish(job_id, DONE, runner_id="runner-1")
+    assert state(queue, job_id)["state"] == DONE
+    assert state(queue, job_id)["owner"] is None
+    assert not os.path.exists(assets)
+
+
+def test_failed_job_keeps_assets_and_can_be_retried(queue):
+    job_id = add_job(queue, "/media/a")
+    assets = os.path.join(rq.RENDER_QUEUE_ASSETS_DIR, job_id)
+    os.makedirs(assets)
+    queue.claim_next("runner-1", set())
+    assert queue.finish(job_id, FAILED, "boom", runner_id="runner-1")
+    assert os.path.isdir(assets)
+
+    assert queue.retry(job_id)
+    job = state(queue, job_id)
+    assert job["state"] == QUEUED
+    assert job["error"] is None
+    assert job["settings"]["resume"] is True
+
+
+def test_recover_requeues_only_stale_owners(queue, monkeypatch):
+    live, dead, silent = (add_job(queue, f"/media/{name}") for name in ("live", "dead", "silent"))
+    for _ in range(3):
+        queue.claim_next("runner-1", set())
+    with queue._transaction():
+        for job in queue._load():
+            if job["id"] == dead:
+                job["owner"]["pid"] = 999999
+            elif job["id"] == silent:
+                job["owner"]["heartbeat"] = time.time() - rq.RENDER_QUEUE_OWNER_TIMEOUT - 1
+        queue._save()
+    monkeypatch.setattr(rq, "_process_alive", lambda pid: pid != 999999)
+
+    queue.recover()
+
+    assert state(queue, live)["state"] == RUNNING
+    for job_id in (dead, silent):
+        job = state(queue, job_id)
+        assert job["state"] == QUEUED
+        assert job["owner"] is None
+        assert job["settings"]["resume"] is True
+
+
+def test_worker_error_marks_job_failed(queue, monkeypatch):
+    QtCore = pytest.importorskip("PyQt6.QtCore")
+
+    class FailingWorker(QtCore.QObject):
+        error = QtCore.pyqtSignal(str)
+        finished = QtCore.pyqtSignal(list, list, list)
+
+        def __init__(self, **settings):
+            super().__init__()
+
+        def run(self):
+            # VideoWorker reports failures by emitting error, never by raising
+            self.error.emit("no audio")
+
+        def stop(self):
+            pass
+
+    module = types.ModuleType("src.video_worker")
+    module.VideoWorker = FailingWorker
+    monkeypatch.setitem(sys.modules, "src.video_worker", module)
+
+    job_id = add_job(queue, "/media/a")
+    assets = os.path.join(rq.RENDER_QUEUE_ASSETS_DIR, job_id)
+    os.makedirs(assets)
+    runner = QueueRunner(queue)
+    runner._start_job(queue.claim_next(runner.runner_id, set()))
+    thread = runner._running[job_id][0]
+    thread.join(10)
+
+    job = state(queue, job_id)
+    assert job["state"] == FAILED
+    assert job["error"] == "no audio"
+    assert os.path.isdir(assets)
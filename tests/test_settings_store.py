@@ -0,0 +1,44 @@
+import os
+import time
+
+import pytest
+
+from src.settings_store import file_lock, read_json, atomic_write_json
+
+
+def test_atomic_write_and_read_json(tmp_path):
+    path = str(tmp_path / "data.json")
+    assert read_json(path) is None
+    assert atomic_write_json(path, {"a": 1})
+    assert read_json(path) == {"a": 1}
+
+
+def test_file_lock_is_exclusive_and_released(tmp_path):
+    path = str(tmp_path / "index.json.lock")
+    with file_lock(path):
+        assert os.path.exists(path)
+        with pytest.raises(OSError):
+            with file_lock(path, timeout=0.2):
+                pass
+    assert not os.path.exists(path)
+
+
+def test_stale_lock_is_broken(tmp_path):
+    path = str(tmp_path / "index.json.lock")
+    with open(path, "w") as f:
+        f.write("crashed-host 1 token")
+    old = time.time() - 60
+    os.utime(path, (old, old))
+    with file_lock(path, stale=10, timeout=1):
+        with open(path) as f:
+            assert "crashed-host" not in f.read()
+
+
+def test_holder_does_not_remove_a_lock_it_no_longer_owns(tmp_path):
+    path = str(tmp_path / "index.json.lock")
+    with file_lock(path):
+        # Our lock was broken as stale and someone else took it
+        os.remove(path)
+        with open(path, "w") as f:
+            f.write("other-host 2 token")
+    assert os.path.exists(path)
@@ -0,0 +1,85 @@
+import copy
+import json
+import os
+
+import pytest
+
+from src.template_utils import diff_template
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config", "templates")
+
+# Stand-in for the defaults SuperCutUI._apply_template_layer_settings falls back to
+LAYER_DEFAULTS = {"enabled": False, "path": "", "size_percent": 50, "x_percent": 0, "y_percent": 75}
+OVERLAY2_DEFAULTS = dict(LAYER_DEFAULTS, size_percent=10, x_percent=75, y_percent=0)
+PER_KEY_SECTIONS = ("video_settings", "ui_settings", "checkbox_labels")
+
+
+def layer_defaults(layer):
+    return OVERLAY2_DEFAULTS if layer == "overlay2" else LAYER_DEFAULTS
+
+
+def fresh_state():
+    return {"video_settings": {}, "ui_settings": {}, "checkbox_labels": {}, "layer_settings": {}}
+
+
+def apply(state, template):
+    """Settings model of a template apply: listed layers are reset to defaults, then take the template's fields"""
+    state = copy.deepcopy(state)
+    for key, value in template.items():
+        if key in PER_KEY_SECTIONS:
+            state[key].update(value)
+        elif key == "layer_settings":
+            for layer, entry in value.items():
+                state["layer_settings"][layer] = dict(layer_defaults(layer), **entry)
+        elif key not in ("name", "description", "category"):
+            state[key] = copy.deepcopy(value)
+    return state
+
+
+def load(name):
+    with open(os.path.join(TEMPLATES_DIR, f"{name}.json"), encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("first, second", [
+    ("template1", "intro1"),
+    ("music_video", "intro1"),
+    ("intro1", "template1"),
+    ("template1", "template1"),
+    ("music_video", "template1"),
+])
+def test_diff_apply_matches_full_apply(first, second):
+    state = apply(fresh_state(), load(first))
+    template = load(second)
+
+    patch = diff_template(state, template)
+
+    assert apply(state, patch) == apply(state, template)
+
+
+def test_partial_layer_entry_is_applied_even_if_listed_fields_match():
+    state = apply(fresh_state(), load("template1"))
+    assert state["layer_settings"]["overlay2"]["enabled"] is False
+
+    patch = diff_template(state, {"layer_settings": {"overlay2": {"enabled": False}}})
+
+    assert patch == {"layer_settings": {"overlay2": {"enabled": False}}}
+
+
+def test_unchanged_template_yields_empty_patch():
+    state = apply(fresh_state(), load("template1"))
+    # A template saved from the current state lists every field
+    template = {key: copy.deepcopy(value) for key, value in state.items()}
+    assert diff_template(state, template) == {}
+
+
+def test_only_changed_keys_and_layers_are_reported():
+    state = apply(fresh_state(), load("template1"))
+    template = copy.deepcopy(state)
+    template["video_settings"]["fps"] = 60
+    template["layer_settings"]["overlay8"]["start_from"] = 0
+
+    patch = diff_template(state, template)
+
+    assert patch == {"video_settings": {"fps": 60},
+                     "layer_settings": {"overlay8": template["layer_settings"]["overlay8"]}}